@@ -0,0 +1,7 @@
+"""
+Benchmarks for md_gd4_docs
+
+Every benchmark is a module that can be run from the repository root, for example:
+
+    python -m benchmarks.code_accumulation
+"""
@@ -0,0 +1,192 @@
+"""
+End-to-end benchmark of the documentation build.
+
+Generates synthetic Godot 4 projects (see benchmarks.project_generator) at several scales, builds their documentation
+with Build and records the wall time of the whole build and of every build phase (see BuildProfiler), taking the best
+of several rounds. Cold builds start without scan cache and documentation, warm builds rebuild the unchanged project
+with the scan cache of the cold build.
+
+The results are written as JSON, to compare them across commits:
+
+    python -m benchmarks.build --output before.json
+    python -m benchmarks.build --output after.json --compare before.json
+
+Everything runs offline, in a temporary directory.
+"""
+
+from argparse import ArgumentParser
+from contextlib import redirect_stdout
+from datetime import datetime, timezone
+from io import StringIO
+from json import dump, load
+from os import remove
+from os.path import join, isfile
+from platform import platform, python_version
+from shutil import rmtree
+from subprocess import run, DEVNULL
+from tempfile import TemporaryDirectory
+from timeit import default_timer
+
+from ruamel.yaml.comments import CommentedMap
+
+from src.control.build import Build
+from src.control.build_profiler import BuildProfiler
+from benchmarks.project_generator import ProjectSpec, generate_project
+
+SCALES: dict = {
+    "small": ProjectSpec(scripts=50, scenes=10),
+    "medium": ProjectSpec(scripts=200, scenes=50),
+    "large": ProjectSpec(scripts=1000, scenes=250, lines_per_script=400),
+}
+
+
+def build_once(project_dir: str, doc_dir: str, conf_file: str, jobs: int, scan_cache: bool) -> dict:
+    """
+    Builds the documentation of a project once.
+
+    Args:
+        project_dir: Directory of the project
+        doc_dir: Destination directory for the documentation
+        conf_file: Path of the (not existing) settings file, the scan cache is stored next to it
+        jobs: Number of worker processes
+        scan_cache: Uses the scan cache if True
+
+    Returns:
+        Wall time of the whole build and of every phase, in seconds
+    """
+    doc_conf_data = CommentedMap({
+        "doc_destination": doc_dir + "/",
+        "rebuild_src_path": True,
+        "project_scan": True,
+        "project_scan_options": CommentedMap({
+            "src_path": project_dir + "/",
+            "read_gd_project": True,
+            "scene2src_links": True
+        }),
+        "filelist_scan": False,
+        "scan_cache": scan_cache
+    })
+    profiler = BuildProfiler()
+    start = default_timer()
+    with redirect_stdout(StringIO()):
+        Build(doc_conf_data, conf_file, jobs, profiler)
+    timings = {"total": default_timer() - start}
+    timings.update({record["name"]: record["wall"] for record in profiler.phases})
+    return timings
+
+
+def best_of(rounds: list[dict]) -> dict:
+    """
+    Takes the fastest time of every measurement over all rounds.
+
+    Args:
+        rounds: The timings of every round
+
+    Returns:
+        The best timings
+    """
+    return {name: min(timings[name] for timings in rounds) for name in rounds[0]}
+
+
+def benchmark_scale(name: str, spec: ProjectSpec, rounds: int, jobs: int) -> dict:
+    """
+    Benchmarks cold and warm builds of a synthetic project.
+
+    Args:
+        name: Name of the scale
+        spec: Scale of the project
+        rounds: Number of rounds, the best one counts
+        jobs: Number of worker processes
+
+    Returns:
+        The result of the scale, with the spec, project statistics and best cold and warm timings
+    """
+    with TemporaryDirectory() as directory:
+        project_dir = join(directory, "project")
+        doc_dir = join(directory, "docs")
+        conf_file = join(directory, "md_gd4_docs.yml")
+        project_stats = generate_project(project_dir, spec)
+        cold_rounds: list[dict] = []
+        warm_rounds: list[dict] = []
+        for _ in range(rounds):
+            rmtree(doc_dir, ignore_errors=True)
+            if isfile(join(directory, "md_gd4_docs.cache")):
+                remove(join(directory, "md_gd4_docs.cache"))
+            cold_rounds.append(build_once(project_dir, doc_dir, conf_file, jobs, True))
+            warm_rounds.append(build_once(project_dir, doc_dir, conf_file, jobs, True))
+    return {
+        "scale": name,
+        "spec": spec.as_dict(),
+        "project": project_stats,
+        "jobs": jobs,
+        "cold": best_of(cold_rounds),
+        "warm": best_of(warm_rounds),
+    }
+
+
+def commit_id() -> str:
+    """
+    Gets the current git commit, if available.
+
+    Returns:
+        The commit hash, or "" if not in a git repository
+    """
+    try:
+        result = run(["git", "rev-parse", "HEAD"], capture_output=True, text=True, stdin=DEVNULL, check=False)
+    except OSError:
+        return ""
+    return result.stdout.strip()
+
+
+def print_results(results: list[dict], previous: dict = None):
+    """
+    Prints the results, compared to previous results if given.
+
+    Args:
+        results: The results of every scale
+        previous: Previous results (as written by main), keyed by scale and build kind
+    """
+    for result in results:
+        project = result["project"]
+        print(f"{result['scale']}: {project['scripts']} scripts, {project['lines']} lines, {project['scenes']} scenes, "
+              f"jobs={result['jobs']}")
+        for kind in ("cold", "warm"):
+            for name, seconds in result[kind].items():
+                line = f"  {kind:<5} {name:<26} {seconds * 1000:>9.1f} ms"
+                old = (previous or {}).get((result["scale"], kind), {}).get(name)
+                if old:
+                    line += f"  ({seconds / old:.2f}x of previous {old * 1000:.1f} ms)"
+                print(line)
+
+
+def main():
+    parser = ArgumentParser(prog="python -m benchmarks.build", description="End-to-end build benchmark")
+    parser.add_argument("--scales", nargs="+", choices=list(SCALES), default=["small", "medium"])
+    parser.add_argument("--rounds", type=int, default=3)
+    parser.add_argument("--jobs", type=int, default=1)
+    parser.add_argument("--output", metavar="FILE", help="Writes the results as JSON to FILE")
+    parser.add_argument("--compare", metavar="FILE", help="Compares with the results in FILE")
+    args = parser.parse_args()
+    results = [benchmark_scale(name, SCALES[name], args.rounds, args.jobs) for name in args.scales]
+    previous = None
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as file:
+            previous = {
+                (result["scale"], kind): result[kind] for result in load(file)["results"] for kind in ("cold", "warm")
+            }
+    print_results(results, previous)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            dump({
+                "commit": commit_id(),
+                "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+                "python": python_version(),
+                "platform": platform(),
+                "rounds": args.rounds,
+                "results": results,
+            }, file, indent=2)
+        print(f"Results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""
+Micro-benchmark for accumulating script code lines in the ClassDoc model.
+
+Appends the lines of generated scripts of growing size to a ClassDoc and reads the code once, like the script scanner
+does. The time per line has to stay (roughly) constant as the file size grows. For comparison, the same is done with
+plain str concatenation on an attribute, which copies the whole code on every line.
+"""
+
+from timeit import default_timer
+
+from src.model.class_doc import ClassDoc
+
+LINE: str = '\t"state_%d": {"enter": "_on_enter", "exit": "_on_exit", "next": "state_%d"},\n'
+SIZES: tuple = (2500, 5000, 10000, 20000, 40000)
+
+
+class ConcatCodeDoc:
+    """
+    Code accumulation by str concatenation on an attribute, as reference
+    """
+    def __init__(self):
+        self.code: str = ""
+
+    def append_code_line(self, line: str):
+        self.code = self.code + line
+
+
+def time_accumulation(doc_class, lines: list[str]) -> float:
+    """
+    Times appending all lines and reading the code once.
+
+    Args:
+        doc_class: Class providing append_code_line and code
+        lines: The code lines to append
+
+    Returns:
+        Elapsed time in seconds
+    """
+    doc = doc_class("bench.gd") if doc_class is ClassDoc else doc_class()
+    start = default_timer()
+    for line in lines:
+        doc.append_code_line(line)
+    len(doc.code)
+    return default_timer() - start
+
+
+def main():
+    print(f"{'lines':>8} {'ClassDoc [ms]':>14} {'ns/line':>9} {'concat [ms]':>12} {'ns/line':>9}")
+    for size in SIZES:
+        lines = [LINE % (i, i + 1) for i in range(size)]
+        model_time = min(time_accumulation(ClassDoc, lines) for _ in range(3))
+        concat_time = time_accumulation(ConcatCodeDoc, lines)
+        print(
+            f"{size:>8} {model_time * 1000:>14.2f} {model_time / size * 1e9:>9.0f} "
+            f"{concat_time * 1000:>12.2f} {concat_time / size * 1e9:>9.0f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
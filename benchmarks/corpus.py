@@ -0,0 +1,166 @@
+"""
+Generator for synthetic, but realistically structured GDScript files.
+
+The scripts follow the usual Godot 4 layout: class_name/extends, a class docstring, signals, enums, consts, exported
+and onready vars, functions with bodies of nested blocks and inner classes. The share of documented members and the
+size of the parts can be configured, a fixed seed makes the output reproducible.
+"""
+
+from os import makedirs
+from os.path import join
+from random import Random
+
+TYPES: tuple = ("int", "float", "String", "bool", "Vector2", "Array[int]", "Dictionary", "Node2D")
+STATEMENTS: tuple = (
+    "var {name} := {value}",
+    "{name} += delta * speed",
+    "velocity = velocity.move_toward(Vector2.ZERO, friction * delta)",
+    "emit_signal(\"changed\", {name})",
+    "print(\"state: %s\" % [{name}])  # debug output",
+    "var result = _helper({name}, \"#not a comment\")",
+    "position += Vector2(cos(angle), sin(angle)) * {value}",
+)
+
+
+def doc_block(rng: Random, indent: str, lines: int) -> list[str]:
+    """
+    Generates a doc comment block.
+
+    Args:
+        rng: Random generator to use
+        indent: Indent in front of the lines
+        lines: Number of description lines
+
+    Returns:
+        The lines of the block, without linebreaks
+    """
+    block = [f"{indent}## Brief description number {rng.randint(0, 999)} of the following member."]
+    if lines > 1:
+        block.append(f"{indent}##")
+        for line in range(lines - 1):
+            block.append(f"{indent}## Detail line {line} explaining [member other] and [method do_it] in depth.")
+    return block
+
+
+def func_lines(rng: Random, indent: str, name: str, body_lines: int, documented: bool) -> list[str]:
+    """
+    Generates a function with doc block, typed arguments and a body of nested blocks.
+
+    Args:
+        rng: Random generator to use
+        indent: Indent in front of the func keyword
+        name: Name of the function
+        body_lines: Number of lines of the body
+        documented: Generates a doc block with Args: and Returns: sections if True
+
+    Returns:
+        The lines of the function, without linebreaks
+    """
+    lines: list[str] = []
+    if documented:
+        lines.extend(doc_block(rng, indent, 2))
+        lines.extend([
+            f"{indent}##", f"{indent}## Args:", f"{indent}##     delta: Elapsed time", f"{indent}##     speed: Factor",
+            f"{indent}##", f"{indent}## Returns:", f"{indent}##     The new value",
+        ])
+    lines.append(f"{indent}func {name}(delta: float, speed: float = 1.0) -> float:")
+    depth = 1
+    for line in range(body_lines):
+        statement = rng.choice(STATEMENTS).format(name=f"value_{line}", value=rng.randint(0, 100))
+        if depth < 4 and rng.random() < 0.15:
+            lines.append(f"{indent}{chr(9) * depth}if value_{line} > {rng.randint(0, 9)}:")
+            depth += 1
+        elif depth > 1 and rng.random() < 0.15:
+            depth -= 1
+        lines.append(f"{indent}{chr(9) * depth}{statement}")
+    lines.append(f"{indent}\treturn delta * speed")
+    lines.append("")
+    return lines
+
+
+def generate_script(
+        index: int,
+        lines_per_script: int = 300,
+        doc_density: float = 0.6,
+        enum_size: int = 6,
+        inner_classes: int = 1,
+        seed: int = 0
+) -> str:
+    """
+    Generates the source of a synthetic script.
+
+    Args:
+        index: Number of the script, used for names and as part of the seed
+        lines_per_script: Approximate number of lines of the script
+        doc_density: Share of members with a doc comment, between 0 and 1
+        enum_size: Number of members per enum
+        inner_classes: Number of inner classes
+        seed: Seed of the random generator
+
+    Returns:
+        The source of the script
+    """
+    rng = Random(seed * 100003 + index)
+    lines: list[str] = [f"class_name Generated{index}", "extends Node2D"]
+    lines.extend(doc_block(rng, "", 3))
+    lines.append(f"## @tutorial(Guide): https://docs.godotengine.org/en/stable/tutorials/scripting/guide_{index % 7}.html")
+    lines.append("")
+    for signal in range(3):
+        if rng.random() < doc_density:
+            lines.append(f"## Emitted when thing {signal} happens.")
+        lines.append(f"signal changed_{signal}(value: int)")
+    lines.append("")
+    lines.extend(doc_block(rng, "", 1))
+    lines.append(f"enum State {{")
+    for member in range(enum_size):
+        doc = f" ## Member {member}" if rng.random() < doc_density else ""
+        lines.append(f"\tSTATE_{member},{doc}")
+    lines.append("}")
+    lines.append("")
+    for const in range(4):
+        doc = f" ## Constant {const}" if rng.random() < doc_density else ""
+        lines.append(f"const LIMIT_{const}: int = {rng.randint(0, 1000)}{doc}")
+    for var in range(6):
+        if rng.random() < doc_density:
+            lines.extend(doc_block(rng, "", 1))
+        prefix = rng.choice(("@export var", "var", "@onready var"))
+        value = "$Node" if prefix.startswith("@onready") else rng.randint(0, 100)
+        lines.append(f"{prefix} value_{var}: {rng.choice(TYPES)} = {value}")
+    lines.append("")
+    func_index = 0
+    inner_left = inner_classes
+    while len(lines) < lines_per_script:
+        if inner_left and rng.random() < 0.1:
+            inner_left -= 1
+            lines.extend(doc_block(rng, "", 1))
+            lines.append(f"class Inner{inner_left} extends RefCounted:")
+            lines.append("\t## Inner value.")
+            lines.append("\tvar inner_value := 0")
+            lines.extend(func_lines(rng, "\t", f"inner_{func_index}", 8, rng.random() < doc_density))
+            func_index += 1
+            continue
+        lines.extend(func_lines(rng, "", f"do_{func_index}", rng.randint(5, 30), rng.random() < doc_density))
+        func_index += 1
+    return "\n".join(lines) + "\n"
+
+
+def write_corpus(directory: str, scripts: int, **options) -> list[str]:
+    """
+    Writes synthetic scripts into a directory.
+
+    Args:
+        directory: Directory to write the scripts to, created if not existing
+        scripts: Number of scripts to write
+        **options: Options passed on to generate_script
+
+    Returns:
+        Paths to the written scripts
+    """
+    makedirs(directory, exist_ok=True)
+    paths: list[str] = []
+    for index in range(scripts):
+        path = join(directory, f"generated_{index}.gd")
+        with open(path, "w") as file:
+            file.write(generate_script(index, **options))
+        paths.append(path)
+    return paths
@@ -0,0 +1,73 @@
+"""
+Benchmark for point queries on the documentation database.
+
+Scans synthetic scripts (see benchmarks.corpus) and stores their documentation twice: as one pickled list of all
+ClassDocs (like a tool would have to load without database) and in a database written by the DocDatabaseWriter. Then
+looks up the documentation of single classes and the location of single members. The pickled list has to be loaded
+completely before the first answer, the database decodes only the JSON rows of the requested class.
+"""
+
+from os.path import getsize, join
+from pickle import dump, load, HIGHEST_PROTOCOL
+from random import Random
+from tempfile import TemporaryDirectory
+from timeit import default_timer
+
+from src.control.doc_database import DocDatabase
+from src.control.script_scanner import ScriptScanner
+from src.view.doc_database_writer import DocDatabaseWriter
+from benchmarks.corpus import write_corpus
+
+PROJECT_SIZES: tuple = (100, 400, 1000)
+QUERIES: int = 200
+
+
+def main():
+    print(f"{'scripts':>7} | {'db size':>9} | {'pickle: first':>13} | {'db: first':>9} | {'db: class':>9} | db: member")
+    for scripts in PROJECT_SIZES:
+        rng = Random(0)
+        with TemporaryDirectory() as directory:
+            paths = write_corpus(join(directory, "scripts"), scripts, lines_per_script=120)
+            scanner = ScriptScanner()
+            class_docs = [scanner.scan(path, False) for path in paths]
+            writer = DocDatabaseWriter(join(directory, "docs"))
+            for class_doc in class_docs:
+                writer.write(class_doc)
+            writer.finish()
+            pickle_file = join(directory, "docs.pickle")
+            with open(pickle_file, "wb") as file:
+                dump(class_docs, file, HIGHEST_PROTOCOL)
+            class_names = [class_doc.class_name for class_doc in class_docs]
+            del class_docs
+            wanted = rng.choice(class_names)
+
+            start = default_timer()
+            with open(pickle_file, "rb") as file:
+                loaded_docs = load(file)
+            next(class_doc for class_doc in loaded_docs if class_doc.class_name == wanted)
+            pickle_first = default_timer() - start
+            del loaded_docs
+
+            start = default_timer()
+            database = DocDatabase(writer.db_file)
+            database.class_doc(wanted)
+            db_first = default_timer() - start
+            queries = [rng.choice(class_names) for _ in range(QUERIES)]
+            start = default_timer()
+            for class_name in queries:
+                database.class_doc(class_name)
+            db_class = (default_timer() - start) / QUERIES
+            members = [row[0] for row in database.connection.execute("SELECT qualified_name FROM members")]
+            queries = [rng.choice(members) for _ in range(QUERIES)]
+            start = default_timer()
+            for qualified_name in queries:
+                database.member(qualified_name)
+            db_member = (default_timer() - start) / QUERIES
+            db_size = getsize(writer.db_file)
+            database.close()
+        print(f"{scripts:>7} | {db_size / 1024:>6.0f} KB | {pickle_first * 1000:>10.1f} ms | "
+              f"{db_first * 1000:>6.2f} ms | {db_class * 1e6:>6.1f} µs | {db_member * 1e6:.1f} µs")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,248 @@
+"""
+The documentation model classes of md_gd4_docs before they were slotted, kept as the baseline of
+benchmarks.model_memory.
+
+The classes are unchanged, with a __dict__ per instance and an own empty tags list per member, except for the var_type
+and tag_type checks: they were always true and raised for every model, so they are fixed here, as in the current
+models. Only the classes and methods used by the benchmark are kept.
+"""
+
+
+class LegacyTagDoc:
+    """
+    Model class for holding documentation for tags
+    """
+    def __init__(self, tag_type: str, tutorial_url: str = "", tutorial_name: str = ""):
+        """
+        Constructor of the tag documentation model.
+
+        Args:
+            tag_type: Possible values are "@tutorial", "@experimental" or "@deprecated"
+            tutorial_url: Only used for @tutorial tag
+            tutorial_name: Only used for @tutorial tag
+
+        Raises:
+            Exception: If tag_type invalid
+        """
+        self.tag_type = tag_type
+        self.tutorial_url = tutorial_url
+        self.tutorial_name = tutorial_name
+        if self.tag_type not in ("@tutorial", "@experimental", "@deprecated"):
+            raise Exception('Only "@tutorial", "@experimental" or "@deprecated" are valid tag types')
+
+
+class LegacySignalDoc:
+    """
+    Model class for holding documentation for signals.
+    """
+    def __init__(self, name: str, description: str, tags: list[LegacyTagDoc] = None):
+        """
+        Constructor of the signal documentation model.
+
+        Args:
+            name: Name of the signal
+            description: Description of the signal
+            tags: Tag(s) of the signal, if any
+        """
+        self.name: str = name
+        if tags is None:
+            self.tags: list[LegacyTagDoc] = []
+        else:
+            self.tags: list[LegacyTagDoc] = tags
+        self.description: str = description
+
+
+class LegacyEnumMemberDoc:
+    """
+    Model class for storing enum members
+    """
+    def __init__(self, value_name: str, value_int: int, description: str = "", tags: list[LegacyTagDoc] = None):
+        """
+        Constructor of the enum member documentation model
+
+        Args:
+            value_name: Name of the enum member
+            value_int: Value of the enum member
+            description: Description of the enum member
+        """
+        self.value_name = value_name
+        self.value_int = value_int
+        if tags is None:
+            self.tags: list[LegacyTagDoc] = []
+        else:
+            self.tags: list[LegacyTagDoc] = tags
+        self.description = description
+
+
+class LegacyEnumDoc:
+    """
+    Model class for storing enum documentation (including enum members)
+    """
+    def __init__(
+            self,
+            name: str,
+            description: str,
+            members: list[LegacyEnumMemberDoc],
+            tags: list[LegacyTagDoc] = None
+    ):
+        """
+        Constructor of the enum documentation model
+
+        Args:
+            name: Name of the enum
+            description: Description of the enum
+        """
+        self.name: str = name
+        self.description: str = description
+        if tags is None:
+            self.tags: list[LegacyTagDoc] = []
+        else:
+            self.tags: list[LegacyTagDoc] = tags
+        self.members: list[LegacyEnumMemberDoc] = members
+
+
+class LegacyVarDoc:
+    """
+    Model class for holding documentation for a var or const.
+    """
+    def __init__(
+            self,
+            name: str,
+            data_type: str,
+            description: str,
+            value=None,
+            var_type: str = "var",
+            tags: list[LegacyTagDoc] = None
+    ):
+        """
+        Constructor of the const documentation model.
+
+        Args:
+            name: Name of the const
+            data_type: Data type of the const
+            description: Description of the const
+            value: Should have data type as mentioned in data_type
+            var_type: Could be "const", "export_var", "var" or "onready_var"
+            tags: Tag(s) of the signal, if any
+        """
+        self.name: str = name
+        self.data_type: str = data_type
+        if tags is None:
+            self.tags: list[LegacyTagDoc] = []
+        else:
+            self.tags: list[LegacyTagDoc] = tags
+        self.description: str = description
+        self.value = value
+        self.var_type: str = var_type
+        if self.var_type not in ("const", "export_var", "var", "onready_var"):
+            raise Exception('Only "const", "export_var", "var" or "onready_var" are valid var types')
+
+
+class LegacyFuncDoc:
+    """
+    Model class for holding documentation for functions
+    """
+    def __init__(self, name: str, description: str, args: list[LegacyVarDoc], tags: list[LegacyTagDoc] = None):
+        """
+        Constructor of the function documentation model.
+
+        Args:
+            name: Name of the function
+            description: Description of the function
+            args: Argument(s) list of the function
+        """
+        self.code: str = ""
+        self.name = name
+        if tags is None:
+            self.tags: list[LegacyTagDoc] = []
+        else:
+            self.tags: list[LegacyTagDoc] = tags
+        self.description = description
+        self.args = args
+
+
+class LegacyClassDoc:
+    """
+    Model class for storing class documentation.
+    """
+    def __init__(self, file_name: str, class_name: str = "not exposed", inner_class: bool = False):
+        """
+        Constructor of the class documentation model.
+
+        Args:
+            file_name: Filename of the script
+            class_name: Class name, only needed to expose class for inheritance or for inner classes
+            inner_class: Is it an inner class? class_name becomes mandatory if True.
+        """
+        self.code: str = ""
+        self.file_name: str = file_name
+        self.class_name: str = class_name
+        self.is_inner_class: bool = inner_class
+        self.extends: str = ""
+        self.tags: list[LegacyTagDoc] = []
+        self.brief_description: str = ""
+        self.detail_description: str = ""
+        self.signal_docs: list[LegacySignalDoc] = []
+        self.enum_docs: list[LegacyEnumDoc] = []
+        self.const_docs: list[LegacyVarDoc] = []
+        self.var_docs: list[LegacyVarDoc] = []
+        self.func_docs: list[LegacyFuncDoc] = []
+        self.inner_class_docs: list[LegacyClassDoc] = []
+
+    def add_signal(self, name: str, description: str, tags: list[LegacyTagDoc] = None):
+        """
+        Adds a signal description item to the doc
+
+        Args:
+            name: Name of the signal
+            description: Description of the signal
+            tags: Tag(s) of the signal, if any
+        """
+        self.signal_docs.append(LegacySignalDoc(name, description, tags))
+
+    def add_enum(
+            self,
+            name: str,
+            description: str,
+            members: list[LegacyEnumMemberDoc],
+            tags: list[LegacyTagDoc] = None
+    ):
+        """
+        Adds an enum item to the doc
+
+        Args:
+            name: Name of the enum
+            description: Description of the enum
+            members: All members of the enum, also these without description
+            tags: Tag(s) of the enum, if any
+        """
+        self.enum_docs.append(LegacyEnumDoc(name, description, members, tags))
+        if tags is None:
+            self.tags: list[LegacyTagDoc] = []
+        else:
+            self.tags: list[LegacyTagDoc] = tags
+
+    def add_attribute(
+            self,
+            name: str,
+            data_type: str,
+            description: str,
+            value=None,
+            var_type: str = "var",
+            tags: list[LegacyTagDoc] = None
+    ):
+        """
+        Adds an attribute (var, const) item to the doc
+
+        Args:
+            name: Name of the Attribute
+            data_type: Data type of the attribute
+            description: Description of the Attribute
+            value: Value of the attribute, if any. Type of the attribute should match data_type
+            var_type: Could be "const", "export_var", "var" or "onready_var"
+            tags: Tag(s) of the signal, if any
+        """
+        if var_type == "const":
+            self.const_docs.append(LegacyVarDoc(name, data_type, description, value, var_type, tags))
+        else:
+            self.var_docs.append(LegacyVarDoc(name, data_type, description, value, var_type, tags))
@@ -0,0 +1,680 @@
+"""
+The line-by-line docstring scanner of md_gd4_docs before the GdLexer/GdParser rewrite, kept unchanged as the baseline
+of benchmarks.script_scanner.
+
+Only the configuration access is adapted: LegacyScriptScanner takes the project directory and the indent setting
+directly instead of the validated doc configuration of a Build. The scanner is not used by the application.
+"""
+
+from validators import url
+
+from src.model.class_doc import ClassDoc
+from src.model.enum_member_doc import EnumMemberDoc
+from src.model.tag_doc import TagDoc
+
+
+class LegacyScriptScanner:
+    """
+    The former Build.script_scanner with its helpers check_url and get_indent.
+
+    Attributes:
+        src_path: The base directory of the project, ending with "/"
+        indent: The indent setting, "tabulator" or "spaces: <number>"
+    """
+
+    def __init__(self, src_path: str = "", indent: str = "tabulator"):
+        """
+        Constructor of the legacy scanner.
+
+        Args:
+            src_path: The base directory of the project, ending with "/"
+            indent: The indent setting, "tabulator" or "spaces: <number>"
+        """
+        self.src_path: str = src_path
+        self.indent: str = indent
+
+    def script_scanner(self, script: str, from_project: bool = True) -> ClassDoc:
+        """
+        Scans docstrings from script, registering docstring class, signal, enum, enum values, const, var, func, and
+        inner class categories
+
+        Members of inner classes are not scanned at this time. Eventually becomes a feature in a future version.
+
+        Args:
+            script: Path to the script to read from
+            from_project: If True, the path of the script is relative to the project root (src_path)
+        """
+        scan_stage: str = ""  # "", "brief_description", "detail_description", "args", "returns", "enum", "func"
+        tmp_brief_description = ""
+        tmp_detail_description = ""
+        tmp_args_description = []  # [name, type, description, value/default/required]
+        tmp_returns_description = []  # [type, description]
+        tmp_tags = []  # [tyg_type, (only if tag=@tutorial --> url, not required tutorial_name]
+        class_doc = ClassDoc(script)
+        if from_project:
+            fp_script = self.src_path + script
+        else:
+            fp_script = script
+        try:
+            with (open(fp_script, "r") as file):
+                for line in file:
+                    class_doc.append_code_line(line)
+                    if scan_stage == "":
+                        if line.strip().startswith("##"):
+                            description_helper = line.replace("##", "", 1).strip()
+                            if not description_helper.replace("#", "").strip() == "":
+                                scan_stage = "brief_description"
+                                if description_helper.strip().startswith("Args:"):
+                                    scan_stage = "args"
+                                    tmp_args_indent = self.get_indent(line)
+
+                                    # todo: scan args line for more text
+
+                                    pass
+                                if description_helper.startswith("Returns:"):
+                                    scan_stage = "returns"
+                                    tmp_returns_indent = self.get_indent(line)
+
+                                    # todo: scan args line for more text
+
+                                    pass
+                                if description_helper.startswith("@tutorial"):
+                                    description_helper = description_helper.split(":", 1)
+                                    description_helper[1] = description_helper[1].strip()
+                                    if "(" in description_helper[0]:
+                                        if description_helper[0].endswith(")"):
+                                            tmp_list = description_helper[0].split("(", 1)
+                                            if tmp_list[0] == "@tutorial":
+                                                description_helper[0] = "@tutorial:"
+                                                description_helper.append(tmp_list[1].strip(")"))
+                                            else:
+                                                print(f"{line}: invalid @tutorial tag, skipping")
+                                                continue
+                                        else:
+                                            print(f"{line}: invalid @tutorial tag, skipping")
+                                            continue
+                                    tag_to_append = [description_helper[0], description_helper[1]]
+                                    if len(description_helper) > 2:
+                                        tag_to_append.append(description_helper[2])
+                                    if description_helper[0].endswith(":") and self.check_url(description_helper[1]):
+                                        tmp_tags.append(tag_to_append)
+                                    else:
+                                        print(f"{line}: invalid @tutorial tag or URL, skipping")
+                                        continue
+                                if description_helper.startswith("@deprecated"):
+                                    tmp_tags.append("@deprecated")
+                                if description_helper.startswith("@experimental"):
+                                    tmp_tags.append("@experimental")
+                                else:
+                                    tmp_brief_description = description_helper
+                            continue
+                        if line.strip().startswith("#"):
+                            #
+                            continue
+                        if line.strip().startswith("@export"):
+                            scan_stage = "@export"
+                            continue
+                        if line.strip().startswith("@onready"):
+                            scan_stage = "@onready"
+                            continue
+                        if "##" in line:
+                            if line.strip().startswith("signal"):
+                                com, doc = line.split("##", 1)
+                                signal_name = com.replace("signal", "", 1).strip()
+                                signal_description = doc.strip()
+                                class_doc.add_signal(signal_name, signal_description)
+                                scan_stage = ""
+                                tmp_brief_description = ""
+                                tmp_detail_description = ""
+                                tmp_tags = []
+                                continue
+                            if line.strip().startswith("enum"):
+                                scan_stage = "enum"
+                                com, doc = line.split("##", 1)
+                                enum_name = ""
+                                enum_description = doc.strip()
+                                com = com.strip()
+                                if com.endswith("{"):
+                                    com = com.replace("{", "").strip()
+                                tmp_enum_members: list[enum_members] = []
+                                if com.endswith("}"):
+                                    if "{" in com:
+                                        com, members = com.split("{", 1)
+                                        com = com.strip
+                                        members = members.rstrip("}").strip()
+                                        for member in members:
+                                            if "=" in com:
+                                                enum_member_value_name, enum_member_value_int = com.split("=")
+                                                enum_member_value_name = enum_member_value_name.strip()
+                                                enum_member_value_int = enum_member_value_int.strip()
+                                            else:
+                                                enum_member_value_name = com.strip()
+                                                if len(tmp_enum_members) < 1:
+                                                    enum_member_value_int = 0
+                                                else:
+                                                    enum_member_value_int = tmp_enum_members[-1].value_int + 1
+                                            tmp_enum_members.append(
+                                                EnumMemberDoc(enum_member_value_name, enum_member_value_int)
+                                            )
+                                        class_doc.add_enum(enum_name, enum_description, tmp_enum_members)
+                                        scan_stage = ""
+                                        tmp_brief_description = ""
+                                        tmp_detail_description = ""
+                                        tmp_tags = []
+                                        tmp_enum_members = []
+                                        continue
+                                    else:
+                                        print(f"Parenthesis error in line {line}, ignoring.")
+                                        continue
+                                enum_name = com.replace("enum", "", 1).strip()
+                                continue
+                            if line.strip().startswith("const"):
+                                var_type = "const"
+                                const_value = None
+                                const_data_type = "undefined"
+                                com, doc = line.split("##", 1)
+                                const_description = doc.strip()
+                                if "=" in com:
+                                    com, const_value = com.split("=", 1)
+                                    const_value = const_value.strip()
+                                    com = com.strip()
+                                if ":=" in com:
+                                    com, const_value = com.split("=", 1)
+                                    const_value = const_value.strip()
+                                    com = com.strip()
+                                if ":" in com:
+                                    com, const_data_type = com.split(":", 1)
+                                    const_data_type = const_data_type.strip()
+                                    com = com.strip()
+                                const_name = com.replace("const", "", 1).strip
+                                class_doc.add_attribute(
+                                    const_name, const_data_type, const_description, const_value, const_data_type
+                                )
+                                scan_stage = ""
+                                tmp_brief_description = ""
+                                tmp_detail_description = ""
+                                tmp_tags = []
+                                continue
+                            if line.strip().startswith("@export var") \
+                                    or line.strip().startswith("var") \
+                                    or line.strip().startswith("@onready var"):
+                                if line.strip().startswith("@export var"):
+                                    var_type = "@export var"
+                                if line.strip().startswith("var"):
+                                    var_type = "var"
+                                if line.strip().startswith("@onready var"):
+                                    var_type = "@onready var"
+                                var_value = None
+                                var_data_type = "undefined"
+                                com, doc = line.split("##", 1)
+                                var_description = doc.strip()
+                                if "=" in com:
+                                    com, var_value = com.split("=", 1)
+                                    var_value = var_value.strip()
+                                    com = com.strip()
+                                if ":=" in com:
+                                    com, var_value = com.split("=", 1)
+                                    var_value = var_value.strip()
+                                    com = com.strip()
+                                if ":" in com:
+                                    com, var_data_type = com.split(":", 1)
+                                    var_data_type = var_data_type.strip()
+                                    com = com.strip()
+                                var_name = com.replace("var", 1).strip()
+                                var_name = var_name.replace("@onready", 1).strip()
+                                var_name = var_name.replace("@export", 1).strip()
+                                class_doc.add_attribute(var_name, var_data_type, var_description, var_value, var_type)
+                                continue
+                            if line.strip().startswith("func"):
+                                scan_stage = "func"
+                                tmp_func_returns = "None"
+                                tmp_func_indent = self.get_indent(line)
+                                cmd, doc = line.split("##")
+                                tmp_brief_description = doc.strip
+                                cmd = cmd.replace("func").strip()
+                                if not cmd.endswith(":") or "(" not in cmd or ")" not in cmd:
+                                    scan_stage = ""
+                                    tmp_func_indent = ""
+                                    tmp_brief_description = ""
+                                    print(f"{line} is not a valid func, ignoring")
+                                    continue
+                                cmd = cmd.replace(":", "")
+                                if "->" in cmd:
+                                    cmd, tmp_func_returns = cmd.split("->")
+                                    tmp_func_returns = tmp_func_returns.strip()
+                                    cmd = cmd.strip()
+                                cmd, args = cmd.split("(", 1)
+                                cmd = cmd.strip()
+                                args = args.strip()
+                                if not args.endswith(")"):
+                                    scan_stage = ""
+                                    tmp_func_indent = ""
+                                    tmp_brief_description = ""
+                                    print(f"{line} is not a valid func, ignoring")
+                                    continue
+                                args = args.strip(")")
+                                if "," in args:
+                                    args = args.split(",")
+                                else:
+                                    args = [args, ]
+                                for arg in args:
+
+                                    pass
+                                # todo: implement func ## in line
+                                continue
+                            if line.strip().startswith("class"):
+                                scan_stage = "inner_class"
+                                tmp_inner_class_indent = self.get_indent(line)
+
+                                # todo: implement class ## in line
+
+                                continue
+                        if "class_name" in line:
+                            if line.startswith("class_name"):
+                                class_name_helper = line.replace("class_name", "").strip()
+                            else:
+                                class_name_helper = line.split("class_name", 1)[1].strip()
+                            class_name_helper = class_name_helper.split(" ", 1)[0]
+                            class_doc.set_class_name(class_name_helper)
+                        if "extends" in line:
+                            if line.startswith("extends"):
+                                extends_helper = line.replace("extends", "").strip()
+                            else:
+                                extends_helper = line.split("extends", 1)[1].strip()
+                            extends_helper = extends_helper.split(" ", 1)[0]
+                            class_doc.set_extends(extends_helper)
+                        continue
+                    if scan_stage == "brief_description":
+                        if line.strip().startswith("##"):
+                            description_helper = line.replace("##", "", 1).strip()
+                            if not description_helper.replace("#", "").strip() == "":
+                                tmp_brief_description += " " + description_helper
+                            else:
+                                scan_stage = "detail_description"
+                            continue
+                    if scan_stage == "detail_description":
+                        if line.strip().startswith("##"):
+                            description_helper = line.replace("##", "", 1)
+                            if description_helper.strip().startswith("Args:"):
+                                scan_stage = "args"
+                                continue
+                            if description_helper.strip().startswith("Returns:"):
+                                scan_stage = "returns"
+                                continue
+                            description_helper = description_helper.strip()
+                            if not description_helper.replace("#", "").strip() == "":
+                                if description_helper.startswith("@tutorial"):
+                                    description_helper = description_helper.split(":", 1)
+                                    description_helper[1] = description_helper[1].strip()
+                                    if "(" in description_helper[0]:
+                                        if description_helper[0].endswith(")"):
+                                            tmp_list = description_helper[0].split("(", 1)
+                                            if tmp_list[0] == "@tutorial":
+                                                description_helper[0] = "@tutorial:"
+                                                description_helper.append(tmp_list[1].strip(")"))
+                                            else:
+                                                print(f"{line}: invalid @tutorial tag, skipping")
+                                                continue
+                                        else:
+                                            print(f"{line}: invalid @tutorial tag, skipping")
+                                            continue
+                                    tag_to_append = [description_helper[0], description_helper[1]]
+                                    if len(description_helper) > 2:
+                                        tag_to_append.append(description_helper[2])
+                                    if description_helper[0].endswith(":") and self.check_url(description_helper[1]):
+                                        tmp_tags.append(tag_to_append)
+                                        continue
+                                    else:
+                                        print(f"{line}: invalid @tutorial tag, skipping")
+                                        continue
+                                    pass
+                                if description_helper.startswith("@deprecated"):
+                                    tmp_tags.append("@deprecated")
+                                    continue
+                                if description_helper.startswith("@experimental"):
+                                    tmp_tags.append("@experimental")
+                                    continue
+                                else:
+                                    if tmp_detail_description != "":
+                                        description_helper = " " + description_helper
+                                    tmp_detail_description += description_helper
+                                    continue
+                            else:
+                                tmp_detail_description += "\n\n"
+                                continue
+                    if scan_stage == "brief_description" or scan_stage == "detail_description":
+                        if not line.strip().startswith("##"):
+                            if line.strip().startswith("#"):
+                                #
+                                continue
+                            if line.strip().startswith("signal"):
+                                if "#" in line:
+                                    line = line.split("#", 1)[0]
+                                signal_name = line.replace("signal", "", 1).strip()
+                                signal_description = tmp_brief_description
+                                if tmp_detail_description != "":
+                                    signal_description = signal_description + "\n\n" + tmp_detail_description
+                                signal_tags: list[TagDoc] = []
+                                for tag in tmp_tags:
+                                    tutorial_url = ""
+                                    tutorial_name = ""
+                                    tag_type = tag[0]
+                                    if len(tag) > 1:
+                                        tutorial_url = tag[1]
+                                    if len(tag) > 2:
+                                        tutorial_name = tag[2]
+                                    signal_tags.append(TagDoc(tag_type, tutorial_url, tutorial_name))
+                                class_doc.add_signal(signal_name, signal_description, signal_tags)
+                                scan_stage = ""
+                                tmp_brief_description = ""
+                                tmp_detail_description = ""
+                                tmp_tags = []
+                                continue
+                            if line.strip().startswith("enum"):
+                                scan_stage = "enum"
+                                enum_name = ""
+                                if "#" in line:
+                                    line = line.split("#", 1)[0]
+                                line = line.strip()
+                                if line.endswith("{"):
+                                    line = line.replace("{", "").strip()
+                                enum_name = line.replace("enum", "", 1).strip()
+                                enum_members: list[enum_members] = []
+                                continue
+                            if line.strip().startswith("const"):
+                                var_type = "const"
+                                const_value = None
+                                const_data_type = "undefined"
+                                line = line.strip()
+                                if "#" in line:
+                                    line = line.split("#", 1)[0].strip()
+                                if "=" in line:
+                                    line, const_value = line.split("=", 1)
+                                    const_value = const_value.strip()
+                                    line = line.strip()
+                                if ":" in line:
+                                    line, const_data_type = line.split(":", 1)
+                                    const_data_type = const_data_type.strip()
+                                    line = line.strip()
+                                const_name = line.replace("const", "", 1).strip()
+                                const_description = tmp_brief_description
+                                if tmp_detail_description != "":
+                                    const_description = const_description + "\n\n" + tmp_brief_description
+                                const_tags: list[TagDoc] = []
+                                for tag in tmp_tags:
+                                    tutorial_url = ""
+                                    tutorial_name = ""
+                                    tag_type = tag[0]
+                                    if len(tag) > 1:
+                                        tutorial_url = tag[1]
+                                    if len(tag) > 2:
+                                        tutorial_name = tag[2]
+                                    const_tags.append(TagDoc(tag_type, tutorial_url, tutorial_name))
+                                class_doc.add_attribute(
+                                    const_name, const_data_type, const_description, const_value, var_type, const_tags
+                                )
+                                scan_stage = ""
+                                tmp_brief_description = ""
+                                tmp_detail_description = ""
+                                tmp_tags = []
+                                continue
+                            if line.strip().startswith("@export var") \
+                                    or line.strip().startswith("var") \
+                                    or line.strip().startswith("@onready var"):
+                                if "#" in line:
+                                    line = line.split("#", 1)[0].strip()
+                                if line.strip().startswith("@export var"):
+                                    var_type = "@export var"
+                                if line.strip().startswith("var"):
+                                    var_type = "var"
+                                if line.strip().startswith("@onready var"):
+                                    var_type = "@onready var"
+                                var_value = None
+                                var_data_type = "undefined"
+                                if "=" in line:
+                                    line, var_value = line.split("=", 1)
+                                    var_value = var_value.strip()
+                                    line = line.strip()
+                                elif ":=" in line:
+                                    line, var_value = line.split(":=", 1)
+                                    var_value = var_value.strip()
+                                    line = line.strip()
+                                if ":" in line:
+                                    line, var_data_type = line.split(":", 1)
+                                    var_data_type = var_data_type.strip()
+                                    line = line.strip()
+                                var_name = line.replace("var", "", 1).strip()
+                                var_name = var_name.replace("@onready", "", 1).strip()
+                                var_name = var_name.replace("@export", "", 1).strip()
+                                var_description = tmp_brief_description
+                                if tmp_detail_description != "":
+                                    var_description = var_description + "\n\n" + tmp_detail_description
+                                var_tags: list[TagDoc] = []
+                                for tag in tmp_tags:
+                                    tutorial_url = ""
+                                    tutorial_name = ""
+                                    tag_type = tag[0]
+                                    if len(tag) > 1:
+                                        tutorial_url = tag[1]
+                                    if len(tag) > 2:
+                                        tutorial_name = tag[2]
+                                    var_tags.append(TagDoc(tag_type, tutorial_url, tutorial_name))
+                                class_doc.add_attribute(
+                                    var_name, var_data_type, var_description, var_value, var_type, var_tags
+                                )
+                                scan_stage = ""
+                                tmp_brief_description = ""
+                                tmp_detail_description = ""
+                                tmp_tags = []
+                                continue
+                            if line.strip().startswith("@export"):
+                                scan_stage = "@export"
+                                continue
+                            if line.strip().startswith("@onready"):
+                                scan_stage = "@onready"
+                                continue
+                            if line.strip().startswith("func"):
+                                scan_stage = "func"
+                                tmp_func_indent = self.get_indent(line)
+
+                                # todo: implement func outer desc
+
+                                continue
+                            if line.strip().startswith("class"):
+                                scan_stage = "inner_class"
+                                tmp_inner_class_indent = self.get_indent(line)
+
+                                # todo: implement class outer desc
+
+                                continue
+                            # todo: should be class docstring if nothing of the above
+                    if scan_stage == "@export" or scan_stage == "@onready":
+                        if scan_stage == "@export":
+                            if not line.strip().startswith("var"):
+                                print("Warning: @export is not followed by var, ignoring ...")
+                                continue
+                            else:
+                                var_type = "@export var"
+                                pass
+                        if scan_stage == "@onready":
+                            if not line.strip().startswith("var"):
+                                print("Warning: @onready is not followed by var, ignoring ...")
+                                continue
+                            else:
+                                var_type = "@onready var"
+                                pass
+                        var_value = None
+                        var_data_type = "undefined"
+                        if "=" in line:
+                            line, var_value = line.split("=", 1)
+                            var_value = var_value.strip()
+                            line = line.strip()
+                        if ":=" in line:
+                            line, var_value = line.split(":=", 1)
+                            var_value = var_value.strip()
+                            line = line.strip()
+                        if ":" in line:
+                            line, var_data_type = line.split(":", 1)
+                            var_data_type = var_data_type.strip()
+                            line = line.strip()
+                        var_name = line.replace("var", "", 1).strip()
+                        var_name = var_name.replace("@onready", "", 1).strip()
+                        var_name = var_name.replace("@export", "", 1).strip()
+                        var_description = tmp_brief_description
+                        if tmp_detail_description != "":
+                            var_description = var_description + "\n\n" + tmp_detail_description
+                        var_tags: list[TagDoc] = []
+                        for tag in tmp_tags:
+                            tutorial_url = ""
+                            tutorial_name = ""
+                            tag_type = tag[0]
+                            if len(tag) > 1:
+                                tutorial_url = tag[1]
+                            if len(tag) > 2:
+                                tutorial_name = tag[2]
+                            var_tags.append(TagDoc(tag_type, tutorial_url, tutorial_name))
+                        class_doc.add_attribute(
+                            var_name, var_data_type, var_description, var_value, var_type, var_tags
+                        )
+                        scan_stage = ""
+                        tmp_brief_description = ""
+                        tmp_detail_description = ""
+                        tmp_tags = []
+                        continue
+                    if scan_stage == "enum":
+                        line = line.strip()
+                        if "#" in line and "##" not in line:
+                            line = line.split("#", 1)[0].strip()
+                        if line == "{" or line == "":
+                            continue
+                        if line.startswith("##"):
+                            line = line.replace("##", "").strip()
+                            if "enum_member_tmp_description" in locals():
+                                if enum_member_description != "" or enum_member_description is not None:
+                                    enum_member_description = enum_member_description + " " + line
+                                else:
+                                    enum_member_description = line
+                            else:
+                                enum_member_description = line
+                            continue
+                        if "##" in line:
+                            com, doc = line.split("##")
+                            com = com.strip()
+                            doc = doc.strip
+                            if "enum_member_tmp_description" in locals():
+                                if enum_member_description != "" or enum_member_description is not None:
+                                    enum_member_description = enum_member_description + " " + doc
+                                else:
+                                    enum_member_description = doc
+                            else:
+                                enum_member_description = doc
+                            if "=" in line:
+                                enum_member_value_name, enum_member_value_int = line.split("=")
+                                enum_member_value_name = enum_member_value_name.strip()
+                                enum_member_value_int = enum_member_value_int.strip()
+                            else:
+                                enum_member_value_name = line.strip()
+                                if len(tmp_enum_members) < 1:
+                                    enum_member_value_int = 0
+                                else:
+                                    enum_member_value_int = tmp_enum_members[-1].value_int + 1
+                            tmp_enum_members.append(
+                                EnumMemberDoc(enum_member_value_name, enum_member_value_int, enum_member_description)
+                            )
+                            continue
+                        if "=" in line:
+                            enum_member_value_name, enum_member_value_int = line.split("=")
+                            enum_member_value_name = enum_member_value_name.strip()
+                            enum_member_value_int = enum_member_value_int.strip()
+                        else:
+                            enum_member_value_name = line.strip()
+                            if len(tmp_enum_members) < 1:
+                                enum_member_value_int = 0
+                            else:
+                                enum_member_value_int = tmp_enum_members[-1].value_int + 1
+                        tmp_enum_members.append(
+                            EnumMemberDoc(enum_member_value_name, enum_member_value_int, enum_member_description)
+                        )
+                        if line.endswith("}"):
+                            enum_tags: list[TagDoc] = []
+                            for tag in tmp_tags:
+                                tutorial_url = ""
+                                tutorial_name = ""
+                                tag_type = tag[0]
+                                if len(tag) > 1:
+                                    tutorial_url = tag[1]
+                                if len(tag) > 2:
+                                    tutorial_name = tag[2]
+                                enum_tags.append(TagDoc(tag_type, tutorial_url, tutorial_name))
+                            class_doc.add_enum(enum_name, enum_description, tmp_enum_members, enum_tags)
+                            scan_stage = ""
+                            tmp_brief_description = ""
+                            tmp_detail_description = ""
+                            tmp_tags = []
+                            tmp_enum_members = []
+                        continue
+                    if scan_stage == "args":
+
+                        continue
+                    if scan_stage == "returns":
+
+                        continue
+                    if scan_stage == "func":
+
+                        pass
+                    if scan_stage == "inner_class":
+
+                        pass
+        except Exception as e:
+
+            # todo: broader exception handling
+            print(e)
+        return class_doc
+
+    @staticmethod
+    def check_url(url_to_check: str) -> bool:
+        """
+        Checks the pattern of an HTTP(S) URL address. Doesn't check if address exists.
+
+        Args:
+            url_to_check: URL address to check
+
+        Returns:
+            True if HTTP(S) URL address pattern is valid, otherwise False
+        """
+        if url(url_to_check):
+            if url_to_check.startswith("http://") or url_to_check.startswith("https://"):
+                return True
+        return False
+
+    def get_indent(self, line: str) -> str:
+        """
+        Form the indent of a line as a string consisting either of tabulators or spaces. Can be used to remove a
+        trailing indent on multiple code lines.
+
+        Args:
+            line: The str to count indent of
+
+        Returns:
+            Indent as str, consisting of tabulator(s) or spaces
+        """
+        if self.indent == "tabulator":
+            indent_count = len(line) - len(line.lstrip("\t"))
+            indent_str = ""
+            if indent_count > 0:
+                for i in range(indent_count):
+                    indent_str = indent_str + "\t"
+                    pass
+        else:
+            number = int(self.indent.split(":", 1)[1].strip())
+            if self.indent % number == 0:
+                indent_count = int((len(line) - len(line.lstrip(" "))) / number)
+                indent_str = ""
+                one_indent = ""
+                for i in range(number):
+                    one_indent = one_indent + " "
+                for i in range(indent_count):
+                    indent_str = indent_str + one_indent
+            else:
+                indent_str = "undefined"
+        return indent_str
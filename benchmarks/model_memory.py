@@ -0,0 +1,86 @@
+"""
+Memory benchmark for the documentation model classes.
+
+Builds the doc models of a synthetic project in memory and reports the traced allocation size per documented member
+(signals, enum members, consts, vars, funcs and their args): with the models before they were slotted (see
+benchmarks.legacy_models) as baseline, with list storage and with the columnar VarDocTable storage for consts and
+vars. Descriptions and names are shared between members, so mostly the size of the model objects themselves is
+measured.
+"""
+
+from tracemalloc import start, stop, take_snapshot
+
+from src.model.class_doc import ClassDoc
+from src.model.enum_member_doc import EnumMemberDoc
+from src.model.func_doc import FuncDoc
+from src.model.var_doc import VarDoc
+from benchmarks.legacy_models import LegacyClassDoc, LegacyEnumMemberDoc, LegacyFuncDoc, LegacyVarDoc
+
+CLASSES: int = 500
+MEMBERS_PER_KIND: int = 40
+
+
+def build_doc_data(storage: str) -> tuple[list, int]:
+    """
+    Builds the doc models of the synthetic project.
+
+    Args:
+        storage: "legacy" for the models before slotting, "list" or "columnar" (passed on to ClassDoc)
+
+    Returns:
+        The class docs and the number of documented members in them
+    """
+    if storage == "legacy":
+        new_class_doc, var_doc, func_doc, enum_member_doc = LegacyClassDoc, LegacyVarDoc, LegacyFuncDoc, \
+            LegacyEnumMemberDoc
+    else:
+        def new_class_doc(file_name: str) -> ClassDoc:
+            return ClassDoc(file_name, columnar=storage == "columnar")
+        var_doc, func_doc, enum_member_doc = VarDoc, FuncDoc, EnumMemberDoc
+    doc_data: list = []
+    members = 0
+    names = [f"member_{i}" for i in range(MEMBERS_PER_KIND)]
+    for class_index in range(CLASSES):
+        class_doc = new_class_doc(f"scripts/script_{class_index}.gd")
+        for name in names:
+            class_doc.add_signal(name, "Emitted when something happens.")
+            class_doc.add_attribute(name, "int", "A constant value.", "1", "const")
+            class_doc.add_attribute(name, "float", "A variable value.", "0.0", "var")
+            args = [var_doc(name, "int", "An argument.", None, "var")]
+            class_doc.func_docs.append(func_doc(name, "Does something.", args))
+            members += 5
+        enum_members = [enum_member_doc(name, i, "An enum member.") for i, name in enumerate(names)]
+        class_doc.add_enum("State", "States of the script.", enum_members)
+        members += len(enum_members)
+        doc_data.append(class_doc)
+    return doc_data, members
+
+
+def measure(storage: str) -> tuple[int, int]:
+    """
+    Measures the memory allocated while building the doc models.
+
+    Args:
+        storage: "legacy", "list" or "columnar", see build_doc_data
+
+    Returns:
+        Allocated bytes and number of documented members
+    """
+    start()
+    doc_data, members = build_doc_data(storage)
+    snapshot = take_snapshot()
+    stop()
+    allocated = sum(stat.size for stat in snapshot.statistics("filename"))
+    del doc_data
+    return allocated, members
+
+
+def main():
+    print(f"{'storage':>10} {'members':>9} {'allocated [KiB]':>16} {'bytes/member':>13}")
+    for storage in ("legacy", "list", "columnar"):
+        allocated, members = measure(storage)
+        print(f"{storage:>10} {members:>9} {allocated / 1024:>16.0f} {allocated / members:>13.1f}")
+
+
+if __name__ == "__main__":
+    main()
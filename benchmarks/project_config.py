@@ -0,0 +1,61 @@
+"""
+Benchmark for parsing project.godot with the ProjectConfig.
+
+Generates synthetic project.godot files with growing numbers of autoloads, input actions (multi-line dictionaries
+with Object values, as written by Godot) and layer names, and measures the single-pass parse into sections.
+"""
+
+from timeit import default_timer
+
+from src.control.project_config import ProjectConfig
+
+PROJECT_SIZES: tuple = (10, 100, 1000)
+ROUNDS: int = 5
+
+
+def synthetic_project_godot(entries: int) -> str:
+    """
+    Generates the content of a project.godot file.
+
+    Args:
+        entries: Number of autoloads, input actions and layer names each
+
+    Returns:
+        The content
+    """
+    lines = [
+        "; Engine configuration file.", "", "config_version=5", "", "[application]", "",
+        'config/name="Benchmark \\"Project\\""', 'run/main_scene="res://scenes/main.tscn"',
+        'config/features=PackedStringArray("4.3", "Forward Plus")', "", "[autoload]", ""
+    ]
+    lines.extend(f'Autoload{n}="*res://autoloads/autoload_{n}.gd"' for n in range(entries))
+    lines.extend(["", "[input]", ""])
+    for n in range(entries):
+        lines.extend([
+            f"action_{n}={{",
+            '"deadzone": 0.5,',
+            '"events": [Object(InputEventKey,"resource_local_to_scene":false,"resource_name":"","device":-1,'
+            f'"keycode":{n},"physical_keycode":0,"unicode":0,"echo":false,"script":null)',
+            "]",
+            "}"
+        ])
+    lines.extend(["", "[layer_names]", ""])
+    lines.extend(f'2d_physics/layer_{n}="layer {n}"' for n in range(entries))
+    return "\n".join(lines) + "\n"
+
+
+def main():
+    print(f"{'entries':>7} | {'size':>8} | {'parse':>8} | throughput")
+    for entries in PROJECT_SIZES:
+        text = synthetic_project_godot(entries)
+        start = default_timer()
+        for _ in range(ROUNDS):
+            config = ProjectConfig(text)
+        parse_time = (default_timer() - start) / ROUNDS
+        assert len(config.section("input")) == entries
+        print(f"{entries:>7} | {len(text) / 1024:>5.0f} KB | {parse_time * 1000:>5.1f} ms | "
+              f"{len(text) / 1024 / 1024 / parse_time:.1f} MB/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,156 @@
+"""
+Generator for synthetic Godot 4 projects.
+
+Writes a complete project to a directory: project.godot (with autoloads), scripts spread over nested directories (see
+benchmarks.corpus for their content), *.gd.uid files and scenes. Every scene references one to three scripts, by path
+or only by uid, and carries a configurable amount of serialized node data behind its ext_resource header. A fixed seed
+makes the project reproducible.
+"""
+
+from os import makedirs
+from os.path import join
+from random import Random
+
+from benchmarks.corpus import generate_script
+
+
+class ProjectSpec:
+    """
+    Scale of a synthetic project.
+
+    Attributes:
+        scripts: Number of scripts
+        lines_per_script: Approximate number of lines per script
+        doc_density: Share of members with a doc comment, between 0 and 1
+        enum_size: Number of members per enum
+        inner_classes: Number of inner classes per script
+        scenes: Number of scenes
+        nodes_per_scene: Number of nodes serialized in every scene
+        scripts_per_dir: Number of scripts per directory
+        seed: Seed of the random generator
+    """
+    def __init__(
+            self,
+            scripts: int = 200,
+            lines_per_script: int = 300,
+            doc_density: float = 0.6,
+            enum_size: int = 6,
+            inner_classes: int = 1,
+            scenes: int = 50,
+            nodes_per_scene: int = 200,
+            scripts_per_dir: int = 20,
+            seed: int = 0
+    ):
+        self.scripts: int = scripts
+        self.lines_per_script: int = lines_per_script
+        self.doc_density: float = doc_density
+        self.enum_size: int = enum_size
+        self.inner_classes: int = inner_classes
+        self.scenes: int = scenes
+        self.nodes_per_scene: int = nodes_per_scene
+        self.scripts_per_dir: int = scripts_per_dir
+        self.seed: int = seed
+
+    def as_dict(self) -> dict:
+        return dict(vars(self))
+
+
+def script_path(spec: ProjectSpec, index: int) -> str:
+    """
+    Gets the path of a script, relative to the project root.
+
+    Args:
+        spec: Scale of the project
+        index: Number of the script
+
+    Returns:
+        The path, nested two directories deep
+    """
+    directory = index // spec.scripts_per_dir
+    return f"scripts/group_{directory % 5}/dir_{directory}/generated_{index}.gd"
+
+
+def script_uid(index: int) -> str:
+    return f"uid://gen{index:08d}"
+
+
+def scene_text(spec: ProjectSpec, rng: Random, index: int) -> str:
+    """
+    Generates the content of a scene.
+
+    Args:
+        spec: Scale of the project
+        rng: Random generator to use
+        index: Number of the scene
+
+    Returns:
+        The content of the .tscn file
+    """
+    scripts = rng.sample(range(spec.scripts), min(spec.scripts, rng.randint(1, 3))) if spec.scripts else []
+    lines: list[str] = [f'[gd_scene load_steps={len(scripts) + 2} format=3 uid="uid://scene{index:06d}"]', ""]
+    for number, script in enumerate(scripts):
+        if rng.random() < 0.3:
+            lines.append(f'[ext_resource type="Script" uid="{script_uid(script)}" id="{number}_s"]')
+        else:
+            lines.append(
+                f'[ext_resource type="Script" uid="{script_uid(script)}" path="res://{script_path(spec, script)}" '
+                f'id="{number}_s"]'
+            )
+    lines.append('[ext_resource type="Texture2D" uid="uid://icon" path="res://icon.svg" id="t"]')
+    lines.extend(["", '[sub_resource type="RectangleShape2D" id="shape"]', "size = Vector2(16, 16)", ""])
+    lines.append(f'[node name="Scene{index}" type="Node2D"]')
+    if scripts:
+        lines.append('script = ExtResource("0_s")')
+    for node in range(spec.nodes_per_scene):
+        lines.extend([
+            "",
+            f'[node name="Node{node}" type="Sprite2D" parent="."]',
+            f"position = Vector2({rng.randint(0, 1000)}, {rng.randint(0, 1000)})",
+            'texture = ExtResource("t")',
+        ])
+    return "\n".join(lines) + "\n"
+
+
+def generate_project(directory: str, spec: ProjectSpec) -> dict:
+    """
+    Writes a synthetic project.
+
+    Args:
+        directory: Directory to write the project to, created if not existing
+        spec: Scale of the project
+
+    Returns:
+        Number of scripts, scenes, lines and bytes written
+    """
+    rng = Random(spec.seed)
+    stats = {"scripts": spec.scripts, "scenes": spec.scenes, "lines": 0, "bytes": 0}
+    makedirs(directory, exist_ok=True)
+    autoloads = "\n".join(
+        f'Autoload{index}="*res://{script_path(spec, index)}"' for index in range(min(3, spec.scripts))
+    )
+    project = (
+        "; Engine configuration file.\n\nconfig_version=5\n\n[application]\n\n"
+        f'config/name="Synthetic {spec.scripts}"\nrun/main_scene="res://scenes/scene_0.tscn"\n'
+        'config/features=PackedStringArray("4.2", "Forward Plus")\n\n'
+        f"[autoload]\n\n{autoloads}\n"
+    )
+    with open(join(directory, "project.godot"), "w") as file:
+        file.write(project)
+    for index in range(spec.scripts):
+        path = join(directory, script_path(spec, index))
+        makedirs(path.rsplit("/", 1)[0], exist_ok=True)
+        source = generate_script(
+            index, spec.lines_per_script, spec.doc_density, spec.enum_size, spec.inner_classes, spec.seed
+        )
+        with open(path, "w") as file:
+            file.write(source)
+        with open(path + ".uid", "w") as file:
+            file.write(script_uid(index) + "\n")
+        stats["lines"] += source.count("\n")
+        stats["bytes"] += len(source.encode())
+    makedirs(join(directory, "scenes"), exist_ok=True)
+    for index in range(spec.scenes):
+        with open(join(directory, "scenes", f"scene_{index}.tscn"), "w") as file:
+            file.write(scene_text(spec, rng, index))
+    makedirs(join(directory, ".godot", "imported"), exist_ok=True)
+    return stats
@@ -0,0 +1,117 @@
+"""
+Benchmark for rendering the project index page.
+
+Builds a synthetic gd_project with many scripts, scenes and autoloads (no files involved) and compares linking the
+main scene and autoloads to their scripts and looking up the autoloads of every page, once by linear scans over
+script_files and the autoload list (as before the lookup maps), once with Build.scene_scripts and the ProjectIndex.
+The scans grow with scripts * autoloads, the maps linearly.
+"""
+
+from timeit import default_timer
+
+from src.view.markdown_writer import MarkdownWriter
+from src.view.project_index import ProjectIndex
+
+PROJECT_SIZES: tuple = ((1000, 100), (3000, 300), (6000, 600))
+
+
+def synthetic_project(scripts: int, autoloads: int) -> tuple[dict, dict, dict]:
+    """
+    Generates script_files, scene_scripts and gd_project of a synthetic project, every script linked to its own scene,
+    every second autoload a scene, the others scripts.
+
+    Args:
+        scripts: Number of scripts
+        autoloads: Number of autoloads
+
+    Returns:
+        script_files, scene_scripts and gd_project
+    """
+    script_files = {f"dir_{n % 50}/script_{n}.gd": {"scenes": [f"scenes/scene_{n}.tscn"]} for n in range(scripts)}
+    scene_scripts = {f"scenes/scene_{n}.tscn": [f"dir_{n % 50}/script_{n}.gd"] for n in range(scripts)}
+    gd_project = {
+        "project_name": "Benchmark",
+        "godot_version": "4.3",
+        "main_scene": {"scene_path": "scenes/scene_0.tscn", "added_script": ""},
+        "autoload": [
+            {
+                "scene_name": f"Autoload{n}",
+                "scene_path": f"scenes/scene_{n * 7}.tscn" if n % 2 else f"dir_{n * 7 % 50}/script_{n * 7}.gd",
+                "added_script": "",
+                "enabled": True
+            }
+            for n in range(autoloads)
+        ]
+    }
+    return script_files, scene_scripts, gd_project
+
+
+def linear_scans(script_files: dict, gd_project: dict) -> int:
+    """
+    Links the autoloads by scanning script_files, and looks up the autoloads of every page by scanning the autoload
+    list.
+
+    Args:
+        script_files: The scripts of the project
+        gd_project: The project information
+
+    Returns:
+        Number of links found
+    """
+    found = 0
+    for autoload in gd_project["autoload"]:
+        scripts = [script for script, info in script_files.items() if autoload["scene_path"] in info["scenes"]]
+        found += bool(scripts) or autoload["scene_path"] in script_files
+    for script in script_files:
+        found += len([
+            autoload["scene_name"] for autoload in gd_project["autoload"] if autoload["scene_path"] == script
+        ])
+    return found
+
+
+def lookup_maps(script_files: dict, scene_scripts: dict, gd_project: dict) -> int:
+    """
+    Links the autoloads with scene_scripts, looks up the autoloads of every page with the ProjectIndex and renders the
+    index page.
+
+    Args:
+        script_files: The scripts of the project
+        scene_scripts: The scripts linked to every scene
+        gd_project: The project information
+
+    Returns:
+        Number of links found
+    """
+    found = 0
+    for autoload in gd_project["autoload"]:
+        if autoload["scene_path"].endswith(".gd"):
+            autoload["added_script"] = autoload["scene_path"] if autoload["scene_path"] in script_files else ""
+        else:
+            autoload["added_script"] = (scene_scripts.get(autoload["scene_path"]) or [""])[0]
+        found += bool(autoload["added_script"])
+    project_index = ProjectIndex(gd_project)
+    writer = MarkdownWriter("", True, gd_project)
+    pages = {}
+    for script in script_files:
+        found += len(project_index.autoload_names(script))
+        pages[writer.page_path(script)] = (script.rsplit("/", 1)[-1], "")
+    project_index.render(pages, writer.page_path, MarkdownWriter.cell)
+    return found
+
+
+def main():
+    print(f"{'scripts':>7} | {'autoloads':>9} | {'linear scans':>12} | {'lookup maps':>11} | found")
+    for scripts, autoloads in PROJECT_SIZES:
+        script_files, scene_scripts, gd_project = synthetic_project(scripts, autoloads)
+        start = default_timer()
+        linear = linear_scans(script_files, gd_project)
+        linear_time = default_timer() - start
+        start = default_timer()
+        mapped = lookup_maps(script_files, scene_scripts, gd_project)
+        map_time = default_timer() - start
+        print(f"{scripts:>7} | {autoloads:>9} | {linear_time * 1000:>9.1f} ms | {map_time * 1000:>8.1f} ms | "
+              f"{linear} / {mapped}")
+
+
+if __name__ == "__main__":
+    main()
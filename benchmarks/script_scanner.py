@@ -0,0 +1,101 @@
+"""
+Benchmark for the docstring scanner.
+
+Scans a corpus of synthetic scripts (see benchmarks.corpus) in a single process and reports the scan throughput.
+Optionally, a directory with real Godot scripts can be scanned instead:
+
+    python -m benchmarks.script_scanner [path/to/godot/project]
+
+With --legacy, the scanner is compared with the line-by-line scanner it replaced (see
+benchmarks.legacy_script_scanner). The legacy scanner aborts a script at its first @tutorial tag, at most documented
+members and at @export/@onready vars declared on one line, so the comparison runs on the corpus with all ## doc
+comments and annotations removed, where both scanners read every line:
+
+    python -m benchmarks.script_scanner --legacy
+"""
+
+from sys import argv
+from os import walk
+from os.path import join, getsize
+from tempfile import TemporaryDirectory
+from timeit import default_timer
+
+from src.control.script_scanner import ScriptScanner
+from benchmarks.corpus import write_corpus
+from benchmarks.legacy_script_scanner import LegacyScriptScanner
+
+SCRIPTS: int = 200
+LINES_PER_SCRIPT: int = 400
+ROUNDS: int = 5
+
+
+def time_scans(paths: list[str], legacy: bool = False) -> float:
+    """
+    Scans all scripts, taking the best of several rounds.
+
+    Args:
+        paths: Paths to the scripts to scan
+        legacy: Scans with the LegacyScriptScanner instead of the ScriptScanner if True
+
+    Returns:
+        Elapsed time of the fastest round in seconds
+    """
+    scan = LegacyScriptScanner().script_scanner if legacy else ScriptScanner().scan
+    best = float("inf")
+    for _ in range(ROUNDS):
+        start = default_timer()
+        for path in paths:
+            scan(path, False)
+        best = min(best, default_timer() - start)
+    return best
+
+
+def strip_doc_comments(paths: list[str]):
+    """
+    Removes all ## doc comment lines, inline ## doc comments and @export/@onready annotations from scripts.
+
+    Args:
+        paths: Paths to the scripts to rewrite
+    """
+    for path in paths:
+        with open(path, "r") as file:
+            lines = [
+                line.split("##", 1)[0].rstrip().replace("@export ", "").replace("@onready ", "")
+                for line in file if not line.strip().startswith("##")
+            ]
+        with open(path, "w") as file:
+            file.write("\n".join(lines) + "\n")
+
+
+def report(paths: list[str], legacy: bool = False):
+    size = sum(getsize(path) for path in paths)
+    lines = 0
+    for path in paths:
+        with open(path, "rb") as file:
+            lines += file.read().count(b"\n")
+    elapsed = time_scans(paths)
+    print(f"{len(paths)} scripts, {lines} lines, {size / 1024:.0f} KiB")
+    print(f"scan time: {elapsed * 1000:.1f} ms ({lines / elapsed / 1000:.0f} k lines/s, "
+          f"{elapsed / len(paths) * 1e6:.0f} us/script)")
+    if legacy:
+        legacy_elapsed = time_scans(paths, True)
+        print(f"legacy scan time: {legacy_elapsed * 1000:.1f} ms ({lines / legacy_elapsed / 1000:.0f} k lines/s), "
+              f"speedup {legacy_elapsed / elapsed:.1f}x")
+
+
+def main():
+    legacy = "--legacy" in argv[1:]
+    arguments = [argument for argument in argv[1:] if argument != "--legacy"]
+    if arguments:
+        paths = [join(root, name) for root, _, names in walk(arguments[0]) for name in names if name.endswith(".gd")]
+        report(sorted(paths), legacy)
+        return
+    with TemporaryDirectory() as directory:
+        paths = write_corpus(directory, SCRIPTS, lines_per_script=LINES_PER_SCRIPT)
+        if legacy:
+            strip_doc_comments(paths)
+        report(paths, legacy)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""
+Benchmark for the prebuilt search index.
+
+Scans synthetic scripts (see benchmarks.corpus), writes their markdown pages and the search index, and compares the
+size of all page text (what a client-side search has to download and index, like the search_index.json of mkdocs)
+with the size of the search index files: the entry table every search loads once, and all shards with the median and
+largest shard a single query word has to load. The names of
+the synthetic scripts repeat a lot (like STATE_0 in every script), so their largest shards are larger than usual.
+"""
+
+from os import listdir
+from os.path import getsize, join, relpath
+from statistics import median
+from tempfile import TemporaryDirectory
+from timeit import default_timer
+
+from src.control.script_scanner import ScriptScanner
+from src.view.markdown_writer import MarkdownWriter
+from src.view.search_index_writer import SearchIndexWriter
+from benchmarks.corpus import write_corpus
+
+PROJECT_SIZES: tuple = (100, 400, 1000)
+
+
+def main():
+    print(f"{'scripts':>7} | {'page text':>9} | {'entries':>9} | {'shards':>9} | {'count':>5} | {'median':>9} | "
+          f"{'max shard':>9} | index build")
+    for scripts in PROJECT_SIZES:
+        with TemporaryDirectory() as directory:
+            paths = write_corpus(join(directory, "scripts"), scripts, lines_per_script=120)
+            scanner = ScriptScanner()
+            class_docs = [scanner.scan(path, False) for path in paths]
+            for class_doc in class_docs:
+                # pages are named after the path relative to the project, like in a build
+                class_doc.file_name = relpath(class_doc.file_name, directory)
+            destination = join(directory, "docs")
+            markdown_writer = MarkdownWriter(destination)
+            search_index_writer = SearchIndexWriter(destination, markdown_writer.page_path)
+            page_text = 0
+            for class_doc in class_docs:
+                page = markdown_writer.write(class_doc)
+                page_text += getsize(join(destination, page))
+            start = default_timer()
+            for class_doc in class_docs:
+                search_index_writer.write(class_doc)
+            search_index_writer.finish()
+            build_time = default_timer() - start
+            search_dir = search_index_writer.search_destination
+            sizes = [
+                getsize(join(search_dir, file_name))
+                for file_name in listdir(search_dir) if file_name.startswith("shard_")
+            ]
+            table_size = getsize(join(search_dir, SearchIndexWriter.ENTRIES_FILE))
+        print(f"{scripts:>7} | {page_text / 1024:>6.0f} KB | {table_size / 1024:>6.0f} KB | "
+              f"{sum(sizes) / 1024:>6.0f} KB | {len(sizes):>5} | {median(sizes) / 1024:>6.1f} KB | "
+              f"{max(sizes) / 1024:>6.1f} KB | {build_time * 1000:.0f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+"""
+Startup benchmark of the command line application.
+
+Runs src/app.py in fresh interpreters with -X importtime for --version, --init and --build (of a small synthetic
+project, see benchmarks.project_generator), and reports per command the best wall time, the summed import time, the
+slowest top level imports and whether the build stack (src.control.build) was imported at all. Python's own startup
+(python -c pass) is measured as baseline.
+
+    python -m benchmarks.startup --rounds 10
+"""
+
+from argparse import ArgumentParser
+from os import environ, makedirs, remove
+from os.path import abspath, dirname, isfile, join
+from subprocess import run, DEVNULL, PIPE
+from sys import executable
+from tempfile import TemporaryDirectory
+from timeit import default_timer
+
+from benchmarks.project_generator import ProjectSpec, generate_project
+
+ROOT: str = dirname(dirname(abspath(__file__)))
+APP: str = join(ROOT, "src", "app.py")
+BUILD_STACK: tuple = ("control.build", "src.control.build", "validators", "multiprocessing")
+
+
+def parse_importtime(stderr: str) -> dict:
+    """
+    Parses the output of -X importtime.
+
+    Args:
+        stderr: Standard error output of the interpreter
+
+    Returns:
+        Summed self import time (us), cumulative import time (us) of every top level import and the set of all
+        imported modules
+    """
+    total = 0
+    top_level: dict[str, int] = {}
+    modules: set[str] = set()
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        self_time, cumulative, name = line[len("import time:"):].split("|")
+        if not self_time.strip().isdigit():
+            continue
+        total += int(self_time)
+        modules.add(name.strip())
+        if not name[1:].startswith(" "):
+            top_level[name.strip()] = int(cumulative)
+    return {"total": total, "top_level": top_level, "modules": modules}
+
+
+def measure(args: list[str], cwd: str, rounds: int, clean_file: str = None) -> dict:
+    """
+    Runs a command in fresh interpreters and measures it.
+
+    Args:
+        args: Interpreter arguments after -X importtime
+        cwd: Working directory of the command
+        rounds: Number of runs, the fastest one counts
+        clean_file: File to delete before every run, if any
+
+    Returns:
+        Best wall time (s), import statistics of the fastest run and if the build stack was imported
+    """
+    env = dict(environ, PYTHONPATH=ROOT)
+    best: dict | None = None
+    for _ in range(rounds):
+        if clean_file and isfile(clean_file):
+            remove(clean_file)
+        start = default_timer()
+        result = run([executable, "-X", "importtime"] + args, cwd=cwd, env=env, stdin=DEVNULL, stdout=DEVNULL,
+                     stderr=PIPE, text=True, check=False)
+        wall = default_timer() - start
+        if best is None or wall < best["wall"]:
+            best = {"wall": wall, **parse_importtime(result.stderr)}
+    best["build_stack"] = sorted(module for module in BUILD_STACK if module in best["modules"])
+    return best
+
+
+def main():
+    parser = ArgumentParser(prog="python -m benchmarks.startup", description="Command line startup benchmark")
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--top", type=int, default=5, help="Number of slowest top level imports to show")
+    args = parser.parse_args()
+    with TemporaryDirectory() as directory:
+        generate_project(join(directory, "project"), ProjectSpec(scripts=20, scenes=5))
+        with open(join(directory, "md_gd4_docs.yml"), "w") as file:
+            file.write(
+                f"doc_destination: {join(directory, 'docs')}\nrebuild_src_path: true\nproject_scan: true\n"
+                f"project_scan_options:\n  src_path: {join(directory, 'project')}\n  read_gd_project: true\n"
+                f"  scene2src_links: true\nfilelist_scan: false\n"
+            )
+        init_dir = join(directory, "init")
+        makedirs(init_dir)
+        commands = {
+            "python -c pass": (["-c", "pass"], directory, None),
+            "--version": ([APP, "--version"], directory, None),
+            "--init": ([APP, "--init"], init_dir, join(init_dir, "md_gd4_docs.yml")),
+            "--build -j 1": ([APP, "--build", "-j", "1"], directory, None),
+        }
+        for name, (command, cwd, clean_file) in commands.items():
+            result = measure(command, cwd, args.rounds, clean_file)
+            print(f"{name:<16} {result['wall'] * 1000:>8.1f} ms wall, {result['total'] / 1000:>7.1f} ms imports, "
+                  f"build stack: {', '.join(result['build_stack']) or 'not imported'}")
+            slowest = sorted(result["top_level"].items(), key=lambda item: item[1], reverse=True)[:args.top]
+            for module, cumulative in slowest:
+                print(f"    {cumulative / 1000:>7.1f} ms  {module}")
+
+
+if __name__ == "__main__":
+    main()
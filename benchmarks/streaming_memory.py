@@ -0,0 +1,77 @@
+"""
+Memory benchmark for the streaming documentation build.
+
+Builds the documentation of synthetic projects (see benchmarks.corpus) of growing size in a single process and reports
+the traced peak memory, once streaming every ClassDoc to the markdown writer and releasing it, once keeping all of
+them in doc_data (keep_doc_data). A first small build imports the lazily imported modules, so they don't count towards
+the peak of the first measured build.
+
+Streaming doesn't keep the peak flat: the symbol index (every class and member) and the dependency graph of the build
+are kept for the whole build and grow with the project. The per-script growth of both peaks is reported, streaming
+only saves the ClassDocs, i.e. the difference between them.
+"""
+
+from contextlib import redirect_stdout
+from io import StringIO
+from os.path import join
+from tempfile import TemporaryDirectory
+from tracemalloc import start, stop, get_traced_memory
+
+from ruamel.yaml.comments import CommentedMap
+
+from src.control.build import Build
+from benchmarks.corpus import write_corpus
+
+PROJECT_SIZES: tuple = (50, 200, 800)
+WARM_UP_SCRIPTS: int = 5
+
+
+def measure(scripts: int, keep_doc_data: bool) -> int:
+    """
+    Builds the documentation of a synthetic project and measures the peak memory.
+
+    Args:
+        scripts: Number of scripts of the project
+        keep_doc_data: Passed on to the build settings
+
+    Returns:
+        Peak of the traced memory in bytes
+    """
+    with TemporaryDirectory() as directory:
+        write_corpus(join(directory, "project", "scripts"), scripts)
+        doc_conf_data = CommentedMap({
+            "doc_destination": join(directory, "docs") + "/",
+            "rebuild_src_path": True,
+            "project_scan": True,
+            "project_scan_options": CommentedMap({
+                "src_path": join(directory, "project") + "/",
+                "read_gd_project": False,
+                "scene2src_links": False
+            }),
+            "filelist_scan": False,
+            "keep_doc_data": keep_doc_data
+        })
+        start()
+        with redirect_stdout(StringIO()):
+            Build(doc_conf_data, join(directory, "md_gd4_docs.yml"), 1)
+        peak = get_traced_memory()[1]
+        stop()
+    return peak
+
+
+def main():
+    measure(WARM_UP_SCRIPTS, True)
+    print("scripts | streaming peak | keep_doc_data peak")
+    peaks: list[tuple[int, int]] = []
+    for scripts in PROJECT_SIZES:
+        streaming = measure(scripts, False)
+        kept = measure(scripts, True)
+        peaks.append((streaming, kept))
+        print(f"{scripts:7} | {streaming / 1024:11.0f} KiB | {kept / 1024:15.0f} KiB")
+    scripts = PROJECT_SIZES[-1] - PROJECT_SIZES[0]
+    print(f"growth per script: {(peaks[-1][0] - peaks[0][0]) / scripts / 1024:.1f} KiB streaming, "
+          f"{(peaks[-1][1] - peaks[0][1]) / scripts / 1024:.1f} KiB with keep_doc_data")
+
+
+if __name__ == "__main__":
+    main()
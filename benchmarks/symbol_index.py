@@ -0,0 +1,97 @@
+"""
+Benchmark for cross-reference lookups with the SymbolIndex.
+
+Scans synthetic scripts (see benchmarks.corpus), lets every class extend a random earlier one, and resolves for every
+class its "inherited by" list and the script of every data type it refers to. Once by nested scans over all scanned
+ClassDocs, as a page renderer without index would have to, once with a SymbolIndex built from the same ClassDocs
+(build time included). The nested scans grow quadratically with the number of classes, the index lookups linearly.
+"""
+
+from os.path import join
+from random import Random
+from tempfile import TemporaryDirectory
+from timeit import default_timer
+
+from src.control.build import Build
+from src.control.script_scanner import ScriptScanner
+from src.control.symbol_index import SymbolIndex
+from benchmarks.corpus import write_corpus
+
+PROJECT_SIZES: tuple = (100, 200, 400)
+
+
+def scan_corpus(scripts: int) -> list:
+    """
+    Scans synthetic scripts, with random inheritance between their classes.
+
+    Args:
+        scripts: Number of scripts
+
+    Returns:
+        The ClassDoc of every script
+    """
+    rng = Random(0)
+    with TemporaryDirectory() as directory:
+        paths = write_corpus(join(directory, "scripts"), scripts, lines_per_script=120)
+        scanner = ScriptScanner()
+        class_docs = [scanner.scan(path, False) for path in paths]
+    for index, class_doc in enumerate(class_docs):
+        if index:
+            class_doc.extends = class_docs[rng.randrange(index)].class_name
+    return class_docs
+
+
+def nested_scans(class_docs: list) -> int:
+    """
+    Resolves subclasses and referenced scripts of every class by scanning all ClassDocs.
+
+    Args:
+        class_docs: The scanned documentation
+
+    Returns:
+        Number of resolved references
+    """
+    resolved = 0
+    for class_doc in class_docs:
+        resolved += len([other for other in class_docs if other.extends == class_doc.class_name])
+        for reference in Build.class_references(class_doc):
+            resolved += len([other.file_name for other in class_docs if other.class_name == reference][:1])
+    return resolved
+
+
+def index_lookups(class_docs: list) -> int:
+    """
+    Resolves subclasses and referenced scripts of every class with a SymbolIndex.
+
+    Args:
+        class_docs: The scanned documentation
+
+    Returns:
+        Number of resolved references
+    """
+    symbol_index = SymbolIndex()
+    for class_doc in class_docs:
+        symbol_index.add(class_doc)
+    resolved = 0
+    for class_doc in class_docs:
+        resolved += len(symbol_index.inherited_by(class_doc.class_name))
+        for reference in Build.class_references(class_doc):
+            resolved += symbol_index.class_script(reference) is not None
+    return resolved
+
+
+def main():
+    print(f"{'classes':>7} | {'nested scans':>12} | {'symbol index':>12} | resolved")
+    for scripts in PROJECT_SIZES:
+        class_docs = scan_corpus(scripts)
+        start = default_timer()
+        nested = nested_scans(class_docs)
+        nested_time = default_timer() - start
+        start = default_timer()
+        indexed = index_lookups(class_docs)
+        index_time = default_timer() - start
+        print(f"{scripts:>7} | {nested_time * 1000:>9.1f} ms | {index_time * 1000:>9.1f} ms | {nested} / {indexed}")
+
+
+if __name__ == "__main__":
+    main()
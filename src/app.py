@@ -6,10 +6,8 @@ The full source code can be found at
 """
 
 import argparse
-from sys import exit
-
-from control.settings import Settings
-from control.build import Build
+import sys
+from os import cpu_count
 
 
 class Main:
@@ -27,32 +25,66 @@ class Main:
         Constructor of the applications Main class.
 
         Depending on command line args, either initializes the settings or build markdown files as configured in
-        the settings file.
+        the settings file. In watch mode, the markdown files are updated after the build whenever files of the project
+        change.
+
+        The settings (with ruamel.yaml) and the build stack are imported only in the code paths needing them, so
+        --version and --help start without loading them, and --init without the build stack.
         """
         self.version: str = "0.1.0"
         args: argparse.Namespace = self.arg_parse_init()
+        from control.settings import Settings
+
         settings: Settings = Settings()
         if args.init:
             result: bool = settings.init_settings()
-        elif args.build:
+        elif args.build or args.watch:
+            from control.build import Build
+            from control.build_profiler import BuildProfiler
+
             result: bool = settings.load_settings()
+            if result and args.watch and not settings.get_settings()["project_scan"]:
+                print("Watch mode needs project_scan to be true")
+                result = False
             if result:
-                Build(settings.get_settings(), settings.doc_conf_file)
+                doc_conf_data = settings.get_settings()
+                if args.watch:
+                    doc_conf_data["keep_doc_data"] = True
+                profiler = BuildProfiler(args.profile is not None or args.profile_json is not None)
+                if args.profile_pstats:
+                    profiler.enable_cprofile()
+                build = Build(
+                    doc_conf_data, settings.doc_conf_file, args.jobs, profiler, settings.validated,
+                    args.explain_rebuild, args.format
+                )
+                settings.mark_validated()
+                if args.profile_pstats:
+                    profiler.dump_pstats(args.profile_pstats)
+                if args.profile is not None:
+                    profiler.report(args.profile)
+                if args.profile_json:
+                    profiler.write_json(args.profile_json)
+                if args.watch:
+                    build.watch()
                 # todo: Build addons/plugins might be handled here later ...
         else:
             print("Something went very wrong ...")
             result: bool = False
         if result:
-            exit(0)
+            sys.exit(0)
         else:
-            exit(5)
+            sys.exit(5)
 
     def arg_parse_init(self):
         """
         Parses and returns the command line arguments.
 
-        Sets init (-i/--init) or build (-b/--build) to True, shows the help (-h/--help) or the version (-v/--version).
-        If none of the former applies, an error message wil be displayed.
+        Sets init (-i/--init), build (-b/--build) or watch (-w/--watch) to True, shows the help (-h/--help) or the
+        version (-v/--version).
+        If none of the former applies, an error message wil be displayed. The number of worker processes for scanning
+        scripts at build can be set with -j/--jobs, the reasons for (re)generating pages are printed with
+        --explain-rebuild, the output format is selected with --format, build timings are printed or written with
+        --profile, --profile-json and --profile-pstats.
         """
         parser = argparse.ArgumentParser(
             prog="md_gd4_docs",
@@ -68,15 +100,53 @@ class Main:
             "-b", "--build", action="store_true",
             help="Creates the documentation files following the settings file ./md_gd4_docs.yml"
         )
+        group.add_argument(
+            "-w", "--watch", action="store_true",
+            help="Like --build, then keeps updating the documentation files whenever files of the project change"
+        )
         group.add_argument(
             "-v", "--version", action="version", version=f"%(prog)s {self.version}",
             help="Shows the version of the application"
         )
-        return parser.parse_args()
+        parser.add_argument(
+            "-j", "--jobs", type=int, default=cpu_count() or 1, metavar="N",
+            help="Number of worker processes for scanning scripts at build, defaults to the number of CPUs"
+        )
+        parser.add_argument(
+            "--profile", type=int, nargs="?", const=10, metavar="N",
+            help="Prints the timings of the build phases and the N slowest scripts (10 if N is omitted) after the build"
+        )
+        parser.add_argument(
+            "--profile-json", metavar="FILE",
+            help="Writes the timings of the build phases and of every scanned script to FILE as JSON"
+        )
+        parser.add_argument(
+            "--explain-rebuild", action="store_true",
+            help="Prints which pages are generated because of which changed scripts, scenes, classes or project.godot, "
+                 "at build and at every update in watch mode"
+        )
+        parser.add_argument(
+            "--format", choices=("markdown", "json", "ndjson"), default="markdown",
+            help="Writes Markdown pages (default), or exports the documentation as a single JSON document or as "
+                 "newline-delimited JSON (one record per script, streamed while scanning) to doc_destination"
+        )
+        parser.add_argument(
+            "--profile-pstats", metavar="FILE",
+            help="Profiles the build (main process) with cProfile and writes the statistics to FILE, see pstats"
+        )
+        args = parser.parse_args()
+        if args.jobs < 1:
+            parser.error("argument -j/--jobs: has to be at least 1")
+        return args
 
 
 if __name__ == '__main__':
     """
-    Init program and starting class.
+    Init program and starting class. freeze_support() is needed for the worker processes of the frozen application,
+    multiprocessing is only imported there.
     """
+    if getattr(sys, "frozen", False):
+        from multiprocessing import freeze_support
+
+        freeze_support()
     Main()
@@ -1,14 +1,28 @@
 from sys import exit
-from os.path import isdir, isfile, join
-from os import walk
-from fnmatch import filter
-from validators import url
-
-from ruamel.yaml.comments import CommentedMap, CommentedSeq
-
+from os import cpu_count
+from os.path import isdir, isfile, dirname, join
+from time import perf_counter
+from collections import deque
+from collections.abc import Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+
+from src import __version__
+from src.control.project_config import ProjectConfig
+from src.control.project_walker import ProjectWalker
+from src.control.build_profiler import BuildProfiler
+from src.control.dependency_graph import DependencyGraph
+from src.control.indent_style import IndentStyle
+from src.control.scene_linker import SceneLinker
+from src.control.scan_cache import ScanCache
+from src.control.settings_schema import SettingsSchema
+from src.control.symbol_index import SymbolIndex
+from src.control.script_scanner import ScriptScanner
+from src.control.url_checker import UrlChecker
 from src.model.class_doc import ClassDoc
-from src.model.enum_member_doc import EnumMemberDoc
-from src.model.tag_doc import TagDoc
+from src.view.doc_database_writer import DocDatabaseWriter
+from src.view.json_writer import JsonWriter
+from src.view.markdown_writer import MarkdownWriter
+from src.view.search_index_writer import SearchIndexWriter
 
 
 class Build:
@@ -19,10 +33,32 @@ class Build:
         doc_conf_data: The deserialized settings for reading the sourcecode
         doc_conf_file: Path to the documentation config file
         gd_project: For information extracted from project.godot file
-        doc_data: For information extracted from script files classes
+        doc_data: For information extracted from script files classes, only filled if keep_doc_data is true
+        doc_writers: Writers receiving the documentation of every script as soon as it is scanned, with write(class_doc,
+            script_info), remove(file_name) and finish() methods. finish returns the number of markdown pages written,
+            0 for other outputs (like the JSON export), which report their files themselves
         script_files: A dictionary with information for all script files in the project and/or in the filelist_scan
             scan_list
         scene_files: A list for all scene files of the project
+        scene_scripts: Scripts of script_files linked to every scene, in the order of the scene file, keyed by scene.
+            The reverse of the scenes of script_files, to look up the scripts of a scene in O(1)
+        scene_references: All scripts referenced by every scene, also those not (yet) in script_files, keyed by scene.
+            Scenes are relinked from it when a script they reference is created or deleted, without reading them again
+        uid_files: A list for all *.uid files of the project, used to resolve uid based script references of scenes
+        scan_cache: Cache of already scanned scripts, None if scan_cache is disabled
+        symbol_index: Index of the classes and members of all scanned scripts and their inheritance, complete before
+            the first page is written, for linking classes and listing subclasses. Saved next to the scan cache if
+            scan_cache is enabled, and updated for changed scripts only
+        jobs: Number of worker processes for scanning scripts, 1 scans in the main process only
+        scanner: Scanner for the docstrings of a single script, configured from doc_conf_data
+        profiler: Records the timings of the build phases, and of every scanned script if enabled
+        io_workers: Number of threads reading project, scene and script files concurrently
+        url_stats: Number of @tutorial URL checks served from the cache, validated and rejected, over all processes
+        dependency_graph: Inputs (scripts, scenes, classes, project.godot) every page depends on, to find the pages
+            affected by a change
+        explain_rebuild: Prints which pages are (re)generated because of which changed inputs if True
+        output_format: Format of the documentation, "markdown" pages, or a "json" or "ndjson" export, see JsonWriter
+        conf_validated: Skips validating the settings (except for the checks on the file system) if True
 
     Attributes: doc_conf_data attributes:
         doc_destination (str): Destination directory for the resulting documentation. Create if not exists
@@ -32,17 +68,33 @@ class Build:
         filelist_scan (bool): Scanning a manually created list if True, can be combined with project_scan to add more
             files to scan
         scan_list (list): List to be scanned if filelist_scan is True
+        scan_cache (bool): Optional, re-scans only changed or new scripts if True, using a cache file stored next to
+            the documentation config file
+        columnar_members (bool): Optional, stores documented consts and vars column-wise if True, to save memory on
+            projects with a lot of documented members
+        keep_doc_data (bool): Optional, keeps the documentation of all scripts in doc_data after writing it if True,
+            otherwise it is released script by script to keep the memory usage flat
+        io_workers (int): Optional, number of threads reading project, scene and script files concurrently, defaults
+            to IO_WORKERS. Higher values help on slow (e.g. network mounted) file systems
+        doc_database (bool): Optional, additionally writes all documentation into an indexed database
+            (md_gd4_docs.db in doc_destination) if True, to be queried with DocDatabase
+        search_index (bool): Optional, writes a sharded search index for the markdown pages and its loader (search
+            directory in doc_destination, to be added to extra_javascript in mkdocs.yml) if True, see SearchIndexWriter
 
     Attributes: doc_conf_data.project_scan_options attributes
         src_path (str): The base directory of the project to scan
         read_gd_project(bool): Creates a project documentation index if True
         scene2src_links (bool): Scans and documents if a script is linked to a scene
+        ignore_patterns (list): Optional glob patterns for directories or files to skip while scanning the project
 
     Attributes: gd_project attributes:
         project_name (str): For the name of the godot project, as read from the project.godot file
         godot_version (str): For the godot version of the godot source code, as read from the project.godot file
-        main_scene (str): For the data of the main (aka starting) scene, as read from the project.godot file
+        main_scene (dict): For the data of the main (aka starting) scene, as read from the project.godot file
         autoload (list[dict]): Scenes that load at application start, if enabled
+        input_actions (list[str]): Names of the input actions of the input map
+        layer_names (dict): Names of the named layers, keyed by layer (like 2d_physics/layer_1)
+        plugins (list[str]): Paths to the plugin.cfg of the enabled editor plugins
 
     Attributes: gd_project.main_scene attributes:
         scene_path (str): For the path to the main (aka starting) scene, as read from the project.godot file
@@ -50,11 +102,13 @@ class Build:
 
     Attributes: gd_project.autoload list[dict] attributes:
         scene_path (str): For the path to the scene, as read from the project.godot file
+        scene_name (str): The name of the autoload
         added_script (str): The script linked to the scene, if any
         enabled (bool): Is the autoload scene enabled?
 
     Attributes: script_files attributes:
-        scene (str): Full path to the connected scene, if any
+        scene (str): Full path to the connected scene, if any. The first scene if connected to several scenes
+        scenes (list[str]): Full paths to all connected scenes
         docs (list): For elements from docstring reading
 
     Returns:
@@ -62,127 +116,163 @@ class Build:
             returns None to the calling Main class. This gives the possibility for working with addons there after the
             creation of the documentation files (for example creating a full site including menus with mkdocs)
     """
-    def __init__(self, doc_conf_data: CommentedMap, doc_conf_file: str):
+    IO_WORKERS: int = 8
+
+    def __init__(
+            self,
+            doc_conf_data: dict,
+            doc_conf_file: str,
+            jobs: int = None,
+            profiler: BuildProfiler = None,
+            conf_validated: bool = False,
+            explain_rebuild: bool = False,
+            output_format: str = "markdown"
+    ):
         """
         Constructor of the class. Anything from reading project to building documentation sites is done from here.
 
         Args:
             doc_conf_data: The deserialized settings for reading the sourcecode
             doc_conf_file: Path to the documentation config file
+            jobs: Number of worker processes for scanning scripts, defaults to the number of CPUs
+            profiler: Records the timings of the build phases (and scripts, if enabled), a new one if None
+            conf_validated: The unchanged settings already passed the checks at an earlier build, see
+                Settings.validated
+            explain_rebuild: Prints which pages are (re)generated because of which changed inputs if True
+            output_format: Format of the documentation, "markdown" pages, or a "json" or "ndjson" export
         """
-        self.doc_conf_data: CommentedMap = doc_conf_data
+        self.doc_conf_data: dict = doc_conf_data
         self.doc_conf_file: str = doc_conf_file
-        self.indent: str = "tabulator"
-        self.gd_project: dict = {
-            "project_name": "",
-            "godot_version": "",
-            "main_scene": {
-                "scene_path": "",
-                "added_script": ""
-            },
-            "autoload": []
-        }
+        self.conf_validated: bool = conf_validated
+        self.explain_rebuild: bool = explain_rebuild
+        self.output_format: str = output_format
+        self.gd_project: dict = self.empty_gd_project()
         self.doc_data: list[ClassDoc] = []
+        self.doc_writers: list = []
         self.script_files: dict = {}
         self.scene_files: list = []
-        self.check_doc_conf_data()
+        self.scene_scripts: dict[str, list[str]] = {}
+        self.scene_references: dict[str, list[str]] = {}
+        self.uid_files: list = []
+        self.scan_cache: ScanCache | None = None
+        self.symbol_index: SymbolIndex = SymbolIndex()
+        self.dependency_graph: DependencyGraph = DependencyGraph()
+        self.jobs: int = jobs if jobs is not None else (cpu_count() or 1)
+        self.io_workers: int = self.IO_WORKERS
+        self.url_stats: dict = {"cached": 0, "validated": 0, "rejected": 0}
+        self.profiler: BuildProfiler = profiler if profiler is not None else BuildProfiler()
+        with self.profiler.phase("check_doc_conf_data"):
+            self.check_doc_conf_data()
         print(f"Check of {self.doc_conf_file} configuration file finished, everything seems ok")
+        self.scanner: ScriptScanner = ScriptScanner(
+            self.doc_conf_data["project_scan_options"]["src_path"] if self.doc_conf_data["project_scan"] else "",
+            self.doc_conf_data.get("columnar_members", False),
+            self.io_workers
+        )
+        if self.doc_conf_data.get("scan_cache", False):
+            # project_scan_options are optional if project_scan is false
+            src_path = self.doc_conf_data.get("project_scan_options", {}).get("src_path", "")
+            self.scan_cache = ScanCache(
+                join(dirname(self.doc_conf_file), "md_gd4_docs.cache"),
+                (__version__, self.doc_conf_data.get("columnar_members", False), src_path)
+            )
+            self.scan_cache.load()
+            self.symbol_index = SymbolIndex(
+                join(dirname(self.doc_conf_file), "md_gd4_docs.symbols"), (__version__, src_path)
+            )
+            self.symbol_index.load()
         if self.doc_conf_data["project_scan"]:
-            self.collect_proj_files_info()
+            with self.profiler.phase("collect_proj_files_info"):
+                self.collect_proj_files_info()
             if self.doc_conf_data["project_scan_options"]["scene2src_links"]:
-                self.connect_scene_to_script()
-            self.scan_project_scripts()
+                with self.profiler.phase("connect_scene_to_script"):
+                    self.connect_scene_to_script()
+            self.link_gd_project_scripts()
+            if self.output_format in JsonWriter.FORMATS:
+                self.doc_writers.append(JsonWriter(
+                    self.doc_conf_data["doc_destination"], self.output_format, self.gd_project
+                ))
+            else:
+                markdown_writer = MarkdownWriter(
+                    self.doc_conf_data["doc_destination"], self.doc_conf_data["rebuild_src_path"], self.gd_project,
+                    self.symbol_index
+                )
+                markdown_writer.reserve_pages(list(self.script_files))
+                self.doc_writers.append(markdown_writer)
+                if self.doc_conf_data.get("search_index", False):
+                    self.doc_writers.append(SearchIndexWriter(
+                        self.doc_conf_data["doc_destination"], markdown_writer.page_path
+                    ))
+            if self.doc_conf_data.get("doc_database", False):
+                self.doc_writers.append(DocDatabaseWriter(self.doc_conf_data["doc_destination"], self.gd_project))
+            with self.profiler.phase("scan_project_scripts"):
+                self.scan_project_scripts()
+            with self.profiler.phase("finish_docs"):
+                self.finish_docs()
 
         #
 
     def check_doc_conf_data(self):
         """
         Checks if the configuration data are correct. Exits directly after printing error message if not.
+
+        The settings are checked against the compiled SettingsSchema first, then the checks depending on several
+        settings follow. If the settings were already validated unchanged before (see Settings.mark_validated), those
+        are skipped. The checks on the file system (existence of src_path and of the scan_list files) always run, as
+        the files may have changed since.
         """
         # todo: point to according chapter/subsite in error msgs urls?
         print("Checking settings correctness before reading & building ...")
-        # print(self.doc_conf_data)
-        if "indent" in self.doc_conf_data:
-            self.indent: str = self.doc_conf_data["indent"]
-            if self.indent != "tabulator":
-                if not self.indent.startswith("spaces:"):
-                    print("Indent setting has to be either tabulator or spaces:number_of_spaces")
-                    exit(5)
-                else:
-                    try:
-                        number = int(self.indent.split(":", 1)[1].strip())
-                        if not (2 <= number >= 12):
-                            print("Indent spaces value error, only numbers between 2 and 12 are allowed")
-                            exit(5)
-                    except Exception as e:
-                        print(e)
-                        print('Indent spaces value error, only numbers are allowed after "spaces:"')
-                        exit(5)
-        if "doc_destination" not in self.doc_conf_data or self.doc_conf_data["doc_destination"] == "" \
-                or not isinstance(self.doc_conf_data["doc_destination"], str):
-            print(f"doc_destination not set in {self.doc_conf_file}, empty or wrong type")
-            print()
-            print("For a full user documentation, visit https://sbo-games-development.github.io/md_gd4_docs/userdoc/")
-            exit(5)
-        if "rebuild_src_path" not in self.doc_conf_data or not isinstance(self.doc_conf_data["rebuild_src_path"], bool):
-            print(f"rebuild_src_path not set in {self.doc_conf_file} or wrong type")
-            exit(5)
-        if "project_scan" not in self.doc_conf_data or not isinstance(self.doc_conf_data["rebuild_src_path"], bool):
-            print(f"project_scan not set in {self.doc_conf_file} or wrong type")
+        if not self.conf_validated:
+            self.validate_doc_conf_data()
+        self.io_workers = self.doc_conf_data.get("io_workers", self.IO_WORKERS)
+        self.check_doc_conf_files()
+
+    def check_doc_conf_files(self):
+        """
+        Checks that src_path and the files of the scan_list exist. Exits directly after printing error message if not.
+        """
+        if self.doc_conf_data["filelist_scan"]:
+            for element in self.doc_conf_data["scan_list"]:
+                if not isfile(element):
+                    print(f"Element {str(element)} in scan_list in {self.doc_conf_file} can't be scanned, file "
+                          f"doesn't exist")
+                    print()
+                    print(
+                        "For a full user documentation, visit "
+                        "https://sbo-games-development.github.io/md_gd4_docs/userdoc/"
+                    )
+                    exit(2)
+        if self.doc_conf_data["project_scan"] and not isdir(self.doc_conf_data["project_scan_options"]["src_path"]):
+            print(f"src_path in project_scan_options in {self.doc_conf_file} doesn't exist")
             print()
             print("For a full user documentation, visit https://sbo-games-development.github.io/md_gd4_docs/userdoc/")
-            exit(5)
-        if self.doc_conf_data["project_scan"]:
-            if "project_scan_options" not in self.doc_conf_data \
-                    or not isinstance(self.doc_conf_data["project_scan_options"], CommentedMap):
-                print(f"project_scan_options not set in {self.doc_conf_file}, wrong type or empty")
-                print("project_scan_options are needed if project_scan is true")
-                print()
-                print(
-                    "For a full user documentation, visit https://sbo-games-development.github.io/md_gd4_docs/userdoc/"
-                )
-                exit(5)
-            if "src_path" not in self.doc_conf_data["project_scan_options"] \
-                    or self.doc_conf_data["project_scan_options"]["src_path"] == ""\
-                    or not isinstance(self.doc_conf_data["project_scan_options"]["src_path"], str):
-                print(f"src_path wrong type or not set in project_scan_option in {self.doc_conf_file}")
-                print()
-                print(
-                    "For a full user documentation, visit https://sbo-games-development.github.io/md_gd4_docs/userdoc/")
-                exit(5)
-            if self.doc_conf_data["project_scan_options"]["src_path"] == self.doc_conf_data["doc_destination"]:
-                print(f"Conflicting options: src_path in project_scan_options can't be the same as doc_destination in "
-                      f"{self.doc_conf_file} settings file")
-                print()
-                print(
-                    "For a full user documentation, visit https://sbo-games-development.github.io/md_gd4_docs/userdoc/"
-                )
-                exit(5)
-            if "read_gd_project" not in self.doc_conf_data["project_scan_options"] \
-                    or not isinstance(self.doc_conf_data["project_scan_options"]["read_gd_project"], bool):
-                print(f"read_gd_project wrong type or not set in project_scan_option in {self.doc_conf_file}")
-                print()
-                print(
-                    "For a full user documentation, visit https://sbo-games-development.github.io/md_gd4_docs/userdoc/"
-                )
-                exit(5)
-            if "scene2src_links" not in self.doc_conf_data["project_scan_options"] \
-                    or not isinstance(self.doc_conf_data["project_scan_options"]["scene2src_links"], bool):
-                print(f"scene2src_links wrong type or not set in project_scan_option in {self.doc_conf_file}")
-                print()
-                print(
-                    "For a full user documentation, visit https://sbo-games-development.github.io/md_gd4_docs/userdoc/"
-                )
-                exit(5)
-            if not isdir(self.doc_conf_data["project_scan_options"]["src_path"]):
-                print(f"src_path in project_scan_options in {self.doc_conf_file} doesn't exist")
+            exit(2)
+
+    def validate_doc_conf_data(self):
+        """
+        Validates the settings against the schema and the checks between settings. Exits directly after printing error
+        message if not.
+        """
+        error = SettingsSchema.validate(self.doc_conf_data)
+        if error is not None:
+            message, show_url = error
+            print(message.format(file=self.doc_conf_file))
+            if show_url:
                 print()
                 print(
                     "For a full user documentation, visit https://sbo-games-development.github.io/md_gd4_docs/userdoc/"
                 )
-                exit(2)
-        if "filelist_scan" not in self.doc_conf_data or not isinstance(self.doc_conf_data["filelist_scan"], bool):
-            print(f"filelist_scan not set in {self.doc_conf_file} or wrong type")
+            exit(5)
+        try:
+            IndentStyle(self.doc_conf_data.get("indent", "tabulator"))
+        except ValueError as e:
+            print(e)
+            exit(5)
+        if self.doc_conf_data["project_scan"] \
+                and self.doc_conf_data["project_scan_options"]["src_path"] == self.doc_conf_data["doc_destination"]:
+            print(f"Conflicting options: src_path in project_scan_options can't be the same as doc_destination in "
+                  f"{self.doc_conf_file} settings file")
             print()
             print("For a full user documentation, visit https://sbo-games-development.github.io/md_gd4_docs/userdoc/")
             exit(5)
@@ -193,15 +283,6 @@ class Build:
             print("For a full user documentation, visit https://sbo-games-development.github.io/md_gd4_docs/userdoc/")
             exit(5)
         if self.doc_conf_data["filelist_scan"]:
-            if "scan_list" not in self.doc_conf_data \
-                    or not isinstance(self.doc_conf_data["scan_list"], CommentedSeq):
-                print(f"scan_list not set in {self.doc_conf_file}, wrong type or empty")
-                print("scan_list is needed if filelist_scan is true")
-                print()
-                print(
-                    "For a full user documentation, visit https://sbo-games-development.github.io/md_gd4_docs/userdoc/"
-                )
-                exit(5)
             if len(self.doc_conf_data["scan_list"]) < 1:
                 print(f"scan_list in {self.doc_conf_file} needs at least 1 file to scan, if file_list_scan is true")
                 print()
@@ -219,801 +300,676 @@ class Build:
                         "https://sbo-games-development.github.io/md_gd4_docs/userdoc/"
                     )
                     exit(5)
-                if not isfile(element):
-                    print(f"Element {str(element)} in scan_list in {self.doc_conf_file} can't be scanned, file "
-                          f"doesn't exist")
-                    print()
-                    print(
-                        "For a full user documentation, visit "
-                        "https://sbo-games-development.github.io/md_gd4_docs/userdoc/"
-                    )
-                    exit(2)
 
     def collect_proj_files_info(self):
         """
-        Recursively gathering *.gd files from the project.
+        Gathers *.gd and *.tscn files from the project in a single walk over src_path, skipping godot cache
+        directories, native addon binaries and the configured ignore_patterns.
 
-        Additionally, reads project.godot file if read_gd_project is true, and gathers *.scene files recursively if
-        scene2src_links is true, to link them to the correspondant .gd script source files
+        Additionally, reads project.godot file if read_gd_project is true, in a separate thread while walking the
+        project, and keeps the *.tscn files if scene2src_links is true, to link them to the correspondant .gd script
+        source files
         """
         print("Scanning godot project ...")
-        if self.doc_conf_data["project_scan_options"]["read_gd_project"]:
-            gd_proj_file = self.doc_conf_data["project_scan_options"]["src_path"] + "/project.godot"
-            if not isfile(gd_proj_file):
-                print(
-                    f"Warning: File '{gd_proj_file}' not found, skipping project index"
-                )
-            else:
-                try:
-                    with open(gd_proj_file, "r") as file:
-                        section = ""
-                        for line in file:
-                            line = line.strip()
-                            if line.startswith(";"):
-                                continue
-                            if line.startswith("[") and line.endswith("]"):
-                                section = line.strip("[").strip("]")
-                            if "config/name=" in line:
-                                project_name = line.replace("config/name=", "").strip('"')
-                                self.gd_project["project_name"] = project_name
-                                continue
-                            if "run/main_scene=" in line:
-                                main_scene = line.replace("run/main_scene=", "").strip('"')
-                                main_scene = main_scene.replace("res://", "")
-                                self.gd_project["main_scene"]["scene_path"] = main_scene
-                                continue
-                            if "config/features=PackedStringArray" in line:
-                                godot_version = line.replace(
-                                    "config/features=PackedStringArray", ""
-                                ).strip("(").strip(")")
-                                godot_version = godot_version.replace('"', "")
-                                self.gd_project["godot_version"] = godot_version
-                                continue
-                            if section == "autoload":
-                                if "=" in line:
-                                    line = line.split("=", 1)
-                                    scene_name = line[0]
-                                    scene_path = line[1]
-                                    scene_path = scene_path.replace("res://", "").strip('"')
-                                    scene_autoload_enabled = True if scene_path.startswith("*") else False
-                                    scene_path = scene_path.strip("*")
-                                    self.gd_project["autoload"].append({
-                                        "scene_path": scene_path,
-                                        "scene_name": scene_name,
-                                        "enabled": scene_autoload_enabled
-                                    })
-                except Exception as e:
-                    print(f"Skipping project index, reading {gd_proj_file} failed with Exception:")
-                    print(e)
-                    self.gd_project: dict = {
-                        "project_name": "",
-                        "godot_version": "",
-                        "main_scene": ""
-                    }
+        gd_proj_file = self.doc_conf_data["project_scan_options"]["src_path"] + "project.godot"
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            gd_project_future: Future | None = None
+            if self.doc_conf_data["project_scan_options"]["read_gd_project"] and isfile(gd_proj_file):
+                gd_project_future = executor.submit(self.read_gd_project, gd_proj_file)
+            walker = ProjectWalker(
+                self.doc_conf_data["project_scan_options"]["src_path"],
+                self.doc_conf_data["project_scan_options"].get("ignore_patterns", [])
+            )
+            tmp_script_files, tmp_scene_files = walker.walk()
+            print(f"Project tree walked: {walker.dirs_visited} directories and {walker.files_visited} files visited")
+            if self.doc_conf_data["project_scan_options"]["read_gd_project"]:
+                if gd_project_future is None:
+                    print(
+                        f"Warning: File '{gd_proj_file}' not found, skipping project index"
+                    )
                 else:
-                    print("Godot project file analyzed")
-        tmp_script_files = self.rec_find_files_with_ext(
-            "gd",
-            self.doc_conf_data["project_scan_options"]["src_path"]
-        )
-        tmp_script_files = [
-            element.replace(self.doc_conf_data["project_scan_options"]["src_path"], "")
-            for element in tmp_script_files
-        ]
+                    try:
+                        gd_project_future.result()
+                    except Exception as e:
+                        print(f"Skipping project index, reading {gd_proj_file} failed with Exception:")
+                        print(e)
+                        self.reset_gd_project()
+                    else:
+                        print("Godot project file analyzed")
         for file in tmp_script_files:
             self.script_files[file] = {
                 "scene": "",
+                "scenes": [],
                 "docs": []
             }
         print("Project script files list created")
         if self.doc_conf_data["project_scan_options"]["scene2src_links"]:
-            self.scene_files = self.rec_find_files_with_ext(
-                "tscn",
-                self.doc_conf_data["project_scan_options"]["src_path"]
-            )
-            self.scene_files = [
-                element.replace(self.doc_conf_data["project_scan_options"]["src_path"], "")
-                for element in self.scene_files
-            ]
+            self.scene_files = tmp_scene_files
+            self.uid_files = walker.files_by_ext.get("uid", [])
             print("Project scene files list created")
 
+    def read_gd_project(self, gd_proj_file: str):
+        """
+        Reads the project name, godot version, main scene, autoload scenes, input actions, layer names and enabled
+        editor plugins from the project.godot file into gd_project, parsing the file once with ProjectConfig. gd_project
+        is only reset and filled after the whole file was parsed, keeping its shape (see empty_gd_project).
+
+        Args:
+            gd_proj_file: Path to the project.godot file
+
+        Raises:
+            OSError: If the file can't be read
+            ValueError: If the file isn't valid ConfigFile syntax
+        """
+        config = ProjectConfig.read(gd_proj_file)
+        self.reset_gd_project()
+        self.gd_project["project_name"] = str(config.get("application", "config/name", ""))
+        self.gd_project["main_scene"]["scene_path"] = self.res_path(config.get("application", "run/main_scene", ""))
+        features = config.get("application", "config/features", [])
+        if isinstance(features, list):
+            self.gd_project["godot_version"] = ", ".join(str(feature) for feature in features)
+        for scene_name, scene_path in config.section("autoload").items():
+            if not isinstance(scene_path, str):
+                continue
+            self.gd_project["autoload"].append({
+                "scene_path": self.res_path(scene_path.lstrip("*")),
+                "scene_name": scene_name,
+                "added_script": "",
+                "enabled": scene_path.startswith("*")
+            })
+        self.gd_project["input_actions"] = list(config.section("input"))
+        self.gd_project["layer_names"] = {
+            layer: str(layer_name) for layer, layer_name in config.section("layer_names").items()
+        }
+        plugins = config.get("editor_plugins", "enabled", [])
+        if isinstance(plugins, list):
+            self.gd_project["plugins"] = [self.res_path(plugin) for plugin in plugins if isinstance(plugin, str)]
+
     @staticmethod
-    def rec_find_files_with_ext(file_extension: str, search_directory: str) -> list:
+    def res_path(path) -> str:
         """
-        Gathers a list of files with the given extension in the given directory
+        Converts a res:// path of project.godot into a path relative to src_path.
 
         Args:
-            file_extension: The extension of the files to search for. Example: gd (and NOT *.gd)
-            search_directory: The directory from which to scan for the files recursively
+            path: The res:// path
 
         Returns:
-            List with the full path of the files found with the given extension, relative to the working directory
+            The path without res://, "" if path isn't a str
         """
-        file_list: list = []
-        for root, dir_names, filenames in walk(search_directory):
-            for filename in filter(filenames, f"*.{file_extension}"):
-                file_list.append(join(root, filename))
-        return file_list
+        return path.removeprefix("res://") if isinstance(path, str) else ""
+
+    @staticmethod
+    def empty_gd_project() -> dict:
+        """
+        Creates an empty gd_project, with all attributes (see the class attributes).
+
+        Returns:
+            The gd_project, as if project.godot didn't set anything
+        """
+        return {
+            "project_name": "",
+            "godot_version": "",
+            "main_scene": {
+                "scene_path": "",
+                "added_script": ""
+            },
+            "autoload": [],
+            "input_actions": [],
+            "layer_names": {},
+            "plugins": []
+        }
+
+    def reset_gd_project(self):
+        """
+        Empties gd_project in place, as the doc_writers refer to it.
+        """
+        self.gd_project.clear()
+        self.gd_project.update(self.empty_gd_project())
 
     def connect_scene_to_script(self):
         """
-        Register scene connected to script where applicable
-        """
-        for scene in self.scene_files:
-            fp_scene = self.doc_conf_data["project_scan_options"]["src_path"] + scene
-            if isfile(fp_scene):
-                try:
-                    with open(fp_scene, "r") as file:
-                        for line in file:
-                            if 'ext_resource type="Script"' not in line:
-                                continue
-                            script_path = line.strip("[").strip("]")
-                            script_path = script_path.replace(
-                                'ext_resource type="Script" path="res://',
-                                ""
-                            )
-                            script_path = script_path.split('"', 1)[0]
-                            self.script_files[script_path]["scene"] = scene
-                            break
-                except Exception as e:
-                    print(f"Skipping file {fp_scene}, reading failed with exception:")
-                    print(e)
+        Register scenes connected to scripts where applicable. Only the ext_resource header of the scene files is read,
+        all scripts referenced by a scene (by path or by uid) are linked to it. The scene files are read by io_workers
+        threads, the links are registered in the order of scene_files
+        """
+        linker = SceneLinker(self.doc_conf_data["project_scan_options"]["src_path"], self.uid_files)
+        links = 0
+        with ThreadPoolExecutor(max_workers=self.io_workers) as executor:
+            scene_futures = [executor.submit(linker.scene_scripts, scene) for scene in self.scene_files]
+        for scene, scene_future in zip(self.scene_files, scene_futures):
+            try:
+                scripts = scene_future.result()
+            except OSError as e:
+                print(f"Skipping file {linker.src_path + scene}, reading failed with exception:")
+                print(e)
+                continue
+            if scripts:
+                self.scene_references[scene] = scripts
+            links += len(self.link_scene(scene))
+        self.profiler.count(bytes_read=linker.bytes_read)
+        print(f"Scenes linked to scripts: {links} links in {len(self.scene_files)} scenes, "
+              f"{linker.bytes_read / 1024:.1f} KiB read")
+
+    def link_scene(self, scene: str) -> list[str]:
+        """
+        Links a scene to the scripts of script_files it references (see scene_references), in the order of the scene
+        file. The scene has to be unlinked before.
+
+        Args:
+            scene: Path to the scene file, relative to src_path
+
+        Returns:
+            The scripts linked
+        """
+        linked_scripts = [script for script in self.scene_references.get(scene, []) if script in self.script_files]
+        for script in linked_scripts:
+            script_info = self.script_files[script]
+            script_info["scenes"].append(scene)
+            script_info["scene"] = script_info["scenes"][0]
+        if linked_scripts:
+            self.scene_scripts[scene] = linked_scripts
+        return linked_scripts
+
+    def unlink_scene(self, scene: str) -> list[str]:
+        """
+        Removes the links of a scene to its scripts.
+
+        Args:
+            scene: Path to the scene file, relative to src_path
+
+        Returns:
+            The scripts (still in script_files) the scene was linked to
+        """
+        unlinked_scripts: list[str] = []
+        for script in self.scene_scripts.pop(scene, []):
+            script_info = self.script_files.get(script)
+            if script_info is not None and scene in script_info["scenes"]:
+                script_info["scenes"].remove(scene)
+                script_info["scene"] = script_info["scenes"][0] if script_info["scenes"] else ""
+                unlinked_scripts.append(script)
+        return unlinked_scripts
 
     def scan_project_scripts(self):
         """
-        Initiates scans of docstrings for all scripts in the project
+        Initiates scans of docstrings for all scripts in the project, streaming the documentation of every script to
+        the doc_writers as soon as it's available, in the order of script_files. Scripts unchanged since the last
+        build are loaded from the scan cache instead, if enabled. The remaining scripts are scanned in parallel if
+        jobs > 1.
+
+        The documentation of a script is released once written, unless keep_doc_data is true. Before the first page is
+        written, the symbol_index is completed with the class declarations of the scripts it doesn't hold yet (see
+        index_declarations), so pages link to classes of scripts written after them. It is updated with the full
+        documentation of every script not loaded unchanged from the scan cache
         """
+        src_path = self.doc_conf_data["project_scan_options"]["src_path"]
+        url_stats = UrlChecker.stats()
+        cached_scripts: set[str] = set()
+        pending_scripts: list[str] = []
+        # size and modification time before scanning, for the scan cache entries of the scanned scripts
+        file_states: dict[str, tuple[int, int] | None] = {}
         for script in self.script_files:
-            self.doc_data.append(self.script_scanner(script))
+            if self.scan_cache is None:
+                pending_scripts.append(script)
+            elif self.scan_cache.is_fresh(src_path + script):
+                cached_scripts.add(script)
+            else:
+                pending_scripts.append(script)
+                file_states[script] = self.scan_cache.file_state(src_path + script)
+        self.symbol_index.prune(set(self.script_files))
+        # scripts shadowed by a class defined twice take the class over if the other script is gone
+        orphaned_scripts = {
+            script for key, scripts in self.symbol_index.shadowed.items() if key not in self.symbol_index.classes
+            for script in scripts
+        }
+        self.index_declarations([
+            script for script in self.script_files
+            if script not in cached_scripts or script not in self.symbol_index.scripts or script in orphaned_scripts
+        ])
+        scanned_docs = self.scan_scripts(pending_scripts)
+        autoload_scripts = self.autoload_scripts()
+        changed_classes: set[str] = set()
+        for script in self.script_files:
+            class_doc = None
+            if script in cached_scripts:
+                class_doc = self.scan_cache.load_doc(src_path + script)
+                if class_doc is None:
+                    file_state = self.scan_cache.file_state(src_path + script)
+                    class_doc = self.scan_script(script)
+                    self.scan_cache.store(src_path + script, class_doc, file_state)
+            else:
+                class_doc = next(scanned_docs)
+                if self.scan_cache is not None:
+                    self.scan_cache.store(src_path + script, class_doc, file_states[script])
+            if script not in cached_scripts or script not in self.symbol_index.scripts:
+                self.symbol_index.add(class_doc)
+            if script not in cached_scripts and self.explain_rebuild:
+                changed_classes.update(self.class_names(class_doc))
+            self.dependency_graph.set_script(
+                script, self.script_files[script]["scenes"], self.class_references(class_doc),
+                script in autoload_scripts
+            )
+            self.write_doc(class_doc, self.script_files[script])
+        if self.explain_rebuild:
+            print(f"Rebuild explained ({self.dependency_graph.summary()}), pages depending on scripts not loaded from "
+                  f"the scan cache:")
+            for line in self.dependency_graph.explain(
+                    self.dependency_graph.affected_pages(set(pending_scripts), changed_classes)
+            ):
+                print(line)
+        for key, scripts in sorted(self.symbol_index.shadowed.items()):
+            print(f"Warning: class {key} is defined by {self.symbol_index.class_script(key)} and {', '.join(scripts)}, "
+                  f"linking to the former")
+        if self.scan_cache is not None:
+            self.scan_cache.prune({src_path + script for script in self.script_files})
+            self.scan_cache.save()
+            self.symbol_index.save()
+            print(f"Project scripts scanned: {self.scan_cache.misses} scanned, {self.scan_cache.hits} loaded from "
+                  f"scan cache")
+        self.add_url_stats(UrlChecker.stats(url_stats))
+        print(f"Tutorial URLs checked: {self.url_stats['cached']} from cache, {self.url_stats['validated']} validated, "
+              f"{self.url_stats['rejected']} rejected without validation")
+
+    def index_declarations(self, scripts: list[str]):
+        """
+        Adds the class declarations of scripts to the symbol_index, read by io_workers threads. The full entries of the
+        scripts replace them once scanned.
 
-    def scan_filelist_scripts(self):
+        Args:
+            scripts: Paths of the scripts, relative to src_path
         """
-        ToDo! Or not needed?
+        if not scripts:
+            return
+        with ThreadPoolExecutor(max_workers=min(self.io_workers, len(scripts))) as executor:
+            for class_doc in executor.map(self.scanner.scan_declarations, scripts):
+                self.symbol_index.add(class_doc)
+
+    def add_url_stats(self, url_stats: dict):
         """
-        pass
+        Adds URL check counters, of the main or a worker process, to url_stats.
 
-    def script_scanner(self, script: str, from_project: bool = True) -> ClassDoc:
+        Args:
+            url_stats: The counters, see UrlChecker.stats
         """
-        Scans docstrings from script, registering docstring class, signal, enum, enum values, const, var, func, and
-        inner class categories
+        for name, count in url_stats.items():
+            self.url_stats[name] += count
 
-        Members of inner classes are not scanned at this time. Eventually becomes a feature in a future version.
+    def write_doc(self, class_doc: ClassDoc, script_info: dict = None):
+        """
+        Passes the documentation of a script on to all doc_writers, and keeps it in doc_data if keep_doc_data is true.
 
         Args:
-            script: Path to the script to read from
-            from_project: If True, the path of the script is relative to the project root (src_path)
+            class_doc: The documentation of the script
+            script_info: The script_files entry of the script, if any
         """
-        scan_stage: str = ""  # "", "brief_description", "detail_description", "args", "returns", "enum", "func"
-        tmp_brief_description = ""
-        tmp_detail_description = ""
-        tmp_args_description = []  # [name, type, description, value/default/required]
-        tmp_returns_description = []  # [type, description]
-        tmp_tags = []  # [tyg_type, (only if tag=@tutorial --> url, not required tutorial_name]
-        class_doc = ClassDoc(script)
-        if from_project:
-            fp_script = self.doc_conf_data["project_scan_options"]["src_path"] + script
+        for doc_writer in self.doc_writers:
+            doc_writer.write(class_doc, script_info)
+        if self.doc_conf_data.get("keep_doc_data", False):
+            self.doc_data.append(class_doc)
+
+    def finish_docs(self):
+        """
+        Lets all doc_writers write their remaining files (like the project index page), and reports the number of
+        markdown pages.
+        """
+        pages = 0
+        for doc_writer in self.doc_writers:
+            pages += doc_writer.finish()
+        doc_destination = self.doc_conf_data["doc_destination"]
+        if self.output_format in JsonWriter.FORMATS:
+            print(f"Documentation written: {self.output_format.upper()} export in {doc_destination}")
         else:
-            fp_script = script
+            print(f"Documentation written: {pages} pages in {doc_destination}")
+
+    def watch(self, debounce: float = 0.2):
+        """
+        Watches src_path for changes after the build, and updates the documentation of the changed files until
+        interrupted (Ctrl+C). Needs keep_doc_data to be true, to keep the documentation of the unchanged scripts.
+
+        Args:
+            debounce: Seconds without further changes before a burst of changes is processed
+        """
+        # imported on demand, the watcher (and ctypes) is only needed in watch mode
+        from src.control.project_watcher import ProjectWatcher
+
+        watcher = ProjectWatcher(
+            self.doc_conf_data["project_scan_options"]["src_path"],
+            self.doc_conf_data["project_scan_options"].get("ignore_patterns", []),
+            debounce
+        )
+        print(f"Watching {watcher.src_path} for changes ({watcher.backend}), press Ctrl+C to stop ...")
         try:
-            with (open(fp_script, "r") as file):
-                for line in file:
-                    class_doc.append_code_line(line)
-                    if scan_stage == "":
-                        if line.strip().startswith("##"):
-                            description_helper = line.replace("##", "", 1).strip()
-                            if not description_helper.replace("#", "").strip() == "":
-                                scan_stage = "brief_description"
-                                if description_helper.strip().startswith("Args:"):
-                                    scan_stage = "args"
-                                    tmp_args_indent = self.get_indent(line)
-
-                                    # todo: scan args line for more text
-
-                                    pass
-                                if description_helper.startswith("Returns:"):
-                                    scan_stage = "returns"
-                                    tmp_returns_indent = self.get_indent(line)
-
-                                    # todo: scan args line for more text
-
-                                    pass
-                                if description_helper.startswith("@tutorial"):
-                                    description_helper = description_helper.split(":", 1)
-                                    description_helper[1] = description_helper[1].strip()
-                                    if "(" in description_helper[0]:
-                                        if description_helper[0].endswith(")"):
-                                            tmp_list = description_helper[0].split("(", 1)
-                                            if tmp_list[0] == "@tutorial":
-                                                description_helper[0] = "@tutorial:"
-                                                description_helper.append(tmp_list[1].strip(")"))
-                                            else:
-                                                print(f"{line}: invalid @tutorial tag, skipping")
-                                                continue
-                                        else:
-                                            print(f"{line}: invalid @tutorial tag, skipping")
-                                            continue
-                                    tag_to_append = [description_helper[0], description_helper[1]]
-                                    if len(description_helper) > 2:
-                                        tag_to_append.append(description_helper[2])
-                                    if description_helper[0].endswith(":") and self.check_url(description_helper[1]):
-                                        tmp_tags.append(tag_to_append)
-                                    else:
-                                        print(f"{line}: invalid @tutorial tag or URL, skipping")
-                                        continue
-                                if description_helper.startswith("@deprecated"):
-                                    tmp_tags.append("@deprecated")
-                                if description_helper.startswith("@experimental"):
-                                    tmp_tags.append("@experimental")
-                                else:
-                                    tmp_brief_description = description_helper
-                            continue
-                        if line.strip().startswith("#"):
-                            #
-                            continue
-                        if line.strip().startswith("@export"):
-                            scan_stage = "@export"
-                            continue
-                        if line.strip().startswith("@onready"):
-                            scan_stage = "@onready"
-                            continue
-                        if "##" in line:
-                            if line.strip().startswith("signal"):
-                                com, doc = line.split("##", 1)
-                                signal_name = com.replace("signal", "", 1).strip()
-                                signal_description = doc.strip()
-                                class_doc.add_signal(signal_name, signal_description)
-                                scan_stage = ""
-                                tmp_brief_description = ""
-                                tmp_detail_description = ""
-                                tmp_tags = []
-                                continue
-                            if line.strip().startswith("enum"):
-                                scan_stage = "enum"
-                                com, doc = line.split("##", 1)
-                                enum_name = ""
-                                enum_description = doc.strip()
-                                com = com.strip()
-                                if com.endswith("{"):
-                                    com = com.replace("{", "").strip()
-                                tmp_enum_members: list[enum_members] = []
-                                if com.endswith("}"):
-                                    if "{" in com:
-                                        com, members = com.split("{", 1)
-                                        com = com.strip
-                                        members = members.rstrip("}").strip()
-                                        for member in members:
-                                            if "=" in com:
-                                                enum_member_value_name, enum_member_value_int = com.split("=")
-                                                enum_member_value_name = enum_member_value_name.strip()
-                                                enum_member_value_int = enum_member_value_int.strip()
-                                            else:
-                                                enum_member_value_name = com.strip()
-                                                if len(tmp_enum_members) < 1:
-                                                    enum_member_value_int = 0
-                                                else:
-                                                    enum_member_value_int = tmp_enum_members[-1].value_int + 1
-                                            tmp_enum_members.append(
-                                                EnumMemberDoc(enum_member_value_name, enum_member_value_int)
-                                            )
-                                        class_doc.add_enum(enum_name, enum_description, tmp_enum_members)
-                                        scan_stage = ""
-                                        tmp_brief_description = ""
-                                        tmp_detail_description = ""
-                                        tmp_tags = []
-                                        tmp_enum_members = []
-                                        continue
-                                    else:
-                                        print(f"Parenthesis error in line {line}, ignoring.")
-                                        continue
-                                enum_name = com.replace("enum", "", 1).strip()
-                                continue
-                            if line.strip().startswith("const"):
-                                var_type = "const"
-                                const_value = None
-                                const_data_type = "undefined"
-                                com, doc = line.split("##", 1)
-                                const_description = doc.strip()
-                                if "=" in com:
-                                    com, const_value = com.split("=", 1)
-                                    const_value = const_value.strip()
-                                    com = com.strip()
-                                if ":=" in com:
-                                    com, const_value = com.split("=", 1)
-                                    const_value = const_value.strip()
-                                    com = com.strip()
-                                if ":" in com:
-                                    com, const_data_type = com.split(":", 1)
-                                    const_data_type = const_data_type.strip()
-                                    com = com.strip()
-                                const_name = com.replace("const", "", 1).strip
-                                class_doc.add_attribute(
-                                    const_name, const_data_type, const_description, const_value, const_data_type
-                                )
-                                scan_stage = ""
-                                tmp_brief_description = ""
-                                tmp_detail_description = ""
-                                tmp_tags = []
-                                continue
-                            if line.strip().startswith("@export var") \
-                                    or line.strip().startswith("var") \
-                                    or line.strip().startswith("@onready var"):
-                                if line.strip().startswith("@export var"):
-                                    var_type = "@export var"
-                                if line.strip().startswith("var"):
-                                    var_type = "var"
-                                if line.strip().startswith("@onready var"):
-                                    var_type = "@onready var"
-                                var_value = None
-                                var_data_type = "undefined"
-                                com, doc = line.split("##", 1)
-                                var_description = doc.strip()
-                                if "=" in com:
-                                    com, var_value = com.split("=", 1)
-                                    var_value = var_value.strip()
-                                    com = com.strip()
-                                if ":=" in com:
-                                    com, var_value = com.split("=", 1)
-                                    var_value = var_value.strip()
-                                    com = com.strip()
-                                if ":" in com:
-                                    com, var_data_type = com.split(":", 1)
-                                    var_data_type = var_data_type.strip()
-                                    com = com.strip()
-                                var_name = com.replace("var", 1).strip()
-                                var_name = var_name.replace("@onready", 1).strip()
-                                var_name = var_name.replace("@export", 1).strip()
-                                class_doc.add_attribute(var_name, var_data_type, var_description, var_value, var_type)
-                                continue
-                            if line.strip().startswith("func"):
-                                scan_stage = "func"
-                                tmp_func_returns = "None"
-                                tmp_func_indent = self.get_indent(line)
-                                cmd, doc = line.split("##")
-                                tmp_brief_description = doc.strip
-                                cmd = cmd.replace("func").strip()
-                                if not cmd.endswith(":") or "(" not in cmd or ")" not in cmd:
-                                    scan_stage = ""
-                                    tmp_func_indent = ""
-                                    tmp_brief_description = ""
-                                    print(f"{line} is not a valid func, ignoring")
-                                    continue
-                                cmd = cmd.replace(":", "")
-                                if "->" in cmd:
-                                    cmd, tmp_func_returns = cmd.split("->")
-                                    tmp_func_returns = tmp_func_returns.strip()
-                                    cmd = cmd.strip()
-                                cmd, args = cmd.split("(", 1)
-                                cmd = cmd.strip()
-                                args = args.strip()
-                                if not args.endswith(")"):
-                                    scan_stage = ""
-                                    tmp_func_indent = ""
-                                    tmp_brief_description = ""
-                                    print(f"{line} is not a valid func, ignoring")
-                                    continue
-                                args = args.strip(")")
-                                if "," in args:
-                                    args = args.split(",")
-                                else:
-                                    args = [args, ]
-                                for arg in args:
-
-                                    pass
-                                # todo: implement func ## in line
-                                continue
-                            if line.strip().startswith("class"):
-                                scan_stage = "inner_class"
-                                tmp_inner_class_indent = self.get_indent(line)
-
-                                # todo: implement class ## in line
-
-                                continue
-                        if "class_name" in line:
-                            if line.startswith("class_name"):
-                                class_name_helper = line.replace("class_name", "").strip()
-                            else:
-                                class_name_helper = line.split("class_name", 1)[1].strip()
-                            class_name_helper = class_name_helper.split(" ", 1)[0]
-                            class_doc.set_class_name(class_name_helper)
-                        if "extends" in line:
-                            if line.startswith("extends"):
-                                extends_helper = line.replace("extends", "").strip()
-                            else:
-                                extends_helper = line.split("extends", 1)[1].strip()
-                            extends_helper = extends_helper.split(" ", 1)[0]
-                            class_doc.set_extends(extends_helper)
-                        continue
-                    if scan_stage == "brief_description":
-                        if line.strip().startswith("##"):
-                            description_helper = line.replace("##", "", 1).strip()
-                            if not description_helper.replace("#", "").strip() == "":
-                                tmp_brief_description += " " + description_helper
-                            else:
-                                scan_stage = "detail_description"
-                            continue
-                    if scan_stage == "detail_description":
-                        if line.strip().startswith("##"):
-                            description_helper = line.replace("##", "", 1)
-                            if description_helper.strip().startswith("Args:"):
-                                scan_stage = "args"
-                                continue
-                            if description_helper.strip().startswith("Returns:"):
-                                scan_stage = "returns"
-                                continue
-                            description_helper = description_helper.strip()
-                            if not description_helper.replace("#", "").strip() == "":
-                                if description_helper.startswith("@tutorial"):
-                                    description_helper = description_helper.split(":", 1)
-                                    description_helper[1] = description_helper[1].strip()
-                                    if "(" in description_helper[0]:
-                                        if description_helper[0].endswith(")"):
-                                            tmp_list = description_helper[0].split("(", 1)
-                                            if tmp_list[0] == "@tutorial":
-                                                description_helper[0] = "@tutorial:"
-                                                description_helper.append(tmp_list[1].strip(")"))
-                                            else:
-                                                print(f"{line}: invalid @tutorial tag, skipping")
-                                                continue
-                                        else:
-                                            print(f"{line}: invalid @tutorial tag, skipping")
-                                            continue
-                                    tag_to_append = [description_helper[0], description_helper[1]]
-                                    if len(description_helper) > 2:
-                                        tag_to_append.append(description_helper[2])
-                                    if description_helper[0].endswith(":") and self.check_url(description_helper[1]):
-                                        tmp_tags.append(tag_to_append)
-                                        continue
-                                    else:
-                                        print(f"{line}: invalid @tutorial tag, skipping")
-                                        continue
-                                    pass
-                                if description_helper.startswith("@deprecated"):
-                                    tmp_tags.append("@deprecated")
-                                    continue
-                                if description_helper.startswith("@experimental"):
-                                    tmp_tags.append("@experimental")
-                                    continue
-                                else:
-                                    if tmp_detail_description != "":
-                                        description_helper = " " + description_helper
-                                    tmp_detail_description += description_helper
-                                    continue
-                            else:
-                                tmp_detail_description += "\n\n"
-                                continue
-                    if scan_stage == "brief_description" or scan_stage == "detail_description":
-                        if not line.strip().startswith("##"):
-                            if line.strip().startswith("#"):
-                                #
-                                continue
-                            if line.strip().startswith("signal"):
-                                if "#" in line:
-                                    line = line.split("#", 1)[0]
-                                signal_name = line.replace("signal", "", 1).strip()
-                                signal_description = tmp_brief_description
-                                if tmp_detail_description != "":
-                                    signal_description = signal_description + "\n\n" + tmp_detail_description
-                                signal_tags: list[TagDoc] = []
-                                for tag in tmp_tags:
-                                    tutorial_url = ""
-                                    tutorial_name = ""
-                                    tag_type = tag[0]
-                                    if len(tag) > 1:
-                                        tutorial_url = tag[1]
-                                    if len(tag) > 2:
-                                        tutorial_name = tag[2]
-                                    signal_tags.append(TagDoc(tag_type, tutorial_url, tutorial_name))
-                                class_doc.add_signal(signal_name, signal_description, signal_tags)
-                                scan_stage = ""
-                                tmp_brief_description = ""
-                                tmp_detail_description = ""
-                                tmp_tags = []
-                                continue
-                            if line.strip().startswith("enum"):
-                                scan_stage = "enum"
-                                enum_name = ""
-                                if "#" in line:
-                                    line = line.split("#", 1)[0]
-                                line = line.strip()
-                                if line.endswith("{"):
-                                    line = line.replace("{", "").strip()
-                                enum_name = line.replace("enum", "", 1).strip()
-                                enum_members: list[enum_members] = []
-                                continue
-                            if line.strip().startswith("const"):
-                                var_type = "const"
-                                const_value = None
-                                const_data_type = "undefined"
-                                line = line.strip()
-                                if "#" in line:
-                                    line = line.split("#", 1)[0].strip()
-                                if "=" in line:
-                                    line, const_value = line.split("=", 1)
-                                    const_value = const_value.strip()
-                                    line = line.strip()
-                                if ":" in line:
-                                    line, const_data_type = line.split(":", 1)
-                                    const_data_type = const_data_type.strip()
-                                    line = line.strip()
-                                const_name = line.replace("const", "", 1).strip()
-                                const_description = tmp_brief_description
-                                if tmp_detail_description != "":
-                                    const_description = const_description + "\n\n" + tmp_brief_description
-                                const_tags: list[TagDoc] = []
-                                for tag in tmp_tags:
-                                    tutorial_url = ""
-                                    tutorial_name = ""
-                                    tag_type = tag[0]
-                                    if len(tag) > 1:
-                                        tutorial_url = tag[1]
-                                    if len(tag) > 2:
-                                        tutorial_name = tag[2]
-                                    const_tags.append(TagDoc(tag_type, tutorial_url, tutorial_name))
-                                class_doc.add_attribute(
-                                    const_name, const_data_type, const_description, const_value, var_type, const_tags
-                                )
-                                scan_stage = ""
-                                tmp_brief_description = ""
-                                tmp_detail_description = ""
-                                tmp_tags = []
-                                continue
-                            if line.strip().startswith("@export var") \
-                                    or line.strip().startswith("var") \
-                                    or line.strip().startswith("@onready var"):
-                                if "#" in line:
-                                    line = line.split("#", 1)[0].strip()
-                                if line.strip().startswith("@export var"):
-                                    var_type = "@export var"
-                                if line.strip().startswith("var"):
-                                    var_type = "var"
-                                if line.strip().startswith("@onready var"):
-                                    var_type = "@onready var"
-                                var_value = None
-                                var_data_type = "undefined"
-                                if "=" in line:
-                                    line, var_value = line.split("=", 1)
-                                    var_value = var_value.strip()
-                                    line = line.strip()
-                                elif ":=" in line:
-                                    line, var_value = line.split(":=", 1)
-                                    var_value = var_value.strip()
-                                    line = line.strip()
-                                if ":" in line:
-                                    line, var_data_type = line.split(":", 1)
-                                    var_data_type = var_data_type.strip()
-                                    line = line.strip()
-                                var_name = line.replace("var", "", 1).strip()
-                                var_name = var_name.replace("@onready", "", 1).strip()
-                                var_name = var_name.replace("@export", "", 1).strip()
-                                var_description = tmp_brief_description
-                                if tmp_detail_description != "":
-                                    var_description = var_description + "\n\n" + tmp_detail_description
-                                var_tags: list[TagDoc] = []
-                                for tag in tmp_tags:
-                                    tutorial_url = ""
-                                    tutorial_name = ""
-                                    tag_type = tag[0]
-                                    if len(tag) > 1:
-                                        tutorial_url = tag[1]
-                                    if len(tag) > 2:
-                                        tutorial_name = tag[2]
-                                    var_tags.append(TagDoc(tag_type, tutorial_url, tutorial_name))
-                                class_doc.add_attribute(
-                                    var_name, var_data_type, var_description, var_value, var_type, var_tags
-                                )
-                                scan_stage = ""
-                                tmp_brief_description = ""
-                                tmp_detail_description = ""
-                                tmp_tags = []
-                                continue
-                            if line.strip().startswith("@export"):
-                                scan_stage = "@export"
-                                continue
-                            if line.strip().startswith("@onready"):
-                                scan_stage = "@onready"
-                                continue
-                            if line.strip().startswith("func"):
-                                scan_stage = "func"
-                                tmp_func_indent = self.get_indent(line)
-
-                                # todo: implement func outer desc
-
-                                continue
-                            if line.strip().startswith("class"):
-                                scan_stage = "inner_class"
-                                tmp_inner_class_indent = self.get_indent(line)
-
-                                # todo: implement class outer desc
-
-                                continue
-                            # todo: should be class docstring if nothing of the above
-                    if scan_stage == "@export" or scan_stage == "@onready":
-                        if scan_stage == "@export":
-                            if not line.strip().startswith("var"):
-                                print("Warning: @export is not followed by var, ignoring ...")
-                                continue
-                            else:
-                                var_type = "@export var"
-                                pass
-                        if scan_stage == "@onready":
-                            if not line.strip().startswith("var"):
-                                print("Warning: @onready is not followed by var, ignoring ...")
-                                continue
-                            else:
-                                var_type = "@onready var"
-                                pass
-                        var_value = None
-                        var_data_type = "undefined"
-                        if "=" in line:
-                            line, var_value = line.split("=", 1)
-                            var_value = var_value.strip()
-                            line = line.strip()
-                        if ":=" in line:
-                            line, var_value = line.split(":=", 1)
-                            var_value = var_value.strip()
-                            line = line.strip()
-                        if ":" in line:
-                            line, var_data_type = line.split(":", 1)
-                            var_data_type = var_data_type.strip()
-                            line = line.strip()
-                        var_name = line.replace("var", "", 1).strip()
-                        var_name = var_name.replace("@onready", "", 1).strip()
-                        var_name = var_name.replace("@export", "", 1).strip()
-                        var_description = tmp_brief_description
-                        if tmp_detail_description != "":
-                            var_description = var_description + "\n\n" + tmp_detail_description
-                        var_tags: list[TagDoc] = []
-                        for tag in tmp_tags:
-                            tutorial_url = ""
-                            tutorial_name = ""
-                            tag_type = tag[0]
-                            if len(tag) > 1:
-                                tutorial_url = tag[1]
-                            if len(tag) > 2:
-                                tutorial_name = tag[2]
-                            var_tags.append(TagDoc(tag_type, tutorial_url, tutorial_name))
-                        class_doc.add_attribute(
-                            var_name, var_data_type, var_description, var_value, var_type, var_tags
-                        )
-                        scan_stage = ""
-                        tmp_brief_description = ""
-                        tmp_detail_description = ""
-                        tmp_tags = []
+            while True:
+                changed_files = watcher.wait_for_changes()
+                start = perf_counter()
+                pages = self.update_project(changed_files)
+                print(f"{len(changed_files)} changed file(s), {pages} page(s) updated in "
+                      f"{(perf_counter() - start) * 1000:.0f} ms")
+        except KeyboardInterrupt:
+            print("Watch mode stopped")
+        finally:
+            watcher.close()
+            if self.scan_cache is not None:
+                self.scan_cache.save()
+                self.symbol_index.save()
+
+    def update_project(self, changed_files: set[str]) -> int:
+        """
+        Updates the documentation after files of the project changed: re-scans changed scripts, re-links changed
+        scenes, re-reads project.godot and re-renders the pages depending on the changes (changed scripts, scripts
+        linked to a changed scene, referring to a class of a changed script or listed as autoload), as found in the
+        dependency_graph before and after the change, the pages of the base classes of changed scripts (listing their
+        subclasses) and the index page. Needs keep_doc_data to be true.
+
+        Scenes referencing a created or deleted script are relinked too, from scene_references. After the watcher lost
+        events, changed_files contains ProjectWatcher.RESYNC, and all known files are checked again.
+
+        Args:
+            changed_files: Paths of the changed, created or deleted files, relative to src_path. Paths ending with "/"
+                stand for a directory moved away, including all of its files, ProjectWatcher.RESYNC ("./") for all
+                files of the project
+
+        Returns:
+            Number of script pages re-rendered
+        """
+        src_path = self.doc_conf_data["project_scan_options"]["src_path"]
+        docs_by_script: dict[str, ClassDoc] = {class_doc.file_name: class_doc for class_doc in self.doc_data}
+        rescanned: set[str] = set()
+        removed: set[str] = set()
+        relinked: set[str] = set()
+        # "./" (after lost watcher events) is the prefix of all files, like a moved directory
+        for moved_dir in [path for path in changed_files if path.endswith("/")]:
+            prefix = "" if moved_dir == "./" else moved_dir
+            changed_files = changed_files | {script for script in self.script_files if script.startswith(prefix)}
+            changed_files = changed_files | {scene for scene in self.scene_files if scene.startswith(prefix)}
+            changed_files = changed_files | {uid_file for uid_file in self.uid_files if uid_file.startswith(prefix)}
+            if not prefix:
+                changed_files = changed_files | {"project.godot"}
+        created: set[str] = set()
+        for script in sorted(path for path in changed_files if path.endswith(".gd")):
+            if isfile(src_path + script):
+                if script not in self.script_files:
+                    self.script_files[script] = {"scene": "", "scenes": [], "docs": []}
+                    created.add(script)
+                rescanned.add(script)
+            elif script in self.script_files:
+                del self.script_files[script]
+                removed.add(script)
+        if self.doc_conf_data["project_scan_options"]["scene2src_links"]:
+            for uid_file in [path for path in changed_files if path.endswith(".uid")]:
+                if isfile(src_path + uid_file) and uid_file not in self.uid_files:
+                    self.uid_files.append(uid_file)
+                elif not isfile(src_path + uid_file) and uid_file in self.uid_files:
+                    self.uid_files.remove(uid_file)
+            linker = SceneLinker(src_path, self.uid_files)
+            changed_scenes = {path for path in changed_files if path.endswith(".tscn")}
+            # unchanged scenes referencing a created or deleted script, relinked without reading them again
+            referencing_scenes = {
+                scene for scene, scripts in self.scene_references.items()
+                if scene not in changed_scenes and not (created | removed).isdisjoint(scripts)
+            }
+            for scene in sorted(changed_scenes | referencing_scenes):
+                relinked.update(self.unlink_scene(scene))
+                if scene in changed_scenes:
+                    self.scene_references.pop(scene, None)
+                    if not isfile(src_path + scene):
+                        if scene in self.scene_files:
+                            self.scene_files.remove(scene)
                         continue
-                    if scan_stage == "enum":
-                        line = line.strip()
-                        if "#" in line and "##" not in line:
-                            line = line.split("#", 1)[0].strip()
-                        if line == "{" or line == "":
-                            continue
-                        if line.startswith("##"):
-                            line = line.replace("##", "").strip()
-                            if "enum_member_tmp_description" in locals():
-                                if enum_member_description != "" or enum_member_description is not None:
-                                    enum_member_description = enum_member_description + " " + line
-                                else:
-                                    enum_member_description = line
-                            else:
-                                enum_member_description = line
-                            continue
-                        if "##" in line:
-                            com, doc = line.split("##")
-                            com = com.strip()
-                            doc = doc.strip
-                            if "enum_member_tmp_description" in locals():
-                                if enum_member_description != "" or enum_member_description is not None:
-                                    enum_member_description = enum_member_description + " " + doc
-                                else:
-                                    enum_member_description = doc
-                            else:
-                                enum_member_description = doc
-                            if "=" in line:
-                                enum_member_value_name, enum_member_value_int = line.split("=")
-                                enum_member_value_name = enum_member_value_name.strip()
-                                enum_member_value_int = enum_member_value_int.strip()
-                            else:
-                                enum_member_value_name = line.strip()
-                                if len(tmp_enum_members) < 1:
-                                    enum_member_value_int = 0
-                                else:
-                                    enum_member_value_int = tmp_enum_members[-1].value_int + 1
-                            tmp_enum_members.append(
-                                EnumMemberDoc(enum_member_value_name, enum_member_value_int, enum_member_description)
-                            )
-                            continue
-                        if "=" in line:
-                            enum_member_value_name, enum_member_value_int = line.split("=")
-                            enum_member_value_name = enum_member_value_name.strip()
-                            enum_member_value_int = enum_member_value_int.strip()
-                        else:
-                            enum_member_value_name = line.strip()
-                            if len(tmp_enum_members) < 1:
-                                enum_member_value_int = 0
-                            else:
-                                enum_member_value_int = tmp_enum_members[-1].value_int + 1
-                        tmp_enum_members.append(
-                            EnumMemberDoc(enum_member_value_name, enum_member_value_int, enum_member_description)
-                        )
-                        if line.endswith("}"):
-                            enum_tags: list[TagDoc] = []
-                            for tag in tmp_tags:
-                                tutorial_url = ""
-                                tutorial_name = ""
-                                tag_type = tag[0]
-                                if len(tag) > 1:
-                                    tutorial_url = tag[1]
-                                if len(tag) > 2:
-                                    tutorial_name = tag[2]
-                                enum_tags.append(TagDoc(tag_type, tutorial_url, tutorial_name))
-                            class_doc.add_enum(enum_name, enum_description, tmp_enum_members, enum_tags)
-                            scan_stage = ""
-                            tmp_brief_description = ""
-                            tmp_detail_description = ""
-                            tmp_tags = []
-                            tmp_enum_members = []
+                    if scene not in self.scene_files:
+                        self.scene_files.append(scene)
+                    try:
+                        scripts = linker.scene_scripts(scene)
+                    except OSError as e:
+                        print(f"Skipping file {linker.src_path + scene}, reading failed with exception:")
+                        print(e)
                         continue
-                    if scan_stage == "args":
+                    if scripts:
+                        self.scene_references[scene] = scripts
+                relinked.update(self.link_scene(scene))
+        autoload_scripts = self.autoload_scripts()
+        if "project.godot" in changed_files and self.doc_conf_data["project_scan_options"]["read_gd_project"]:
+            try:
+                self.read_gd_project(src_path + "project.godot")
+            except Exception as e:
+                print(f"Skipping project index, reading {src_path}project.godot failed with Exception:")
+                print(e)
+                self.reset_gd_project()
+        self.link_gd_project_scripts()
+        changed_classes: set[str] = set()
+        # base classes of the changed scripts, before and after the change, their pages list the subclasses
+        changed_bases: set[str] = set()
+        for script in rescanned | removed:
+            if script in docs_by_script:
+                class_doc = docs_by_script.pop(script)
+                changed_classes.update(self.class_names(class_doc))
+                changed_bases.update(self.class_bases(class_doc))
+            self.symbol_index.remove(script)
+        for script in sorted(rescanned):
+            file_state = self.scan_cache.file_state(src_path + script) if self.scan_cache is not None else None
+            class_doc = self.scan_script(script)
+            if self.scan_cache is not None:
+                self.scan_cache.store(src_path + script, class_doc, file_state)
+            self.symbol_index.add(class_doc)
+            docs_by_script[script] = class_doc
+            changed_classes.update(self.class_names(class_doc))
+            changed_bases.update(self.class_bases(class_doc))
+        self.doc_data = [docs_by_script[script] for script in self.script_files if script in docs_by_script]
+        changed_inputs = rescanned | removed | {path for path in changed_files if path.endswith(".tscn")}
+        if "project.godot" in changed_files:
+            changed_inputs.add("project.godot")
+        # pages depending on the changed inputs before and after the change, e.g. on a class that moved to another page
+        affected_pages = self.dependency_graph.affected_pages(changed_inputs, changed_classes)
+        for script in removed:
+            self.dependency_graph.remove_script(script)
+        if "project.godot" in changed_inputs:
+            relinked = relinked | ((autoload_scripts | self.autoload_scripts()) & set(docs_by_script))
+        autoload_scripts = self.autoload_scripts()
+        for script in rescanned | relinked:
+            if script in docs_by_script and script in self.script_files:
+                self.dependency_graph.set_script(
+                    script, self.script_files[script]["scenes"], self.class_references(docs_by_script[script]),
+                    script in autoload_scripts
+                )
+        for page, inputs in self.dependency_graph.affected_pages(changed_inputs, changed_classes).items():
+            affected_pages.setdefault(page, set()).update(inputs)
+        for base in changed_bases:
+            base_script = self.symbol_index.class_script(base)
+            if base_script is not None and base_script not in rescanned | removed:
+                affected_pages.setdefault(base_script, set()).add(DependencyGraph.CLASS_PREFIX + base)
+        if self.explain_rebuild:
+            print(f"Rebuild explained ({self.dependency_graph.summary()}):")
+            for line in self.dependency_graph.explain(affected_pages):
+                print(line)
+        affected = set(affected_pages) | rescanned
+        for doc_writer in self.doc_writers:
+            for script in sorted(removed):
+                doc_writer.remove(script)
+            # the changed scripts first, so the pages referring to them link to their current classes
+            for class_doc in self.doc_data:
+                if class_doc.file_name in rescanned:
+                    doc_writer.write(class_doc, self.script_files[class_doc.file_name])
+            for class_doc in self.doc_data:
+                if class_doc.file_name in affected and class_doc.file_name not in rescanned:
+                    doc_writer.write(class_doc, self.script_files[class_doc.file_name])
+            doc_writer.finish()
+        return len(affected & set(self.script_files))
+
+    def link_gd_project_scripts(self):
+        """
+        Sets the added_script of the main scene and of every autoload in gd_project: the script itself for autoload
+        scripts, otherwise the first script linked to the scene (usually the script of its root node), "" if none. One
+        lookup in scene_scripts per scene, so the project index page links its scripts without scanning script_files.
+        """
+        main_scene = self.gd_project.get("main_scene")
+        if isinstance(main_scene, dict):
+            main_scene["added_script"] = self.scene_script(main_scene.get("scene_path", ""))
+        for autoload in self.gd_project.get("autoload", []):
+            autoload["added_script"] = self.scene_script(autoload["scene_path"])
 
-                        continue
-                    if scan_stage == "returns":
+    def scene_script(self, scene_path: str) -> str:
+        """
+        Gets the script added to a scene, or the script itself.
 
-                        continue
-                    if scan_stage == "func":
+        Args:
+            scene_path: Path of a scene or script, relative to src_path
 
-                        pass
-                    if scan_stage == "inner_class":
+        Returns:
+            Path of the script, "" if the scene has no (documented) script
+        """
+        if scene_path.endswith(".gd"):
+            return scene_path if scene_path in self.script_files else ""
+        scripts = self.scene_scripts.get(scene_path)
+        return scripts[0] if scripts else ""
 
-                        pass
-        except Exception as e:
+    def autoload_scripts(self) -> set[str]:
+        """
+        Gets the scripts registered as autoload in project.godot.
 
-            # todo: broader exception handling
+        Returns:
+            Paths of the autoload scripts, relative to src_path
+        """
+        return {autoload["scene_path"] for autoload in self.gd_project.get("autoload", [])}
+
+    @classmethod
+    def class_names(cls, class_doc: ClassDoc) -> set[str]:
+        """
+        Gets the names of a class and its inner classes.
+
+        Args:
+            class_doc: The documentation of the class
+
+        Returns:
+            The exposed class names
+        """
+        names = {class_doc.class_name} if class_doc.class_name != "not exposed" else set()
+        for inner_class_doc in class_doc.inner_class_docs:
+            names.update(cls.class_names(inner_class_doc))
+        return names
+
+    @classmethod
+    def class_bases(cls, class_doc: ClassDoc) -> set[str]:
+        """
+        Gets the base classes of a class and its inner classes.
+
+        Args:
+            class_doc: The documentation of the class
+
+        Returns:
+            The class keys of the base classes, see SymbolIndex.base_key
+        """
+        bases = {SymbolIndex.base_key(class_doc.extends)} if class_doc.extends else set()
+        for inner_class_doc in class_doc.inner_class_docs:
+            bases.update(cls.class_bases(inner_class_doc))
+        return bases
+
+    @classmethod
+    def class_references(cls, class_doc: ClassDoc) -> set[str]:
+        """
+        Gets the data types a class and its inner classes refer to (extends, consts, vars, function args and return
+        types), the ones pages link to.
+
+        Args:
+            class_doc: The documentation of the class
+
+        Returns:
+            The data types referred to
+        """
+        references = {class_doc.extends}
+        references.update(var_doc.data_type for var_doc in class_doc.const_docs)
+        references.update(var_doc.data_type for var_doc in class_doc.var_docs)
+        for func_doc in class_doc.func_docs:
+            references.add(func_doc.return_type)
+            references.update(arg.data_type for arg in func_doc.args)
+        for inner_class_doc in class_doc.inner_class_docs:
+            references.update(cls.class_references(inner_class_doc))
+        return references
+
+    def scan_scripts(self, scripts: list[str], from_project: bool = True) -> Iterator[ClassDoc]:
+        """
+        Scans the docstrings of several scripts, fanning them out in chunks to a pool of worker processes if jobs > 1.
+        The documentation is yielded script by script, as soon as it's scanned. At most two chunks per worker process
+        are scanned ahead of the script being yielded, so finished documentation doesn't pile up in memory. The scans
+        are timed if the profiler records script timings.
+
+        Falls back to scanning in the main process if the worker processes can't be started or break down.
+
+        Args:
+            scripts: Paths to the scripts to read from
+            from_project: If True, the paths of the scripts are relative to the project root (src_path)
+
+        Returns:
+            The ClassDoc of every script, in the same order as scripts
+        """
+        timed = self.profiler.script_timings
+        if self.jobs <= 1 or len(scripts) < 2:
+            for script in scripts:
+                yield self.scan_script(script, from_project)
+            return
+        # imported on demand, multiprocessing is only needed for scanning in worker processes
+        from concurrent.futures import ProcessPoolExecutor
+        from concurrent.futures.process import BrokenProcessPool
+
+        chunk_size = max(1, -(-len(scripts) // (self.jobs * 4)))
+        chunks = [scripts[i:i + chunk_size] for i in range(0, len(scripts), chunk_size)]
+        scanned = 0
+        try:
+            with ProcessPoolExecutor(max_workers=min(self.jobs, len(chunks))) as executor:
+                pending_chunks: deque[tuple[list[str], Future]] = deque()
+                next_chunk = 0
+                while scanned < len(scripts):
+                    while next_chunk < len(chunks) and len(pending_chunks) < self.jobs * 2:
+                        pending_chunks.append((chunks[next_chunk], executor.submit(
+                            self.scanner.scan_chunk, chunks[next_chunk], from_project, timed
+                        )))
+                        next_chunk += 1
+                    chunk, chunk_future = pending_chunks.popleft()
+                    results, url_stats = chunk_future.result()
+                    self.add_url_stats(url_stats)
+                    for script, result in zip(chunk, results):
+                        scanned += 1
+                        if timed:
+                            result, timing = result
+                            self.profiler.add_script(script, timing)
+                        yield result
+        except (OSError, BrokenProcessPool) as e:
+            print("Scanning scripts in parallel failed with exception, scanning in a single process:")
             print(e)
-        return class_doc
+            for script in scripts[scanned:]:
+                yield self.scan_script(script, from_project)
 
-    @staticmethod
-    def check_url(url_to_check: str) -> bool:
+    def scan_script(self, script: str, from_project: bool = True) -> ClassDoc:
         """
-        Checks the pattern of an HTTP(S) URL address. Doesn't check if address exists.
+        Scans a single script in the main process, timed if the profiler records script timings.
 
         Args:
-            url_to_check: URL address to check
+            script: Path to the script to read from
+            from_project: If True, the path of the script is relative to the project root (src_path)
 
         Returns:
-            True if HTTP(S) URL address pattern is valid, otherwise False
+            The documentation of the script
         """
-        if url(url_to_check):
-            if url_to_check.startswith("http://") or url_to_check.startswith("https://"):
-                return True
-        return False
+        if not self.profiler.script_timings:
+            return self.scanner.scan(script, from_project)
+        class_doc, timing = self.scanner.scan_timed(script, from_project)
+        self.profiler.add_script(script, timing)
+        return class_doc
 
-    def get_indent(self, line: str) -> str:
+    def script_scanner(self, script: str, from_project: bool = True) -> ClassDoc:
         """
-        Form the indent of a line as a string consisting either of tabulators or spaces. Can be used to remove a
-        trailing indent on multiple code lines.
+        Scans docstrings from script, registering docstring class, signal, enum, enum values, const, var, func, and
+        inner class categories
 
         Args:
-            line: The str to count indent of
+            script: Path to the script to read from
+            from_project: If True, the path of the script is relative to the project root (src_path)
 
         Returns:
-            Indent as str, consisting of tabulator(s) or spaces
-        """
-        if self.indent == "tabulator":
-            indent_count = len(line) - len(line.lstrip("\t"))
-            indent_str = ""
-            if indent_count > 0:
-                for i in range(indent_count):
-                    indent_str = indent_str + "\t"
-                    pass
-        else:
-            number = int(self.indent.split(":", 1)[1].strip())
-            if self.indent % number == 0:
-                indent_count = int((len(line) - len(line.lstrip(" "))) / number)
-                indent_str = ""
-                one_indent = ""
-                for i in range(number):
-                    one_indent = one_indent + " "
-                for i in range(indent_count):
-                    indent_str = indent_str + one_indent
-            else:
-                indent_str = "undefined"
-        return indent_str
+            The documentation of the script
+        """
+        return self.scanner.scan(script, from_project)
+
+    def scan_filelist_scripts(self):
+        """
+        ToDo! Or not needed?
+        """
+        pass
@@ -0,0 +1,129 @@
+from cProfile import Profile
+from contextlib import contextmanager
+from json import dump
+from time import perf_counter, process_time
+
+
+class BuildProfiler:
+    """
+    Records timings of a build: wall and CPU time, bytes read and line counts of every build phase and, if enabled,
+    of every scanned script.
+
+    The per-script timings are measured by the ScriptScanner (also in worker processes) and added with add_script.
+    Optionally, the whole build in the main process is profiled with cProfile as well.
+
+    Attributes:
+        script_timings: Records per-script timings if True
+        phases: Name, wall time, CPU time, bytes and lines of every phase, in the order the phases ended
+        scripts: Script, wall time, CPU time, bytes and lines of every scanned script
+        profile: The cProfile profiler, if enabled
+    """
+    def __init__(self, script_timings: bool = False):
+        """
+        Constructor of the build profiler.
+
+        Args:
+            script_timings: Records per-script timings if True
+        """
+        self.script_timings: bool = script_timings
+        self.phases: list[dict] = []
+        self.scripts: list[dict] = []
+        self.profile: Profile | None = None
+        self._current_phase: dict | None = None
+
+    @contextmanager
+    def phase(self, name: str):
+        """
+        Measures a build phase, used as context manager. Phases may be nested, bytes and lines are counted for the
+        innermost phase.
+
+        Args:
+            name: Name of the phase
+        """
+        outer_phase = self._current_phase
+        record = {"name": name, "wall": 0.0, "cpu": 0.0, "bytes": 0, "lines": 0}
+        self._current_phase = record
+        start_wall = perf_counter()
+        start_cpu = process_time()
+        try:
+            yield record
+        finally:
+            record["wall"] = perf_counter() - start_wall
+            record["cpu"] = process_time() - start_cpu
+            self._current_phase = outer_phase
+            self.phases.append(record)
+
+    def count(self, bytes_read: int = 0, lines: int = 0):
+        """
+        Adds bytes read and lines to the current phase.
+
+        Args:
+            bytes_read: Number of bytes read
+            lines: Number of lines read
+        """
+        if self._current_phase is not None:
+            self._current_phase["bytes"] += bytes_read
+            self._current_phase["lines"] += lines
+
+    def add_script(self, script: str, timing: dict):
+        """
+        Adds the timing of a scanned script, and counts its bytes and lines for the current phase.
+
+        Args:
+            script: Path to the script
+            timing: wall, cpu, bytes and lines of the scan, as measured by ScriptScanner.scan_timed
+        """
+        self.scripts.append({"script": script, **timing})
+        self.count(timing["bytes"], timing["lines"])
+
+    def enable_cprofile(self):
+        """
+        Starts profiling the main process with cProfile.
+        """
+        self.profile = Profile()
+        self.profile.enable()
+
+    def dump_pstats(self, pstats_file: str):
+        """
+        Stops cProfile profiling and writes the statistics, to be read with the pstats module or tools like snakeviz.
+
+        Args:
+            pstats_file: Path to the file to write
+        """
+        if self.profile is None:
+            return
+        self.profile.disable()
+        self.profile.dump_stats(pstats_file)
+        print(f"cProfile statistics written to {pstats_file}")
+
+    def report(self, top: int = 10):
+        """
+        Prints the phases and the slowest scripts.
+
+        Args:
+            top: Number of slowest scripts to print
+        """
+        print()
+        print(f"{'Phase':<28} {'wall ms':>10} {'cpu ms':>10} {'KiB':>10} {'lines':>10}")
+        for record in self.phases:
+            print(f"{record['name']:<28} {record['wall'] * 1000:>10.1f} {record['cpu'] * 1000:>10.1f} "
+                  f"{record['bytes'] / 1024:>10.1f} {record['lines']:>10}")
+        if self.scripts and top > 0:
+            print()
+            print(f"Slowest {min(top, len(self.scripts))} of {len(self.scripts)} scanned scripts:")
+            print(f"{'wall ms':>10} {'cpu ms':>10} {'KiB':>10} {'lines':>10}  script")
+            for record in sorted(self.scripts, key=lambda script: script["wall"], reverse=True)[:top]:
+                print(f"{record['wall'] * 1000:>10.2f} {record['cpu'] * 1000:>10.2f} {record['bytes'] / 1024:>10.1f} "
+                      f"{record['lines']:>10}  {record['script']}")
+        print()
+
+    def write_json(self, json_file: str):
+        """
+        Writes all recorded timings as JSON, e.g. to compare builds in CI.
+
+        Args:
+            json_file: Path to the file to write
+        """
+        with open(json_file, "w", encoding="utf-8") as file:
+            dump({"phases": self.phases, "scripts": self.scripts}, file, indent=2)
+        print(f"Build timings written to {json_file}")
@@ -0,0 +1,151 @@
+class DependencyGraph:
+    """
+    Records which documentation pages depend on which inputs, to regenerate only the affected pages after a change.
+
+    Pages are named by the script they document, the project index page by INDEX_PAGE. Inputs are the files of the
+    project (scripts, scenes and project.godot, relative to src_path) and classes, named "class:" followed by the class
+    name. The page of a script depends on
+    * the script itself,
+    * the scenes linked to it (listed on the page),
+    * the classes it refers to (extends, data types), as their links on the page change with the scripts defining
+      them,
+    * project.godot, if the script is an autoload (listed on the page).
+    The index page depends on every script (title and brief description) and on project.godot.
+
+    The edges are kept in both directions, so the pages depending on a changed input are found with O(1) lookups.
+
+    Attributes:
+        dependencies: Inputs of every page, keyed by page
+        dependents: Pages depending on every input, keyed by input
+    """
+    INDEX_PAGE: str = "index"
+    PROJECT_FILE: str = "project.godot"
+    CLASS_PREFIX: str = "class:"
+
+    def __init__(self):
+        """
+        Constructor of the dependency graph.
+        """
+        self.dependencies: dict[str, set[str]] = {self.INDEX_PAGE: {self.PROJECT_FILE}}
+        self.dependents: dict[str, set[str]] = {self.PROJECT_FILE: {self.INDEX_PAGE}}
+
+    def set_page(self, page: str, inputs: set[str]):
+        """
+        Sets the inputs of a page, replacing its previous ones.
+
+        Args:
+            page: The page
+            inputs: All inputs the page depends on
+        """
+        self.remove_page(page)
+        self.dependencies[page] = set(inputs)
+        for page_input in inputs:
+            self.dependents.setdefault(page_input, set()).add(page)
+
+    def remove_page(self, page: str):
+        """
+        Drops a page and its edges.
+
+        Args:
+            page: The page
+        """
+        for page_input in self.dependencies.pop(page, ()):
+            pages = self.dependents[page_input]
+            pages.discard(page)
+            if not pages:
+                del self.dependents[page_input]
+
+    def add_input(self, page: str, page_input: str):
+        """
+        Adds a single input to a page.
+
+        Args:
+            page: The page
+            page_input: The input the page depends on
+        """
+        self.dependencies.setdefault(page, set()).add(page_input)
+        self.dependents.setdefault(page_input, set()).add(page)
+
+    def remove_input(self, page: str, page_input: str):
+        """
+        Drops a single input of a page.
+
+        Args:
+            page: The page
+            page_input: The input the page doesn't depend on anymore
+        """
+        self.dependencies.get(page, set()).discard(page_input)
+        pages = self.dependents.get(page_input)
+        if pages is not None:
+            pages.discard(page)
+            if not pages:
+                del self.dependents[page_input]
+
+    def set_script(self, script: str, scenes: list[str], class_references: set[str], autoload: bool = False):
+        """
+        Sets the inputs of the page of a script, and adds the script to the inputs of the index page.
+
+        Args:
+            script: Path of the script, relative to src_path
+            scenes: Paths of the scenes linked to the script
+            class_references: Names of the classes the script refers to
+            autoload: True if the script is an autoload of the project
+        """
+        inputs = {script}
+        inputs.update(scenes)
+        inputs.update(self.CLASS_PREFIX + name for name in class_references if name and name != "undefined")
+        if autoload:
+            inputs.add(self.PROJECT_FILE)
+        self.set_page(script, inputs)
+        self.add_input(self.INDEX_PAGE, script)
+
+    def remove_script(self, script: str):
+        """
+        Drops the page of a script that doesn't exist anymore.
+
+        Args:
+            script: Path of the script, relative to src_path
+        """
+        self.remove_page(script)
+        self.remove_input(self.INDEX_PAGE, script)
+
+    def affected_pages(self, changed_files: set[str], changed_classes: set[str] = None) -> dict[str, set[str]]:
+        """
+        Gets the pages to regenerate after inputs changed.
+
+        Args:
+            changed_files: Changed, created or deleted files, relative to src_path
+            changed_classes: Names of the classes defined by the changed scripts, before and after the change
+
+        Returns:
+            The changed inputs causing the regeneration, keyed by affected page
+        """
+        affected: dict[str, set[str]] = {}
+        changed_inputs = set(changed_files)
+        changed_inputs.update(self.CLASS_PREFIX + name for name in changed_classes or ())
+        for changed_input in changed_inputs:
+            for page in self.dependents.get(changed_input, ()):
+                affected.setdefault(page, set()).add(changed_input)
+        return affected
+
+    def explain(self, affected: dict[str, set[str]]) -> list[str]:
+        """
+        Describes why pages are regenerated, for debugging.
+
+        Args:
+            affected: The changed inputs causing the regeneration, keyed by page, see affected_pages
+
+        Returns:
+            One line per page, naming the inputs it is regenerated for
+        """
+        return [f"  {page} <- {', '.join(sorted(affected[page]))}" for page in sorted(affected)]
+
+    def summary(self) -> str:
+        """
+        Describes the size of the graph.
+
+        Returns:
+            Number of pages, inputs and edges
+        """
+        edges = sum(len(inputs) for inputs in self.dependencies.values())
+        return f"{len(self.dependencies)} pages, {len(self.dependents)} inputs, {edges} edges"
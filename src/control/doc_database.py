@@ -0,0 +1,214 @@
+import sqlite3
+from json import loads
+from os.path import getsize, isfile
+
+
+class DocDatabase:
+    """
+    Reader for the documentation database written by the DocDatabaseWriter at build, to look up the documentation of
+    single classes and members without scanning scripts or loading every page.
+
+    The database is an SQLite file with one row per script (linked scenes), one row per class (the class record of the
+    JSON export, see JsonWriter.class_record, without the inner classes) and one row per member (signal, enum, enum
+    member, const, var or func record), keyed like in the SymbolIndex. The records are stored as JSON, so a lookup
+    decodes only the rows it asks for, and opening a database never runs code from it. The file is read through mmap
+    (PRAGMA mmap_size), so repeated point queries don't copy pages through read calls.
+
+    Attributes:
+        db_file: Path to the database file
+        connection: Read-only connection to the database
+    """
+    DB_FORMAT: int = 2
+    MMAP_SIZE: int = 256 * 1024 * 1024
+    SCHEMA: tuple = (
+        "CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT NOT NULL)",
+        "CREATE TABLE scripts (script TEXT PRIMARY KEY, class_key TEXT NOT NULL, scenes TEXT NOT NULL)",
+        "CREATE TABLE classes (class_key TEXT PRIMARY KEY, script TEXT NOT NULL, extends TEXT NOT NULL, "
+        "doc TEXT NOT NULL)",
+        "CREATE TABLE members (qualified_name TEXT PRIMARY KEY, name TEXT NOT NULL, kind TEXT NOT NULL, "
+        "script TEXT NOT NULL, class_key TEXT NOT NULL, doc TEXT)",
+        "CREATE INDEX classes_script ON classes (script)",
+        "CREATE INDEX members_name ON members (name)",
+        "CREATE INDEX members_script ON members (script)",
+        "CREATE INDEX members_class_key ON members (class_key)"
+    )
+
+    def __init__(self, db_file: str):
+        """
+        Constructor of the reader, opens the database read-only.
+
+        Args:
+            db_file: Path to the database file
+
+        Raises:
+            FileNotFoundError: If the database file doesn't exist
+            ValueError: If the database was written in another format
+        """
+        if not isfile(db_file):
+            raise FileNotFoundError(f"Documentation database {db_file} doesn't exist")
+        self.db_file: str = db_file
+        self.connection: sqlite3.Connection = sqlite3.connect(f"file:{db_file}?mode=ro", uri=True)
+        self.connection.execute(f"PRAGMA mmap_size = {min(max(getsize(db_file), 1), self.MMAP_SIZE)}")
+        db_format = self.meta("db_format")
+        if db_format != str(self.DB_FORMAT):
+            self.connection.close()
+            raise ValueError(f"Documentation database {db_file} has format {db_format}, expected {self.DB_FORMAT}")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        """
+        Closes the connection to the database.
+        """
+        self.connection.close()
+
+    def meta(self, key: str) -> str | None:
+        """
+        Gets a meta value of the database.
+
+        Args:
+            key: db_format, generator_version or gd_project (as JSON)
+
+        Returns:
+            The value, None if not set
+        """
+        row = self.connection.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def gd_project(self) -> dict:
+        """
+        Gets the information extracted from the project.godot file at build.
+
+        Returns:
+            The gd_project of the build
+        """
+        return loads(self.meta("gd_project") or "{}")
+
+    def scripts(self) -> list[str]:
+        """
+        Gets the paths of all documented scripts.
+
+        Returns:
+            The paths, relative to the project root, sorted
+        """
+        return [row[0] for row in self.connection.execute("SELECT script FROM scripts ORDER BY script")]
+
+    def scenes(self, script: str) -> list[str]:
+        """
+        Gets the scenes linked to a script.
+
+        Args:
+            script: Path of the script, relative to the project root
+
+        Returns:
+            The paths of the scenes, empty if the script is unknown
+        """
+        row = self.connection.execute("SELECT scenes FROM scripts WHERE script = ?", (script,)).fetchone()
+        return loads(row[0]) if row else []
+
+    def script_doc(self, script: str) -> dict | None:
+        """
+        Gets the documentation of a script, decoding only the rows of its classes.
+
+        Args:
+            script: Path of the script, relative to the project root
+
+        Returns:
+            The class record of the script, including its inner classes, see JsonWriter.class_record. None if unknown,
+            or if the class name of the script is defined by another script too
+        """
+        row = self.connection.execute("SELECT class_key FROM scripts WHERE script = ?", (script,)).fetchone()
+        if row is None or self.class_script(row[0]) != script:
+            return None
+        return self.class_doc(row[0])
+
+    def class_script(self, class_key: str) -> str | None:
+        """
+        Gets the script defining a class.
+
+        Args:
+            class_key: The class name, qualified with the outer classes for inner classes (like Player.Stats), or the
+                path of the script for scripts without class_name
+
+        Returns:
+            Path of the script, None if unknown
+        """
+        row = self.connection.execute("SELECT script FROM classes WHERE class_key = ?", (class_key,)).fetchone()
+        return row[0] if row else None
+
+    def class_doc(self, class_key: str) -> dict | None:
+        """
+        Gets the documentation of a class, decoding only its row and the rows of its inner classes.
+
+        Args:
+            class_key: The class name, see class_script
+
+        Returns:
+            The class record, including its inner classes, see JsonWriter.class_record. None if unknown
+        """
+        row = self.connection.execute("SELECT doc FROM classes WHERE class_key = ?", (class_key,)).fetchone()
+        if row is None:
+            return None
+        record = loads(row[0])
+        # the rows of the inner classes in the order of the script, as inserted
+        inner_class_keys = self.connection.execute(
+            "SELECT qualified_name FROM members WHERE class_key = ? AND kind = 'class' ORDER BY rowid", (class_key,)
+        ).fetchall()
+        inner_records = [self.class_doc(inner_class_key) for (inner_class_key,) in inner_class_keys]
+        record["inner_classes"] = [inner_record for inner_record in inner_records if inner_record is not None]
+        return record
+
+    def find_members(self, name: str) -> list[tuple[str, str, str, str]]:
+        """
+        Finds all members with a name, in any class.
+
+        Args:
+            name: The member name, like health (or State.IDLE for members of named enums)
+
+        Returns:
+            Qualified name, kind, script and class key of every member with that name, sorted by qualified name
+        """
+        return self.connection.execute(
+            "SELECT qualified_name, kind, script, class_key FROM members WHERE name = ? ORDER BY qualified_name",
+            (name,)
+        ).fetchall()
+
+    def member(self, qualified_name: str) -> tuple[str, str, str] | None:
+        """
+        Gets where a member is defined.
+
+        Args:
+            qualified_name: Class key and member name, joined with "." (like Player.Stats.health)
+
+        Returns:
+            Kind (signal, enum, enum_member, const, var, func or class), script and class key of the member, None if
+            unknown
+        """
+        return self.connection.execute(
+            "SELECT kind, script, class_key FROM members WHERE qualified_name = ?", (qualified_name,)
+        ).fetchone()
+
+    def member_doc(self, qualified_name: str) -> dict | None:
+        """
+        Gets the documentation of a member, decoding only its row.
+
+        Args:
+            qualified_name: Class key and member name, joined with "."
+
+        Returns:
+            The record of the member, like in the class records of JsonWriter: a signal, enum, enum member, var (consts
+            and vars) or func record, or the class record of inner classes. None if unknown
+        """
+        row = self.connection.execute(
+            "SELECT kind, doc FROM members WHERE qualified_name = ?", (qualified_name,)
+        ).fetchone()
+        if row is None:
+            return None
+        kind, doc = row
+        if kind == "class":
+            return self.class_doc(qualified_name)
+        return loads(doc)
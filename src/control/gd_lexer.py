@@ -0,0 +1,264 @@
+from re import compile, VERBOSE
+
+from src.model.source_buffer import SourceBuffer
+
+
+class Token:
+    """
+    A single logical line (or block of doc comment lines) of a GDScript file, as produced by the GdLexer.
+
+    Attributes:
+        kind: One of the GdLexer token kinds (DOC, BLANK, ANNOTATION, DECL or CODE)
+        indent: Number of indent characters (tabulators or spaces) in front of the line
+        start: Byte offset of the start of the line in the source buffer
+        end: Byte offset after the end of the line, for a func DECL after the end of the function body
+        keyword: The declaration keyword of a DECL token (e.g. "func", "var", "static func"), otherwise ""
+        annotations: Annotations in front of the line or keyword (e.g. ["@export"])
+        code: The code after the keyword, without comments
+        doc: The text after ## of the lines of a DOC token (one line per doc comment line), or the inline ## doc
+            comment after the code of other tokens
+    """
+    __slots__ = ("kind", "indent", "start", "end", "keyword", "annotations", "code", "doc")
+
+    def __init__(
+            self,
+            kind: str,
+            indent: int,
+            start: int,
+            end: int,
+            keyword: str = "",
+            annotations: list[str] = None,
+            code: str = "",
+            doc: str = ""
+    ):
+        """
+        Constructor of the token.
+
+        Args:
+            kind: One of the GdLexer token kinds
+            indent: Number of indent characters in front of the line
+            start: Byte offset of the start of the line
+            end: Byte offset after the end of the line (or function body)
+            keyword: The declaration keyword of a DECL token
+            annotations: Annotations in front of the line or keyword
+            code: The code after the keyword, without comments
+            doc: Doc comment text of the line
+        """
+        self.kind: str = kind
+        self.indent: int = indent
+        self.start: int = start
+        self.end: int = end
+        self.keyword: str = keyword
+        self.annotations: list[str] = annotations if annotations is not None else []
+        self.code: str = code
+        self.doc: str = doc
+
+    def __repr__(self) -> str:
+        return f"Token({self.kind}, {self.indent}, {self.keyword!r}, {self.annotations!r}, {self.code!r}, {self.doc!r})"
+
+
+class GdLexer:
+    """
+    Splits a GDScript source buffer into tokens, one per logical line, using precompiled regular expressions.
+
+    Doc comment lines (##), blank lines, annotation lines, declarations (class_name, extends, signal, enum, const,
+    var, func, class) and any other code lines are told apart by a single match per line. Consecutive doc comment
+    lines are matched at once and become a single DOC token. Plain comments (#) are dropped. The bodies of functions
+    and the setter/getter bodies of properties are skipped with one search for the next line that isn't indented
+    deeper, so they never get tokenized line by line.
+    """
+    DOC: str = "DOC"
+    BLANK: str = "BLANK"
+    ANNOTATION: str = "ANNOTATION"
+    DECL: str = "DECL"
+    CODE: str = "CODE"
+
+    LINE_PATTERN = compile(rb"""
+        (?P<indent>[ \t]*+)
+        (?:
+            (?P<doc>\#\#[^\n]*+(?:\n[ \t]*+\#\#[^\n]*+)*+)
+          | \#[^\n]*+
+          | (?P<annotations>(?:@\w++(?:\([^)\n]*+\))?+[ \t]*+)*+)
+            (?:(?P<keyword>(?:static[ \t]++)?(?:func|var)|signal|enum|const|class_name|extends|class)\b[ \t]*+)?+
+            (?P<code>(?:[^\#"'\n]++|"(?:[^"\\\n]|\\.)*+"|'(?:[^'\\\n]|\\.)*+')*+)
+            (?:\#\#(?P<inline_doc>[^\n]*+)|\#[^\n]*+)?+
+        )
+        (?:\n|$)
+    """, VERBOSE)
+    ANNOTATION_PATTERN = compile(r"@\w+(?:\([^)]*\))?")
+    STRING_PATTERN = compile(r""""(?:[^"\\]|\\.)*"|'(?:[^'\\]|\\.)*'""")
+    _body_end_patterns: dict = {}
+
+    @classmethod
+    def body_end_pattern(cls, indent: int):
+        """
+        Gets the precompiled pattern finding the end of a block, i.e. the next line with code or a doc comment that is
+        not indented deeper than indent. Plain comments and blank lines don't end a block.
+
+        Args:
+            indent: Number of indent characters of the line opening the block
+
+        Returns:
+            The compiled pattern, matching the linebreak in front of the first line after the block
+        """
+        pattern = cls._body_end_patterns.get(indent)
+        if pattern is None:
+            pattern = compile(rb"\n(?=[ \t]{0,%d}(?:[^ \t\n\r#]|##))" % indent)
+            cls._body_end_patterns[indent] = pattern
+        return pattern
+
+    @classmethod
+    def bracket_depth(cls, code: str) -> int:
+        """
+        Counts the brackets opened but not closed in a piece of code, ignoring brackets in string literals.
+
+        Args:
+            code: The code to count the brackets of
+
+        Returns:
+            Number of open brackets, negative if more brackets are closed than opened
+        """
+        if '"' in code or "'" in code:
+            code = cls.STRING_PATTERN.sub("", code)
+        return code.count("(") + code.count("[") + code.count("{") \
+            - code.count(")") - code.count("]") - code.count("}")
+
+    @classmethod
+    def tokenize(cls, source: SourceBuffer) -> list[Token]:
+        """
+        Tokenizes a GDScript source buffer.
+
+        Args:
+            source: The buffer holding the script
+
+        Returns:
+            The tokens of the script, in source order
+        """
+        data = source.data
+        size = len(data)
+        match_line = cls.LINE_PATTERN.match
+        tokens: list[Token] = []
+        position = 0
+        while position < size:
+            match = match_line(data, position)
+            if match is None:
+                # unterminated string literal or the like, keep the line as plain code
+                line_end = data.find(b"\n", position)
+                line_end = size if line_end == -1 else line_end + 1
+                line = data[position:line_end].decode("utf-8", errors="replace")
+                stripped = line.lstrip(" \t")
+                tokens.append(Token(cls.CODE, len(line) - len(stripped), position, line_end, code=stripped.strip()))
+                position = line_end
+                continue
+            line_end = match.end()
+            indent, doc, annotations, keyword, code, inline_doc = match.group(
+                "indent", "doc", "annotations", "keyword", "code", "inline_doc"
+            )
+            if doc is not None:
+                doc = "\n".join(
+                    line.lstrip(" \t")[2:] for line in doc.decode("utf-8", "replace").split("\n")
+                )
+                tokens.append(Token(cls.DOC, len(indent), position, line_end, doc=doc))
+            elif code is None:
+                # plain comment line
+                pass
+            elif keyword is not None:
+                token = Token(
+                    cls.DECL,
+                    len(indent),
+                    position,
+                    line_end,
+                    b" ".join(keyword.split()).decode(),
+                    cls.ANNOTATION_PATTERN.findall(annotations.decode("utf-8", "replace")) if annotations else None,
+                    code.decode("utf-8", "replace").strip(),
+                    inline_doc.decode("utf-8", "replace").strip() if inline_doc is not None else ""
+                )
+                if token.keyword.endswith("func"):
+                    line_end = cls.read_func(data, token, match_line)
+                elif token.keyword.endswith("var") and token.code.endswith(":") and cls.bracket_depth(token.code) == 0:
+                    line_end = cls.skip_block(data, token.indent, line_end)
+                tokens.append(token)
+            elif annotations:
+                tokens.append(Token(
+                    cls.ANNOTATION,
+                    len(indent),
+                    position,
+                    line_end,
+                    annotations=cls.ANNOTATION_PATTERN.findall(annotations.decode("utf-8", "replace")),
+                    code=code.decode("utf-8", "replace").strip(),
+                    doc=inline_doc.decode("utf-8", "replace").strip() if inline_doc is not None else ""
+                ))
+            elif code.strip():
+                tokens.append(Token(
+                    cls.CODE,
+                    len(indent),
+                    position,
+                    line_end,
+                    code=code.decode("utf-8", "replace").strip(),
+                    doc=inline_doc.decode("utf-8", "replace").strip() if inline_doc is not None else ""
+                ))
+            else:
+                tokens.append(Token(cls.BLANK, len(indent), position, line_end))
+            position = line_end
+        return tokens
+
+    @classmethod
+    def skip_block(cls, data, indent: int, block_start: int) -> int:
+        """
+        Skips an indented block, like the set/get bodies of a property declared with "var name: type:".
+
+        Args:
+            data: The source buffer data
+            indent: Number of indent characters of the line opening the block
+            block_start: Byte offset of the first line of the block
+
+        Returns:
+            Byte offset of the first line after the block
+        """
+        block_end = cls.body_end_pattern(indent).search(data, block_start - 1)
+        return len(data) if block_end is None else block_end.start() + 1
+
+    @classmethod
+    def read_func(cls, data, token: Token, match_line) -> int:
+        """
+        Completes a func DECL token: joins the lines of a multi-line function signature into its code and skips the
+        function body. The end of the token is set to the end of the last line of the body.
+
+        Args:
+            data: The source buffer data
+            token: The func DECL token, holding the first line of the signature
+            match_line: The match method of LINE_PATTERN
+
+        Returns:
+            Byte offset of the first line after the function
+        """
+        size = len(data)
+        header_end = token.end
+        depth = cls.bracket_depth(token.code)
+        while depth > 0 and header_end < size:
+            match = match_line(data, header_end)
+            if match is None:
+                break
+            code = match.group("code")
+            if code:
+                code = code.decode("utf-8", "replace").strip()
+                token.code = token.code + " " + code
+                depth += cls.bracket_depth(code)
+            if match.group("inline_doc") is not None and not token.doc:
+                token.doc = match.group("inline_doc").decode("utf-8", "replace").strip()
+            header_end = match.end()
+        if header_end >= size:
+            token.end = size
+            return size
+        block_end = cls.body_end_pattern(token.indent).search(data, header_end - 1)
+        body_end = size if block_end is None else block_end.start() + 1
+        token.end = body_end
+        # trailing blank and comment lines belong to the following code, not to the function body
+        while token.end > header_end:
+            line_start = data.rfind(b"\n", header_end, token.end - 1) + 1
+            if line_start <= header_end:
+                line_start = header_end
+            if data[line_start:token.end].strip() and not data[line_start:token.end].lstrip().startswith(b"#"):
+                break
+            token.end = line_start
+        return body_end
@@ -0,0 +1,567 @@
+from re import compile, MULTILINE
+
+from src.control.gd_lexer import GdLexer, Token
+from src.model.class_doc import ClassDoc
+from src.model.enum_member_doc import EnumMemberDoc
+from src.model.source_buffer import SourceBuffer
+from src.model.tag_doc import TagDoc
+from src.model.var_doc import VarDoc
+
+
+class DocBlock:
+    """
+    The parsed content of a block of ## doc comment lines.
+
+    Attributes:
+        brief_description: First paragraph of the block
+        detail_description: All further paragraphs, separated by an empty line
+        tags: Tags of the block (@tutorial, @deprecated, @experimental)
+        args: Descriptions from the Args: section, keyed by argument name
+        returns: Description from the Returns: section
+        returns_type: Data type in front of the Returns: description (like bool in "bool: True if ..."), "" if none
+    """
+    __slots__ = ("brief_description", "detail_description", "tags", "args", "returns", "returns_type")
+
+    def __init__(self):
+        """
+        Constructor of an empty doc block.
+        """
+        self.brief_description: str = ""
+        self.detail_description: str = ""
+        self.tags: list[TagDoc] = []
+        self.args: dict[str, str] = {}
+        self.returns: str = ""
+        self.returns_type: str = ""
+
+    @property
+    def description(self) -> str:
+        """
+        Brief and detail description, separated by an empty line.
+        """
+        if self.detail_description:
+            return self.brief_description + "\n\n" + self.detail_description
+        return self.brief_description
+
+
+class GdParser:
+    """
+    Builds the ClassDoc of a script from the tokens of the GdLexer.
+
+    The parser is table-driven: doc comment lines are collected until the next declaration, then the handler registered
+    for the keyword of the declaration in DECL_HANDLERS consumes the declaration together with the collected doc block
+    and annotations. A doc block separated by a blank line before any member (or in front of class_name/extends) is the
+    description of the script class. Inner classes get their own ClassDoc with their members.
+
+    Only documented signals, enums, consts, vars and funcs are registered, i.e. members with a doc block in front or an
+    inline ## doc comment.
+
+    Attributes:
+        source: The buffer holding the script
+        class_doc: The documentation of the script to fill
+        check_url: Function to check the URL of @tutorial tags
+        columnar: Stores consts and vars of inner classes column-wise if True, see ClassDoc
+    """
+    DECL_HANDLERS: dict[str, str] = {
+        "class_name": "parse_class_name",
+        "extends": "parse_extends",
+        "signal": "parse_signal",
+        "enum": "parse_enum",
+        "const": "parse_attribute",
+        "var": "parse_attribute",
+        "static var": "parse_attribute",
+        "func": "parse_func",
+        "static func": "parse_func",
+        "class": "parse_inner_class"
+    }
+    GROUP_ANNOTATIONS: tuple = ("@export_group", "@export_subgroup", "@export_category")
+    ATTRIBUTE_PATTERN = compile(r"(?P<name>\w+)\s*(?::(?!=)\s*(?P<data_type>[^=]*?))?\s*(?::?=\s*(?P<value>.*?))?\s*$")
+    ACCESSOR_PATTERN = compile(r"\s*:\s*(?:set|get)\b.*$|\s*:$")
+    FUNC_PATTERN = compile(r"(?P<name>\w+)\s*\((?P<args>.*)\)\s*(?:->\s*(?P<returns>[^:]+?))?\s*:(?P<body>.*)$")
+    SIGNAL_PATTERN = compile(r"(?P<name>\w+)\s*(?:\((?P<args>.*)\))?")
+    CLASS_PATTERN = compile(r"(?P<name>\w+)(?:\s+extends\s+(?P<extends>\"[^\"]*\"|'[^']*'|[^:]+?))?\s*:?\s*$")
+    ENUM_PATTERN = compile(r"(?P<name>\w*)\s*\{?(?P<members>.*)$")
+    ENUM_MEMBER_PATTERN = compile(r"\s*(?P<name>\w+)\s*(?:=\s*(?P<value>[^,]+?))?\s*$")
+    TUTORIAL_PATTERN = compile(r"@tutorial(?:\((?P<name>[^)]*)\))?\s*:\s*(?P<url>\S+)\s*$")
+    ARG_DOC_PATTERN = compile(r"(?P<name>\w+)\s*(?:\([^)]*\))?\s*:\s*(?P<description>.*)$")
+    SECTION_PATTERN = compile(r"(?P<section>Args|Arguments|Parameters|Returns|Return)\s*:\s*(?P<text>.*)$")
+    DECLARATION_PATTERN = compile(
+        rb"^(?P<indent>[ \t]*)(?P<keyword>class_name|extends|class)[ \t]+(?P<code>[^\n#]*)", MULTILINE
+    )
+    RETURNS_TYPE_PATTERN = compile(r"(?P<data_type>[A-Za-z_]\w*(?:\[[\w, ]*\])?)\s*:\s*(?P<description>.*)$")
+
+    def __init__(self, source: SourceBuffer, class_doc: ClassDoc, check_url, columnar: bool = False):
+        """
+        Constructor of the parser.
+
+        Args:
+            source: The buffer holding the script
+            class_doc: The documentation of the script to fill
+            check_url: Function to check the URL of @tutorial tags, returning True for valid URLs
+            columnar: Stores consts and vars of inner classes column-wise if True
+        """
+        self.source: SourceBuffer = source
+        self.class_doc: ClassDoc = class_doc
+        self.check_url = check_url
+        self.columnar: bool = columnar
+        self._tokens: list[Token] = []
+        self._index: int = 0
+        self._class_stack: list[tuple[ClassDoc, int]] = []
+        self._class_doc_open: bool = True
+
+    def parse(self) -> ClassDoc:
+        """
+        Tokenizes and parses the script.
+
+        Returns:
+            The filled documentation of the script
+        """
+        self._tokens = GdLexer.tokenize(self.source)
+        self._class_stack = [(self.class_doc, -1)]
+        self._class_doc_open = True
+        doc_tokens: list[Token] = []
+        annotations: list[str] = []
+        tokens = self._tokens
+        self._index = 0
+        while self._index < len(tokens):
+            token = tokens[self._index]
+            self._index += 1
+            kind = token.kind
+            if kind == GdLexer.BLANK:
+                if doc_tokens and self._class_doc_open and len(self._class_stack) == 1:
+                    self.set_class_description(self.class_doc, self.parse_doc_block(doc_tokens))
+                doc_tokens = []
+                annotations = []
+                continue
+            while token.indent <= self._class_stack[-1][1]:
+                self._class_stack.pop()
+            if kind == GdLexer.DOC:
+                doc_tokens.append(token)
+            elif kind == GdLexer.ANNOTATION:
+                if token.code or any(annotation.startswith(self.GROUP_ANNOTATIONS) for annotation in token.annotations):
+                    # inspector groups and annotated statements don't belong to the next member
+                    doc_tokens = []
+                    annotations = []
+                else:
+                    annotations.extend(token.annotations)
+            elif kind == GdLexer.DECL:
+                handler = getattr(self, self.DECL_HANDLERS[token.keyword])
+                handler(token, doc_tokens, annotations + token.annotations)
+                doc_tokens = []
+                annotations = []
+            else:
+                doc_tokens = []
+                annotations = []
+        if doc_tokens and self._class_doc_open:
+            self.set_class_description(self.class_doc, self.parse_doc_block(doc_tokens))
+        return self.class_doc
+
+    @classmethod
+    def parse_declarations(cls, source: SourceBuffer, class_doc: ClassDoc) -> ClassDoc:
+        """
+        Reads only the class declarations of a script (class_name, extends and inner classes, nested by their indent)
+        with one search over the source, without tokenizing it, for completing the symbol index before the scripts
+        are scanned.
+
+        Args:
+            source: The buffer holding the script
+            class_doc: The documentation of the script to fill
+
+        Returns:
+            The documentation of the script, with class name, base class and inner classes only
+        """
+        class_stack: list[tuple[ClassDoc, int]] = [(class_doc, -1)]
+        for match in cls.DECLARATION_PATTERN.finditer(source.data):
+            indent = len(match.group("indent"))
+            code = match.group("code").decode("utf-8", "replace").strip()
+            while indent <= class_stack[-1][1]:
+                class_stack.pop()
+            keyword = match.group("keyword")
+            if keyword == b"extends":
+                class_stack[-1][0].set_extends(code.split(" ", 1)[0].rstrip(":"))
+                continue
+            class_match = cls.CLASS_PATTERN.match(code)
+            if class_match is None:
+                continue
+            if keyword == b"class_name":
+                class_doc.set_class_name(class_match.group("name"))
+                current_doc = class_doc
+            else:
+                current_doc = ClassDoc(class_doc.file_name, class_match.group("name"), True)
+                class_stack[-1][0].inner_class_docs.append(current_doc)
+                class_stack.append((current_doc, indent))
+            if class_match.group("extends"):
+                current_doc.set_extends(class_match.group("extends").strip())
+        return class_doc
+
+    @property
+    def current_class(self) -> ClassDoc:
+        """
+        The class (script class or inner class) the current declaration belongs to.
+        """
+        return self._class_stack[-1][0]
+
+    def set_class_description(self, class_doc: ClassDoc, doc_block: DocBlock):
+        """
+        Sets the descriptions and tags of a class from a doc block.
+
+        Args:
+            class_doc: The class documentation to set
+            doc_block: The parsed doc block of the class
+        """
+        class_doc.brief_description = doc_block.brief_description
+        class_doc.detail_description = doc_block.detail_description
+        class_doc.set_tags(doc_block.tags)
+        if class_doc is self.class_doc:
+            self._class_doc_open = False
+
+    def parse_doc_block(self, doc_tokens: list[Token], inline_doc: str = "") -> DocBlock:
+        """
+        Parses the lines of a doc comment block into descriptions, tags and Args:/Returns: sections.
+
+        Args:
+            doc_tokens: The DOC tokens of the block
+            inline_doc: Inline ## doc comment of the declaration, appended as own paragraph
+
+        Returns:
+            The parsed doc block
+        """
+        doc_block = DocBlock()
+        paragraphs: list[list[str]] = [[]]
+        section = ""
+        section_indent = 0
+        arg_name = ""
+        match_section = self.SECTION_PATTERN.match
+        for raw_line in [line for token in doc_tokens for line in token.doc.split("\n")]:
+            line = raw_line.strip()
+            if section:
+                if not line:
+                    section = ""
+                    continue
+                if len(raw_line) - len(raw_line.lstrip()) > section_indent:
+                    if section == "args":
+                        match = self.ARG_DOC_PATTERN.match(line)
+                        if match is not None and (not arg_name or match.group("name") not in doc_block.args):
+                            arg_name = match.group("name")
+                            doc_block.args[arg_name] = match.group("description").strip()
+                        elif arg_name:
+                            doc_block.args[arg_name] = (doc_block.args[arg_name] + " " + line).strip()
+                    else:
+                        doc_block.returns = (doc_block.returns + " " + line).strip()
+                    continue
+                section = ""
+            if not line or not line.strip("#"):
+                if paragraphs[-1]:
+                    paragraphs.append([])
+                continue
+            first = line[0]
+            if first == "@":
+                tag = self.parse_tag(line)
+                if tag is not None:
+                    doc_block.tags.append(tag)
+                continue
+            match = match_section(line) if first in "APR" else None
+            if match is not None:
+                section = "returns" if match.group("section").startswith("Return") else "args"
+                section_indent = len(raw_line) - len(raw_line.lstrip())
+                arg_name = ""
+                if section == "returns":
+                    doc_block.returns = match.group("text").strip()
+                continue
+            paragraphs[-1].append(line)
+        match = self.RETURNS_TYPE_PATTERN.match(doc_block.returns)
+        if match is not None:
+            doc_block.returns_type = match.group("data_type")
+            doc_block.returns = match.group("description")
+        if inline_doc:
+            paragraphs.append([inline_doc])
+        paragraphs = [" ".join(paragraph) for paragraph in paragraphs if paragraph]
+        if paragraphs:
+            doc_block.brief_description = paragraphs[0]
+            doc_block.detail_description = "\n\n".join(paragraphs[1:])
+        return doc_block
+
+    def parse_tag(self, line: str) -> TagDoc | None:
+        """
+        Parses a tag line of a doc block.
+
+        Args:
+            line: The stripped doc line, starting with @
+
+        Returns:
+            The tag, or None if the tag is invalid or unknown
+        """
+        if line.startswith("@tutorial"):
+            match = self.TUTORIAL_PATTERN.match(line)
+            if match is None or not self.check_url(match.group("url")):
+                print(f"{line}: invalid @tutorial tag or URL, skipping")
+                return None
+            return TagDoc("@tutorial", match.group("url"), (match.group("name") or "").strip())
+        for tag_type in ("@deprecated", "@experimental"):
+            if line.startswith(tag_type):
+                return TagDoc(tag_type)
+        print(f"{line}: unknown tag, skipping")
+        return None
+
+    def parse_class_name(self, token: Token, doc_tokens: list[Token], annotations: list[str]):
+        """
+        Handles a class_name declaration, optionally followed by extends on the same line.
+        """
+        match = self.CLASS_PATTERN.match(token.code)
+        if match is None:
+            print(f"class_name {token.code} is not a valid class name, ignoring")
+            return
+        self.class_doc.set_class_name(match.group("name"))
+        if match.group("extends"):
+            self.class_doc.set_extends(match.group("extends").strip())
+        if doc_tokens and self._class_doc_open:
+            self.set_class_description(self.class_doc, self.parse_doc_block(doc_tokens, token.doc))
+
+    def parse_extends(self, token: Token, doc_tokens: list[Token], annotations: list[str]):
+        """
+        Handles an extends declaration.
+        """
+        self.current_class.set_extends(token.code.split(" ", 1)[0].rstrip(":"))
+        if doc_tokens and self._class_doc_open:
+            self.set_class_description(self.class_doc, self.parse_doc_block(doc_tokens, token.doc))
+
+    def parse_signal(self, token: Token, doc_tokens: list[Token], annotations: list[str]):
+        """
+        Handles a signal declaration, with its arguments spanning multiple lines joined. Argument descriptions are
+        taken from the Args: section of the doc block.
+        """
+        self._class_doc_open = False
+        if not doc_tokens and not token.doc:
+            return
+        code = self.join_lines(token.code)
+        match = self.SIGNAL_PATTERN.match(code)
+        if match is None:
+            print(f"signal {code} is not a valid signal, ignoring")
+            return
+        doc_block = self.parse_doc_block(doc_tokens, token.doc)
+        self.current_class.add_signal(
+            match.group("name"),
+            doc_block.description,
+            doc_block.tags,
+            self.parse_args(match.group("args") or "", doc_block, f"signal {match.group('name')}")
+        )
+
+    def parse_enum(self, token: Token, doc_tokens: list[Token], annotations: list[str]):
+        """
+        Handles an enum declaration, on a single line or with one or more members per line. Doc comments in front of
+        a member line and inline doc comments after it describe the (last) member of the line.
+        """
+        self._class_doc_open = False
+        match = self.ENUM_PATTERN.match(token.code)
+        members: list[EnumMemberDoc] = []
+        member_doc: list[str] = []
+        code = match.group("members")
+        enum_closed = "}" in code
+        self.add_enum_members(members, code.split("}", 1)[0], member_doc, "")
+        while not enum_closed and self._index < len(self._tokens):
+            member_token = self._tokens[self._index]
+            if member_token.kind == GdLexer.DECL:
+                print(f"Parenthesis error in enum {token.code}, ignoring the rest of the enum")
+                break
+            self._index += 1
+            if member_token.kind == GdLexer.DOC:
+                member_doc.extend(line.strip() for line in member_token.doc.split("\n") if line.strip())
+                continue
+            if member_token.kind != GdLexer.CODE:
+                continue
+            enum_closed = "}" in member_token.code
+            self.add_enum_members(
+                members, member_token.code.split("}", 1)[0].lstrip("{"), member_doc, member_token.doc
+            )
+        if not doc_tokens and not token.doc:
+            return
+        doc_block = self.parse_doc_block(doc_tokens, token.doc)
+        self.current_class.add_enum(match.group("name"), doc_block.description, members, doc_block.tags)
+
+    def add_enum_members(self, members: list[EnumMemberDoc], code: str, member_doc: list[str], inline_doc: str):
+        """
+        Adds the enum members declared in a piece of code.
+
+        Args:
+            members: The enum members parsed so far, new members are appended
+            code: Code with comma separated members, e.g. "IDLE, RUN = 5,"
+            member_doc: Doc comment lines in front of the members, emptied when used
+            inline_doc: Inline doc comment of the code line, describing its last member
+        """
+        names = [name for name in code.split(",") if name.strip()]
+        for position, name_code in enumerate(names):
+            match = self.ENUM_MEMBER_PATTERN.match(name_code)
+            if match is None:
+                print(f"{name_code.strip()} is not a valid enum member, ignoring")
+                continue
+            value = match.group("value")
+            if value is not None:
+                try:
+                    value = int(value, 0)
+                except ValueError:
+                    value = value.strip()
+            elif not members:
+                value = 0
+            elif isinstance(members[-1].value_int, int):
+                value = members[-1].value_int + 1
+            description = " ".join(member_doc)
+            if position == len(names) - 1 and inline_doc:
+                description = (description + " " + inline_doc).strip()
+            member_doc.clear()
+            members.append(EnumMemberDoc(match.group("name"), value, description))
+
+    def parse_attribute(self, token: Token, doc_tokens: list[Token], annotations: list[str]):
+        """
+        Handles a const or var declaration, including @export and @onready vars. Values spanning multiple lines are
+        joined.
+        """
+        self._class_doc_open = False
+        code = self.join_lines(token.code)
+        if not doc_tokens and not token.doc:
+            return
+        match = self.ATTRIBUTE_PATTERN.match(self.ACCESSOR_PATTERN.sub("", code))
+        if match is None:
+            print(f"{token.keyword} {code} is not a valid {token.keyword}, ignoring")
+            return
+        if token.keyword == "const":
+            var_type = "const"
+        elif any(annotation.startswith("@export") for annotation in annotations):
+            var_type = "export_var"
+        elif "@onready" in annotations:
+            var_type = "onready_var"
+        else:
+            var_type = "var"
+        doc_block = self.parse_doc_block(doc_tokens, token.doc)
+        self.current_class.add_attribute(
+            match.group("name"),
+            (match.group("data_type") or "").strip() or "undefined",
+            doc_block.description,
+            match.group("value"),
+            var_type,
+            doc_block.tags
+        )
+
+    def parse_func(self, token: Token, doc_tokens: list[Token], annotations: list[str]):
+        """
+        Handles a func declaration. Argument descriptions are taken from the Args: section of the doc block, the return
+        description from the Returns: section without the data type in front of it, which is the return type if the
+        signature doesn't declare one. The code span covers the signature and the body of the function.
+        """
+        self._class_doc_open = False
+        if not doc_tokens and not token.doc:
+            return
+        match = self.FUNC_PATTERN.match(token.code)
+        if match is None:
+            print(f"func {token.code} is not a valid func, ignoring")
+            return
+        doc_block = self.parse_doc_block(doc_tokens, token.doc)
+        func_doc = self.current_class.add_func(
+            match.group("name"),
+            doc_block.description,
+            self.parse_args(match.group("args"), doc_block, f"func {match.group('name')}"),
+            doc_block.tags,
+            (match.group("returns") or "").strip() or doc_block.returns_type or "undefined",
+            doc_block.returns,
+            token.keyword.startswith("static")
+        )
+        func_doc.set_code_span(self.source, token.start, token.end)
+
+    def join_lines(self, code: str) -> str:
+        """
+        Joins the code lines following a declaration while brackets opened in the declaration are not closed, e.g. for
+        values or signal arguments spanning multiple lines.
+
+        Args:
+            code: The code of the declaration
+
+        Returns:
+            The code of the declaration and its continuation lines, separated by a space
+        """
+        depth = GdLexer.bracket_depth(code)
+        while depth > 0 and self._index < len(self._tokens):
+            next_token = self._tokens[self._index]
+            if next_token.kind not in (GdLexer.CODE, GdLexer.BLANK):
+                break
+            self._index += 1
+            code = code + " " + next_token.code
+            depth += GdLexer.bracket_depth(next_token.code)
+        return code
+
+    def parse_args(self, code: str, doc_block: DocBlock, owner: str) -> list[VarDoc]:
+        """
+        Parses the arguments of a func or signal signature, described by the Args: section of the doc block.
+
+        Args:
+            code: The code between the parentheses of the signature
+            doc_block: The parsed doc block of the func or signal
+            owner: The func or signal, like "func move", for messages about invalid arguments
+
+        Returns:
+            The documentation of the arguments
+        """
+        args: list[VarDoc] = []
+        for arg_code in self.split_args(code):
+            arg_match = self.ATTRIBUTE_PATTERN.match(arg_code)
+            if arg_match is None:
+                print(f"{arg_code} is not a valid argument of {owner}, ignoring")
+                continue
+            args.append(VarDoc(
+                arg_match.group("name"),
+                (arg_match.group("data_type") or "").strip() or "undefined",
+                doc_block.args.get(arg_match.group("name"), ""),
+                arg_match.group("value")
+            ))
+        return args
+
+    @staticmethod
+    def split_args(code: str) -> list[str]:
+        """
+        Splits the arguments of a function signature at the commas outside of brackets and strings.
+
+        Args:
+            code: The code between the parentheses of the signature
+
+        Returns:
+            The code of every argument
+        """
+        if "," not in code:
+            return [code.strip()] if code.strip() else []
+        args: list[str] = []
+        depth = 0
+        quote = ""
+        arg_start = 0
+        for position, char in enumerate(code):
+            if quote:
+                if char == quote and code[position - 1] != "\\":
+                    quote = ""
+            elif char in "\"'":
+                quote = char
+            elif char in "([{":
+                depth += 1
+            elif char in ")]}":
+                depth -= 1
+            elif char == "," and depth == 0:
+                args.append(code[arg_start:position])
+                arg_start = position + 1
+        args.append(code[arg_start:])
+        return [arg.strip() for arg in args if arg.strip()]
+
+    def parse_inner_class(self, token: Token, doc_tokens: list[Token], annotations: list[str]):
+        """
+        Handles an inner class declaration. The following declarations indented deeper belong to the inner class.
+        """
+        self._class_doc_open = False
+        match = self.CLASS_PATTERN.match(token.code)
+        if match is None:
+            print(f"class {token.code} is not a valid inner class, ignoring")
+            return
+        inner_class_doc = ClassDoc(self.class_doc.file_name, match.group("name"), True, self.columnar)
+        if match.group("extends"):
+            inner_class_doc.set_extends(match.group("extends").strip())
+        if doc_tokens or token.doc:
+            self.set_class_description(inner_class_doc, self.parse_doc_block(doc_tokens, token.doc))
+        block_end = GdLexer.body_end_pattern(token.indent).search(self.source.data, token.end - 1)
+        inner_class_doc.set_code_span(
+            self.source, token.start, len(self.source) if block_end is None else block_end.start() + 1
+        )
+        self.current_class.inner_class_docs.append(inner_class_doc)
+        self._class_stack.append((inner_class_doc, token.indent))
@@ -0,0 +1,44 @@
+class IndentStyle:
+    """
+    Indent style of the scripts, parsed and validated once from the indent setting.
+
+    Scanning doesn't depend on the indent style: like Godot, the GdLexer compares the number of indent characters of
+    the lines to find the end of blocks, whichever character and width the scripts use.
+
+    Attributes:
+        setting: The indent setting, either tabulator or spaces:number_of_spaces
+        char: The indent character, a tabulator or a space
+        width: Number of indent characters per indent level
+    """
+    MIN_SPACES: int = 2
+    MAX_SPACES: int = 12
+
+    def __init__(self, setting: str = "tabulator"):
+        """
+        Constructor of the indent style.
+
+        Args:
+            setting: The indent setting, either tabulator or spaces:number_of_spaces
+
+        Raises:
+            ValueError: If the setting is neither tabulator nor spaces with a number of spaces between MIN_SPACES and
+                MAX_SPACES
+        """
+        if setting == "tabulator":
+            char, width = "\t", 1
+        elif setting.startswith("spaces:"):
+            try:
+                width = int(setting.split(":", 1)[1].strip())
+            except ValueError:
+                raise ValueError('Indent spaces value error, only numbers are allowed after "spaces:"')
+            if not (self.MIN_SPACES <= width <= self.MAX_SPACES):
+                raise ValueError(
+                    f"Indent spaces value error, only numbers between {self.MIN_SPACES} and {self.MAX_SPACES} are "
+                    f"allowed"
+                )
+            char = " "
+        else:
+            raise ValueError("Indent setting has to be either tabulator or spaces:number_of_spaces")
+        self.setting: str = setting
+        self.char: str = char
+        self.width: int = width
@@ -0,0 +1,317 @@
+from re import compile
+
+
+class ProjectConfig:
+    """
+    Parser for Godot's ConfigFile format, as used by project.godot, reading the whole file in a single pass into a
+    dictionary of sections, each a dictionary of its keys.
+
+    Values are converted into Python values:
+    * strings ("...", with escapes like \\" and \\n), StringName (&"...") and NodePath (^"...") into str,
+    * numbers into int or float, true/false into bool, null into None,
+    * arrays ([...]) and typed arrays (PackedStringArray(...), Array[...](...) etc.) into list,
+    * dictionaries ({...}) into dict,
+    * Object(Class, "property": value, ...) into a dict with type "Object", class and properties,
+    * all other constructors (like Vector2(1, 2) or Color(...)) into a dict with type and args.
+    Values may span several lines. Lines starting with ; (or #) outside of values are comments, keys in front of the
+    first section are stored in the "" section.
+
+    Attributes:
+        sections: The keys and values of every section, keyed by section name
+    """
+    NUMBER_PATTERN = compile(r"[+-]?(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?")
+    IDENTIFIER_PATTERN = compile(r"[A-Za-z_][A-Za-z0-9_]*")
+    TYPED_ARRAY_PATTERN = compile(r"Array\[[A-Za-z0-9_]+\]")
+    KEY_PATTERN = compile(r"[ \t]*([^=\n]+?)[ \t]*=[ \t]*")
+    CLASS_ARG_PATTERN = compile(r"([A-Za-z_][A-Za-z0-9_]*)[ \t\r\n]*(?=[,)])")
+    KEYWORDS: frozenset = frozenset(("true", "false", "null", "nil", "inf", "inf_neg", "nan"))
+    FLOAT_CONSTANTS: dict = {"inf": float("inf"), "inf_neg": float("-inf"), "nan": float("nan")}
+    ESCAPES: dict = {"b": "\b", "t": "\t", "n": "\n", "f": "\f", "r": "\r", '"': '"', "\\": "\\", "'": "'"}
+
+    def __init__(self, text: str = ""):
+        """
+        Constructor of the config, parses text at once.
+
+        Args:
+            text: Content of the config file
+
+        Raises:
+            ValueError: If the text isn't valid ConfigFile syntax, with the line of the error
+        """
+        self.sections: dict[str, dict] = {}
+        self._text: str = text
+        self._pos: int = 0
+        if text:
+            self.parse()
+
+    @classmethod
+    def read(cls, config_file: str):
+        """
+        Reads and parses a config file.
+
+        Args:
+            config_file: Path to the config file (like project.godot)
+
+        Returns:
+            The parsed ProjectConfig
+
+        Raises:
+            OSError: If the file can't be read
+            ValueError: If the file isn't valid ConfigFile syntax
+        """
+        with open(config_file, "r", encoding="utf-8") as file:
+            return cls(file.read())
+
+    def get(self, section: str, key: str, default=None):
+        """
+        Gets a value.
+
+        Args:
+            section: Name of the section, like application
+            key: The key within the section, like config/name
+            default: Returned if the section or key doesn't exist
+
+        Returns:
+            The value, or default
+        """
+        return self.sections.get(section, {}).get(key, default)
+
+    def section(self, section: str) -> dict:
+        """
+        Gets all keys of a section.
+
+        Args:
+            section: Name of the section, like autoload
+
+        Returns:
+            The values keyed by key, in the order of the file. Empty if the section doesn't exist
+        """
+        return self.sections.get(section, {})
+
+    def error(self, message: str) -> ValueError:
+        """
+        Creates a parse error at the current position.
+
+        Args:
+            message: What went wrong
+
+        Returns:
+            The error, naming the line
+        """
+        return ValueError(f"{message} in line {self._text.count(chr(10), 0, self._pos) + 1}")
+
+    def parse(self):
+        """
+        Parses the whole text into sections, line by line outside of values and character by character within them.
+        """
+        text = self._text
+        length = len(text)
+        current: dict | None = None
+        while self._pos < length:
+            line_end = text.find("\n", self._pos)
+            if line_end == -1:
+                line_end = length
+            line = text[self._pos:line_end].strip()
+            if not line or line[0] in ";#":
+                self._pos = line_end + 1
+                continue
+            if line[0] == "[":
+                if not line.endswith("]"):
+                    raise self.error("Unterminated section header")
+                current = self.sections.setdefault(line[1:-1].strip(), {})
+                self._pos = line_end + 1
+                continue
+            match = self.KEY_PATTERN.match(text, self._pos)
+            if match is None:
+                raise self.error("Expected key=value")
+            if current is None:
+                current = self.sections.setdefault("", {})
+            self._pos = match.end()
+            current[match.group(1)] = self.parse_value()
+            self.skip_space(False)
+            if self._pos < length and text[self._pos] not in "\r\n;":
+                raise self.error("Unexpected characters after value")
+            line_end = text.find("\n", self._pos)
+            self._pos = length if line_end == -1 else line_end + 1
+
+    def skip_space(self, newlines: bool = True):
+        """
+        Skips whitespace (and line breaks, within values).
+
+        Args:
+            newlines: Skips line breaks too if True
+        """
+        text = self._text
+        whitespace = " \t\r\n" if newlines else " \t"
+        while self._pos < len(text) and text[self._pos] in whitespace:
+            self._pos += 1
+
+    def parse_value(self):
+        """
+        Parses the value at the current position.
+
+        Returns:
+            The value, converted as described for the class
+        """
+        self.skip_space()
+        text = self._text
+        if self._pos >= len(text):
+            raise self.error("Missing value")
+        char = text[self._pos]
+        if char == '"':
+            return self.parse_string()
+        if char in "&^" and text.startswith('"', self._pos + 1):
+            self._pos += 1
+            return self.parse_string()
+        if char == "[":
+            self._pos += 1
+            return self.parse_items("]")
+        if char == "{":
+            self._pos += 1
+            return self.parse_dictionary()
+        match = self.NUMBER_PATTERN.match(text, self._pos)
+        if match is not None:
+            self._pos = match.end()
+            number = match.group(0)
+            if number.lstrip("+-").isdigit():
+                return int(number)
+            return float(number)
+        match = self.TYPED_ARRAY_PATTERN.match(text, self._pos) or self.IDENTIFIER_PATTERN.match(text, self._pos)
+        if match is None:
+            raise self.error(f"Unexpected character {char!r}")
+        self._pos = match.end()
+        name = match.group(0)
+        if name in ("true", "false"):
+            return name == "true"
+        if name in ("null", "nil"):
+            return None
+        if name in self.FLOAT_CONSTANTS:
+            return self.FLOAT_CONSTANTS[name]
+        self.skip_space()
+        if not text.startswith("(", self._pos):
+            raise self.error(f"Unknown identifier {name}")
+        self._pos += 1
+        args = self.parse_items(")")
+        if name.startswith("Array["):
+            return args[0] if len(args) == 1 and isinstance(args[0], list) else args
+        if name.endswith("Array"):
+            return args
+        if name == "Object":
+            return {
+                "type": name,
+                "class": args[0] if args else "",
+                "properties": {key: value for item in args[1:] if isinstance(item, dict) for key, value in item.items()}
+            }
+        return {"type": name, "args": args}
+
+    def parse_string(self) -> str:
+        """
+        Parses a quoted string, starting at the opening quote. Escapes are resolved, line breaks kept.
+
+        Returns:
+            The string
+        """
+        text = self._text
+        start = self._pos + 1
+        end = text.find('"', start)
+        if end != -1 and text.find("\\", start, end) == -1:
+            self._pos = end + 1
+            return text[start:end]
+        parts: list[str] = []
+        position = start
+        while True:
+            if position >= len(text):
+                raise self.error("Unterminated string")
+            char = text[position]
+            if char == '"':
+                break
+            if char == "\\" and position + 1 < len(text):
+                escaped = text[position + 1]
+                if escaped == "u" and position + 5 < len(text):
+                    parts.append(chr(int(text[position + 2:position + 6], 16)))
+                    position += 6
+                    continue
+                parts.append(self.ESCAPES.get(escaped, escaped))
+                position += 2
+                continue
+            parts.append(char)
+            position += 1
+        self._pos = position + 1
+        return "".join(parts)
+
+    def parse_items(self, closing: str) -> list:
+        """
+        Parses comma separated values up to the closing bracket. Items of the form "key": value (as in Object
+        constructors) are returned as single-key dicts, bare class names (like InputEventKey) as str.
+
+        Args:
+            closing: The closing bracket, ] or )
+
+        Returns:
+            The items
+        """
+        items: list = []
+        text = self._text
+        while True:
+            self.skip_space()
+            if self._pos >= len(text):
+                raise self.error(f"Missing {closing}")
+            if text[self._pos] == closing:
+                self._pos += 1
+                return items
+            if closing == ")" and not items:
+                match = self.CLASS_ARG_PATTERN.match(text, self._pos)
+                if match is not None and match.group(1) not in self.KEYWORDS:
+                    self._pos = match.end(1)
+                    items.append(match.group(1))
+                    self.skip_item_separator(closing)
+                    continue
+            item = self.parse_value()
+            self.skip_space()
+            if text.startswith(":", self._pos) and isinstance(item, str):
+                self._pos += 1
+                item = {item: self.parse_value()}
+                self.skip_space()
+            items.append(item)
+            self.skip_item_separator(closing)
+
+    def skip_item_separator(self, closing: str):
+        """
+        Skips the comma after an item, if any.
+
+        Args:
+            closing: The closing bracket expected if there is no comma
+        """
+        self.skip_space()
+        if self._pos < len(self._text) and self._text[self._pos] == ",":
+            self._pos += 1
+        elif not self._text.startswith(closing, self._pos):
+            raise self.error(f"Expected , or {closing}")
+
+    def parse_dictionary(self) -> dict:
+        """
+        Parses a dictionary, starting after the opening brace.
+
+        Returns:
+            The dictionary. Keys which aren't hashable (like arrays) are converted to str
+        """
+        dictionary: dict = {}
+        text = self._text
+        while True:
+            self.skip_space()
+            if self._pos >= len(text):
+                raise self.error("Missing }")
+            if text[self._pos] == "}":
+                self._pos += 1
+                return dictionary
+            key = self.parse_value()
+            self.skip_space()
+            if not text.startswith(":", self._pos):
+                raise self.error("Expected : in dictionary")
+            self._pos += 1
+            value = self.parse_value()
+            try:
+                dictionary[key] = value
+            except TypeError:
+                dictionary[str(key)] = value
+            self.skip_item_separator("}")
@@ -0,0 +1,120 @@
+from os import scandir
+from fnmatch import translate
+from re import compile
+
+
+class ProjectWalker:
+    """
+    Walks a godot project directory tree once and sorts all files found by their extension.
+
+    Directories matching one of the prune patterns (godot caches, native addon binaries and the user configured
+    ignore patterns) are not descended into at all. Patterns containing a "/" are matched against the path relative to
+    the project root, all others against the name of the directory or file only. Like os.walk, symbolic links to
+    directories are not followed.
+
+    Attributes:
+        src_path: The base directory of the project to walk, ending with "/"
+        ignore_patterns: User configured glob patterns for directories or files to skip
+        files_by_ext: Relative paths (with "/" as separator) of all files found, keyed by extension without dot
+        dirs_visited: Number of directories read while walking
+        files_visited: Number of files seen while walking
+    """
+    DEFAULT_PRUNE_PATTERNS: tuple = (".godot", ".import", "addons/*/bin")
+
+    def __init__(self, src_path: str, ignore_patterns: list[str] = None):
+        """
+        Constructor of the project walker.
+
+        Args:
+            src_path: The base directory of the project to walk
+            ignore_patterns: Glob patterns for directories or files to skip, additionally to the default ones
+        """
+        if not src_path.endswith("/"):
+            src_path = src_path + "/"
+        self.src_path: str = src_path
+        self.ignore_patterns: list[str] = list(ignore_patterns) if ignore_patterns else []
+        self.files_by_ext: dict[str, list[str]] = {}
+        self.dirs_visited: int = 0
+        self.files_visited: int = 0
+        patterns = list(self.DEFAULT_PRUNE_PATTERNS) + self.ignore_patterns
+        self._path_matcher = self.compile_patterns([pattern for pattern in patterns if "/" in pattern])
+        self._name_matcher = self.compile_patterns([pattern for pattern in patterns if "/" not in pattern])
+
+    @staticmethod
+    def compile_patterns(patterns: list[str]):
+        """
+        Combines glob patterns into one precompiled regular expression.
+
+        Args:
+            patterns: The glob patterns to combine
+
+        Returns:
+            The match method of the compiled expression, or None if there are no patterns
+        """
+        if not patterns:
+            return None
+        return compile("|".join(f"(?:{translate(pattern.strip('/'))})" for pattern in patterns)).match
+
+    def is_ignored(self, name: str, rel_path: str) -> bool:
+        """
+        Checks if a directory or file has to be skipped.
+
+        Args:
+            name: Name of the directory or file
+            rel_path: Path of the directory or file, relative to src_path
+
+        Returns:
+            True if one of the prune patterns matches
+        """
+        if self._name_matcher is not None and self._name_matcher(name):
+            return True
+        if self._path_matcher is not None and self._path_matcher(rel_path):
+            return True
+        return False
+
+    def walk(self, rel_dir: str = "") -> tuple[list[str], list[str]]:
+        """
+        Walks the project tree in a single pass, filling files_by_ext and the visit counters.
+
+        Args:
+            rel_dir: Walks only this directory of the project and its subdirectories if set, relative to src_path and
+                ending with "/". The paths found stay relative to src_path, so path patterns match as for the whole tree
+
+        Returns:
+            The list of script (.gd) files and the list of scene (.tscn) files, relative to src_path
+        """
+        self.files_by_ext = {}
+        self.dirs_visited = 0
+        self.files_visited = 0
+        pending: list[str] = [rel_dir]
+        while pending:
+            rel_dir = pending.pop()
+            try:
+                with scandir(self.src_path + rel_dir) as iterator:
+                    entries = sorted(iterator, key=lambda entry: entry.name)
+            except OSError as e:
+                print(f"Skipping directory {self.src_path + rel_dir}, reading failed with exception:")
+                print(e)
+                continue
+            self.dirs_visited += 1
+            sub_dirs: list[str] = []
+            for entry in entries:
+                rel_path = rel_dir + entry.name
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        if not self.is_ignored(entry.name, rel_path):
+                            sub_dirs.append(rel_path + "/")
+                        continue
+                    if entry.is_symlink() and entry.is_dir():
+                        continue
+                except OSError as e:
+                    print(f"Skipping {self.src_path + rel_path}, reading failed with exception:")
+                    print(e)
+                    continue
+                self.files_visited += 1
+                if self.is_ignored(entry.name, rel_path):
+                    continue
+                extension = entry.name.rsplit(".", 1)[1] if "." in entry.name else ""
+                self.files_by_ext.setdefault(extension, []).append(rel_path)
+            pending.extend(reversed(sub_dirs))
+        return self.files_by_ext.get("gd", []), self.files_by_ext.get("tscn", [])
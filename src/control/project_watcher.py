@@ -0,0 +1,438 @@
+from ctypes import CDLL, get_errno
+from ctypes.util import find_library
+from os import read, close, scandir, stat, strerror
+from os.path import isdir
+from select import select
+from struct import calcsize, unpack_from
+from time import monotonic, sleep
+
+from src.control.project_walker import ProjectWalker
+
+
+class ProjectWatcher:
+    """
+    Watches the files of a godot project the documentation depends on (scripts, scenes, uid files and project.godot)
+    for changes.
+
+    On Linux, the kernel reports changes via inotify (used through ctypes, one watch per directory). If the kernel's
+    event queue overflows, events are lost, and the whole project is reported as changed (see RESYNC), to be compared
+    with the files known by the build.
+
+    Where inotify isn't available, the project is polled every poll_interval seconds. A poll only reads the
+    modification time of every directory, which changes when files are created, deleted or renamed in it (like the godot
+    editor saving a file via a temporary file), and rescans the directories that changed. Files changed in place don't
+    change their directory, so additionally POLL_BATCH of the watched files are checked per poll, round-robin. A poll
+    costs O(directories + POLL_BATCH) instead of a stat call per file.
+
+    Like ProjectWalker, links to directories are not followed, so a link loop can't make the watcher recurse forever.
+
+    Both ways, a burst of changes (like the godot editor saving several files at once) is collected until no further
+    change happened for debounce seconds, then reported at once.
+
+    Attributes:
+        src_path: The base directory of the project, ending with "/"
+        ignore_patterns: User configured glob patterns for directories or files to skip
+        debounce: Seconds without changes ending a burst of changes
+        poll_interval: Seconds between two polls, if inotify isn't available
+        backend: "inotify" or "polling"
+    """
+    WATCHED_EXTENSIONS: tuple = ("gd", "tscn", "uid")
+    IN_MODIFY: int = 0x00000002
+    IN_ATTRIB: int = 0x00000004
+    IN_CLOSE_WRITE: int = 0x00000008
+    IN_MOVED_FROM: int = 0x00000040
+    IN_MOVED_TO: int = 0x00000080
+    IN_CREATE: int = 0x00000100
+    IN_DELETE: int = 0x00000200
+    IN_DELETE_SELF: int = 0x00000400
+    IN_Q_OVERFLOW: int = 0x00004000
+    IN_IGNORED: int = 0x00008000
+    IN_ISDIR: int = 0x40000000
+    IN_NONBLOCK: int = 0o4000
+    IN_CLOEXEC: int = 0o2000000
+    WATCH_MASK: int = IN_MODIFY | IN_ATTRIB | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE \
+        | IN_DELETE_SELF
+    EVENT_FORMAT: str = "iIII"
+    EVENT_SIZE: int = calcsize(EVENT_FORMAT)
+    RESYNC: str = "./"
+    POLL_BATCH: int = 256
+
+    def __init__(self, src_path: str, ignore_patterns: list[str] = None, debounce: float = 0.2,
+                 poll_interval: float = 1.0):
+        """
+        Constructor of the project watcher. Starts watching at once.
+
+        Args:
+            src_path: The base directory of the project
+            ignore_patterns: Glob patterns for directories or files to skip, additionally to the default ones
+            debounce: Seconds without changes ending a burst of changes
+            poll_interval: Seconds between two polls, if inotify isn't available
+        """
+        if not src_path.endswith("/"):
+            src_path = src_path + "/"
+        self.src_path: str = src_path
+        self.ignore_patterns: list[str] = list(ignore_patterns) if ignore_patterns else []
+        self.debounce: float = debounce
+        self.poll_interval: float = poll_interval
+        self.backend: str = "polling"
+        self._walker: ProjectWalker = ProjectWalker(src_path, self.ignore_patterns)
+        self._libc = None
+        self._fd: int = -1
+        self._watched_dirs: dict[int, str] = {}
+        self._snapshot: dict[str, tuple[int, int]] = {}
+        self._dir_mtimes: dict[str, int] = {}
+        self._dir_files: dict[str, set[str]] = {}
+        self._dir_subdirs: dict[str, set[str]] = {}
+        self._poll_order: list[str] = []
+        self._poll_position: int = 0
+        if self.start_inotify():
+            self.backend = "inotify"
+        else:
+            self.snapshot_dir("")
+
+    def start_inotify(self) -> bool:
+        """
+        Sets up inotify watches for all directories of the project.
+
+        Returns:
+            True if inotify is available and watching, otherwise False
+        """
+        try:
+            self._libc = CDLL(find_library("c") or "libc.so.6", use_errno=True)
+            self._fd = self._libc.inotify_init1(self.IN_NONBLOCK | self.IN_CLOEXEC)
+        except (OSError, AttributeError):
+            return False
+        if self._fd < 0:
+            return False
+        self.watch_dir("")
+        return True
+
+    def watch_dir(self, rel_dir: str) -> list[str]:
+        """
+        Adds inotify watches for a directory and all its subdirectories.
+
+        Args:
+            rel_dir: Path of the directory, relative to src_path, ending with "/" (or "" for src_path itself)
+
+        Returns:
+            The watched files already existing in the directories, relative to src_path. Always empty for src_path
+        """
+        for directory in [rel_dir] + [rel_dir + sub_dir for sub_dir in self.list_dirs(rel_dir)]:
+            wd = self._libc.inotify_add_watch(self._fd, (self.src_path + directory).encode(), self.WATCH_MASK)
+            if wd < 0:
+                print(f"Watching directory {self.src_path + directory} failed: {strerror(get_errno())}")
+                continue
+            self._watched_dirs[wd] = directory
+        if not rel_dir:
+            return []
+        self._walker.walk(rel_dir)
+        return [path for paths in self._walker.files_by_ext.values() for path in paths if self.is_watched(path)]
+
+    def list_dirs(self, rel_dir: str) -> list[str]:
+        """
+        Lists all not ignored subdirectories of a directory, recursively, without following links to directories.
+
+        Args:
+            rel_dir: Path of the directory, relative to src_path
+
+        Returns:
+            Paths of the subdirectories relative to rel_dir, each ending with "/"
+        """
+        found: list[str] = []
+        pending: list[str] = [""]
+        while pending:
+            sub_dir = pending.pop()
+            try:
+                with scandir(self.src_path + rel_dir + sub_dir) as iterator:
+                    for entry in iterator:
+                        path = sub_dir + entry.name
+                        try:
+                            is_dir = entry.is_dir(follow_symlinks=False)
+                        except OSError:
+                            continue
+                        if is_dir and not self._walker.is_ignored(entry.name, rel_dir + path):
+                            found.append(path + "/")
+                            pending.append(path + "/")
+            except OSError:
+                continue
+        return found
+
+    def is_watched(self, rel_path: str) -> bool:
+        """
+        Checks if a changed file is one the documentation depends on.
+
+        Args:
+            rel_path: Path of the file, relative to src_path
+
+        Returns:
+            True for scripts, scenes, uid files and project.godot outside of ignored directories
+        """
+        if rel_path != "project.godot" and rel_path.rsplit(".", 1)[-1] not in self.WATCHED_EXTENSIONS:
+            return False
+        parts = rel_path.split("/")
+        for index, name in enumerate(parts):
+            if self._walker.is_ignored(name, "/".join(parts[:index + 1])):
+                return False
+        return True
+
+    def wait_for_changes(self) -> set[str]:
+        """
+        Blocks until files changed, and the burst of changes is over.
+
+        Returns:
+            Paths of the changed, created or deleted files, relative to src_path. A path ending with "/" stands for a
+            directory moved away, including all of its files, RESYNC for all files of the project
+        """
+        changed_files: set[str] = set()
+        last_change = 0.0
+        while True:
+            if changed_files:
+                timeout = self.debounce - (monotonic() - last_change)
+                if timeout <= 0:
+                    return changed_files
+            else:
+                timeout = None
+            if self.backend == "inotify":
+                found = self.read_events(timeout)
+            else:
+                sleep(self.poll_interval if timeout is None else min(timeout, self.poll_interval))
+                found = self.poll_changes()
+            if found:
+                changed_files.update(found)
+                last_change = monotonic()
+
+    def read_events(self, timeout: float | None) -> set[str]:
+        """
+        Waits for inotify events and translates them into changed files.
+
+        Args:
+            timeout: Seconds to wait at most, None to wait until an event arrives
+
+        Returns:
+            Paths of the changed watched files, relative to src_path. After the event queue overflowed, all watched
+            files found and RESYNC
+        """
+        readable, _, _ = select([self._fd], [], [], timeout)
+        if not readable:
+            return set()
+        try:
+            data = read(self._fd, 65536)
+        except BlockingIOError:
+            return set()
+        changed_files: set[str] = set()
+        offset = 0
+        while offset + self.EVENT_SIZE <= len(data):
+            wd, mask, _, name_size = unpack_from(self.EVENT_FORMAT, data, offset)
+            offset += self.EVENT_SIZE
+            name = data[offset:offset + name_size].rstrip(b"\0").decode("utf-8", "replace")
+            offset += name_size
+            if mask & self.IN_Q_OVERFLOW:
+                print("Watching events overflowed, checking all files of the project")
+                return self.resync()
+            directory = self._watched_dirs.get(wd)
+            if directory is None:
+                continue
+            if mask & self.IN_IGNORED:
+                del self._watched_dirs[wd]
+                continue
+            rel_path = directory + name
+            if mask & self.IN_ISDIR:
+                if mask & (self.IN_CREATE | self.IN_MOVED_TO) and not self._walker.is_ignored(name, rel_path):
+                    # files may have been created in the new directory before it was watched
+                    changed_files.update(self.watch_dir(rel_path + "/"))
+                elif mask & self.IN_MOVED_FROM:
+                    # the files of the directory are gone without own events, reported as the directory path
+                    changed_files.add(rel_path + "/")
+                continue
+            if name and self.is_watched(rel_path):
+                changed_files.add(rel_path)
+        return changed_files
+
+    def resync(self) -> set[str]:
+        """
+        Recovers from lost inotify events: watches the directories created meanwhile and lists all watched files.
+
+        Returns:
+            All watched files of the project and RESYNC, so deleted files are found by comparing with the files known
+        """
+        self.watch_dir("")
+        return set(self.known_files()) | {self.RESYNC}
+
+    def known_files(self) -> list[str]:
+        """
+        Walks the project and lists the watched files.
+
+        Returns:
+            Paths of the files, relative to src_path
+        """
+        self._walker.walk()
+        return [path for paths in self._walker.files_by_ext.values() for path in paths if self.is_watched(path)]
+
+    def snapshot_dir(self, rel_dir: str) -> set[str]:
+        """
+        Records the modification time of a directory and its subdirectories, and modification time and size of the
+        watched files in them, for polling.
+
+        Args:
+            rel_dir: Path of the directory, relative to src_path, ending with "/" (or "" for src_path itself)
+
+        Returns:
+            Paths of the watched files found, relative to src_path
+        """
+        found: set[str] = set()
+        pending: list[str] = [rel_dir]
+        while pending:
+            directory = pending.pop()
+            sub_dirs, files = self.read_dir(directory)
+            if sub_dirs is None:
+                continue
+            pending.extend(sub_dirs)
+            found.update(files)
+        return found
+
+    def read_dir(self, rel_dir: str) -> tuple[set[str] | None, set[str]]:
+        """
+        Reads a directory (not recursively) into the polling snapshot: its modification time, its not ignored
+        subdirectories (not following links) and modification time and size of its watched files.
+
+        Args:
+            rel_dir: Path of the directory, relative to src_path
+
+        Returns:
+            The subdirectories and the watched files of the directory, relative to src_path. None and an empty set if
+            the directory can't be read
+        """
+        try:
+            dir_mtime = stat(self.src_path + rel_dir).st_mtime_ns
+            with scandir(self.src_path + rel_dir) as iterator:
+                entries = list(iterator)
+        except OSError:
+            return None, set()
+        sub_dirs: set[str] = set()
+        files: set[str] = set()
+        for entry in entries:
+            rel_path = rel_dir + entry.name
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    if not self._walker.is_ignored(entry.name, rel_path):
+                        sub_dirs.add(rel_path + "/")
+                elif self.is_watched(rel_path) and not entry.is_dir():
+                    file_stat = entry.stat()
+                    self._snapshot[rel_path] = (file_stat.st_mtime_ns, file_stat.st_size)
+                    files.add(rel_path)
+            except OSError:
+                continue
+        self._dir_mtimes[rel_dir] = dir_mtime
+        self._dir_files[rel_dir] = files
+        self._dir_subdirs[rel_dir] = sub_dirs
+        return sub_dirs, files
+
+    def forget_dir(self, rel_dir: str) -> set[str]:
+        """
+        Drops a directory gone and its subdirectories from the polling snapshot.
+
+        Args:
+            rel_dir: Path of the directory, relative to src_path
+
+        Returns:
+            Paths of the watched files the directories contained, relative to src_path
+        """
+        gone: set[str] = set()
+        pending: list[str] = [rel_dir]
+        while pending:
+            directory = pending.pop()
+            self._dir_mtimes.pop(directory, None)
+            pending.extend(self._dir_subdirs.pop(directory, ()))
+            for path in self._dir_files.pop(directory, ()):
+                self._snapshot.pop(path, None)
+                gone.add(path)
+        return gone
+
+    def poll_dir(self, rel_dir: str) -> set[str]:
+        """
+        Rescans a directory whose modification time changed, comparing its watched files and subdirectories with the
+        snapshot.
+
+        Args:
+            rel_dir: Path of the directory, relative to src_path
+
+        Returns:
+            Paths of the changed, created or deleted files, relative to src_path
+        """
+        old_files = self._dir_files.get(rel_dir, set())
+        old_sub_dirs = self._dir_subdirs.get(rel_dir, set())
+        old_stats = {path: self._snapshot.pop(path, None) for path in old_files}
+        sub_dirs, files = self.read_dir(rel_dir)
+        if sub_dirs is None:
+            for path, file_stat in old_stats.items():
+                if file_stat is not None:
+                    self._snapshot[path] = file_stat
+            return set()
+        changed_files = {path for path in files if old_stats.get(path) != self._snapshot[path]}
+        changed_files.update(path for path in old_files if path not in files)
+        for sub_dir in sub_dirs - old_sub_dirs:
+            changed_files.update(self.snapshot_dir(sub_dir))
+        for sub_dir in old_sub_dirs - sub_dirs:
+            changed_files.update(self.forget_dir(sub_dir))
+        return changed_files
+
+    def poll_batch(self) -> set[str]:
+        """
+        Checks the next POLL_BATCH watched files for changes in place, round-robin over all watched files.
+
+        Returns:
+            Paths of the changed or deleted files, relative to src_path
+        """
+        if self._poll_position >= len(self._poll_order):
+            self._poll_order = list(self._snapshot)
+            self._poll_position = 0
+        batch = self._poll_order[self._poll_position:self._poll_position + self.POLL_BATCH]
+        self._poll_position += self.POLL_BATCH
+        changed_files: set[str] = set()
+        for path in batch:
+            known_stat = self._snapshot.get(path)
+            if known_stat is None:
+                continue
+            try:
+                file_stat = stat(self.src_path + path)
+            except OSError:
+                # deleted, reported by polling its directory
+                continue
+            if (file_stat.st_mtime_ns, file_stat.st_size) != known_stat:
+                self._snapshot[path] = (file_stat.st_mtime_ns, file_stat.st_size)
+                changed_files.add(path)
+        return changed_files
+
+    def poll_changes(self) -> set[str]:
+        """
+        Compares the modification times of the directories with the snapshot, rescans the changed directories and
+        checks the next batch of files for changes in place.
+
+        Returns:
+            Paths of the changed, created or deleted files since the last poll, relative to src_path
+        """
+        if not isdir(self.src_path):
+            return set()
+        changed_files: set[str] = set()
+        for rel_dir in list(self._dir_mtimes):
+            if rel_dir not in self._dir_mtimes:
+                # dropped with a parent directory gone
+                continue
+            try:
+                dir_mtime = stat(self.src_path + rel_dir).st_mtime_ns
+            except OSError:
+                changed_files.update(self.forget_dir(rel_dir))
+                continue
+            if dir_mtime != self._dir_mtimes[rel_dir]:
+                changed_files.update(self.poll_dir(rel_dir))
+        changed_files.update(self.poll_batch())
+        return changed_files
+
+    def close(self):
+        """
+        Stops watching.
+        """
+        if self._fd >= 0:
+            close(self._fd)
+            self._fd = -1
+        self._watched_dirs = {}
@@ -0,0 +1,209 @@
+from io import BytesIO
+from os import stat, replace, remove
+from os.path import isfile
+from hashlib import sha256
+from pickle import Pickler, Unpickler, dump, load, HIGHEST_PROTOCOL, PickleError
+
+from src.model.class_doc import ClassDoc
+from src.model.source_buffer import SourceBuffer
+
+
+class ScanCache:
+    """
+    Persistent cache of scanned script documentation, used to only re-scan changed or new scripts on a rebuild.
+
+    Every entry is keyed by the path of the script and holds its size, modification time, content hash and the
+    serialized ClassDoc tree. A script whose size and modification time didn't change is loaded from the cache after a
+    single stat call. If only the modification time changed (e.g. after a checkout), the content hash decides.
+
+    The source of the script isn't cached, only the models with the code spans into it. A loaded ClassDoc refers to a
+    SourceBuffer reading the script on first access of its code, see SourceBuffer.
+
+    Attributes:
+        cache_file: Path to the cache file, stored next to the documentation config file
+        fingerprint: Settings and version the cached entries depend on. A different fingerprint discards the cache
+        entries: Cache entries keyed by script path, with size, mtime_ns, hash and class_doc (pickled) attributes
+        hits: Number of scripts loaded from the cache during this build
+        misses: Number of scripts that had to be scanned during this build
+    """
+    CACHE_FORMAT: int = 8
+
+    def __init__(self, cache_file: str, fingerprint: tuple):
+        """
+        Constructor of the scan cache.
+
+        Args:
+            cache_file: Path to the cache file
+            fingerprint: Settings and version the cached entries depend on
+        """
+        self.cache_file: str = cache_file
+        self.fingerprint: tuple = (self.CACHE_FORMAT,) + tuple(fingerprint)
+        self.entries: dict[str, dict] = {}
+        self.hits: int = 0
+        self.misses: int = 0
+
+    def load(self) -> bool:
+        """
+        Loads the cache entries from the cache file, if it exists and was written with the same fingerprint.
+
+        Returns:
+            True if cache entries were loaded, otherwise False (starting with an empty cache)
+        """
+        self.entries = {}
+        if not isfile(self.cache_file):
+            return False
+        try:
+            with open(self.cache_file, "rb") as file:
+                cache_data = load(file)
+        except (OSError, EOFError, PickleError, AttributeError, ImportError) as e:
+            print(f"Ignoring scan cache {self.cache_file}, reading failed with exception:")
+            print(e)
+            return False
+        if not isinstance(cache_data, dict) or cache_data.get("fingerprint") != self.fingerprint:
+            print(f"Scan cache {self.cache_file} is outdated, rescanning all scripts")
+            return False
+        self.entries = cache_data["entries"]
+        return True
+
+    @staticmethod
+    def hash_file(file_path: str) -> str:
+        """
+        Calculates the content hash of a file.
+
+        Args:
+            file_path: Path to the file to hash
+
+        Returns:
+            Hex digest of the file content
+        """
+        with open(file_path, "rb") as file:
+            return sha256(file.read()).hexdigest()
+
+    def is_fresh(self, script_path: str) -> bool:
+        """
+        Checks if the cache entry of a script is up-to-date, without loading the cached documentation. Counts as hit
+        or miss.
+
+        Args:
+            script_path: Path to the script, as used for reading it
+
+        Returns:
+            True if the script didn't change since it was cached, False if it is new, changed or unreadable
+        """
+        entry = self.entries.get(script_path)
+        if entry is None:
+            self.misses += 1
+            return False
+        try:
+            script_stat = stat(script_path)
+            if script_stat.st_size != entry["size"]:
+                self.misses += 1
+                return False
+            if script_stat.st_mtime_ns != entry["mtime_ns"]:
+                if self.hash_file(script_path) != entry["hash"]:
+                    self.misses += 1
+                    return False
+                entry["mtime_ns"] = script_stat.st_mtime_ns
+        except OSError:
+            self.misses += 1
+            return False
+        self.hits += 1
+        return True
+
+    @staticmethod
+    def file_state(script_path: str) -> tuple[int, int] | None:
+        """
+        Gets size and modification time of a script, to be taken before scanning it and passed to store.
+
+        Args:
+            script_path: Path to the script, as used for reading it
+
+        Returns:
+            Size and modification time (ns) of the script, or None if it can't be read
+        """
+        try:
+            script_stat = stat(script_path)
+        except OSError:
+            return None
+        return script_stat.st_size, script_stat.st_mtime_ns
+
+    def load_doc(self, script_path: str) -> ClassDoc | None:
+        """
+        Loads the cached documentation of a script. Doesn't check if the script changed, see is_fresh.
+
+        Args:
+            script_path: Path to the script, as used for reading it
+
+        Returns:
+            The cached ClassDoc, or None if there is no entry or it can't be loaded
+        """
+        entry = self.entries.get(script_path)
+        if entry is None:
+            return None
+        source = SourceBuffer(script_path, (entry["size"], entry["mtime_ns"]))
+        unpickler = Unpickler(BytesIO(entry["class_doc"]))
+        unpickler.persistent_load = lambda source_id: source
+        try:
+            return unpickler.load()
+        except (PickleError, AttributeError, ImportError, EOFError):
+            return None
+
+    def store(self, script_path: str, class_doc: ClassDoc, file_state: tuple[int, int] | None):
+        """
+        Adds or replaces the cache entry of a freshly scanned script. The content hash is taken from the source the
+        documentation was scanned from, size and modification time from file_state taken before the script was read.
+        So a script changed while it is scanned is stored with the metadata of its old content, and is scanned again
+        at the next build, instead of its outdated documentation being cached for the new content.
+
+        Args:
+            script_path: Path to the script, as used for reading it
+            class_doc: The scanned documentation of the script
+            file_state: Size and modification time of the script before it was scanned, see file_state
+        """
+        if file_state is None or class_doc.source is None:
+            # not readable, scanned again at the next build
+            self.entries.pop(script_path, None)
+            return
+        pickled_doc = BytesIO()
+        pickler = Pickler(pickled_doc, HIGHEST_PROTOCOL)
+        # the source buffer is left out, see load_doc
+        pickler.persistent_id = lambda obj: "source" if isinstance(obj, SourceBuffer) else None
+        pickler.dump(class_doc)
+        self.entries[script_path] = {
+            "size": file_state[0],
+            "mtime_ns": file_state[1],
+            "hash": sha256(class_doc.source.data).hexdigest(),
+            "class_doc": pickled_doc.getvalue()
+        }
+        class_doc.source.release()
+
+    def prune(self, script_paths: set[str]):
+        """
+        Drops the cache entries of all scripts which are not part of the project (anymore).
+
+        Args:
+            script_paths: Paths of all scripts of the current build
+        """
+        for script_path in [path for path in self.entries if path not in script_paths]:
+            del self.entries[script_path]
+
+    def save(self) -> bool:
+        """
+        Writes the cache entries to the cache file. A temporary file is renamed over the old cache, so an interrupted
+        build never leaves a corrupt cache behind.
+
+        Returns:
+            True if writing the cache file was successful
+        """
+        tmp_cache_file = self.cache_file + ".tmp"
+        try:
+            with open(tmp_cache_file, "wb") as file:
+                dump({"fingerprint": self.fingerprint, "entries": self.entries}, file, HIGHEST_PROTOCOL)
+            replace(tmp_cache_file, self.cache_file)
+        except (OSError, PickleError) as e:
+            print(f"Writing scan cache {self.cache_file} failed with exception:")
+            print(e)
+            if isfile(tmp_cache_file):
+                remove(tmp_cache_file)
+            return False
+        return True
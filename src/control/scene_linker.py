@@ -0,0 +1,121 @@
+from re import compile, MULTILINE
+from threading import Lock
+
+
+class SceneLinker:
+    """
+    Finds the scripts attached to godot scenes by reading only the header of the .tscn files.
+
+    Godot 4 writes all ext_resource entries at the top of a scene file, in front of the first sub_resource or node
+    section. The header is read in chunks of CHUNK_SIZE bytes until one of those sections starts, so the (possibly
+    megabytes of) serialized node data is never read. Scripts are referenced either by their res:// path or, for
+    scripts moved since the scene was saved, only by their uid, which is resolved through the *.gd.uid files of the
+    project.
+
+    scene_scripts can be called from several threads at once, to read the scene files concurrently.
+
+    Attributes:
+        src_path: The base directory of the project, ending with "/"
+        uid_files: Paths of the *.uid files of the project, relative to src_path
+        bytes_read: Number of bytes read from scene files so far
+    """
+    CHUNK_SIZE: int = 4096
+    MAX_HEADER_SIZE: int = 1 << 20
+    HEADER_END_PATTERN = compile(rb"^\[(?:sub_resource|node)[ \]]", MULTILINE)
+    EXT_RESOURCE_PATTERN = compile(rb"^\[ext_resource ([^\n]*)\][ \t\r]*$", MULTILINE)
+    ATTRIBUTE_PATTERN = compile(rb'(\w+)="([^"]*)"')
+
+    def __init__(self, src_path: str, uid_files: list[str] = None):
+        """
+        Constructor of the scene linker.
+
+        Args:
+            src_path: The base directory of the project
+            uid_files: Paths of the *.uid files of the project, relative to src_path
+        """
+        if not src_path.endswith("/"):
+            src_path = src_path + "/"
+        self.src_path: str = src_path
+        self.uid_files: list[str] = list(uid_files) if uid_files else []
+        self.bytes_read: int = 0
+        self._scripts_by_uid: dict[str, str] | None = None
+        self._lock: Lock = Lock()
+
+    def read_header(self, scene: str) -> bytes:
+        """
+        Reads the header of a scene file, i.e. everything in front of the first sub_resource or node section.
+
+        Args:
+            scene: Path to the scene file, relative to src_path
+
+        Returns:
+            The header of the scene file
+
+        Raises:
+            OSError: If the scene file can't be read
+        """
+        header = b""
+        with open(self.src_path + scene, "rb") as file:
+            while len(header) < self.MAX_HEADER_SIZE:
+                chunk = file.read(self.CHUNK_SIZE)
+                if not chunk:
+                    break
+                with self._lock:
+                    self.bytes_read += len(chunk)
+                # a section start may be split between chunks, so the search starts at the last line of the header
+                search_start = header.rfind(b"\n") + 1
+                header = header + chunk
+                match = self.HEADER_END_PATTERN.search(header, search_start)
+                if match is not None:
+                    return header[:match.start()]
+        return header
+
+    def scene_scripts(self, scene: str) -> list[str]:
+        """
+        Gets all scripts referenced as ext_resource by a scene.
+
+        Args:
+            scene: Path to the scene file, relative to src_path
+
+        Returns:
+            Paths to the scripts, relative to src_path, in the order of the scene file
+
+        Raises:
+            OSError: If the scene file can't be read
+        """
+        scripts: list[str] = []
+        for match in self.EXT_RESOURCE_PATTERN.finditer(self.read_header(scene)):
+            attributes = dict(self.ATTRIBUTE_PATTERN.findall(match.group(1)))
+            if attributes.get(b"type") != b"Script":
+                continue
+            script = ""
+            if b"path" in attributes:
+                script = attributes[b"path"].decode("utf-8", "replace").removeprefix("res://")
+            elif b"uid" in attributes:
+                script = self.resolve_uid(attributes[b"uid"].decode("utf-8", "replace"))
+            if script and script not in scripts:
+                scripts.append(script)
+        return scripts
+
+    def resolve_uid(self, uid: str) -> str:
+        """
+        Resolves the uid of a script to its path. The *.uid files are read on first use only.
+
+        Args:
+            uid: The uid, e.g. "uid://b2k4x7mfw3c1p"
+
+        Returns:
+            Path to the script, relative to src_path, or "" if the uid is unknown
+        """
+        with self._lock:
+            if self._scripts_by_uid is None:
+                scripts_by_uid: dict[str, str] = {}
+                for uid_file in self.uid_files:
+                    try:
+                        with open(self.src_path + uid_file, "r") as file:
+                            scripts_by_uid[file.read().strip()] = uid_file.removesuffix(".uid")
+                    except OSError as e:
+                        print(f"Skipping file {self.src_path + uid_file}, reading failed with exception:")
+                        print(e)
+                self._scripts_by_uid = scripts_by_uid
+        return self._scripts_by_uid.get(uid, "")
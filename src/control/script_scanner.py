@@ -0,0 +1,179 @@
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from time import perf_counter, thread_time
+
+from src.control.gd_parser import GdParser
+from src.control.url_checker import UrlChecker
+from src.model.class_doc import ClassDoc
+from src.model.source_buffer import SourceBuffer
+
+
+class ScriptScanner:
+    """
+    Scans the docstrings of a single script file into a ClassDoc.
+
+    The scanner only holds the few settings needed for scanning, so it is cheap to send to worker processes when
+    scanning scripts in parallel.
+
+    Attributes:
+        src_path: The base directory of the project, scripts from the project are relative to it
+        columnar: Stores consts and vars of the scanned scripts column-wise if True, see ClassDoc
+        io_workers: Number of threads reading the scripts of a chunk ahead while scanning, 1 reads them one by one
+    """
+    def __init__(self, src_path: str = "", columnar: bool = False, io_workers: int = 1):
+        """
+        Constructor of the script scanner.
+
+        Args:
+            src_path: The base directory of the project, ending with "/"
+            columnar: Stores consts and vars of the scanned scripts column-wise if True
+            io_workers: Number of threads reading the scripts of a chunk ahead while scanning
+        """
+        self.src_path: str = src_path
+        self.columnar: bool = columnar
+        self.io_workers: int = io_workers
+
+    def scan_chunk(self, scripts: list[str], from_project: bool = True, timed: bool = False) -> tuple[list, dict]:
+        """
+        Scans several scripts one after another. Used as the unit of work for the worker processes.
+
+        If io_workers > 1, the files are read by a pool of threads, up to two reads per thread ahead of the script
+        being scanned, so waiting for the file system overlaps with scanning. The order of the results is not affected.
+
+        Args:
+            scripts: Paths to the scripts to read from
+            from_project: If True, the paths of the scripts are relative to the project root (src_path)
+            timed: Measures every scan if True, see scan_timed
+
+        Returns:
+            The ClassDoc of every script, or (ClassDoc, timing) tuples if timed, in the same order as scripts. And the
+            URL check counters of the chunk (see UrlChecker.stats), as they are kept per process
+        """
+        url_stats = UrlChecker.stats()
+        scan = self.scan_timed if timed else self.scan
+        if self.io_workers <= 1 or len(scripts) < 2:
+            return [scan(script, from_project) for script in scripts], UrlChecker.stats(url_stats)
+        class_docs: list = []
+        read_ahead = self.io_workers * 2
+        pending_sources: deque[Future] = deque()
+        next_read = 0
+        with ThreadPoolExecutor(max_workers=min(self.io_workers, len(scripts))) as executor:
+            for script in scripts:
+                while next_read < len(scripts) and len(pending_sources) < read_ahead:
+                    pending_sources.append(
+                        executor.submit(SourceBuffer, self.script_path(scripts[next_read], from_project))
+                    )
+                    next_read += 1
+                class_docs.append(scan(script, from_project, pending_sources.popleft()))
+        return class_docs, UrlChecker.stats(url_stats)
+
+    def scan_timed(
+            self,
+            script: str,
+            from_project: bool = True,
+            pending_source: Future = None
+    ) -> tuple[ClassDoc, dict]:
+        """
+        Scans a script like scan, measuring wall time, CPU time (of the scanning thread), bytes and lines of the script.
+
+        Args:
+            script: Path to the script to read from
+            from_project: If True, the path of the script is relative to the project root (src_path)
+            pending_source: The SourceBuffer of the script, if already being read by another thread
+
+        Returns:
+            The documentation of the script and its timing, with wall, cpu, bytes and lines attributes
+        """
+        start_wall = perf_counter()
+        start_cpu = thread_time()
+        class_doc = self.scan(script, from_project, pending_source)
+        timing = {"wall": perf_counter() - start_wall, "cpu": thread_time() - start_cpu, "bytes": 0, "lines": 0}
+        if class_doc.source is not None:
+            timing["bytes"] = len(class_doc.source)
+            timing["lines"] = class_doc.source.data.count(b"\n")
+            class_doc.source.release()
+        return class_doc, timing
+
+    def script_path(self, script: str, from_project: bool = True) -> str:
+        """
+        Gets the path of a script to open.
+
+        Args:
+            script: Path to the script
+            from_project: If True, the path of the script is relative to the project root (src_path)
+
+        Returns:
+            The path to open the script with
+        """
+        if from_project:
+            return self.src_path + script
+        return script
+
+    def scan(self, script: str, from_project: bool = True, pending_source: Future = None) -> ClassDoc:
+        """
+        Scans docstrings from script, registering docstring class, signal, enum, enum values, const, var, func, and
+        inner class categories
+
+        The script is tokenized once by the GdLexer, the GdParser builds the ClassDoc from the tokens. A large script is
+        released once parsed, see SourceBuffer.release.
+
+        Args:
+            script: Path to the script to read from
+            from_project: If True, the path of the script is relative to the project root (src_path)
+            pending_source: The SourceBuffer of the script, if already being read by another thread
+
+        Returns:
+            The documentation of the script, as far as it could be scanned
+        """
+        class_doc = ClassDoc(script, columnar=self.columnar)
+        fp_script = self.script_path(script, from_project)
+        try:
+            source = pending_source.result() if pending_source is not None else SourceBuffer(fp_script)
+            class_doc.set_code_span(source, 0, len(source))
+            try:
+                GdParser(source, class_doc, UrlChecker.check, self.columnar).parse()
+            finally:
+                source.release()
+        except Exception as e:
+
+            # todo: broader exception handling
+            print(f"Scanning {fp_script} failed with exception:")
+            print(e)
+        return class_doc
+
+    def scan_declarations(self, script: str, from_project: bool = True) -> ClassDoc:
+        """
+        Reads only the class declarations of a script (class_name, extends and inner classes), see
+        GdParser.parse_declarations. Much cheaper than a scan, used to complete the symbol index before the
+        documentation is written.
+
+        Args:
+            script: Path to the script to read from
+            from_project: If True, the path of the script is relative to the project root (src_path)
+
+        Returns:
+            The documentation of the script with its classes only, without members and source
+        """
+        class_doc = ClassDoc(script)
+        fp_script = self.script_path(script, from_project)
+        try:
+            source = SourceBuffer(fp_script)
+            GdParser.parse_declarations(source, class_doc)
+            source.release()
+        except Exception as e:
+            print(f"Reading the declarations of {fp_script} failed with exception:")
+            print(e)
+        return class_doc
+
+    @staticmethod
+    def check_url(url_to_check: str) -> bool:
+        """
+        Checks the pattern of an HTTP(S) URL address. Doesn't check if address exists.
+
+        Args:
+            url_to_check: URL address to check
+
+        Returns:
+            True if HTTP(S) URL address pattern is valid, otherwise False
+        """
+        return UrlChecker.check(url_to_check)
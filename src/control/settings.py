@@ -1,7 +1,12 @@
-from os.path import isfile
+from os import stat, replace
+from os.path import isfile, dirname, join
+from pickle import dump, load, HIGHEST_PROTOCOL, PickleError
+
 from ruamel.yaml import YAML
 from ruamel.yaml.comments import CommentedMap
 
+from src import __version__
+
 
 class Settings:
     """
@@ -10,8 +15,12 @@ class Settings:
     Attributes:
         doc_conf_file: The settings for reading the source are stored in this yaml file
         doc_conf_data: The deserialized settings for reading the sourcecode, also used as template at --init
-        yaml: Object for loading and serializing yaml
+        yaml: Object for round-trip loading (keeping comments) and serializing yaml
+        safe_yaml: Object for loading yaml without comments, using the C based loader if available
+        validated: True if the loaded settings were already validated unchanged at an earlier build
     """
+    VALIDATED_CACHE_FORMAT: int = 1
+
     def __init__(self):
         """
         Constructor of the class, defining class attributes.
@@ -24,16 +33,26 @@ class Settings:
             "project_scan_options": {
                 "src_path": "",
                 "read_gd_project": True,
-                "scene2src_links": True
+                "scene2src_links": True,
+                "ignore_patterns": []
             },
             "filelist_scan": False,
             "scan_list": [
                 "./file1.gd",
                 "./file2.gd"
             ],
-            "indent": "tabulator"
+            "indent": "tabulator",
+            "scan_cache": True,
+            "io_workers": 8,
+            "keep_doc_data": False,
+            "doc_database": False,
+            "search_index": False
         }
         self.yaml: YAML = YAML()
+        self.safe_yaml: YAML = YAML(typ="safe")
+        self.validated: bool = False
+        self._conf_key: tuple | None = None
+        self._settings_copy: dict | None = None
         print("Application settings initialized.")
 
     def init_settings(self) -> bool:
@@ -58,10 +77,17 @@ class Settings:
             print(e)
             return False
 
-    def load_settings(self) -> bool:
+    def load_settings(self, round_trip: bool = False) -> bool:
         """
         Loads the settings from the configuration file, if it exists, and serializes it into the doc_conf_data dict.
 
+        If the configuration file didn't change (same modification time and size) since its settings were validated
+        at an earlier build, the validated settings are taken from the validated cache file instead, and validated is
+        set True. Otherwise the file is loaded with the fast safe loader, or round-trip keeping comments if requested.
+
+        Args:
+            round_trip: Loads the settings as CommentedMap keeping the comments, e.g. to write them back, if True
+
         Returns:
             True if loading and serializing is successful. Further checks of the correctness of the file are not done
                 here, has to be done before reading the source at the build stage
@@ -72,9 +98,18 @@ class Settings:
             print("A settings template can be created with:")
             print("    md_gd4_docs --init")
             return False
+        self._settings_copy = None
+        self.validated = False
         try:
+            conf_stat = stat(self.doc_conf_file)
+            self._conf_key = (
+                self.VALIDATED_CACHE_FORMAT, __version__, conf_stat.st_mtime_ns, conf_stat.st_size, round_trip
+            )
+            if self.load_validated():
+                print(f"Documentation settings file {self.doc_conf_file} unchanged, validated settings loaded.")
+                return True
             with open(self.doc_conf_file, "r") as file:
-                self.doc_conf_data = self.yaml.load(file)
+                self.doc_conf_data = (self.yaml if round_trip else self.safe_yaml).load(file)
                 if not self.doc_conf_data["doc_destination"].endswith("/"):
                     self.doc_conf_data["doc_destination"] = \
                         self.doc_conf_data["doc_destination"] + "/"
@@ -88,12 +123,65 @@ class Settings:
             print(e)
             return False
 
-    def get_settings(self) -> CommentedMap:
+    def validated_cache_file(self) -> str:
+        """
+        Gets the path of the validated cache file, stored next to the configuration file.
+
+        Returns:
+            Path to the validated cache file
+        """
+        return join(dirname(self.doc_conf_file), "md_gd4_docs.settings.cache")
+
+    def load_validated(self) -> bool:
+        """
+        Loads the validated settings from the validated cache file, if they were stored for the current configuration
+        file (same modification time and size) and version.
+
+        Returns:
+            True if validated settings were loaded, otherwise False
+        """
+        if not isfile(self.validated_cache_file()):
+            return False
+        try:
+            with open(self.validated_cache_file(), "rb") as file:
+                cache_data = load(file)
+        except (OSError, EOFError, PickleError, AttributeError, ImportError):
+            return False
+        if not isinstance(cache_data, dict) or cache_data.get("key") != self._conf_key:
+            return False
+        self.doc_conf_data = cache_data["doc_conf_data"]
+        self.validated = True
+        return True
+
+    def mark_validated(self):
+        """
+        Stores the loaded settings in the validated cache file, after they passed the checks of the build. The next
+        load_settings of the unchanged configuration file skips parsing it, and the build skips the checks of the
+        settings (but not those on the file system, like the existence of src_path).
+        """
+        if self.validated or self._conf_key is None:
+            return
+        tmp_file = self.validated_cache_file() + ".tmp"
+        try:
+            with open(tmp_file, "wb") as file:
+                dump({"key": self._conf_key, "doc_conf_data": self.doc_conf_data}, file, HIGHEST_PROTOCOL)
+            replace(tmp_file, self.validated_cache_file())
+        except (OSError, PickleError) as e:
+            print(f"Writing validated settings {self.validated_cache_file()} failed with Exception:")
+            print(e)
+            return
+        self.validated = True
+
+    def get_settings(self) -> dict:
         """
-        Get the settings dict.
+        Get the settings dict. The copy of the loaded settings is only made once per load, later calls return the same
+        copy.
 
         Returns:
-            doc_conf_data: Deserialized settings object. Further checks of the correctness of this settings object is
-                not done here, has to be done before reading the source at the build stage
+            doc_conf_data: Deserialized settings object, a CommentedMap if loaded round-trip. Further checks of the
+                correctness of this settings object is not done here, has to be done before reading the source at the
+                build stage
         """
-        return CommentedMap(self.doc_conf_data)
+        if self._settings_copy is None:
+            self._settings_copy = self.doc_conf_data.copy()
+        return self._settings_copy
@@ -0,0 +1,146 @@
+class SettingsSchema:
+    """
+    Schema of the documentation settings, compiled once into a tuple of checks.
+
+    Every rule names a settings key (as path into the nested settings), the expected type, whether the key is
+    mandatory, the key that has to be true for the rule to apply, the error message and whether the userdoc link is
+    shown with it. The type checks work on round-trip (CommentedMap/CommentedSeq) and safe loaded (dict/list) settings
+    alike. Checks depending on several keys or on the file system are left to Build.check_doc_conf_data.
+
+    Attributes:
+        RULES: The rules, in the order they are checked
+        TYPE_CHECKS: Check function for every type used in the rules
+    """
+    RULES: tuple = (
+        (
+            ("indent",), "str", False, None, "Indent setting has to be either tabulator or spaces:number_of_spaces",
+            False
+        ),
+        (("doc_destination",), "str", True, None, "doc_destination not set in {file}, empty or wrong type", True),
+        (("rebuild_src_path",), "bool", True, None, "rebuild_src_path not set in {file} or wrong type", False),
+        (("project_scan",), "bool", True, None, "project_scan not set in {file} or wrong type", True),
+        (
+            ("project_scan_options",), "mapping", True, ("project_scan",),
+            "project_scan_options not set in {file}, wrong type or empty\n"
+            "project_scan_options are needed if project_scan is true", True
+        ),
+        (
+            ("project_scan_options", "src_path"), "str", True, ("project_scan",),
+            "src_path wrong type or not set in project_scan_option in {file}", True
+        ),
+        (
+            ("project_scan_options", "read_gd_project"), "bool", True, ("project_scan",),
+            "read_gd_project wrong type or not set in project_scan_option in {file}", True
+        ),
+        (
+            ("project_scan_options", "scene2src_links"), "bool", True, ("project_scan",),
+            "scene2src_links wrong type or not set in project_scan_option in {file}", True
+        ),
+        (
+            ("project_scan_options", "ignore_patterns"), "str_list", False, ("project_scan",),
+            "ignore_patterns in project_scan_option in {file} has to be a list of glob patterns", True
+        ),
+        (
+            ("scan_cache",), "bool", False, None,
+            "scan_cache in {file} has wrong type, only true or false are allowed", True
+        ),
+        (
+            ("columnar_members",), "bool", False, None,
+            "columnar_members in {file} has wrong type, only true or false are allowed", True
+        ),
+        (
+            ("keep_doc_data",), "bool", False, None,
+            "keep_doc_data in {file} has wrong type, only true or false are allowed", True
+        ),
+        (
+            ("io_workers",), "positive_int", False, None,
+            "io_workers in {file} has wrong type or value, only numbers from 1 up are allowed", True
+        ),
+        (
+            ("doc_database",), "bool", False, None,
+            "doc_database in {file} has wrong type, only true or false are allowed", True
+        ),
+        (
+            ("search_index",), "bool", False, None,
+            "search_index in {file} has wrong type, only true or false are allowed", True
+        ),
+        (("filelist_scan",), "bool", True, None, "filelist_scan not set in {file} or wrong type", True),
+        (
+            ("scan_list",), "list", True, ("filelist_scan",),
+            "scan_list not set in {file}, wrong type or empty\nscan_list is needed if filelist_scan is true", True
+        ),
+    )
+    TYPE_CHECKS: dict = {
+        "bool": lambda value: value.__class__ is bool,
+        "str": lambda value: isinstance(value, str) and value != "",
+        "mapping": lambda value: isinstance(value, dict),
+        "list": lambda value: isinstance(value, list),
+        "str_list": lambda value: isinstance(value, list) and all(isinstance(element, str) for element in value),
+        "positive_int": lambda value: value.__class__ is int and value >= 1,
+    }
+    _compiled: tuple | None = None
+
+    @classmethod
+    def compile(cls) -> tuple:
+        """
+        Compiles the rules into checks, only once per process.
+
+        Returns:
+            A tuple of (check function, message, show userdoc link) for every rule. The check function gets the
+            settings and returns False if the rule is violated
+        """
+        if cls._compiled is None:
+            cls._compiled = tuple(
+                (cls.compile_rule(path, cls.TYPE_CHECKS[value_type], required, condition), message, show_url)
+                for path, value_type, required, condition, message, show_url in cls.RULES
+            )
+        return cls._compiled
+
+    @staticmethod
+    def compile_rule(path: tuple, type_check, required: bool, condition: tuple | None):
+        """
+        Compiles a single rule into a check function.
+
+        Args:
+            path: Keys leading to the checked value
+            type_check: Check function for the type of the value
+            required: The value is mandatory if True
+            condition: Keys leading to a value that has to be true for the rule to apply, None to apply always
+
+        Returns:
+            The check function, returning False if the rule is violated
+        """
+        *parent_keys, key = path
+
+        def check(doc_conf_data: dict) -> bool:
+            if condition is not None:
+                enabled = doc_conf_data
+                for condition_key in condition:
+                    enabled = enabled.get(condition_key)
+                if not enabled:
+                    return True
+            parent = doc_conf_data
+            for parent_key in parent_keys:
+                parent = parent[parent_key]
+            if key not in parent:
+                return not required
+            return type_check(parent[key])
+
+        return check
+
+    @classmethod
+    def validate(cls, doc_conf_data: dict) -> tuple[str, bool] | None:
+        """
+        Checks the settings against the schema, stopping at the first violated rule.
+
+        Args:
+            doc_conf_data: The deserialized settings
+
+        Returns:
+            None if the settings follow the schema, otherwise the error message (with a {file} placeholder for the
+            settings file) and whether the userdoc link should be shown
+        """
+        for check, message, show_url in cls.compile():
+            if not check(doc_conf_data):
+                return message, show_url
+        return None
@@ -0,0 +1,313 @@
+from os import replace, remove
+from os.path import isfile
+from pickle import dump, load, HIGHEST_PROTOCOL, PickleError
+
+from src.model.class_doc import ClassDoc
+
+
+class SymbolIndex:
+    """
+    Global index of the symbols defined by the scanned scripts, completed before the documentation is written (from
+    the declarations of the scripts, see ScriptScanner.scan_declarations) and updated script by script afterward, so
+    cross-references (also to scripts written later) are resolved with O(1) lookups instead of scanning the
+    documentation of all scripts.
+
+    Classes are keyed by their class name, or by the path of the script for scripts without class_name, inner classes
+    qualified with the key of their outer class (like Player.Stats). Members are keyed by their qualified name, the
+    class key and the member name joined with "." (like Player.Stats.health, or Player.State.IDLE for enum members).
+    As the documentation of a script is released once written, members map to a small locator (kind, script, class
+    key) instead of the documentation node itself. The base class of every class is kept as inheritance graph,
+    together with the reverse edges. A class name defined by several scripts is kept for the script added first, the
+    other scripts are recorded in shadowed, to be reported. A script with class_name can also be named by its path
+    (like extends "res://player/player.gd"), which is resolved to its class name by all lookups.
+
+    The index can be saved and loaded, so an incremental build only updates the entries of changed scripts.
+
+    Attributes:
+        index_file: Path to the file the index is saved to, "" if not persisted
+        fingerprint: Settings and version the index depends on. A different fingerprint discards the saved index
+        classes: Script defining each class, keyed by class key
+        members: Kind, script and class key of each member, keyed by qualified name
+        bases: Base class of each class extending one, keyed by class key
+        subclasses: Class keys of the direct subclasses, keyed by base class
+        scripts: Class keys and qualified member names defined by each script, keyed by script
+        shadowed: Scripts defining a class already defined by another script, keyed by class key
+        script_classes: Class name of each script with class_name, keyed by script
+    """
+    INDEX_FORMAT: int = 3
+
+    def __init__(self, index_file: str = "", fingerprint: tuple = ()):
+        """
+        Constructor of the symbol index.
+
+        Args:
+            index_file: Path to the file the index is saved to, "" if not persisted
+            fingerprint: Settings and version the index depends on
+        """
+        self.index_file: str = index_file
+        self.fingerprint: tuple = (self.INDEX_FORMAT,) + tuple(fingerprint)
+        self.classes: dict[str, str] = {}
+        self.members: dict[str, tuple[str, str, str]] = {}
+        self.bases: dict[str, str] = {}
+        self.subclasses: dict[str, set[str]] = {}
+        self.scripts: dict[str, tuple[list[str], list[str]]] = {}
+        self.shadowed: dict[str, list[str]] = {}
+        self.script_classes: dict[str, str] = {}
+
+    @staticmethod
+    def class_key(class_doc: ClassDoc, outer_key: str = "") -> str:
+        """
+        Gets the key of a class in the index.
+
+        Args:
+            class_doc: The documentation of the class
+            outer_key: Key of the outer class, for inner classes
+
+        Returns:
+            The class name (qualified with the outer class for inner classes), or the path of the script for scripts
+            without class_name
+        """
+        if outer_key:
+            return f"{outer_key}.{class_doc.class_name}"
+        if class_doc.class_name == "not exposed":
+            return class_doc.file_name
+        return class_doc.class_name
+
+    @staticmethod
+    def base_key(extends: str) -> str:
+        """
+        Gets the class key of a base class, as named after extends.
+
+        Args:
+            extends: The base class, a class name or the (quoted) path of a script
+
+        Returns:
+            The class key, "" if the class doesn't extend another one
+        """
+        return extends.strip().strip("\"'").removeprefix("res://")
+
+    def add(self, class_doc: ClassDoc):
+        """
+        Adds the classes and members of a scanned script, replacing its previous entries.
+
+        Args:
+            class_doc: The documentation of the script
+        """
+        script = class_doc.file_name
+        if script in self.scripts:
+            self.remove(script)
+        class_keys: list[str] = []
+        member_names: list[str] = []
+        pending: list[tuple[ClassDoc, str]] = [(class_doc, self.class_key(class_doc))]
+        while pending:
+            current_doc, key = pending.pop()
+            if key in self.classes:
+                if script not in self.shadowed.setdefault(key, []):
+                    self.shadowed[key].append(script)
+            else:
+                self.classes[key] = script
+                class_keys.append(key)
+                base = self.base_key(current_doc.extends)
+                if base:
+                    self.bases[key] = base
+                    self.subclasses.setdefault(base, set()).add(key)
+            members: list[tuple[str, str]] = [("signal", signal_doc.name) for signal_doc in current_doc.signal_docs]
+            for enum_doc in current_doc.enum_docs:
+                if enum_doc.name:
+                    members.append(("enum", enum_doc.name))
+                    members.extend(
+                        ("enum_member", f"{enum_doc.name}.{member.value_name}") for member in enum_doc.members
+                    )
+                else:
+                    members.extend(("enum_member", member.value_name) for member in enum_doc.members)
+            members.extend(("const", const_doc.name) for const_doc in current_doc.const_docs)
+            members.extend(("var", var_doc.name) for var_doc in current_doc.var_docs)
+            members.extend(("func", func_doc.name) for func_doc in current_doc.func_docs)
+            for inner_class_doc in current_doc.inner_class_docs:
+                members.append(("class", inner_class_doc.class_name))
+                pending.append((inner_class_doc, self.class_key(inner_class_doc, key)))
+            for kind, name in members:
+                qualified_name = f"{key}.{name}"
+                if qualified_name not in self.members:
+                    self.members[qualified_name] = (kind, script, key)
+                    member_names.append(qualified_name)
+        self.scripts[script] = (class_keys, member_names)
+        script_key = self.class_key(class_doc)
+        if script_key != script and self.classes.get(script_key) == script:
+            self.script_classes[script] = script_key
+
+    def remove(self, script: str):
+        """
+        Drops all classes and members of a script.
+
+        Args:
+            script: Path of the script, relative to the project root
+        """
+        class_keys, member_names = self.scripts.pop(script, ([], []))
+        self.script_classes.pop(script, None)
+        for key in class_keys:
+            del self.classes[key]
+            base = self.bases.pop(key, None)
+            if base is not None:
+                self.subclasses[base].discard(key)
+                if not self.subclasses[base]:
+                    del self.subclasses[base]
+        for qualified_name in member_names:
+            del self.members[qualified_name]
+        for key in [key for key, scripts in self.shadowed.items() if script in scripts]:
+            self.shadowed[key].remove(script)
+            if not self.shadowed[key]:
+                del self.shadowed[key]
+
+    def prune(self, scripts: set[str]):
+        """
+        Drops the entries of all scripts which are not part of the project (anymore).
+
+        Args:
+            scripts: Paths of all scripts of the current build
+        """
+        for script in [script for script in self.scripts if script not in scripts]:
+            self.remove(script)
+
+    def resolve(self, class_name: str) -> str:
+        """
+        Gets the class key of a class, also if named by the path of a script with class_name.
+
+        Args:
+            class_name: The class key or the path of a script
+
+        Returns:
+            The class key, class_name itself if it isn't the path of a script with class_name
+        """
+        return self.script_classes.get(class_name, class_name)
+
+    def class_script(self, class_name: str) -> str | None:
+        """
+        Gets the script defining a class.
+
+        Args:
+            class_name: The class key, or the path of a script with class_name
+
+        Returns:
+            Path of the script, or None for unknown (e.g. engine) classes
+        """
+        return self.classes.get(self.resolve(class_name))
+
+    def is_inner_class(self, class_name: str) -> bool:
+        """
+        Checks if a class is an inner class, i.e. a member of another class.
+
+        Args:
+            class_name: The class key
+
+        Returns:
+            True for inner classes, False for script classes and unknown classes
+        """
+        entry = self.members.get(class_name)
+        return entry is not None and entry[0] == "class"
+
+    def member(self, qualified_name: str) -> tuple[str, str, str] | None:
+        """
+        Gets where a member is defined.
+
+        Args:
+            qualified_name: Class key and member name, joined with "."
+
+        Returns:
+            Kind (signal, enum, enum_member, const, var, func or class), script and class key of the member, or None if
+            unknown
+        """
+        return self.members.get(qualified_name)
+
+    def base_classes(self, class_name: str) -> list[str]:
+        """
+        Gets the chain of base classes of a class, up to the first class not defined in the project (like an engine
+        class).
+
+        Args:
+            class_name: The class key
+
+        Returns:
+            The base classes, the direct base class first
+        """
+        class_name = self.resolve(class_name)
+        chain: list[str] = []
+        base = self.resolve(self.bases.get(class_name, ""))
+        while base and base not in chain and base != class_name:
+            chain.append(base)
+            base = self.resolve(self.bases.get(base, ""))
+        return chain
+
+    def inherited_by(self, class_name: str) -> list[str]:
+        """
+        Gets the direct subclasses of a class, also those extending it by the path of its script.
+
+        Args:
+            class_name: The class key
+
+        Returns:
+            The class keys of the subclasses, sorted
+        """
+        subclasses = set(self.subclasses.get(class_name, ()))
+        script = self.classes.get(class_name)
+        if script is not None and self.script_classes.get(script) == class_name:
+            subclasses.update(self.subclasses.get(script, ()))
+        return sorted(subclasses)
+
+    def load(self) -> bool:
+        """
+        Loads the index from index_file, if it exists and was saved with the same fingerprint.
+
+        Returns:
+            True if the index was loaded, otherwise False (starting with an empty index)
+        """
+        if not self.index_file or not isfile(self.index_file):
+            return False
+        try:
+            with open(self.index_file, "rb") as file:
+                index_data = load(file)
+        except (OSError, EOFError, PickleError, AttributeError, ImportError) as e:
+            print(f"Ignoring symbol index {self.index_file}, reading failed with exception:")
+            print(e)
+            return False
+        if not isinstance(index_data, dict) or index_data.get("fingerprint") != self.fingerprint:
+            return False
+        self.classes = index_data["classes"]
+        self.members = index_data["members"]
+        self.bases = index_data["bases"]
+        self.subclasses = index_data["subclasses"]
+        self.scripts = index_data["scripts"]
+        self.shadowed = index_data["shadowed"]
+        self.script_classes = index_data["script_classes"]
+        return True
+
+    def save(self) -> bool:
+        """
+        Writes the index to index_file, via a temporary file renamed over the old index.
+
+        Returns:
+            True if writing the index file was successful
+        """
+        if not self.index_file:
+            return False
+        tmp_index_file = self.index_file + ".tmp"
+        try:
+            with open(tmp_index_file, "wb") as file:
+                dump({
+                    "fingerprint": self.fingerprint,
+                    "classes": self.classes,
+                    "members": self.members,
+                    "bases": self.bases,
+                    "subclasses": self.subclasses,
+                    "scripts": self.scripts,
+                    "shadowed": self.shadowed,
+                    "script_classes": self.script_classes
+                }, file, HIGHEST_PROTOCOL)
+            replace(tmp_index_file, self.index_file)
+        except (OSError, PickleError) as e:
+            print(f"Writing symbol index {self.index_file} failed with exception:")
+            print(e)
+            if isfile(tmp_index_file):
+                remove(tmp_index_file)
+            return False
+        return True
@@ -0,0 +1,72 @@
+from functools import lru_cache
+from re import compile
+
+
+class UrlChecker:
+    """
+    Checks the URLs of @tutorial tags, with the same results as validators.url restricted to HTTP(S) addresses.
+
+    Everything not starting with http:// or https:// is rejected by a precompiled pattern without calling validators.
+    The results of validators are memoized in an LRU cache, as large projects refer to the same few tutorial URLs
+    over and over again. The cache and the counters are kept per process, for the whole build.
+
+    Attributes:
+        URL_PATTERN: Pattern an URL has to start with, to be validated at all
+        CACHE_SIZE: Maximum number of URLs kept in the cache
+        rejected: Number of URLs rejected by URL_PATTERN in this process
+    """
+    URL_PATTERN = compile(r"https?://")
+    CACHE_SIZE: int = 1024
+    rejected: int = 0
+
+    @classmethod
+    def check(cls, url_to_check: str) -> bool:
+        """
+        Checks the pattern of an HTTP(S) URL address. Doesn't check if address exists.
+
+        Args:
+            url_to_check: URL address to check
+
+        Returns:
+            True if HTTP(S) URL address pattern is valid, otherwise False
+        """
+        if cls.URL_PATTERN.match(url_to_check) is None:
+            cls.rejected += 1
+            return False
+        return cls.validate(url_to_check)
+
+    @staticmethod
+    @lru_cache(maxsize=CACHE_SIZE)
+    def validate(url_to_check: str) -> bool:
+        """
+        Validates an URL with validators, memoized.
+
+        Args:
+            url_to_check: URL address to check
+
+        Returns:
+            True if validators accepts the URL, otherwise False
+        """
+        # imported on demand, validators is slow to import and only needed for scripts with @tutorial tags
+        from validators import url
+
+        return bool(url(url_to_check))
+
+    @classmethod
+    def stats(cls, since: dict = None) -> dict:
+        """
+        Gets the counters of this process.
+
+        Args:
+            since: Counters taken earlier, to get only the checks made after them
+
+        Returns:
+            Number of checks served from the cache (cached), validated with validators (validated) and rejected by
+            URL_PATTERN (rejected)
+        """
+        cache_info = cls.validate.cache_info()
+        counters = {"cached": cache_info.hits, "validated": cache_info.misses, "rejected": cls.rejected}
+        if since is not None:
+            for name in counters:
+                counters[name] -= since[name]
+        return counters
@@ -3,14 +3,28 @@ from src.model.signal_doc import SignalDoc
 from src.model.enum_doc import EnumDoc
 from src.model.var_doc import VarDoc
 from src.model.func_doc import FuncDoc
-from src.model.tag_doc import TagDoc
+from src.model.tag_doc import TagDoc, NO_TAGS
+from src.model.var_doc_table import VarDocTable
+from src.model.source_buffer import SourceBuffer
 
 
 class ClassDoc:
     """
     Model class for storing class documentation.
     """
-    def __init__(self, file_name: str, class_name: str = "not exposed", inner_class: bool = False):
+    __slots__ = (
+        "_code_fragments", "_source", "code_span", "file_name", "class_name", "is_inner_class", "extends", "tags",
+        "brief_description", "detail_description", "signal_docs", "enum_docs", "const_docs", "var_docs", "func_docs",
+        "inner_class_docs"
+    )
+
+    def __init__(
+            self,
+            file_name: str,
+            class_name: str = "not exposed",
+            inner_class: bool = False,
+            columnar: bool = False
+    ):
         """
         Constructor of the class documentation model.
 
@@ -18,22 +32,26 @@ class ClassDoc:
             file_name: Filename of the script
             class_name: Class name, only needed to expose class for inheritance or for inner classes
             inner_class: Is it an inner class? class_name becomes mandatory if True.
+            columnar: Stores consts and vars column-wise in a VarDocTable instead of a list of VarDoc if True, to
+                save memory on scripts with a lot of documented members
 
         Raises:
             Exception: If inner class True without or with invalid class_name
         """
-        self.code: str = ""
+        self._code_fragments: list[str] = []
+        self._source: SourceBuffer | None = None
+        self.code_span: tuple[int, int] | None = None
         self.file_name: str = file_name
         self.class_name: str = class_name
         self.is_inner_class: bool = inner_class
         self.extends: str = ""
-        self.tags: list[TagDoc] = []
+        self.tags: tuple[TagDoc, ...] = NO_TAGS
         self.brief_description: str = ""
         self.detail_description: str = ""
         self.signal_docs: list[SignalDoc] = []
         self.enum_docs: list[EnumDoc] = []
-        self.const_docs: list[VarDoc] = []
-        self.var_docs: list[VarDoc] = []
+        self.const_docs: list[VarDoc] | VarDocTable = VarDocTable() if columnar else []
+        self.var_docs: list[VarDoc] | VarDocTable = VarDocTable() if columnar else []
         self.func_docs: list[FuncDoc] = []
         self.inner_class_docs: list[ClassDoc] = []
         if self.inner_class_docs and (self.class_name == "not exposed" or " " in self.class_name):
@@ -66,7 +84,16 @@ class ClassDoc:
         """
         self.extends = extends
 
-    def add_signal(self, name: str, description: str, tags: list[TagDoc] = None):
+    def set_tags(self, tags: list[TagDoc]):
+        """
+        Sets the tags of the script file (or inner class)
+
+        Args:
+            tags: Tag(s) of the class, if any
+        """
+        self.tags = tuple(tags) if tags else NO_TAGS
+
+    def add_signal(self, name: str, description: str, tags: list[TagDoc] = None, args: list[VarDoc] = None):
         """
         Adds a signal description item to the doc
 
@@ -74,8 +101,9 @@ class ClassDoc:
             name: Name of the signal
             description: Description of the signal
             tags: Tag(s) of the signal, if any
+            args: Argument(s) list of the signal, if any
         """
-        self.signal_docs.append(SignalDoc(name, description, tags))
+        self.signal_docs.append(SignalDoc(name, description, tags, args))
 
     def add_enum(self, name: str, description: str, members: list[EnumMemberDoc], tags: list[TagDoc] = None):
         """
@@ -88,11 +116,6 @@ class ClassDoc:
             tags: Tag(s) of the enum, if any
         """
         self.enum_docs.append(EnumDoc(name, description, members, tags))
-        if tags is None:
-            self.tags: list[TagDoc] = []
-        else:
-            self.tags: list[TagDoc] = tags
-        pass
 
     def add_attribute(
             self,
@@ -114,16 +137,101 @@ class ClassDoc:
             var_type: Could be "const", "export_var", "var" or "onready_var"
             tags: Tag(s) of the signal, if any
         """
-        if var_type == "const":
-            self.const_docs.append(VarDoc(name, data_type, description, value, var_type, tags))
+        var_docs = self.const_docs if var_type == "const" else self.var_docs
+        if isinstance(var_docs, VarDocTable):
+            var_docs.add(name, data_type, description, value, var_type, tags)
         else:
-            self.var_docs.append(VarDoc(name, data_type, description, value, var_type, tags))
+            var_docs.append(VarDoc(name, data_type, description, value, var_type, tags))
+
+    def add_func(
+            self,
+            name: str,
+            description: str,
+            args: list[VarDoc],
+            tags: list[TagDoc] = None,
+            return_type: str = "undefined",
+            return_description: str = "",
+            is_static: bool = False
+    ) -> FuncDoc:
+        """
+        Adds a function item to the doc
+
+        Args:
+            name: Name of the function
+            description: Description of the function
+            args: Argument(s) list of the function
+            tags: Tag(s) of the function, if any
+            return_type: Return type of the function, "undefined" if not declared
+            return_description: Description of the return value
+            is_static: Is it a static function?
+
+        Returns:
+            The added function doc, e.g. to set its code
+        """
+        func_doc = FuncDoc(name, description, args, tags, return_type, return_description, is_static)
+        self.func_docs.append(func_doc)
+        return func_doc
+
+    @property
+    def code(self) -> str:
+        """
+        Code of the script (or inner class). A code span is decoded from the source buffer, appended code lines are
+        only joined when the code is read.
+
+        Returns:
+            All code lines as one str
+        """
+        if self._source is not None:
+            return self._source.text(*self.code_span)
+        if len(self._code_fragments) != 1:
+            self._code_fragments = ["".join(self._code_fragments)]
+        return self._code_fragments[0]
+
+    @code.setter
+    def code(self, code: str):
+        self._source = None
+        self.code_span = None
+        self._code_fragments = [code]
+
+    @property
+    def source(self) -> SourceBuffer | None:
+        """
+        Buffer holding the source file, to slice source snippets from without reading the file again. None if the
+        code isn't referred to by span (e.g. set as str)
+        """
+        return self._source
+
+    def set_code_span(self, source: SourceBuffer, start: int, end: int):
+        """
+        Refers the code of the script (or inner class) to a span of its source buffer, without copying the code.
+
+        Args:
+            source: The buffer holding the source file
+            start: Start offset of the code in source
+            end: End offset of the code in source
+        """
+        self._source = source
+        self.code_span = (start, end)
+        self._code_fragments = []
 
     def append_code_line(self, line: str):
         """
-        Appends a line of code to the func doc. No auto linebreak, so \n need to be in line (if needed)
+        Appends a line of code to the class doc. No auto linebreak, so \n need to be in line (if needed)
 
         Args:
             line: The line of code to be added
         """
-        self.code = self.code + line
+        self._code_fragments.append(line)
+
+    def __getstate__(self) -> tuple[None, dict]:
+        """
+        Joins appended code lines before pickling. A code span is pickled as offsets together with the source buffer,
+        which is pickled only once for all models referring to it (see SourceBuffer.__getstate__).
+
+        Returns:
+            The slot values to pickle
+        """
+        state = {slot: getattr(self, slot) for slot in self.__slots__}
+        if self._source is None:
+            state["_code_fragments"] = ["".join(self._code_fragments)] if self._code_fragments else []
+        return None, state
@@ -1,11 +1,13 @@
 from src.model.enum_member_doc import EnumMemberDoc
-from src.model.tag_doc import TagDoc
+from src.model.tag_doc import TagDoc, NO_TAGS
 
 
 class EnumDoc:
     """
     Model class for storing enum documentation (including enum members)
     """
+    __slots__ = ("name", "description", "tags", "members")
+
     def __init__(self, name: str, description: str, members: list[EnumMemberDoc], tags: list[TagDoc] = None):
         """
         Constructor of the enum documentation model
@@ -13,11 +15,10 @@ class EnumDoc:
         Args:
             name: Name of the enum
             description: Description of the enum
+            members: All members of the enum
+            tags: Tag(s) of the enum, if any
         """
         self.name: str = name
         self.description: str = description
-        if tags is None:
-            self.tags: list[TagDoc] = []
-        else:
-            self.tags: list[TagDoc] = tags
+        self.tags: tuple[TagDoc, ...] = tuple(tags) if tags else NO_TAGS
         self.members: list[EnumMemberDoc] = members
@@ -1,10 +1,12 @@
-from src.model.tag_doc import TagDoc
+from src.model.tag_doc import TagDoc, NO_TAGS
 
 
 class EnumMemberDoc:
     """
     Model class for storing enum members
     """
+    __slots__ = ("value_name", "value_int", "tags", "description")
+
     def __init__(self, value_name: str, value_int: int, description: str = "", tags: list[TagDoc] = None):
         """
         Constructor of the enum member documentation model
@@ -17,8 +19,5 @@ class EnumMemberDoc:
 
         self.value_name = value_name
         self.value_int = value_int
-        if tags is None:
-            self.tags: list[TagDoc] = []
-        else:
-            self.tags: list[TagDoc] = tags
+        self.tags: tuple[TagDoc, ...] = tuple(tags) if tags else NO_TAGS
         self.description = description
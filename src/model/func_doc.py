@@ -1,12 +1,27 @@
 from src.model.var_doc import VarDoc
-from src.model.tag_doc import TagDoc
+from src.model.tag_doc import TagDoc, NO_TAGS
+from src.model.source_buffer import SourceBuffer
 
 
 class FuncDoc:
     """
     Model class for holding documentation for functions
     """
-    def __init__(self, name: str, description: str, args: list[VarDoc], tags: list[TagDoc] = None):
+    __slots__ = (
+        "_code_fragments", "_source", "code_span", "name", "tags", "description", "args", "return_type",
+        "return_description", "is_static"
+    )
+
+    def __init__(
+            self,
+            name: str,
+            description: str,
+            args: list[VarDoc],
+            tags: list[TagDoc] = None,
+            return_type: str = "undefined",
+            return_description: str = "",
+            is_static: bool = False
+    ):
         """
         Constructor of the function documentation model.
 
@@ -14,15 +29,55 @@ class FuncDoc:
             name: Name of the function
             description: Description of the function
             args: Argument(s) list of the function
+            tags: Tag(s) of the function, if any
+            return_type: Return type of the function, "undefined" if not declared
+            return_description: Description of the return value
+            is_static: Is it a static function?
         """
-        self.code: str = ""
+        self._code_fragments: list[str] = []
+        self._source: SourceBuffer | None = None
+        self.code_span: tuple[int, int] | None = None
         self.name = name
-        if tags is None:
-            self.tags: list[TagDoc] = []
-        else:
-            self.tags: list[TagDoc] = tags
+        self.tags: tuple[TagDoc, ...] = tuple(tags) if tags else NO_TAGS
         self.description = description
         self.args = args
+        self.return_type: str = return_type
+        self.return_description: str = return_description
+        self.is_static: bool = is_static
+
+    @property
+    def code(self) -> str:
+        """
+        Code of the function. A code span is decoded from the source buffer, appended code lines are only joined
+        when the code is read.
+
+        Returns:
+            All code lines as one str
+        """
+        if self._source is not None:
+            return self._source.text(*self.code_span)
+        if len(self._code_fragments) != 1:
+            self._code_fragments = ["".join(self._code_fragments)]
+        return self._code_fragments[0]
+
+    @code.setter
+    def code(self, code: str):
+        self._source = None
+        self.code_span = None
+        self._code_fragments = [code]
+
+    def set_code_span(self, source: SourceBuffer, start: int, end: int):
+        """
+        Refers the code of the function to a span of its source buffer, without copying the code.
+
+        Args:
+            source: The buffer holding the source file
+            start: Start offset of the code in source
+            end: End offset of the code in source
+        """
+        self._source = source
+        self.code_span = (start, end)
+        self._code_fragments = []
 
     def append_code_line(self, line: str):
         """
@@ -31,7 +86,20 @@ class FuncDoc:
         Args:
             line: The line of code to be added
         """
-        self.code = self.code + line
+        self._code_fragments.append(line)
+
+    def __getstate__(self) -> tuple[None, dict]:
+        """
+        Joins appended code lines before pickling. A code span is pickled as offsets together with the source buffer,
+        which is pickled only once for all models referring to it (see SourceBuffer.__getstate__).
+
+        Returns:
+            The slot values to pickle
+        """
+        state = {slot: getattr(self, slot) for slot in self.__slots__}
+        if self._source is None:
+            state["_code_fragments"] = ["".join(self._code_fragments)] if self._code_fragments else []
+        return None, state
 
     def set_code(self, code: str):
         """
@@ -1,11 +1,14 @@
-from src.model.tag_doc import TagDoc
+from src.model.tag_doc import TagDoc, NO_TAGS
+from src.model.var_doc import VarDoc
 
 
 class SignalDoc:
     """
     Model class for holding documentation for signals.
     """
-    def __init__(self, name: str, description: str, tags: list[TagDoc] = None):
+    __slots__ = ("name", "tags", "description", "args")
+
+    def __init__(self, name: str, description: str, tags: list[TagDoc] = None, args: list[VarDoc] = None):
         """
         Constructor of the signal documentation model.
 
@@ -13,10 +16,9 @@ class SignalDoc:
             name: Name of the signal
             description: Description of the signal
             tags: Tag(s) of the signal, if any
+            args: Argument(s) list of the signal, if any
         """
         self.name: str = name
-        if tags is None:
-            self.tags: list[TagDoc] = []
-        else:
-            self.tags: list[TagDoc] = tags
+        self.tags: tuple[TagDoc, ...] = tuple(tags) if tags else NO_TAGS
         self.description: str = description
+        self.args: tuple[VarDoc, ...] = tuple(args) if args else ()
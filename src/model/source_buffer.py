@@ -0,0 +1,201 @@
+from mmap import mmap, ACCESS_READ
+from os import fstat
+from array import array
+
+
+class SourceBuffer:
+    """
+    Read-only buffer holding the content of a source file, read once as a whole.
+
+    Small files are read into memory, large files are memory-mapped. Lines and code parts are addressed by (start, end)
+    byte offsets into the buffer, so models can refer to source code spans instead of holding copies of it. The text is
+    only decoded (as UTF-8) for the span requested.
+
+    Large files are only mapped while they are parsed, see release: a file truncated while mapped would crash the
+    process on the next read (SIGBUS), and on Windows a mapped file can't be saved by the editor.
+
+    A buffer can also refer to a file scanned before (e.g. by documentation loaded from the scan cache) without reading
+    it: the file is read on first access of data, and only if it still has the size and modification time it had when
+    it was scanned. Otherwise the code spans don't fit the file anymore, and the buffer stays empty.
+
+    Attributes:
+        file_path: Path to the source file
+        file_state: Size and modification time (ns) of the file when it was read
+        data: The raw content of the file, bytes or mmap
+        line_offsets: Byte offset of the start of every line, followed by the size of the buffer. Built on first use
+    """
+    MMAP_THRESHOLD: int = 1 << 20
+
+    def __init__(self, file_path: str, file_state: tuple[int, int] | None = None):
+        """
+        Constructor of the source buffer, reads (or maps) the file, unless file_state is given.
+
+        Args:
+            file_path: Path to the source file
+            file_state: Size and modification time (ns) of a file scanned before. If given, the file is only read on
+                first access of data
+
+        Raises:
+            OSError: If the file can't be read
+        """
+        self.file_path: str = file_path
+        self.file_state: tuple[int, int] | None = file_state
+        self._data: bytes | mmap | None = None
+        self._line_offsets: array | None = None
+        if file_state is None:
+            with open(file_path, "rb") as file:
+                file_stat = fstat(file.fileno())
+                self.file_state = (file_stat.st_size, file_stat.st_mtime_ns)
+                if file_stat.st_size >= self.MMAP_THRESHOLD:
+                    self._data = mmap(file.fileno(), 0, access=ACCESS_READ)
+                else:
+                    self._data = file.read()
+
+    @property
+    def data(self) -> bytes | mmap:
+        """
+        The raw content of the file, read on first access if the buffer refers to a file scanned before.
+        """
+        if self._data is None:
+            self._data = self.read_unchanged()
+        return self._data
+
+    def read_unchanged(self) -> bytes:
+        """
+        Reads the file, if it didn't change since it was scanned.
+
+        Returns:
+            The content of the file, empty if the file changed (size or modification time) or can't be read
+        """
+        try:
+            with open(self.file_path, "rb") as file:
+                file_stat = fstat(file.fileno())
+                if (file_stat.st_size, file_stat.st_mtime_ns) != self.file_state:
+                    return b""
+                return file.read()
+        except OSError:
+            return b""
+
+    def release(self):
+        """
+        Releases the content of a large file (closing its memory mapping), once it is parsed. It is read again, as a
+        copy instead of a mapping, on the next access of data. The content of small files is kept.
+        """
+        if self._data is None or len(self._data) < self.MMAP_THRESHOLD:
+            return
+        if isinstance(self._data, mmap):
+            self._data.close()
+        self._data = None
+        self._line_offsets = None
+
+    @property
+    def line_offsets(self) -> array:
+        """
+        Byte offset of the start of every line, followed by the size of the buffer.
+        """
+        if self._line_offsets is None:
+            self._line_offsets = self.index_lines(self.data)
+        return self._line_offsets
+
+    @staticmethod
+    def index_lines(data: bytes | mmap) -> array:
+        """
+        Builds the line offset index of a buffer.
+
+        Args:
+            data: The buffer to index
+
+        Returns:
+            Byte offset of the start of every line, followed by the size of the buffer
+        """
+        offsets = array("q", [0])
+        size = len(data)
+        position = data.find(b"\n")
+        while position != -1:
+            offsets.append(position + 1)
+            position = data.find(b"\n", position + 1)
+        if offsets[-1] != size:
+            offsets.append(size)
+        return offsets
+
+    def __getstate__(self) -> dict:
+        """
+        Pickles the file path and state and the content as bytes (also of a memory-mapped file), without the line
+        offset index, which is rebuilt on first use. The content of a released buffer isn't read again for pickling,
+        the unpickled buffer reads the file on first access. Models referring to the same buffer share it in a pickle,
+        so the source is pickled once per script, however many code spans refer to it.
+
+        Returns:
+            The state to pickle
+        """
+        return {
+            "file_path": self.file_path,
+            "file_state": self.file_state,
+            "data": bytes(self._data) if self._data is not None else None
+        }
+
+    def __setstate__(self, state: dict):
+        """
+        Restores an unpickled buffer.
+
+        Args:
+            state: The state pickled by __getstate__
+        """
+        self.file_path = state["file_path"]
+        self.file_state = state["file_state"]
+        self._data = state["data"]
+        self._line_offsets = None
+
+    def __len__(self) -> int:
+        """
+        Size of the buffer in bytes.
+        """
+        return len(self.data)
+
+    @property
+    def line_count(self) -> int:
+        """
+        Number of lines in the buffer.
+        """
+        return len(self.line_offsets) - 1
+
+    def line_span(self, first_line: int, last_line: int = None) -> tuple[int, int]:
+        """
+        Gets the byte offsets of a range of lines.
+
+        Args:
+            first_line: Index of the first line (starting at 0)
+            last_line: Index of the last line (included), defaults to first_line
+
+        Returns:
+            Start and end offset of the lines, including the linebreak of the last line
+        """
+        if last_line is None:
+            last_line = first_line
+        return self.line_offsets[first_line], self.line_offsets[last_line + 1]
+
+    def text(self, start: int = 0, end: int = None) -> str:
+        """
+        Decodes a span of the buffer.
+
+        Args:
+            start: Start offset of the span
+            end: End offset of the span, defaults to the end of the buffer
+
+        Returns:
+            The text of the span, with \r\n linebreaks converted to \n
+        """
+        if end is None:
+            end = len(self.data)
+        return self.data[start:end].decode("utf-8", errors="replace").replace("\r\n", "\n")
+
+    def lines(self):
+        """
+        Iterates over all lines of the buffer, decoding one line at a time.
+
+        Returns:
+            Generator yielding the text of every line, including its linebreak
+        """
+        offsets = self.line_offsets
+        for index in range(len(offsets) - 1):
+            yield self.text(offsets[index], offsets[index + 1])
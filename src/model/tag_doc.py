@@ -4,6 +4,8 @@ class TagDoc:
     """
     Model class for holding documentation for tags
     """
+    __slots__ = ("tag_type", "tutorial_url", "tutorial_name")
+
     def __init__(self, tag_type: str, tutorial_url: str = "", tutorial_name: str = ""):
         """
         Constructor of the tag documentation model.
@@ -19,7 +21,9 @@ class TagDoc:
         self.tag_type = tag_type
         self.tutorial_url = tutorial_url
         self.tutorial_name = tutorial_name
-        if self.tag_type != "@tutorial" \
-                or self.tag_type != "@experimental" \
-                or self.tag_type != "@deprecated":
+        if self.tag_type not in ("@tutorial", "@experimental", "@deprecated"):
             raise Exception('Only "@tutorial", "@experimental" or "@deprecated" are valid tag types')
+
+
+NO_TAGS: tuple[TagDoc, ...] = ()
+"""Shared (immutable) tags of all documented members without tags"""
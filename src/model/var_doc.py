@@ -1,10 +1,11 @@
-from src.model.tag_doc import TagDoc
+from src.model.tag_doc import TagDoc, NO_TAGS
 
 
 class VarDoc:
     """
     Model class for holding documentation for a var or const.
     """
+    __slots__ = ("name", "data_type", "tags", "description", "value", "var_type")
 
     def __init__(
             self,
@@ -28,15 +29,9 @@ class VarDoc:
         """
         self.name: str = name
         self.data_type: str = data_type
-        if tags is None:
-            self.tags: list[TagDoc] = []
-        else:
-            self.tags: list[TagDoc] = tags
+        self.tags: tuple[TagDoc, ...] = tuple(tags) if tags else NO_TAGS
         self.description: str = description
         self.value = value
         self.var_type: str = var_type
-        if self.var_type != "const" \
-                or self.var_type != "export_var" \
-                or self.var_type != "var" \
-                or self.var_type != "onready_var":
+        if self.var_type not in ("const", "export_var", "var", "onready_var"):
             raise Exception('Only "const", "export_var", "var" or "onready_var" are valid var types')
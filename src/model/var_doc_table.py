@@ -0,0 +1,107 @@
+from src.model.var_doc import VarDoc
+from src.model.tag_doc import TagDoc, NO_TAGS
+
+
+class VarDocTable:
+    """
+    Columnar storage for a large number of var or const documentations.
+
+    Instead of one VarDoc object per member, every attribute is kept in its own column list, and tags are only stored
+    for the members that have any. VarDoc objects are created on access only. Supports the list operations used on
+    ClassDoc.const_docs and ClassDoc.var_docs (append, len, index access and iteration).
+
+    Attributes:
+        names: Column of the member names
+        data_types: Column of the member data types
+        descriptions: Column of the member descriptions
+        values: Column of the member values
+        var_types: Column of the member var types
+        tags: Tags of the members having tags, keyed by row index
+    """
+    __slots__ = ("names", "data_types", "descriptions", "values", "var_types", "tags")
+
+    def __init__(self):
+        """
+        Constructor of the columnar var documentation storage.
+        """
+        self.names: list[str] = []
+        self.data_types: list[str] = []
+        self.descriptions: list[str] = []
+        self.values: list = []
+        self.var_types: list[str] = []
+        self.tags: dict[int, tuple[TagDoc, ...]] = {}
+
+    def add(
+            self,
+            name: str,
+            data_type: str,
+            description: str,
+            value=None,
+            var_type: str = "var",
+            tags: list[TagDoc] = None
+    ):
+        """
+        Adds a var or const documentation as new row.
+
+        Args:
+            name: Name of the var or const
+            data_type: Data type of the var or const
+            description: Description of the var or const
+            value: Value of the var or const, if any
+            var_type: Could be "const", "export_var", "var" or "onready_var"
+            tags: Tag(s) of the var or const, if any
+
+        Raises:
+            Exception: If var_type invalid
+        """
+        if var_type not in ("const", "export_var", "var", "onready_var"):
+            raise Exception('Only "const", "export_var", "var" or "onready_var" are valid var types')
+        if tags:
+            self.tags[len(self.names)] = tuple(tags)
+        self.names.append(name)
+        self.data_types.append(data_type)
+        self.descriptions.append(description)
+        self.values.append(value)
+        self.var_types.append(var_type)
+
+    def append(self, var_doc: VarDoc):
+        """
+        Adds the data of a VarDoc as new row.
+
+        Args:
+            var_doc: The var or const documentation to add
+        """
+        self.add(
+            var_doc.name, var_doc.data_type, var_doc.description, var_doc.value, var_doc.var_type, var_doc.tags
+        )
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def __getitem__(self, index: int) -> VarDoc:
+        """
+        Creates the VarDoc of a row.
+
+        Args:
+            index: Index of the row
+
+        Returns:
+            The var or const documentation of the row
+        """
+        if index < 0:
+            index += len(self.names)
+        return VarDoc(
+            self.names[index],
+            self.data_types[index],
+            self.descriptions[index],
+            self.values[index],
+            self.var_types[index],
+            self.tags.get(index, NO_TAGS)
+        )
+
+    def __iter__(self):
+        """
+        Iterates over the VarDoc of every row.
+        """
+        for index in range(len(self.names)):
+            yield self[index]
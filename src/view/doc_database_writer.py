@@ -0,0 +1,167 @@
+import sqlite3
+from json import dumps
+from os import makedirs, remove, replace
+from os.path import isfile
+
+from src import __version__
+from src.control.doc_database import DocDatabase
+from src.control.symbol_index import SymbolIndex
+from src.model.class_doc import ClassDoc
+from src.view.json_writer import JsonWriter
+
+
+class DocDatabaseWriter:
+    """
+    Writes the documentation of every script into a single indexed SQLite database (md_gd4_docs.db in
+    doc_destination), to be queried with DocDatabase by class name, script path or member name.
+
+    Every script gets one row with its linked scenes, each of its classes and members one row with its JSON record
+    (as in the export of the JsonWriter) in the indexed classes and members tables, keyed like in the SymbolIndex. A
+    class defined by several scripts is kept for the script written first. The first build writes into a new temporary
+    database within a single transaction, renamed over the old database by finish, so readers never see a partial
+    database. After finish, further write and remove calls (e.g. in watch mode) update the database in place, committed
+    by the next finish.
+
+    Attributes:
+        doc_destination: Destination directory for the database, ending with "/"
+        gd_project: Information extracted from the project.godot file
+        db_file: Path of the database file
+    """
+    DB_FILE: str = "md_gd4_docs.db"
+
+    def __init__(self, doc_destination: str, gd_project: dict = None):
+        """
+        Constructor of the database writer. Starts the database at once.
+
+        Args:
+            doc_destination: Destination directory for the database, created if not existing
+            gd_project: Information extracted from the project.godot file, if any
+        """
+        if not doc_destination.endswith("/"):
+            doc_destination = doc_destination + "/"
+        self.doc_destination: str = doc_destination
+        self.gd_project: dict = gd_project if gd_project is not None else {}
+        self.db_file: str = doc_destination + self.DB_FILE
+        self._scripts: set[str] = set()
+        makedirs(doc_destination, exist_ok=True)
+        self._tmp_db_file: str | None = self.db_file + ".tmp"
+        if isfile(self._tmp_db_file):
+            remove(self._tmp_db_file)
+        self._connection: sqlite3.Connection = sqlite3.connect(self._tmp_db_file)
+        self._connection.execute("PRAGMA journal_mode = OFF")
+        self._connection.execute("PRAGMA synchronous = OFF")
+        for statement in DocDatabase.SCHEMA:
+            self._connection.execute(statement)
+        self._connection.executemany("INSERT INTO meta (key, value) VALUES (?, ?)", (
+            ("db_format", str(DocDatabase.DB_FORMAT)),
+            ("generator_version", __version__)
+        ))
+
+    def write(self, class_doc: ClassDoc, script_info: dict = None):
+        """
+        Adds or replaces the rows of a script and its classes and members.
+
+        Args:
+            class_doc: The documentation of the script
+            script_info: The script_files entry of the script, for the linked scenes
+        """
+        script = class_doc.file_name
+        self.remove(script)
+        self._scripts.add(script)
+        class_key = SymbolIndex.class_key(class_doc)
+        self._connection.execute(
+            "INSERT INTO scripts (script, class_key, scenes) VALUES (?, ?, ?)",
+            (script, class_key, dumps(list((script_info or {}).get("scenes", []))))
+        )
+        classes: list[tuple] = []
+        members: list[tuple] = []
+        pending: list[tuple[ClassDoc, str]] = [(class_doc, class_key)]
+        while pending:
+            current_doc, key = pending.pop()
+            classes.append((
+                key, script, SymbolIndex.base_key(current_doc.extends),
+                dumps(JsonWriter.class_record(current_doc, False), default=str)
+            ))
+            for kind, name, record in self.member_records(current_doc):
+                members.append((f"{key}.{name}", name, kind, script, key, record))
+            for inner_class_doc in current_doc.inner_class_docs:
+                pending.append((inner_class_doc, SymbolIndex.class_key(inner_class_doc, key)))
+        self._connection.executemany(
+            "INSERT OR IGNORE INTO classes (class_key, script, extends, doc) VALUES (?, ?, ?, ?)", classes
+        )
+        self._connection.executemany(
+            "INSERT OR IGNORE INTO members (qualified_name, name, kind, script, class_key, doc) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            members
+        )
+
+    @staticmethod
+    def member_records(class_doc: ClassDoc) -> list[tuple[str, str, str | None]]:
+        """
+        Gets the members of a class with their JSON records, named like in the SymbolIndex.
+
+        Args:
+            class_doc: The documentation of the class
+
+        Returns:
+            Kind, name and JSON record of every member, in the order of the script. Inner classes have no record, as
+            they get their own class row
+        """
+        members: list[tuple[str, str, str | None]] = [
+            ("signal", signal_doc.name, dumps(JsonWriter.signal_record(signal_doc), default=str))
+            for signal_doc in class_doc.signal_docs
+        ]
+        for enum_doc in class_doc.enum_docs:
+            prefix = f"{enum_doc.name}." if enum_doc.name else ""
+            if enum_doc.name:
+                members.append(("enum", enum_doc.name, dumps(JsonWriter.enum_record(enum_doc), default=str)))
+            members.extend(
+                ("enum_member", prefix + member.value_name, dumps(JsonWriter.enum_member_record(member), default=str))
+                for member in enum_doc.members
+            )
+        members.extend(
+            ("const", const_doc.name, dumps(JsonWriter.var_record(const_doc), default=str))
+            for const_doc in class_doc.const_docs
+        )
+        members.extend(
+            ("var", var_doc.name, dumps(JsonWriter.var_record(var_doc), default=str)) for var_doc in class_doc.var_docs
+        )
+        members.extend(
+            ("func", func_doc.name, dumps(JsonWriter.func_record(func_doc), default=str))
+            for func_doc in class_doc.func_docs
+        )
+        members.extend(("class", inner_class_doc.class_name, None) for inner_class_doc in class_doc.inner_class_docs)
+        return members
+
+    def remove(self, file_name: str):
+        """
+        Drops the rows of a script and its classes and members.
+
+        Args:
+            file_name: Path of the script, relative to the project root
+        """
+        if file_name not in self._scripts:
+            return
+        self._scripts.discard(file_name)
+        for table in ("scripts", "classes", "members"):
+            self._connection.execute(f"DELETE FROM {table} WHERE script = ?", (file_name,))
+
+    def finish(self) -> int:
+        """
+        Stores the gd_project and commits the database. At the first finish, the temporary database replaces the old
+        one and is reopened for updates.
+
+        Returns:
+            Number of pages written, always 0 as the database is no page
+        """
+        self._connection.execute(
+            "INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", ("gd_project", dumps(self.gd_project))
+        )
+        self._connection.commit()
+        if self._tmp_db_file is not None:
+            self._connection.close()
+            replace(self._tmp_db_file, self.db_file)
+            self._tmp_db_file = None
+            self._connection = sqlite3.connect(self.db_file)
+        print(f"Documentation database: {len(self._scripts)} scripts in {self.db_file}")
+        return 0
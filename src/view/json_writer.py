@@ -0,0 +1,357 @@
+from json import dumps, loads, dump, load
+from os import makedirs, remove, replace
+from os.path import isfile
+
+from src import __version__
+from src.model.class_doc import ClassDoc
+from src.model.enum_doc import EnumDoc
+from src.model.enum_member_doc import EnumMemberDoc
+from src.model.func_doc import FuncDoc
+from src.model.signal_doc import SignalDoc
+from src.model.tag_doc import TagDoc
+from src.model.var_doc import VarDoc
+
+
+class JsonWriter:
+    """
+    Exports the documentation of every script as machine-readable JSON records, for editor plugins, search services
+    and other downstream tools.
+
+    Two formats are supported:
+    * ndjson: One JSON record per line, streamed to md_gd4_docs.ndjson as soon as a script is scanned, so consumers
+      can process the export incrementally. The first line is the header record, followed by one class record per
+      script, the project record (gd_project) and the end record with the number of classes, marking the export
+      complete.
+    * json: A single document in md_gd4_docs.json, with the header attributes, a classes list of class records and
+      the gd_project. The class records are streamed into a temporary file, renamed over the export by finish.
+
+    Every record carries the schema version; SCHEMA_VERSION is incremented on incompatible changes. The records cover
+    all documentation models (ClassDoc, SignalDoc, EnumDoc, EnumMemberDoc, VarDoc, FuncDoc, TagDoc). The source code
+    (SourceBuffer) isn't exported, only the byte span of every class and function in its script.
+
+    After finish, further write and remove calls (e.g. in watch mode) are collected, and the next finish rewrites the
+    export with the changed records replaced, line by line for ndjson.
+
+    Attributes:
+        doc_destination: Destination directory for the export, ending with "/"
+        output_format: "json" or "ndjson"
+        gd_project: Information extracted from the project.godot file
+        export_file: Path of the export file
+        classes_written: Number of class records of the export
+    """
+    SCHEMA: str = "md_gd4_docs"
+    SCHEMA_VERSION: int = 1
+    FORMATS: tuple = ("json", "ndjson")
+
+    def __init__(self, doc_destination: str, output_format: str = "ndjson", gd_project: dict = None):
+        """
+        Constructor of the JSON writer. Starts the export at once.
+
+        Args:
+            doc_destination: Destination directory for the export, created if not existing
+            output_format: "json" or "ndjson"
+            gd_project: Information extracted from the project.godot file, if any
+
+        Raises:
+            ValueError: If output_format isn't supported
+        """
+        if output_format not in self.FORMATS:
+            raise ValueError(f"Output format {output_format} isn't supported, only {', '.join(self.FORMATS)}")
+        if not doc_destination.endswith("/"):
+            doc_destination = doc_destination + "/"
+        self.doc_destination: str = doc_destination
+        self.output_format: str = output_format
+        self.gd_project: dict = gd_project if gd_project is not None else {}
+        self.export_file: str = f"{doc_destination}md_gd4_docs.{output_format}"
+        self.classes_written: int = 0
+        self._updated: dict[str, str] = {}
+        self._removed: set[str] = set()
+        makedirs(doc_destination, exist_ok=True)
+        self._stream_file: str = self.export_file if output_format == "ndjson" else self.export_file + ".tmp"
+        self._stream = open(self._stream_file, "w", encoding="utf-8")
+        header = self.header()
+        if output_format == "ndjson":
+            self._stream.write(dumps(header) + "\n")
+        else:
+            self._stream.write(dumps(header)[:-1] + ', "classes": [\n')
+
+    def header(self) -> dict:
+        """
+        Gets the header attributes of the export.
+
+        Returns:
+            Record type, schema, schema version and version of md_gd4_docs
+        """
+        return {
+            "record": "header",
+            "schema": self.SCHEMA,
+            "schema_version": self.SCHEMA_VERSION,
+            "generator_version": __version__
+        }
+
+    def write(self, class_doc: ClassDoc, script_info: dict = None):
+        """
+        Exports the documentation of a script as class record.
+
+        Args:
+            class_doc: The documentation of the script
+            script_info: The script_files entry of the script, for the linked scenes
+        """
+        record = dumps({
+            "record": "class",
+            "schema_version": self.SCHEMA_VERSION,
+            "script": class_doc.file_name,
+            "scenes": list((script_info or {}).get("scenes", [])),
+            "doc": self.class_record(class_doc)
+        }, default=str)
+        if self._stream is None:
+            self._updated[class_doc.file_name] = record
+            self._removed.discard(class_doc.file_name)
+            return
+        if self.output_format == "ndjson":
+            self._stream.write(record + "\n")
+        else:
+            self._stream.write(("," if self.classes_written else "") + record + "\n")
+        self.classes_written += 1
+
+    def remove(self, file_name: str):
+        """
+        Drops the class record of a script that doesn't exist anymore, at the next finish.
+
+        Args:
+            file_name: Path of the script, relative to the project root
+        """
+        self._updated.pop(file_name, None)
+        self._removed.add(file_name)
+
+    def finish(self) -> int:
+        """
+        Completes the export with the project record, or rewrites it with the records changed since the last finish.
+
+        Returns:
+            Number of pages written, always 0 as the export is no page
+        """
+        if self._stream is not None:
+            project = dumps({"record": "project", "schema_version": self.SCHEMA_VERSION, "gd_project": self.gd_project})
+            if self.output_format == "ndjson":
+                self._stream.write(project + "\n")
+                self._stream.write(dumps({"record": "end", "classes": self.classes_written}) + "\n")
+                self._stream.close()
+            else:
+                self._stream.write(f'], "gd_project": {dumps(self.gd_project)}}}\n')
+                self._stream.close()
+                replace(self._stream_file, self.export_file)
+            self._stream = None
+        elif self.output_format == "ndjson":
+            self.update_ndjson()
+        else:
+            self.update_json()
+        self._updated = {}
+        self._removed = set()
+        print(f"{self.output_format.upper()} export: {self.classes_written} class records in {self.export_file}")
+        return 0
+
+    def update_ndjson(self):
+        """
+        Rewrites the NDJSON export line by line, replacing the class records of updated scripts, dropping removed ones
+        and appending new ones, followed by the current project and end records.
+        """
+        tmp_export_file = self.export_file + ".tmp"
+        self.classes_written = 0
+        try:
+            with open(self.export_file, "r", encoding="utf-8") as old_file, \
+                    open(tmp_export_file, "w", encoding="utf-8") as file:
+                for line in old_file:
+                    record = loads(line)
+                    if record["record"] == "class":
+                        if record["script"] in self._removed:
+                            continue
+                        line = self._updated.pop(record["script"], line.rstrip("\n")) + "\n"
+                        self.classes_written += 1
+                    elif record["record"] != "header":
+                        continue
+                    file.write(line)
+                for line in self._updated.values():
+                    file.write(line + "\n")
+                    self.classes_written += 1
+                file.write(dumps({"record": "project", "schema_version": self.SCHEMA_VERSION,
+                                  "gd_project": self.gd_project}) + "\n")
+                file.write(dumps({"record": "end", "classes": self.classes_written}) + "\n")
+            replace(tmp_export_file, self.export_file)
+        except (OSError, ValueError) as e:
+            print(f"Updating export {self.export_file} failed with exception:")
+            print(e)
+            if isfile(tmp_export_file):
+                remove(tmp_export_file)
+
+    def update_json(self):
+        """
+        Rewrites the JSON export, replacing the class records of updated scripts, dropping removed ones and appending
+        new ones, with the current gd_project.
+        """
+        tmp_export_file = self.export_file + ".tmp"
+        try:
+            with open(self.export_file, "r", encoding="utf-8") as file:
+                export = load(file)
+            classes = [
+                loads(self._updated.pop(record["script"])) if record["script"] in self._updated else record
+                for record in export["classes"] if record["script"] not in self._removed
+            ]
+            classes.extend(loads(record) for record in self._updated.values())
+            export["classes"] = classes
+            export["gd_project"] = self.gd_project
+            with open(tmp_export_file, "w", encoding="utf-8") as file:
+                dump(export, file)
+            replace(tmp_export_file, self.export_file)
+            self.classes_written = len(classes)
+        except (OSError, ValueError, KeyError) as e:
+            print(f"Updating export {self.export_file} failed with exception:")
+            print(e)
+            if isfile(tmp_export_file):
+                remove(tmp_export_file)
+
+    @staticmethod
+    def tag_records(tags: tuple[TagDoc, ...]) -> list[dict]:
+        """
+        Converts tags (@tutorial etc.) into JSON compatible records.
+
+        Args:
+            tags: The tags of a documented element
+
+        Returns:
+            One record per tag
+        """
+        return [
+            {"tag_type": tag.tag_type, "tutorial_url": tag.tutorial_url, "tutorial_name": tag.tutorial_name}
+            for tag in tags
+        ]
+
+    @classmethod
+    def var_record(cls, var_doc: VarDoc) -> dict:
+        """
+        Converts the documentation of a variable, constant or function argument into a JSON compatible record.
+
+        Args:
+            var_doc: The documentation of the variable, also a row of a VarDocTable
+
+        Returns:
+            The record
+        """
+        return {
+            "name": var_doc.name,
+            "data_type": var_doc.data_type,
+            "var_type": var_doc.var_type,
+            "value": var_doc.value,
+            "description": var_doc.description,
+            "tags": cls.tag_records(var_doc.tags)
+        }
+
+    @classmethod
+    def signal_record(cls, signal_doc: SignalDoc) -> dict:
+        """
+        Converts the documentation of a signal into a JSON compatible record.
+
+        Args:
+            signal_doc: The documentation of the signal
+
+        Returns:
+            The record
+        """
+        return {
+            "name": signal_doc.name,
+            "description": signal_doc.description,
+            "args": [cls.var_record(arg) for arg in signal_doc.args],
+            "tags": cls.tag_records(signal_doc.tags)
+        }
+
+    @classmethod
+    def enum_record(cls, enum_doc: EnumDoc) -> dict:
+        """
+        Converts the documentation of an enum, including its members, into a JSON compatible record.
+
+        Args:
+            enum_doc: The documentation of the enum
+
+        Returns:
+            The record
+        """
+        return {
+            "name": enum_doc.name,
+            "description": enum_doc.description,
+            "tags": cls.tag_records(enum_doc.tags),
+            "members": [cls.enum_member_record(member) for member in enum_doc.members]
+        }
+
+    @classmethod
+    def enum_member_record(cls, member: EnumMemberDoc) -> dict:
+        """
+        Converts the documentation of an enum member into a JSON compatible record.
+
+        Args:
+            member: The documentation of the enum member
+
+        Returns:
+            The record
+        """
+        return {
+            "value_name": member.value_name,
+            "value_int": member.value_int,
+            "description": member.description,
+            "tags": cls.tag_records(member.tags)
+        }
+
+    @classmethod
+    def func_record(cls, func_doc: FuncDoc) -> dict:
+        """
+        Converts the documentation of a function, including its arguments, into a JSON compatible record.
+
+        Args:
+            func_doc: The documentation of the function
+
+        Returns:
+            The record, with the byte span of the function in its script instead of the code
+        """
+        return {
+            "name": func_doc.name,
+            "is_static": func_doc.is_static,
+            "args": [cls.var_record(arg) for arg in func_doc.args],
+            "return_type": func_doc.return_type,
+            "return_description": func_doc.return_description,
+            "description": func_doc.description,
+            "tags": cls.tag_records(func_doc.tags),
+            "code_span": list(func_doc.code_span) if func_doc.code_span else None
+        }
+
+    @classmethod
+    def class_record(cls, class_doc: ClassDoc, inner_classes: bool = True) -> dict:
+        """
+        Converts the documentation of a class, including its inner classes, into a JSON compatible record.
+
+        Args:
+            class_doc: The documentation of the class
+            inner_classes: Includes the records of the inner classes if True, otherwise the record has no
+                inner_classes attribute
+
+        Returns:
+            The record, with all members of the class
+        """
+        record = {
+            "file_name": class_doc.file_name,
+            "class_name": class_doc.class_name,
+            "is_inner_class": class_doc.is_inner_class,
+            "extends": class_doc.extends,
+            "brief_description": class_doc.brief_description,
+            "detail_description": class_doc.detail_description,
+            "tags": cls.tag_records(class_doc.tags),
+            "code_span": list(class_doc.code_span) if class_doc.code_span else None,
+            "signals": [cls.signal_record(signal_doc) for signal_doc in class_doc.signal_docs],
+            "enums": [cls.enum_record(enum_doc) for enum_doc in class_doc.enum_docs],
+            "consts": [cls.var_record(const_doc) for const_doc in class_doc.const_docs],
+            "vars": [cls.var_record(var_doc) for var_doc in class_doc.var_docs],
+            "funcs": [cls.func_record(func_doc) for func_doc in class_doc.func_docs]
+        }
+        if inner_classes:
+            record["inner_classes"] = [
+                cls.class_record(inner_class_doc) for inner_class_doc in class_doc.inner_class_docs
+            ]
+        return record
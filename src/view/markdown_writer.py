@@ -0,0 +1,623 @@
+from hashlib import sha256
+from json import dump, load
+from os import makedirs, remove, replace, rmdir
+from os.path import dirname, isfile
+from posixpath import relpath
+from re import compile
+from unicodedata import normalize
+
+from src.control.symbol_index import SymbolIndex
+from src.model.class_doc import ClassDoc
+from src.model.func_doc import FuncDoc
+from src.model.tag_doc import TagDoc
+from src.view.project_index import ProjectIndex
+
+
+class MarkdownWriter:
+    """
+    Writes the documentation of every script to its own markdown page as soon as the script is scanned.
+
+    Every page is written to a temporary file first, which then is renamed over the page, so an interrupted build
+    never leaves a half written page behind. Once written, the ClassDoc isn't needed anymore: only one summary line
+    per page is kept, for the project index page written by finish (see ProjectIndex). Data types and base classes
+    naming a class of the project are linked to its page (and anchor, for inner classes), resolved through the
+    SymbolIndex of the build, which holds all classes before the first page is written. Every class lists the classes
+    extending it.
+
+    Pages whose content didn't change since the last build are not written again, so their modification time stays
+    the same and tools like mkdocs (dirty builds) or rsync only process the changed pages. The content hash of every
+    page is kept in a manifest file in doc_destination. Pages listed in the manifest of the last build but not written
+    anymore (e.g. of deleted scripts) are deleted by finish.
+
+    Scripts whose pages would collide (a script index.gd in the root with the project index page, or a/b.gd and a_b.gd
+    if rebuild_src_path is false) get a page with a number appended instead of overwriting each other. Pages are
+    assigned in the order the scripts are reserved (see reserve_pages), so they stay the same from build to build.
+    A page that can't be written is reported and skipped, the build goes on.
+
+    Attributes:
+        doc_destination: Destination directory for the documentation, ending with "/"
+        rebuild_src_path: Reproduces the directories of the scripts in doc_destination if True, otherwise all pages
+            are written into doc_destination, their names prefixed with the directories of the script
+        gd_project: Information extracted from the project.godot file, for the index page
+        project_index: Renders the index page and looks up the autoloads of every script
+        symbol_index: Index of the classes of all scripts and their inheritance, see SymbolIndex
+        pages: Title and brief description of every page written so far, keyed by page
+        script_pages: The page assigned to every script, keyed by the path of the script
+        page_scripts: The script every assigned page belongs to, keyed by page
+        manifest: Content hashes of the pages of this build, keyed by page
+        previous_manifest: Content hashes of the pages of the last build, keyed by page
+        pages_written: Number of pages written (new or changed) since the last finish
+        pages_unchanged: Number of pages left untouched since the last finish
+        pages_deleted: Number of stale pages deleted by finish
+    """
+    INDEX_PAGE: str = "index.md"
+    MANIFEST_FILE: str = ".md_gd4_docs_manifest.json"
+    ANCHOR_PATTERN = compile(r"[^\w\s-]")
+    ANCHOR_SEPARATOR_PATTERN = compile(r"[-\s]+")
+    ANCHOR_NUMBER_PATTERN = compile(r"^(.*)_([0-9]+)$")
+
+    def __init__(
+            self,
+            doc_destination: str,
+            rebuild_src_path: bool = True,
+            gd_project: dict = None,
+            symbol_index: SymbolIndex = None
+    ):
+        """
+        Constructor of the markdown writer.
+
+        Args:
+            doc_destination: Destination directory for the documentation, created if not existing
+            rebuild_src_path: Reproduces the directories of the scripts in doc_destination if True
+            gd_project: Information extracted from the project.godot file, if any
+            symbol_index: Index of the classes of all scripts, an empty one (linking nothing) if None
+        """
+        if not doc_destination.endswith("/"):
+            doc_destination = doc_destination + "/"
+        self.doc_destination: str = doc_destination
+        self.rebuild_src_path: bool = rebuild_src_path
+        self.gd_project: dict = gd_project if gd_project is not None else {}
+        self.project_index: ProjectIndex = ProjectIndex(self.gd_project)
+        self.symbol_index: SymbolIndex = symbol_index if symbol_index is not None else SymbolIndex()
+        self.pages: dict[str, tuple[str, str]] = {}
+        self.script_pages: dict[str, str] = {}
+        self.page_scripts: dict[str, str] = {self.INDEX_PAGE: ""}
+        self.manifest: dict[str, str] = {}
+        self.previous_manifest: dict[str, str] = self.load_manifest()
+        self.pages_written: int = 0
+        self.pages_unchanged: int = 0
+        self.pages_deleted: int = 0
+
+    def reserve_pages(self, file_names: list[str]):
+        """
+        Assigns the pages of scripts ahead of writing them, so colliding pages are numbered in this order rather than
+        in the order the scripts are written or linked.
+
+        Args:
+            file_names: Paths of the scripts, relative to the project root
+        """
+        for file_name in file_names:
+            self.page_path(file_name)
+
+    def page_path(self, file_name: str) -> str:
+        """
+        Gets the page of a script, assigning it on first use. A page already assigned to another script (or the
+        project index page) gets a number appended, like player_2.md.
+
+        Args:
+            file_name: Path of the script, relative to the project root
+
+        Returns:
+            Path of the page, relative to doc_destination
+        """
+        page = self.script_pages.get(file_name)
+        if page is not None:
+            return page
+        base = file_name.removeprefix("res://").removeprefix("./")
+        if base.endswith(".gd"):
+            base = base[:-3]
+        if not self.rebuild_src_path:
+            base = base.replace("/", "_")
+        page = base + ".md"
+        number = 1
+        while page in self.page_scripts:
+            number += 1
+            page = f"{base}_{number}.md"
+        if number > 1:
+            other = self.page_scripts[base + ".md"]
+            collision = f"the page of {other}" if other else "the project index page"
+            print(f"Page {base}.md of {file_name} collides with {collision}, writing it to {page}")
+        self.script_pages[file_name] = page
+        self.page_scripts[page] = file_name
+        return page
+
+    @classmethod
+    def anchor(cls, title: str) -> str:
+        """
+        Gets the anchor of a heading, the way mkdocs creates it (slugify of the toc extension), without numbering
+        repeated anchors, see unique_anchor.
+
+        Args:
+            title: The text of the heading
+
+        Returns:
+            The anchor, without #
+        """
+        title = normalize("NFKD", title).encode("ascii", "ignore").decode("ascii")
+        return cls.ANCHOR_SEPARATOR_PATTERN.sub("-", cls.ANCHOR_PATTERN.sub("", title).strip().lower())
+
+    @classmethod
+    def unique_anchor(cls, title: str, used_anchors: set[str]) -> str:
+        """
+        Gets the anchor of a heading on a page, numbered the way mkdocs does if an earlier heading of the page has the
+        same anchor: signals, signals_1, signals_2 and so on.
+
+        Args:
+            title: The text of the heading
+            used_anchors: Anchors of the headings above on the page, extended in place
+
+        Returns:
+            The anchor, without #
+        """
+        anchor = cls.anchor(title)
+        while anchor in used_anchors or not anchor:
+            match = cls.ANCHOR_NUMBER_PATTERN.match(anchor)
+            anchor = f"{match[1]}_{int(match[2]) + 1}" if match else f"{anchor}_1"
+        used_anchors.add(anchor)
+        return anchor
+
+    @classmethod
+    def page_anchors(cls, class_doc: ClassDoc, used_anchors: set[str] = None) -> dict:
+        """
+        Gets the anchors of the headings render_class writes for a class, in the same order, so repeated headings
+        (like the Signals section of every inner class) are numbered like on the page.
+
+        Args:
+            class_doc: The documentation of the class
+            used_anchors: Anchors of the headings above the class on the page, extended in place
+
+        Returns:
+            The anchor of the class title and of its sections (signals, enums, constants, properties, methods,
+            inner_classes) if rendered, and the anchors of its enum_docs, func_docs and inner_class_docs as lists
+        """
+        if used_anchors is None:
+            used_anchors = set()
+        anchors: dict = {"class": cls.unique_anchor(cls.class_title(class_doc), used_anchors)}
+        if class_doc.signal_docs:
+            anchors["signals"] = cls.unique_anchor("Signals", used_anchors)
+        if class_doc.enum_docs:
+            anchors["enums"] = cls.unique_anchor("Enums", used_anchors)
+        anchors["enum_docs"] = [
+            cls.unique_anchor(enum_doc.name or "Unnamed enum", used_anchors) for enum_doc in class_doc.enum_docs
+        ]
+        if len(class_doc.const_docs):
+            anchors["constants"] = cls.unique_anchor("Constants", used_anchors)
+        if len(class_doc.var_docs):
+            anchors["properties"] = cls.unique_anchor("Properties", used_anchors)
+        if class_doc.func_docs:
+            anchors["methods"] = cls.unique_anchor("Methods", used_anchors)
+        anchors["func_docs"] = [cls.unique_anchor(func_doc.name, used_anchors) for func_doc in class_doc.func_docs]
+        if class_doc.inner_class_docs:
+            anchors["inner_classes"] = cls.unique_anchor("Inner classes", used_anchors)
+        anchors["inner_class_docs"] = [
+            cls.page_anchors(inner_class_doc, used_anchors) for inner_class_doc in class_doc.inner_class_docs
+        ]
+        return anchors
+
+    def write(self, class_doc: ClassDoc, script_info: dict = None) -> str:
+        """
+        Writes the page of a script.
+
+        Args:
+            class_doc: The documentation of the script
+            script_info: The script_files entry of the script, for the linked scenes. Autoloads of the script are taken
+                from gd_project
+
+        Returns:
+            Path of the page written, relative to doc_destination
+        """
+        page = self.page_path(class_doc.file_name)
+        title = self.class_title(class_doc)
+        lines = self.render_class(class_doc, page, 1, [])
+        scenes = (script_info or {}).get("scenes", [])
+        if scenes:
+            lines[3:3] = ["", "Linked scene(s): " + ", ".join(f"`{scene}`" for scene in scenes)]
+        autoloads = self.project_index.autoload_names(class_doc.file_name)
+        if autoloads:
+            lines[3:3] = ["", "Autoload: " + ", ".join(f"`{name}`" for name in autoloads)]
+        self.write_page(page, "\n".join(lines) + "\n")
+        self.pages[page] = (title, class_doc.brief_description)
+        return page
+
+    def remove(self, file_name: str):
+        """
+        Forgets the page of a script that doesn't exist anymore. The page itself is deleted by the next finish.
+
+        Args:
+            file_name: Path of the script, relative to the project root
+        """
+        page = self.page_path(file_name)
+        self.pages.pop(page, None)
+        self.manifest.pop(page, None)
+        del self.script_pages[file_name]
+        del self.page_scripts[page]
+
+    def finish(self) -> int:
+        """
+        Writes the project index page, linking all pages written, deletes the stale pages of the last build and saves
+        the manifest. Can be called again after writing or removing more pages (e.g. in watch mode).
+
+        Returns:
+            Number of pages written, including the index page
+        """
+        lines = self.project_index.render(self.pages, self.page_path, self.cell)
+        self.write_page(self.INDEX_PAGE, "\n".join(lines) + "\n")
+        self.delete_stale_pages()
+        self.save_manifest()
+        self.previous_manifest = dict(self.manifest)
+        print(f"Markdown pages: {self.pages_written} written, {self.pages_unchanged} unchanged, {self.pages_deleted} "
+              f"deleted")
+        self.pages_written = 0
+        self.pages_unchanged = 0
+        self.pages_deleted = 0
+        return len(self.pages) + 1
+
+    def load_manifest(self) -> dict[str, str]:
+        """
+        Loads the manifest of the last build.
+
+        Returns:
+            Content hashes of the pages of the last build, empty if there is no (readable) manifest
+        """
+        manifest_file = self.doc_destination + self.MANIFEST_FILE
+        if not isfile(manifest_file):
+            return {}
+        try:
+            with open(manifest_file, "r", encoding="utf-8") as file:
+                manifest = load(file)
+        except (OSError, ValueError) as e:
+            print(f"Ignoring manifest {manifest_file}, reading failed with exception:")
+            print(e)
+            return {}
+        if not isinstance(manifest, dict):
+            return {}
+        return manifest
+
+    def save_manifest(self):
+        """
+        Writes the manifest of this build, via a temporary file renamed over the old manifest.
+        """
+        manifest_file = self.doc_destination + self.MANIFEST_FILE
+        try:
+            makedirs(self.doc_destination, exist_ok=True)
+            with open(manifest_file + ".tmp", "w", encoding="utf-8") as file:
+                dump(dict(sorted(self.manifest.items())), file, indent=0)
+            replace(manifest_file + ".tmp", manifest_file)
+        except OSError as e:
+            print(f"Writing manifest {manifest_file} failed with exception:")
+            print(e)
+
+    def delete_stale_pages(self):
+        """
+        Deletes the pages of the last build which weren't written during this build, and the directories left empty.
+        Only pages listed in the manifest are deleted, other files in doc_destination are never touched.
+        """
+        for page in sorted(set(self.previous_manifest) - set(self.manifest)):
+            page_file = self.doc_destination + page
+            try:
+                if isfile(page_file):
+                    remove(page_file)
+                    self.pages_deleted += 1
+            except OSError as e:
+                print(f"Deleting stale page {page_file} failed with exception:")
+                print(e)
+                continue
+            page_dir = dirname(page)
+            while page_dir:
+                try:
+                    rmdir(self.doc_destination + page_dir)
+                except OSError:
+                    break
+                page_dir = dirname(page_dir)
+
+    def write_page(self, page: str, text: str) -> bool:
+        """
+        Writes a page atomically, via a temporary file renamed over the page. Skipped if the existing page has the same
+        content, as known from the manifest or, for pages not in the manifest, by hashing the existing page.
+
+        Args:
+            page: Path of the page, relative to doc_destination
+            text: Content of the page
+
+        Returns:
+            True if the page was written, False if it was unchanged or writing it failed
+        """
+        content = text.encode("utf-8")
+        content_hash = sha256(content).hexdigest()
+        self.manifest[page] = content_hash
+        page_file = self.doc_destination + page
+        if isfile(page_file):
+            previous_hash = self.previous_manifest.get(page)
+            if previous_hash is None:
+                try:
+                    with open(page_file, "rb") as file:
+                        previous_hash = sha256(file.read()).hexdigest()
+                except OSError:
+                    previous_hash = None
+            if previous_hash == content_hash:
+                self.pages_unchanged += 1
+                return False
+        tmp_page_file = page_file + ".tmp"
+        try:
+            makedirs(dirname(page_file), exist_ok=True)
+            with open(tmp_page_file, "wb") as file:
+                file.write(content)
+            replace(tmp_page_file, page_file)
+        except OSError as e:
+            print(f"Writing page {page_file} failed with exception:")
+            print(e)
+            if isfile(tmp_page_file):
+                remove(tmp_page_file)
+            # an older version of the page may still be there, keep it listed as it was
+            if page in self.previous_manifest:
+                self.manifest[page] = self.previous_manifest[page]
+            else:
+                self.manifest.pop(page)
+            return False
+        self.pages_written += 1
+        return True
+
+    @staticmethod
+    def class_title(class_doc: ClassDoc) -> str:
+        """
+        Gets the title of a class, the class name if exposed, otherwise the name of the script.
+
+        Args:
+            class_doc: The documentation of the class
+
+        Returns:
+            The title
+        """
+        if class_doc.class_name != "not exposed":
+            return class_doc.class_name
+        return class_doc.file_name.rsplit("/", 1)[-1]
+
+    @staticmethod
+    def cell(text) -> str:
+        """
+        Escapes a text for a table cell.
+
+        Args:
+            text: The text to escape
+
+        Returns:
+            The text, on a single line and with escaped |
+        """
+        if text is None:
+            return ""
+        return " ".join(str(text).split()).replace("|", "\\|")
+
+    def resolve_class(self, class_name: str, scopes: list[str]) -> str | None:
+        """
+        Resolves a class name the way GDScript does: as inner class of the current class or one of its outer classes
+        first, then as global class (or script path, or qualified inner class like Player.Stats).
+
+        Args:
+            class_name: The class name, as written in the script
+            scopes: Class keys of the current class and its outer classes, the innermost first
+
+        Returns:
+            The class key in the symbol_index, or None if the class isn't defined by the project
+        """
+        for scope in scopes:
+            if self.symbol_index.class_script(f"{scope}.{class_name}") is not None:
+                return f"{scope}.{class_name}"
+        class_key = SymbolIndex.base_key(class_name)
+        if class_key and self.symbol_index.class_script(class_key) is not None:
+            return class_key
+        return None
+
+    def class_link(self, class_key: str, page: str) -> str:
+        """
+        Gets the link to the documentation of a class.
+
+        Args:
+            class_key: The class key in the symbol_index
+            page: The page the link is placed on
+
+        Returns:
+            The relative link to the page of the class, with the anchor of inner classes
+        """
+        target_page = self.page_path(self.symbol_index.class_script(class_key))
+        target_anchor = ""
+        if self.symbol_index.is_inner_class(class_key):
+            target_anchor = "#" + self.anchor(class_key.rsplit(".", 1)[-1])
+        link = relpath(target_page, dirname(page) or ".") if target_page != page else ""
+        return link + target_anchor
+
+    def type_link(self, data_type: str, page: str, scopes: list[str]) -> str:
+        """
+        Formats a data type, linking it to the documentation of the class if defined by the project.
+
+        Args:
+            data_type: The data type
+            page: The page the link is placed on
+            scopes: Class keys of the class the data type is used in and its outer classes, the innermost first
+
+        Returns:
+            The data type as markdown
+        """
+        if data_type in ("", "undefined"):
+            return ""
+        class_key = self.resolve_class(data_type, scopes)
+        if class_key is None:
+            return f"`{data_type}`"
+        return f"[`{data_type}`]({self.class_link(class_key, page)})"
+
+    def subclass_links(self, class_key: str, page: str) -> list[str]:
+        """
+        Formats the direct subclasses of a class, linked to their documentation. Inner classes extending a sibling by
+        its bare name count as well.
+
+        Args:
+            class_key: The class key of the class
+            page: The page the links are placed on
+
+        Returns:
+            The subclasses as markdown, sorted by class key
+        """
+        subclasses = set(self.symbol_index.inherited_by(class_key))
+        if self.symbol_index.is_inner_class(class_key):
+            script = self.symbol_index.class_script(class_key)
+            subclasses.update(
+                subclass for subclass in self.symbol_index.inherited_by(class_key.rsplit(".", 1)[-1])
+                if self.symbol_index.class_script(subclass) == script
+            )
+        return [f"[`{subclass}`]({self.class_link(subclass, page)})" for subclass in sorted(subclasses)]
+
+    def render_tags(self, tags: tuple[TagDoc, ...]) -> list[str]:
+        """
+        Renders the tags of a member.
+
+        Args:
+            tags: The tags
+
+        Returns:
+            The lines of the tags, empty if there are none
+        """
+        lines: list[str] = []
+        for tag in tags:
+            if tag.tag_type == "@deprecated":
+                lines.append("**Deprecated**")
+            elif tag.tag_type == "@experimental":
+                lines.append("**Experimental**")
+            elif tag.tag_type == "@tutorial":
+                lines.append(f"Tutorial: [{tag.tutorial_name or tag.tutorial_url}]({tag.tutorial_url})")
+        return lines
+
+    def render_class(self, class_doc: ClassDoc, page: str, level: int, scopes: list[str]) -> list[str]:
+        """
+        Renders the documentation of a class, including its inner classes. Headings added or moved here have to be
+        added or moved in page_anchors as well.
+
+        Args:
+            class_doc: The documentation of the class
+            page: The page the class is rendered on
+            level: Heading level of the class title
+            scopes: Class keys of the outer classes, the innermost first, empty for the class of the script
+
+        Returns:
+            The lines of the class documentation
+        """
+        class_key = SymbolIndex.class_key(class_doc, scopes[0] if scopes else "")
+        class_scopes = [class_key] + scopes
+        heading = "#" * min(level, 6)
+        sub_heading = "#" * min(level + 1, 6)
+        lines: list[str] = [f"{heading} {self.class_title(class_doc)}"]
+        if not class_doc.is_inner_class:
+            lines.extend(["", f"Script: `{class_doc.file_name}`"])
+        if class_doc.extends:
+            lines.extend(["", f"Extends: {self.type_link(class_doc.extends, page, scopes)}"])
+        if self.symbol_index.class_script(class_key) == class_doc.file_name:
+            subclass_links = self.subclass_links(class_key, page)
+            if subclass_links:
+                lines.extend(["", "Inherited by: " + ", ".join(subclass_links)])
+        for line in self.render_tags(class_doc.tags):
+            lines.extend(["", line])
+        if class_doc.brief_description:
+            lines.extend(["", class_doc.brief_description])
+        if class_doc.detail_description:
+            lines.extend(["", class_doc.detail_description])
+        if class_doc.signal_docs:
+            lines.extend(["", f"{sub_heading} Signals", ""])
+            for signal_doc in class_doc.signal_docs:
+                signature = f"({self.args_signature(signal_doc.args)})" if signal_doc.args else ""
+                lines.append(f"* `{signal_doc.name}{signature}`: {self.cell(signal_doc.description)}")
+        if class_doc.enum_docs:
+            lines.extend(["", f"{sub_heading} Enums"])
+            for enum_doc in class_doc.enum_docs:
+                lines.extend(["", f"{'#' * min(level + 2, 6)} {enum_doc.name or 'Unnamed enum'}", ""])
+                if enum_doc.description:
+                    lines.extend([enum_doc.description, ""])
+                lines.extend(["| Name | Value | Description |", "| --- | --- | --- |"])
+                for member in enum_doc.members:
+                    lines.append(
+                        f"| `{member.value_name}` | {self.cell(member.value_int)} | {self.cell(member.description)} |"
+                    )
+        if len(class_doc.const_docs):
+            lines.extend(["", f"{sub_heading} Constants", ""])
+            lines.extend(["| Name | Type | Value | Description |", "| --- | --- | --- | --- |"])
+            for const_doc in class_doc.const_docs:
+                lines.append(
+                    f"| `{const_doc.name}` | {self.type_link(const_doc.data_type, page, class_scopes)} | "
+                    f"{self.cell(const_doc.value)} | {self.cell(const_doc.description)} |"
+                )
+        if len(class_doc.var_docs):
+            lines.extend(["", f"{sub_heading} Properties", ""])
+            lines.extend(["| Name | Type | Default | Description |", "| --- | --- | --- | --- |"])
+            for var_doc in class_doc.var_docs:
+                prefix = {"export_var": "@export ", "onready_var": "@onready "}.get(var_doc.var_type, "")
+                lines.append(
+                    f"| `{prefix}{var_doc.name}` | {self.type_link(var_doc.data_type, page, class_scopes)} | "
+                    f"{self.cell(var_doc.value)} | {self.cell(var_doc.description)} |"
+                )
+        if class_doc.func_docs:
+            lines.extend(["", f"{sub_heading} Methods"])
+            for func_doc in class_doc.func_docs:
+                lines.extend([""] + self.render_func(func_doc, page, level + 2, class_scopes))
+        if class_doc.inner_class_docs:
+            lines.extend(["", f"{sub_heading} Inner classes"])
+            for inner_class_doc in class_doc.inner_class_docs:
+                lines.extend([""] + self.render_class(inner_class_doc, page, level + 2, class_scopes))
+        return lines
+
+    @staticmethod
+    def args_signature(args) -> str:
+        """
+        Renders the arguments of a func or signal as in its declaration.
+
+        Args:
+            args: The documentation of the arguments
+
+        Returns:
+            The comma separated arguments with their data types and default values, if declared
+        """
+        return ", ".join(
+            arg.name + (f": {arg.data_type}" if arg.data_type != "undefined" else "")
+            + (f" = {arg.value}" if arg.value is not None else "")
+            for arg in args
+        )
+
+    def render_func(self, func_doc: FuncDoc, page: str, level: int, scopes: list[str]) -> list[str]:
+        """
+        Renders the documentation of a function.
+
+        Args:
+            func_doc: The documentation of the function
+            page: The page the function is rendered on
+            level: Heading level of the function name
+            scopes: Class keys of the class of the function and its outer classes, the innermost first
+
+        Returns:
+            The lines of the function documentation
+        """
+        lines: list[str] = [f"{'#' * min(level, 6)} {func_doc.name}", ""]
+        signature = self.args_signature(func_doc.args)
+        return_type = f" -> {func_doc.return_type}" if func_doc.return_type != "undefined" else ""
+        static = "static " if func_doc.is_static else ""
+        lines.extend(["```gdscript", f"{static}func {func_doc.name}({signature}){return_type}", "```"])
+        for line in self.render_tags(func_doc.tags):
+            lines.extend(["", line])
+        if func_doc.description:
+            lines.extend(["", func_doc.description])
+        described_args = [arg for arg in func_doc.args if arg.description]
+        if described_args:
+            lines.extend(["", "Args:", ""])
+            for arg in described_args:
+                lines.append(f"* `{arg.name}`: {self.cell(arg.description)}")
+        if func_doc.return_description or return_type:
+            returns = self.type_link(func_doc.return_type, page, scopes)
+            if func_doc.return_description:
+                returns = f"{returns} {func_doc.return_description}".strip()
+            lines.extend(["", f"Returns: {returns}"])
+        return lines
@@ -0,0 +1,133 @@
+from typing import Callable
+
+
+class ProjectIndex:
+    """
+    Renders the project index page from gd_project and the pages written: the project overview (name, Godot version,
+    main scene), the autoload table, input actions, layer names, editor plugins and the tree of all script pages,
+    grouped by directory.
+
+    The main scene and the autoloads are linked to the pages of their scripts (added_script in gd_project, see
+    Build.link_gd_project_scripts). The autoload names of every script are kept in a map built once per autoload list,
+    so looking them up for every page and rendering the whole index take O(1) per script and autoload, besides sorting
+    the pages for the tree.
+
+    Attributes:
+        gd_project: Information extracted from the project.godot file
+        script_autoloads: Names of the autoloads of every script, keyed by script (scene_path)
+    """
+
+    def __init__(self, gd_project: dict):
+        """
+        Constructor of the project index.
+
+        Args:
+            gd_project: Information extracted from the project.godot file, updated in place on changes
+        """
+        self.gd_project: dict = gd_project
+        self.script_autoloads: dict[str, list[str]] = {}
+        self._autoload_list: list | None = None
+        self._autoload_count: int = 0
+
+    def refresh(self):
+        """
+        Rebuilds script_autoloads if the autoload list of gd_project was replaced or extended since the last call.
+        """
+        autoloads = self.gd_project.get("autoload") or []
+        if autoloads is self._autoload_list and len(autoloads) == self._autoload_count:
+            return
+        self.script_autoloads = {}
+        for autoload in autoloads:
+            self.script_autoloads.setdefault(autoload["scene_path"], []).append(autoload["scene_name"])
+        # keeping the list referenced, so a new list can't be mistaken for it
+        self._autoload_list = autoloads
+        self._autoload_count = len(autoloads)
+
+    def autoload_names(self, script: str) -> list[str]:
+        """
+        Gets the names a script is registered as autoload with.
+
+        Args:
+            script: Path of the script, relative to the project root
+
+        Returns:
+            The autoload names, empty if the script isn't an autoload
+        """
+        self.refresh()
+        return self.script_autoloads.get(script, [])
+
+    def render(self, pages: dict[str, tuple[str, str]], page_path: Callable[[str], str], cell: Callable) -> list[str]:
+        """
+        Renders the index page in one pass over gd_project and the pages.
+
+        Args:
+            pages: Title and brief description of every page written, keyed by page
+            page_path: Gets the page of a script, see MarkdownWriter.page_path
+            cell: Escapes a text for a table cell, see MarkdownWriter.cell
+
+        Returns:
+            The lines of the index page
+        """
+        lines: list[str] = [f"# {self.gd_project.get('project_name') or 'Project documentation'}", ""]
+        if self.gd_project.get("godot_version"):
+            lines.extend([f"Godot version: {self.gd_project['godot_version']}", ""])
+        main_scene = self.gd_project.get("main_scene")
+        if isinstance(main_scene, dict) and main_scene.get("scene_path"):
+            script_link = self.script_link(main_scene.get("added_script", ""), pages, page_path)
+            script_link = f" ({script_link})" if script_link else ""
+            lines.extend([f"Main scene: `{main_scene['scene_path']}`{script_link}", ""])
+        if self.gd_project.get("autoload"):
+            lines.extend(["## Autoload", "", "| Name | Path | Script | Enabled |", "| --- | --- | --- | --- |"])
+            for autoload in self.gd_project["autoload"]:
+                lines.append(
+                    f"| {cell(autoload['scene_name'])} | `{autoload['scene_path']}` | "
+                    f"{self.script_link(autoload.get('added_script', ''), pages, page_path)} | "
+                    f"{'yes' if autoload['enabled'] else 'no'} |"
+                )
+            lines.append("")
+        if self.gd_project.get("input_actions"):
+            actions = ", ".join(f"`{action}`" for action in self.gd_project["input_actions"])
+            lines.extend(["## Input actions", "", actions, ""])
+        if self.gd_project.get("layer_names"):
+            lines.extend(["## Layer names", "", "| Layer | Name |", "| --- | --- |"])
+            for layer, layer_name in self.gd_project["layer_names"].items():
+                lines.append(f"| `{layer}` | {cell(layer_name)} |")
+            lines.append("")
+        if self.gd_project.get("plugins"):
+            lines.extend(["## Editor plugins", ""])
+            lines.extend(f"* `{plugin}`" for plugin in self.gd_project["plugins"])
+            lines.append("")
+        lines.extend(["## Scripts", ""])
+        open_dirs: list[str] = []
+        for page in sorted(pages, key=lambda page_name: page_name.split("/")):
+            page_dirs = page.split("/")[:-1]
+            common = 0
+            while common < min(len(open_dirs), len(page_dirs)) and open_dirs[common] == page_dirs[common]:
+                common += 1
+            for depth in range(common, len(page_dirs)):
+                lines.append(f"{'    ' * depth}* **{page_dirs[depth]}/**")
+            open_dirs = page_dirs
+            title, brief_description = pages[page]
+            description = f": {cell(brief_description)}" if brief_description else ""
+            lines.append(f"{'    ' * len(page_dirs)}* [{cell(title)}]({page}){description}")
+        return lines
+
+    @staticmethod
+    def script_link(script: str, pages: dict[str, tuple[str, str]], page_path: Callable[[str], str]) -> str:
+        """
+        Formats a script, linking it to its page if written.
+
+        Args:
+            script: Path of the script, relative to the project root, "" for none
+            pages: Title and brief description of every page written, keyed by page
+            page_path: Gets the page of a script
+
+        Returns:
+            The link (or the path, if the script has no page), "" if there is no script
+        """
+        if not script:
+            return ""
+        page = page_path(script)
+        if page in pages:
+            return f"[{pages[page][0]}]({page})"
+        return f"`{script}`"
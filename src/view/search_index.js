@@ -0,0 +1,207 @@
+/*
+ * Loader of the search index written by md_gd4_docs (see SearchIndexWriter), copied to the search directory of the
+ * documentation as search.js and added to the mkdocs.yml of the site:
+ *
+ *   extra_javascript:
+ *     - <doc_destination>/search/search.js
+ *
+ * The entry table and the index are loaded on the first search, the shards of the typed prefixes as needed. Symbols
+ * typed into the search field of the Material theme are listed above the results of the full text search. Inputs
+ * with a data-gd-search attribute get their own result list, gdSearch(query) returns the results for other themes.
+ * Set data-directory-urls="false" on the script element if the site doesn't use directory urls.
+ */
+(function () {
+    "use strict";
+
+    const SCHEMA_VERSION = 2;
+    const MAX_RESULTS = 10;
+    const PREFIX_FACTOR = 0.5;
+    const script = document.currentScript;
+    const searchUrl = new URL(".", script.src);
+    const docUrl = new URL("..", searchUrl);
+    const directoryUrls = script.dataset.directoryUrls !== "false";
+    let indexPromise = null;
+    const shardPromises = new Map();
+
+    function fetchJson(file, hash) {
+        return fetch(new URL(file + "?v=" + hash.slice(0, 12), searchUrl)).then(function (response) {
+            if (!response.ok) {
+                throw new Error("Loading search index file " + file + " failed: " + response.status);
+            }
+            return response.json();
+        });
+    }
+
+    function loadIndex() {
+        if (indexPromise === null) {
+            indexPromise = fetchJson("index.json", String(Date.now())).then(function (index) {
+                if (index.schema_version !== SCHEMA_VERSION) {
+                    throw new Error("Unsupported search index schema version " + index.schema_version);
+                }
+                return fetchJson(index.entries.file, index.entries.hash).then(function (table) {
+                    return {index: index, table: table};
+                });
+            });
+        }
+        return indexPromise;
+    }
+
+    function loadShard(index, prefix) {
+        if (!shardPromises.has(prefix)) {
+            const shard = index.shards[prefix];
+            shardPromises.set(prefix, fetchJson(shard.file, shard.hash));
+        }
+        return shardPromises.get(prefix);
+    }
+
+    // Adds the postings of the node and, scaled by PREFIX_FACTOR, of all tokens below it to the scores
+    function addPostings(node, scores, factor) {
+        for (const label in node) {
+            if (label) {
+                addPostings(node[label], scores, PREFIX_FACTOR);
+            } else {
+                for (const posting of node[label]) {
+                    scores.set(posting[0], (scores.get(posting[0]) || 0) + posting[1] * factor);
+                }
+            }
+        }
+    }
+
+    // Scores the entries of all tokens starting with the word in a shard, tokens longer than the word scaled down
+    function matchWord(trie, word, scores) {
+        let node = trie;
+        let position = 0;
+        while (position < word.length) {
+            const rest = word.slice(position);
+            let next = null;
+            for (const label in node) {
+                if (label && (rest.startsWith(label) || label.startsWith(rest))) {
+                    next = label;
+                    break;
+                }
+            }
+            if (next === null) {
+                return;
+            }
+            node = node[next];
+            position += next.length;
+        }
+        addPostings(node, scores, position === word.length ? 1 : PREFIX_FACTOR);
+    }
+
+    function searchWord(data, word) {
+        const prefixLength = data.index.shard_prefix;
+        const prefixes = Object.keys(data.index.shards).filter(function (prefix) {
+            return word.length < prefixLength ? prefix.startsWith(word) : prefix === word.slice(0, prefixLength);
+        });
+        return Promise.all(prefixes.map(function (prefix) {
+            return loadShard(data.index, prefix);
+        })).then(function (shards) {
+            const scores = new Map();
+            for (const shard of shards) {
+                matchWord(shard.trie, word, scores);
+            }
+            return scores;
+        });
+    }
+
+    function pageUrl(page, anchor) {
+        let url = page.replace(/\.md$/, directoryUrls ? "/" : ".html");
+        if (directoryUrls) {
+            url = url.replace(/(^|\/)index\/$/, "$1");
+        }
+        return new URL(url + (anchor ? "#" + anchor : ""), docUrl).href;
+    }
+
+    // Searches the symbols matching all words of the query, best score first
+    function gdSearch(query) {
+        const words = query.toLowerCase().split(/[^\p{L}\p{N}_]+/u).filter(Boolean);
+        if (!words.length) {
+            return Promise.resolve([]);
+        }
+        return loadIndex().then(function (data) {
+            return Promise.all(words.map(function (word) {
+                return searchWord(data, word);
+            })).then(function (wordScores) {
+                const results = [];
+                for (const [entryNumber, score] of wordScores[0]) {
+                    let total = score;
+                    for (const scores of wordScores.slice(1)) {
+                        total = scores.has(entryNumber) ? total + scores.get(entryNumber) : -1;
+                        if (total < 0) {
+                            break;
+                        }
+                    }
+                    if (total >= 0) {
+                        const entry = data.table.entries[entryNumber];
+                        results.push({
+                            title: entry[0],
+                            url: pageUrl(data.table.pages[entry[1]], entry[2]),
+                            kind: entry[3],
+                            score: total
+                        });
+                    }
+                }
+                results.sort(function (a, b) {
+                    return b.score - a.score || a.title.localeCompare(b.title);
+                });
+                return results.slice(0, MAX_RESULTS);
+            });
+        });
+    }
+
+    function renderResults(list, results) {
+        list.replaceChildren.apply(list, results.map(function (result) {
+            const item = document.createElement("li");
+            const link = document.createElement("a");
+            link.href = result.url;
+            link.textContent = result.title;
+            const kind = document.createElement("small");
+            kind.textContent = " " + result.kind.replace("_", " ");
+            item.append(link, kind);
+            return item;
+        }));
+        list.hidden = results.length === 0;
+    }
+
+    function bindInput(input, list) {
+        let query = "";
+        input.addEventListener("input", function () {
+            query = input.value;
+            const currentQuery = query;
+            gdSearch(currentQuery).then(function (results) {
+                if (currentQuery === query) {
+                    renderResults(list, results);
+                }
+            }).catch(function (error) {
+                console.error(error);
+            });
+        });
+    }
+
+    function bindInputs() {
+        const materialInput = document.querySelector("[data-md-component=search-query]");
+        const materialResults = document.querySelector("[data-md-component=search-result]");
+        if (materialInput && materialResults) {
+            const list = document.createElement("ol");
+            list.className = "gd-search-results md-search-result__list";
+            list.hidden = true;
+            materialResults.prepend(list);
+            bindInput(materialInput, list);
+        }
+        for (const input of document.querySelectorAll("input[data-gd-search]")) {
+            const list = document.createElement("ol");
+            list.className = "gd-search-results";
+            list.hidden = true;
+            input.after(list);
+            bindInput(input, list);
+        }
+    }
+
+    window.gdSearch = gdSearch;
+    if (document.readyState === "loading") {
+        document.addEventListener("DOMContentLoaded", bindInputs);
+    } else {
+        bindInputs();
+    }
+})();
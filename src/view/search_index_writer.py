@@ -0,0 +1,384 @@
+from hashlib import sha256
+from json import dumps, load
+from os import makedirs, remove, replace
+from os.path import dirname, isfile
+from re import compile
+from string import ascii_lowercase, digits
+from typing import Callable
+
+from src.model.class_doc import ClassDoc
+from src.view.markdown_writer import MarkdownWriter
+
+
+class SearchIndexWriter:
+    """
+    Writes a prebuilt search index for the markdown pages, built from the documentation models while scanning, so a
+    site doesn't have to build its index from the text of all pages in the browser.
+
+    Every class and member is a search entry with title (qualified like Player.jump), page, anchor and kind. Anchors
+    are those of the headings MarkdownWriter renders, numbered like mkdocs does for repeated headings (see
+    MarkdownWriter.page_anchors). Names are split into tokens by tokenize (snake_case and PascalCase parts, plus the
+    whole name), descriptions into words. The tokens are distributed over shards by their first SHARD_PREFIX
+    characters, each shard holding a prefix trie of its tokens and the numbers of the entries they point to, so a
+    client only loads the entry table and the shards of the typed prefixes. Description words found in more than
+    COMMON_WORD_SHARE of all entries (at least MIN_COMMON_WORD_COUNT) are skipped, as they don't help finding anything
+    and would add most entries to their shard.
+
+    Files written to the search directory in doc_destination:
+    * index.json: schema_version, shard_prefix (number of characters), the file and content hash (sha256, e.g. for
+      cache busting) of the entry table and of every shard, keyed by prefix. Tokens shorter than the prefix are in
+      the shard of the token.
+    * entries.json: pages (relative to doc_destination) and entries, every entry stored once as [title, page number,
+      anchor, kind]. The anchor is "" for the class of a script (top of the page).
+    * shard_<prefix>.json: trie, nested dicts keyed by edge label (one or more characters). The "" key of a node holds
+      the postings of the token ending there, pairs of entry number (in the entry table) and score.
+    * search.js: The loader searching the index in the browser, see LOADER_FILE.
+    Characters other than a-z and 0-9 are written as their hex code enclosed in _ in shard file names. Files whose
+    content didn't change are not written again, shards not needed anymore are deleted.
+
+    The loader is added to a mkdocs site in its mkdocs.yml, with the path of doc_destination in docs_dir:
+
+        extra_javascript:
+          - <doc_destination>/search/search.js
+
+    It searches the symbols typed into the search field of the Material theme and lists the best matches above the
+    results of the full text search plugin, which can stay enabled for the rest of the site. Other themes can use an
+    input element with a data-gd-search attribute, or call gdSearch(query) for a list of results. Without
+    use_directory_urls, data-directory-urls="false" has to be set on the script element.
+
+    Attributes:
+        search_destination: Directory of the search index files, ending with "/"
+        page_path: Gets the page of a script, see MarkdownWriter.page_path
+        entries: Search entries with their tokens and scores, keyed by script
+        file_hashes: Content hashes of the entry table and shards written, keyed by file name
+    """
+    SCHEMA_VERSION: int = 2
+    SEARCH_DIR: str = "search/"
+    INDEX_FILE: str = "index.json"
+    ENTRIES_FILE: str = "entries.json"
+    LOADER_FILE: str = "search.js"
+    SHARD_PREFIX: int = 2
+    NAME_SCORE: int = 8
+    PART_SCORE: int = 4
+    WORD_SCORE: int = 1
+    COMMON_WORD_SHARE: float = 0.02
+    MIN_COMMON_WORD_COUNT: int = 50
+    NAME_PART_PATTERN = compile(r"[A-Z]+(?=[A-Z][a-z])|[A-Z]?[a-z]+|[A-Z]+|\d+")
+    WORD_PATTERN = compile(r"[^\W_]{3,}")
+    SHARD_NAME_CHARS: frozenset = frozenset(ascii_lowercase + digits)
+
+    def __init__(self, doc_destination: str, page_path: Callable[[str], str]):
+        """
+        Constructor of the search index writer.
+
+        Args:
+            doc_destination: Destination directory for the documentation, the index is written to its search directory
+            page_path: Gets the page of a script, see MarkdownWriter.page_path
+        """
+        if not doc_destination.endswith("/"):
+            doc_destination = doc_destination + "/"
+        self.search_destination: str = doc_destination + self.SEARCH_DIR
+        self.page_path: Callable[[str], str] = page_path
+        self.entries: dict[str, list[tuple[tuple[str, str, str, str], dict[str, int]]]] = {}
+        self.file_hashes: dict[str, str] = self.load_file_hashes()
+
+    @classmethod
+    def tokenize(cls, name: str) -> list[str]:
+        """
+        Splits a symbol name into lower case search tokens: the parts of snake_case and PascalCase (or camelCase)
+        names with acronyms kept together, followed by the whole name. Numbers are only part of the whole name, as
+        they mostly enumerate similar names.
+
+        Args:
+            name: The symbol name, like get_player_name or HTTPRequest2D
+
+        Returns:
+            The tokens, like get, player, name, get_player_name or http, request, d, httprequest2d
+        """
+        tokens = [part.lower() for part in cls.NAME_PART_PATTERN.findall(name) if not part.isdigit()]
+        whole_name = name.strip("_").lower()
+        if whole_name and whole_name not in tokens:
+            tokens.append(whole_name)
+        return tokens
+
+    @classmethod
+    def entry_tokens(cls, name: str, *descriptions: str) -> dict[str, int]:
+        """
+        Gets the tokens of a search entry with their score, the best one if a token occurs several times.
+
+        Args:
+            name: The symbol name
+            *descriptions: The descriptions of the symbol
+
+        Returns:
+            The score of every token, keyed by token
+        """
+        tokens: dict[str, int] = {}
+        for description in descriptions:
+            for word in cls.WORD_PATTERN.findall(description or ""):
+                tokens[word.lower()] = cls.WORD_SCORE
+        for token in cls.tokenize(name):
+            tokens[token] = max(tokens.get(token, 0), cls.PART_SCORE)
+        whole_name = name.strip("_").lower()
+        if whole_name:
+            tokens[whole_name] = cls.NAME_SCORE
+        return tokens
+
+    def write(self, class_doc: ClassDoc, script_info: dict = None):
+        """
+        Collects the search entries of a script, replacing its previous ones.
+
+        Args:
+            class_doc: The documentation of the script
+            script_info: Not used, for the writer interface
+        """
+        entries: list[tuple[tuple[str, str, str, str], dict[str, int]]] = []
+        anchors = MarkdownWriter.page_anchors(class_doc)
+        anchors["class"] = ""
+        self.add_class(entries, class_doc, self.page_path(class_doc.file_name), anchors)
+        self.entries[class_doc.file_name] = entries
+
+    def add_class(self, entries: list, class_doc: ClassDoc, page: str, anchors: dict):
+        """
+        Adds the search entries of a class and its members, including its inner classes.
+
+        Args:
+            entries: Search entries of the script, extended in place
+            class_doc: The documentation of the class
+            page: Page of the class, relative to the doc_destination
+            anchors: Anchors of the class and its sections on the page, see MarkdownWriter.page_anchors
+        """
+        title = MarkdownWriter.class_title(class_doc)
+        entries.append((
+            (title, page, anchors["class"], "class"),
+            self.entry_tokens(title, class_doc.brief_description, class_doc.detail_description)
+        ))
+        for signal_doc in class_doc.signal_docs:
+            entries.append((
+                (f"{title}.{signal_doc.name}", page, anchors["signals"], "signal"),
+                self.entry_tokens(signal_doc.name, signal_doc.description)
+            ))
+        for enum_doc, enum_anchor in zip(class_doc.enum_docs, anchors["enum_docs"]):
+            if enum_doc.name:
+                entries.append((
+                    (f"{title}.{enum_doc.name}", page, enum_anchor, "enum"),
+                    self.entry_tokens(enum_doc.name, enum_doc.description)
+                ))
+            for member in enum_doc.members:
+                entries.append((
+                    (f"{title}.{member.value_name}", page, enum_anchor, "enum_member"),
+                    self.entry_tokens(member.value_name, member.description)
+                ))
+        for const_doc in class_doc.const_docs:
+            entries.append((
+                (f"{title}.{const_doc.name}", page, anchors["constants"], "const"),
+                self.entry_tokens(const_doc.name, const_doc.description)
+            ))
+        for var_doc in class_doc.var_docs:
+            entries.append((
+                (f"{title}.{var_doc.name}", page, anchors["properties"], "var"),
+                self.entry_tokens(var_doc.name, var_doc.description)
+            ))
+        for func_doc, func_anchor in zip(class_doc.func_docs, anchors["func_docs"]):
+            entries.append((
+                (f"{title}.{func_doc.name}", page, func_anchor, "func"),
+                self.entry_tokens(func_doc.name, func_doc.description, func_doc.return_description)
+            ))
+        for inner_class_doc, inner_anchors in zip(class_doc.inner_class_docs, anchors["inner_class_docs"]):
+            self.add_class(entries, inner_class_doc, page, inner_anchors)
+
+    def remove(self, file_name: str):
+        """
+        Drops the search entries of a script that doesn't exist anymore.
+
+        Args:
+            file_name: Path of the script, relative to the project root
+        """
+        self.entries.pop(file_name, None)
+
+    def finish(self) -> int:
+        """
+        Builds the entry table and the shards from the collected entries and writes the changed ones, the index file
+        and the loader. Can be called again after writing or removing more scripts (e.g. in watch mode).
+
+        Returns:
+            Number of pages written, always 0 as the search index files are no pages
+        """
+        entry_count = 0
+        word_counts: dict[str, int] = {}
+        for entries in self.entries.values():
+            entry_count += len(entries)
+            for _, tokens in entries:
+                for token, score in tokens.items():
+                    if score == self.WORD_SCORE:
+                        word_counts[token] = word_counts.get(token, 0) + 1
+        max_word_count = max(self.MIN_COMMON_WORD_COUNT, int(entry_count * self.COMMON_WORD_SHARE))
+        common_words = {word for word, count in word_counts.items() if count > max_word_count}
+        pages: list[str] = []
+        page_numbers: dict[str, int] = {}
+        table: list[tuple[str, int, str, str]] = []
+        shards: dict[str, dict[str, list[tuple[int, int]]]] = {}
+        for script in sorted(self.entries):
+            for (title, page, anchor, kind), tokens in self.entries[script]:
+                if page not in page_numbers:
+                    page_numbers[page] = len(pages)
+                    pages.append(page)
+                entry_number = len(table)
+                table.append((title, page_numbers[page], anchor, kind))
+                for token, score in tokens.items():
+                    if score == self.WORD_SCORE and token in common_words:
+                        continue
+                    shards.setdefault(token[:self.SHARD_PREFIX], {}).setdefault(token, []).append((entry_number, score))
+        makedirs(self.search_destination, exist_ok=True)
+        file_hashes: dict[str, str] = {}
+        files_written = self.write_changed(self.ENTRIES_FILE, {"pages": pages, "entries": table}, file_hashes)
+        for prefix in sorted(shards):
+            files_written += self.write_changed(self.shard_file(prefix), self.build_shard(shards[prefix]), file_hashes)
+        for file_name in set(self.file_hashes) - set(file_hashes):
+            if isfile(self.search_destination + file_name):
+                remove(self.search_destination + file_name)
+        self.file_hashes = file_hashes
+        self.write_file(self.INDEX_FILE, dumps({
+            "schema_version": self.SCHEMA_VERSION,
+            "shard_prefix": self.SHARD_PREFIX,
+            "entries": {"file": self.ENTRIES_FILE, "hash": file_hashes[self.ENTRIES_FILE]},
+            "shards": {
+                prefix: {"file": self.shard_file(prefix), "hash": file_hashes[self.shard_file(prefix)]}
+                for prefix in sorted(shards)
+            }
+        }, separators=(",", ":"), ensure_ascii=False))
+        self.write_loader()
+        print(f"Search index: {entry_count} entries in {len(shards)} shards, {files_written} files written, "
+              f"{len(common_words)} common words skipped")
+        return 0
+
+    def write_changed(self, file_name: str, data, file_hashes: dict[str, str]) -> int:
+        """
+        Writes a search index file as JSON, unless the file of the last build has the same content.
+
+        Args:
+            file_name: Name of the file, relative to the search directory
+            data: Content of the file, serialized as JSON
+            file_hashes: Content hashes of the files of this build, extended in place
+
+        Returns:
+            1 if the file was written, 0 if it was unchanged
+        """
+        content = dumps(data, separators=(",", ":"), ensure_ascii=False)
+        file_hashes[file_name] = sha256(content.encode("utf-8")).hexdigest()
+        if self.file_hashes.get(file_name) == file_hashes[file_name] and isfile(self.search_destination + file_name):
+            return 0
+        self.write_file(file_name, content)
+        return 1
+
+    def write_loader(self):
+        """
+        Copies the loader (search_index.js next to this module) to the search directory, if it differs.
+        """
+        with open(dirname(__file__) + "/search_index.js", "r", encoding="utf-8") as file:
+            content = file.read()
+        loader_file = self.search_destination + self.LOADER_FILE
+        if isfile(loader_file):
+            with open(loader_file, "r", encoding="utf-8") as file:
+                if file.read() == content:
+                    return
+        self.write_file(self.LOADER_FILE, content)
+
+    @staticmethod
+    def build_shard(tokens: dict[str, list[tuple[int, int]]]) -> dict:
+        """
+        Builds the prefix trie of a shard. Chains of nodes with a single child and no postings are merged into one
+        edge labeled with all their characters (radix trie), to keep the shard small.
+
+        Args:
+            tokens: The postings (entry number and score) of every token of the shard, keyed by token
+
+        Returns:
+            The shard, with the trie
+        """
+        trie: dict = {}
+        for token in sorted(tokens):
+            node = trie
+            for char in token:
+                node = node.setdefault(char, {})
+            node[""] = tokens[token]
+        return {"trie": SearchIndexWriter.merge_chains(trie)}
+
+    @staticmethod
+    def merge_chains(node: dict) -> dict:
+        """
+        Merges the chains of nodes with a single child and no postings below a trie node.
+
+        Args:
+            node: The trie node, keyed by character, postings keyed by ""
+
+        Returns:
+            The node, its children keyed by edge labels of one or more characters
+        """
+        merged: dict = {}
+        for label, child in node.items():
+            if not label:
+                merged[label] = child
+                continue
+            while len(child) == 1 and "" not in child:
+                (next_char, child), = child.items()
+                label += next_char
+            merged[label] = SearchIndexWriter.merge_chains(child)
+        return merged
+
+    @classmethod
+    def shard_file(cls, prefix: str) -> str:
+        """
+        Gets the file name of a shard.
+
+        Args:
+            prefix: The prefix of the tokens in the shard
+
+        Returns:
+            The file name, relative to the search directory
+        """
+        name = "".join(char if char in cls.SHARD_NAME_CHARS else f"_{ord(char):x}_" for char in prefix)
+        return f"shard_{name}.json"
+
+    def load_file_hashes(self) -> dict[str, str]:
+        """
+        Loads the content hashes of the entry table and shards of the last build from the index file. The files of an
+        index with another schema version are listed without hash, so they are written again or deleted.
+
+        Returns:
+            The content hashes, keyed by file name. Empty if there is no (readable) index file
+        """
+        index_file = self.search_destination + self.INDEX_FILE
+        if not isfile(index_file):
+            return {}
+        try:
+            with open(index_file, "r", encoding="utf-8") as file:
+                index_data = load(file)
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(index_data, dict):
+            return {}
+        files = list(index_data.get("shards", {}).values())
+        if isinstance(index_data.get("entries"), dict):
+            files.append(index_data["entries"])
+        same_schema = index_data.get("schema_version") == self.SCHEMA_VERSION
+        return {file["file"]: file["hash"] if same_schema else "" for file in files}
+
+    def write_file(self, file_name: str, content: str):
+        """
+        Writes a search index file atomically, via a temporary file renamed over the file.
+
+        Args:
+            file_name: Name of the file, relative to the search directory
+            content: Content of the file
+        """
+        search_file = self.search_destination + file_name
+        try:
+            with open(search_file + ".tmp", "w", encoding="utf-8") as file:
+                file.write(content)
+            replace(search_file + ".tmp", search_file)
+        except OSError as e:
+            print(f"Writing search index file {search_file} failed with exception:")
+            print(e)
+            if isfile(search_file + ".tmp"):
+                remove(search_file + ".tmp")
@@ -0,0 +1,305 @@
+"""
+Regression tests for the GdLexer and GdParser, scanning small GDScript snippets into a ClassDoc.
+"""
+
+from src.control.gd_parser import GdParser
+from src.control.script_scanner import ScriptScanner
+from src.model.class_doc import ClassDoc
+
+
+def scan(tmp_path, code: str) -> ClassDoc:
+    """
+    Scans a script.
+
+    Args:
+        tmp_path: Directory to write the script to
+        code: Content of the script
+
+    Returns:
+        The documentation of the script
+    """
+    (tmp_path / "script.gd").write_text(code, encoding="utf-8")
+    return ScriptScanner(str(tmp_path) + "/").scan("script.gd")
+
+
+def test_class_description(tmp_path):
+    class_doc = scan(tmp_path, "class_name Player\nextends CharacterBody2D\n## Brief.\n##\n## Detail.\n")
+    assert class_doc.class_name == "Player"
+    assert class_doc.extends == "CharacterBody2D"
+    assert class_doc.brief_description == "Brief."
+    assert class_doc.detail_description == "Detail."
+
+
+def test_enum_with_inline_docs(tmp_path):
+    class_doc = scan(tmp_path, (
+        "extends Node\n"
+        "\n"
+        "## States.\n"
+        "enum State {\n"
+        "\tIDLE, ## Doing nothing.\n"
+        "\t## Running around.\n"
+        "\tRUN = 5,\n"
+        "\tJUMP,\n"
+        "}\n"
+        "\n"
+        "## Inline enum.\n"
+        "enum {A, B = 0x10, C} ## Appended to the enum description.\n"
+    ))
+    state, unnamed = class_doc.enum_docs
+    assert state.name == "State"
+    assert state.description == "States."
+    assert [(member.value_name, member.value_int, member.description) for member in state.members] == [
+        ("IDLE", 0, "Doing nothing."), ("RUN", 5, "Running around."), ("JUMP", 6, "")
+    ]
+    assert unnamed.name == ""
+    assert unnamed.description == "Inline enum.\n\nAppended to the enum description."
+    assert [(member.value_name, member.value_int, member.description) for member in unnamed.members] == [
+        ("A", 0, ""), ("B", 16, ""), ("C", 17, "")
+    ]
+
+
+def test_multi_line_signature(tmp_path):
+    class_doc = scan(tmp_path, (
+        "extends Node\n"
+        "\n"
+        "## Moves the node.\n"
+        "func move(\n"
+        "\t\tdirection: Vector2,\n"
+        "\t\tspeed: float = 1.0,\n"
+        ") -> void:\n"
+        "\tposition += direction * speed\n"
+        "\n"
+        "\n"
+        "## After move.\n"
+        "func after() -> int:\n"
+        "\treturn 1\n"
+    ))
+    move, after = class_doc.func_docs
+    assert move.name == "move"
+    assert [(arg.name, arg.data_type, arg.value) for arg in move.args] == [
+        ("direction", "Vector2", None), ("speed", "float", "1.0")
+    ]
+    assert move.return_type == "void"
+    assert move.code.startswith("func move(\n")
+    assert move.code.rstrip().endswith("position += direction * speed")
+    assert after.name == "after"
+    assert after.return_type == "int"
+
+
+def test_dictionary_default_arguments(tmp_path):
+    class_doc = scan(tmp_path, (
+        "extends Node\n"
+        "\n"
+        "## Configures.\n"
+        "func configure(options: Dictionary = {\"a\": 1, \"b\": [1, 2]}, name := \"x, y\") -> void:\n"
+        "\tpass\n"
+    ))
+    assert [(arg.name, arg.data_type, arg.value) for arg in class_doc.func_docs[0].args] == [
+        ("options", "Dictionary", "{\"a\": 1, \"b\": [1, 2]}"), ("name", "undefined", "\"x, y\"")
+    ]
+
+
+def test_args_and_returns_sections(tmp_path):
+    class_doc = scan(tmp_path, (
+        "extends Node\n"
+        "\n"
+        "## Checks a value.\n"
+        "##\n"
+        "## Args:\n"
+        "##     value: The value to check\n"
+        "##         on two lines\n"
+        "##\n"
+        "## Returns:\n"
+        "##     bool: True if the value is fine\n"
+        "func check(value: int):\n"
+        "\treturn value > 0\n"
+        "\n"
+        "\n"
+        "## Gets a name.\n"
+        "##\n"
+        "## Returns: String: The name\n"
+        "func get_name() -> StringName:\n"
+        "\treturn &\"name\"\n"
+    ))
+    check, get_name = class_doc.func_docs
+    assert check.description == "Checks a value."
+    assert check.args[0].description == "The value to check on two lines"
+    assert check.return_description == "True if the value is fine"
+    assert check.return_type == "bool"
+    assert get_name.return_description == "The name"
+    assert get_name.return_type == "StringName"
+
+
+def test_export_on_its_own_line(tmp_path):
+    class_doc = scan(tmp_path, (
+        "extends Node\n"
+        "\n"
+        "## Speed.\n"
+        "@export\n"
+        "var speed: float = 1.5\n"
+        "\n"
+        "## Target.\n"
+        "@onready\n"
+        "var target := $Target\n"
+        "\n"
+        "@export_group(\"Group\")\n"
+        "## Grouped.\n"
+        "@export var grouped := 1\n"
+        "\n"
+        "## Plain.\n"
+        "var plain = 0\n"
+    ))
+    assert [(var_doc.name, var_doc.data_type, var_doc.value, var_doc.var_type) for var_doc in class_doc.var_docs] == [
+        ("speed", "float", "1.5", "export_var"),
+        ("target", "undefined", "$Target", "onready_var"),
+        ("grouped", "undefined", "1", "export_var"),
+        ("plain", "undefined", "0", "var")
+    ]
+
+
+def test_nested_inner_classes(tmp_path):
+    class_doc = scan(tmp_path, (
+        "extends Node\n"
+        "\n"
+        "## Outer class.\n"
+        "class Outer extends RefCounted:\n"
+        "\t## Outer value.\n"
+        "\tvar outer_value := 1\n"
+        "\n"
+        "\t## Inner class.\n"
+        "\tclass Inner:\n"
+        "\t\t## Inner value.\n"
+        "\t\tvar inner_value := 2\n"
+        "\n"
+        "\t\t## Inner method.\n"
+        "\t\tfunc inner_method() -> void:\n"
+        "\t\t\tpass\n"
+        "\n"
+        "\t## Outer method, after the inner class.\n"
+        "\tfunc outer_method() -> int:\n"
+        "\t\treturn 1\n"
+        "\n"
+        "\n"
+        "## Script var, after the classes.\n"
+        "var after := 0\n"
+    ))
+    assert [var_doc.name for var_doc in class_doc.var_docs] == ["after"]
+    outer = class_doc.inner_class_docs[0]
+    assert (outer.class_name, outer.extends, outer.brief_description) == ("Outer", "RefCounted", "Outer class.")
+    assert [var_doc.name for var_doc in outer.var_docs] == ["outer_value"]
+    assert [func_doc.name for func_doc in outer.func_docs] == ["outer_method"]
+    inner = outer.inner_class_docs[0]
+    assert inner.class_name == "Inner"
+    assert inner.is_inner_class
+    assert [var_doc.name for var_doc in inner.var_docs] == ["inner_value"]
+    assert [func_doc.name for func_doc in inner.func_docs] == ["inner_method"]
+    assert inner.code.startswith("\tclass Inner:")
+
+
+def test_spaces_indent(tmp_path):
+    class_doc = scan(tmp_path, (
+        "extends Node\n"
+        "\n"
+        "## Outer class.\n"
+        "class Outer:\n"
+        "    ## Outer method.\n"
+        "    func outer_method() -> void:\n"
+        "        pass\n"
+        "\n"
+        "## Script method.\n"
+        "func script_method() -> void:\n"
+        "    pass\n"
+    ))
+    assert [func_doc.name for func_doc in class_doc.func_docs] == ["script_method"]
+    assert [func_doc.name for func_doc in class_doc.inner_class_docs[0].func_docs] == ["outer_method"]
+
+
+def test_signal_arguments(tmp_path):
+    class_doc = scan(tmp_path, (
+        "extends Node\n"
+        "\n"
+        "## Emitted on a hit.\n"
+        "## Args:\n"
+        "##     damage: Damage taken\n"
+        "signal hit(damage: int, source = null)\n"
+        "signal died ## Emitted once.\n"
+        "## Emitted on a move.\n"
+        "signal moved(\n"
+        "\tfrom: Vector2,\n"
+        "\tto: Vector2\n"
+        ")\n"
+    ))
+    assert [signal_doc.name for signal_doc in class_doc.signal_docs] == ["hit", "died", "moved"]
+    hit, died, moved = class_doc.signal_docs
+    assert [(arg.name, arg.data_type, arg.value, arg.description) for arg in hit.args] == [
+        ("damage", "int", None, "Damage taken"), ("source", "undefined", "null", "")
+    ]
+    assert hit.description == "Emitted on a hit."
+    assert died.args == () and died.description == "Emitted once."
+    assert [(arg.name, arg.data_type) for arg in moved.args] == [("from", "Vector2"), ("to", "Vector2")]
+
+
+def test_property_accessor_bodies_are_skipped(tmp_path):
+    class_doc = scan(tmp_path, (
+        "extends Node\n"
+        "\n"
+        "## Health of the player.\n"
+        "var health: int = 10:\n"
+        "\tset(value):\n"
+        "\t\t## Not a member.\n"
+        "\t\tvar clamped = clamp(value, 0, 10)\n"
+        "\t\thealth = clamped\n"
+        "\tget:\n"
+        "\t\treturn health\n"
+        "## Speed of the player.\n"
+        "var speed := 1.0: set = set_speed\n"
+    ))
+    assert [(var_doc.name, var_doc.data_type, var_doc.value) for var_doc in class_doc.var_docs] == [
+        ("health", "int", "10"), ("speed", "undefined", "1.0")
+    ]
+
+
+def test_undocumented_members_are_skipped(tmp_path):
+    class_doc = scan(tmp_path, (
+        "extends Node\n"
+        "\n"
+        "signal plain_signal\n"
+        "var plain_var := 1\n"
+        "# plain comment\n"
+        "func plain_func():\n"
+        "\tpass\n"
+    ))
+    assert not class_doc.signal_docs
+    assert not class_doc.var_docs
+    assert not class_doc.func_docs
+
+
+def test_split_args():
+    assert GdParser.split_args("a: int, b := [1, 2], c = {\"k\": (1, 2)}, d = \"x, \\\"y\\\"\"") == [
+        "a: int", "b := [1, 2]", "c = {\"k\": (1, 2)}", "d = \"x, \\\"y\\\"\""
+    ]
+
+
+def test_scan_declarations(tmp_path):
+    (tmp_path / "script.gd").write_text((
+        "class_name Player extends \"res://base.gd\"\n"
+        "\n"
+        "## Outer class.\n"
+        "class Outer extends RefCounted:\n"
+        "\tfunc method():\n"
+        "\t\tpass\n"
+        "\n"
+        "\tclass Inner extends Outer:\n"
+        "\t\tvar value := 1\n"
+        "\n"
+        "class Sibling:\n"
+        "\tpass\n"
+    ), encoding="utf-8")
+    class_doc = ScriptScanner(str(tmp_path) + "/").scan_declarations("script.gd")
+    assert (class_doc.class_name, class_doc.extends) == ("Player", "\"res://base.gd\"")
+    assert [(inner.class_name, inner.extends) for inner in class_doc.inner_class_docs] == [
+        ("Outer", "RefCounted"), ("Sibling", "")
+    ]
+    inner = class_doc.inner_class_docs[0].inner_class_docs[0]
+    assert (inner.class_name, inner.extends, inner.is_inner_class) == ("Inner", "Outer", True)
+    assert not class_doc.var_docs and not class_doc.func_docs
@@ -0,0 +1,115 @@
+"""
+Regression tests for the MarkdownWriter: page paths, failed writes and the manifest of unchanged and stale pages.
+"""
+
+from os import stat
+
+from src.model.class_doc import ClassDoc
+from src.view.markdown_writer import MarkdownWriter
+
+
+def class_doc(file_name: str, class_name: str = "not exposed") -> ClassDoc:
+    """
+    Creates the documentation of a script with a brief description only.
+
+    Args:
+        file_name: Path of the script, relative to the project root
+        class_name: Class name of the script
+
+    Returns:
+        The documentation of the script
+    """
+    doc = ClassDoc(file_name)
+    doc.set_class_name(class_name)
+    doc.brief_description = f"Script {file_name}."
+    return doc
+
+
+def test_page_paths(tmp_path):
+    writer = MarkdownWriter(str(tmp_path))
+    assert writer.page_path("player/player.gd") == "player/player.md"
+    assert writer.page_path("res://enemy.gd") == "enemy.md"
+    assert writer.page_path("./main.gd") == "main.md"
+    assert writer.page_path(".hidden/tool.gd") == ".hidden/tool.md"
+    flat_writer = MarkdownWriter(str(tmp_path), False)
+    assert flat_writer.page_path("player/player.gd") == "player_player.md"
+
+
+def test_root_index_script_does_not_overwrite_the_index_page(tmp_path):
+    writer = MarkdownWriter(str(tmp_path))
+    page = writer.write(class_doc("index.gd", "Index"))
+    writer.finish()
+    assert page == "index_2.md"
+    assert (tmp_path / "index_2.md").read_text().startswith("# Index\n")
+    assert "[Index](index_2.md)" in (tmp_path / "index.md").read_text()
+
+
+def test_flattened_pages_collide_deterministically(tmp_path):
+    writer = MarkdownWriter(str(tmp_path), False)
+    writer.reserve_pages(["a/b.gd", "a_b.gd"])
+    writer.write(class_doc("a_b.gd"))
+    writer.write(class_doc("a/b.gd"))
+    writer.finish()
+    assert writer.page_path("a/b.gd") == "a_b.md"
+    assert writer.page_path("a_b.gd") == "a_b_2.md"
+    assert "`a/b.gd`" in (tmp_path / "a_b.md").read_text()
+    assert "`a_b.gd`" in (tmp_path / "a_b_2.md").read_text()
+
+
+def test_unwritable_page_is_skipped(tmp_path, capsys):
+    (tmp_path / "broken.md").mkdir()
+    writer = MarkdownWriter(str(tmp_path))
+    writer.write(class_doc("broken.gd"))
+    writer.write(class_doc("fine.gd"))
+    writer.finish()
+    assert "Writing page" in capsys.readouterr().out
+    assert (tmp_path / "fine.md").is_file()
+    assert "broken.md" not in writer.manifest
+
+
+def build(tmp_path, *file_names: str) -> MarkdownWriter:
+    """
+    Writes the pages of scripts and finishes the build, like a build of a project with these scripts.
+
+    Args:
+        tmp_path: The doc_destination
+        *file_names: Paths of the scripts, relative to the project root
+
+    Returns:
+        The finished markdown writer
+    """
+    writer = MarkdownWriter(str(tmp_path))
+    writer.reserve_pages(list(file_names))
+    for file_name in file_names:
+        writer.write(class_doc(file_name))
+    writer.finish()
+    return writer
+
+
+def test_unchanged_pages_are_not_written_again(tmp_path, capsys):
+    build(tmp_path, "player/player.gd", "enemy.gd")
+    page_mtime = stat(tmp_path / "player/player.md").st_mtime_ns
+    capsys.readouterr()
+    build(tmp_path, "player/player.gd", "enemy.gd")
+    assert "Markdown pages: 0 written, 3 unchanged, 0 deleted" in capsys.readouterr().out
+    assert stat(tmp_path / "player/player.md").st_mtime_ns == page_mtime
+
+
+def test_stale_pages_and_empty_directories_are_deleted(tmp_path):
+    (tmp_path / "player").mkdir()
+    (tmp_path / "player/notes.md").write_text("Not a page of the build.\n", encoding="utf-8")
+    build(tmp_path, "player/player.gd", "enemy/slime.gd")
+    writer = build(tmp_path, "player/player.gd")
+    assert not (tmp_path / "enemy").exists()
+    assert (tmp_path / "player/notes.md").is_file()
+    assert set(writer.manifest) == {"index.md", "player/player.md"}
+
+
+def test_removed_script_is_deleted_by_finish(tmp_path):
+    writer = build(tmp_path, "player.gd", "enemy.gd")
+    writer.remove("enemy.gd")
+    writer.finish()
+    assert not (tmp_path / "enemy.md").exists()
+    assert "enemy.md" not in (tmp_path / "index.md").read_text()
+    assert "enemy.md" not in (tmp_path / ".md_gd4_docs_manifest.json").read_text()
+    assert writer.page_path("enemy.gd") == "enemy.md"
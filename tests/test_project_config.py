@@ -0,0 +1,88 @@
+"""
+Regression tests for the ProjectConfig parser, reading project.godot snippets as written by the godot editor.
+"""
+
+from pytest import raises
+
+from src.control.project_config import ProjectConfig
+
+
+def test_escaped_strings_and_sections():
+    config = ProjectConfig(
+        "; Engine configuration file.\n"
+        "config_version=5\n"
+        "\n"
+        "[application]\n"
+        "\n"
+        "config/name=\"Demo \\\"Quoted\\\" Game\"\n"
+        "config/description=\"First line\\nSecond line \\\\ backslash\"\n"
+        "run/main_scene=\"res://scenes/main.tscn\"\n"
+        "config/features=PackedStringArray(\"4.3\", \"Forward Plus\")\n"
+        "config/icon=\"res://icon.svg\"\n"
+    )
+    assert config.get("", "config_version") == 5
+    assert config.get("application", "config/name") == "Demo \"Quoted\" Game"
+    assert config.get("application", "config/description") == "First line\nSecond line \\ backslash"
+    assert config.get("application", "run/main_scene") == "res://scenes/main.tscn"
+    assert config.get("application", "config/features") == ["4.3", "Forward Plus"]
+    assert config.get("application", "missing", "default") == "default"
+
+
+def test_input_events():
+    config = ProjectConfig(
+        "[input]\n"
+        "\n"
+        "jump={\n"
+        "\"deadzone\": 0.5,\n"
+        "\"events\": [Object(InputEventKey,\"resource_local_to_scene\":false,\"resource_name\":\"\",\"device\":-1,"
+        "\"window_id\":0,\"alt_pressed\":false,\"keycode\":0,\"physical_keycode\":32,\"unicode\":32,"
+        "\"echo\":false,\"script\":null)\n"
+        ", Object(InputEventJoypadButton,\"device\":-1,\"button_index\":0,\"pressure\":0.0,\"pressed\":true,"
+        "\"script\":null)\n"
+        "]\n"
+        "}\n"
+    )
+    jump = config.get("input", "jump")
+    assert jump["deadzone"] == 0.5
+    key_event, button_event = jump["events"]
+    assert key_event["type"] == "Object"
+    assert key_event["class"] == "InputEventKey"
+    assert key_event["properties"]["physical_keycode"] == 32
+    assert key_event["properties"]["resource_name"] == ""
+    assert key_event["properties"]["script"] is None
+    assert button_event["class"] == "InputEventJoypadButton"
+    assert button_event["properties"]["pressed"] is True
+
+
+def test_typed_arrays_and_constructors():
+    config = ProjectConfig(
+        "[autoload]\n"
+        "\n"
+        "Globals=\"*res://scripts/globals.gd\"\n"
+        "\n"
+        "[editor_plugins]\n"
+        "\n"
+        "enabled=PackedStringArray(\"res://addons/foo/plugin.cfg\")\n"
+        "\n"
+        "[misc]\n"
+        "\n"
+        "layers=Array[int]([1, 2, 4])\n"
+        "empty=PackedStringArray()\n"
+        "size=Vector2i(1920, 1080)\n"
+        "color=Color(0.1, 0.2, 0.3, 1)\n"
+        "ratio=-1.5e-3\n"
+        "flags=[true, false, null, inf]\n"
+    )
+    assert config.section("autoload") == {"Globals": "*res://scripts/globals.gd"}
+    assert config.get("editor_plugins", "enabled") == ["res://addons/foo/plugin.cfg"]
+    assert config.get("misc", "layers") == [1, 2, 4]
+    assert config.get("misc", "empty") == []
+    assert config.get("misc", "size") == {"type": "Vector2i", "args": [1920, 1080]}
+    assert config.get("misc", "color") == {"type": "Color", "args": [0.1, 0.2, 0.3, 1]}
+    assert config.get("misc", "ratio") == -1.5e-3
+    assert config.get("misc", "flags") == [True, False, None, float("inf")]
+
+
+def test_syntax_error_names_the_line():
+    with raises(ValueError, match="line 3"):
+        ProjectConfig("[application]\n\nconfig/name=\"unterminated\n")
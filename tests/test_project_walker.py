@@ -0,0 +1,61 @@
+"""
+Regression tests for the ProjectWalker, walking small project trees.
+"""
+
+from os import symlink
+
+from src.control.project_walker import ProjectWalker
+
+
+def make_files(tmp_path, *paths: str):
+    """
+    Creates empty files and their directories.
+
+    Args:
+        tmp_path: Directory to create the files in
+        *paths: Paths of the files, relative to tmp_path
+    """
+    for path in paths:
+        (tmp_path / path).parent.mkdir(parents=True, exist_ok=True)
+        (tmp_path / path).touch()
+
+
+def test_sorts_files_by_extension(tmp_path):
+    make_files(tmp_path, "project.godot", "main.tscn", "player/player.gd", "player/player.tscn", "icon.svg")
+    scripts, scenes = ProjectWalker(str(tmp_path)).walk()
+    assert scripts == ["player/player.gd"]
+    assert scenes == ["main.tscn", "player/player.tscn"]
+
+
+def test_prunes_default_and_ignored_directories(tmp_path):
+    make_files(tmp_path, ".godot/cache.gd", "addons/tool/bin/lib.gd", "addons/tool/tool.gd", "tests/test.gd", "a.gd")
+    scripts, _ = ProjectWalker(str(tmp_path), ["tests"]).walk()
+    assert scripts == ["a.gd", "addons/tool/tool.gd"]
+
+
+def test_patterns_are_case_sensitive(tmp_path):
+    make_files(tmp_path, "Tests/keep.gd", "tests/skip.gd")
+    scripts, _ = ProjectWalker(str(tmp_path), ["tests"]).walk()
+    assert scripts == ["Tests/keep.gd"]
+
+
+def test_walks_a_subdirectory_with_project_relative_paths(tmp_path):
+    make_files(tmp_path, "addons/tool/tool.gd", "addons/other/other.gd", "main.gd")
+    scripts, _ = ProjectWalker(str(tmp_path), ["addons/other"]).walk("addons/")
+    assert scripts == ["addons/tool/tool.gd"]
+
+
+def test_does_not_follow_directory_links(tmp_path):
+    make_files(tmp_path, "a/script.gd", "b/linked.gd")
+    symlink("..", tmp_path / "a" / "loop")
+    symlink(tmp_path / "b", tmp_path / "a" / "b_link")
+    symlink("self_loop", tmp_path / "self_loop")
+    scripts, _ = ProjectWalker(str(tmp_path)).walk()
+    assert scripts == ["a/script.gd", "b/linked.gd"]
+
+
+def test_keeps_file_links(tmp_path):
+    make_files(tmp_path, "shared/base.gd")
+    symlink(tmp_path / "shared" / "base.gd", tmp_path / "base_link.gd")
+    scripts, _ = ProjectWalker(str(tmp_path)).walk()
+    assert scripts == ["base_link.gd", "shared/base.gd"]
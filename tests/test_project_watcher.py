@@ -0,0 +1,120 @@
+"""
+Regression tests for the ProjectWatcher: polling for created, changed and deleted files, inotify events and links to
+directories.
+"""
+
+from os import stat, symlink, utime
+from shutil import rmtree
+
+import pytest
+
+from src.control.project_watcher import ProjectWatcher
+
+
+def make_files(tmp_path, *paths: str):
+    """
+    Creates empty files and their directories.
+
+    Args:
+        tmp_path: Directory to create the files in
+        *paths: Paths of the files, relative to tmp_path
+    """
+    for path in paths:
+        (tmp_path / path).parent.mkdir(parents=True, exist_ok=True)
+        (tmp_path / path).touch()
+
+
+def bump_mtime(path):
+    """
+    Moves the modification time of a file or directory one second ahead, so a change is seen even on file systems
+    with coarse timestamps.
+
+    Args:
+        path: The file or directory
+    """
+    path_stat = stat(path)
+    utime(path, ns=(path_stat.st_atime_ns, path_stat.st_mtime_ns + 1_000_000_000))
+
+
+def polling_watcher(tmp_path, monkeypatch) -> ProjectWatcher:
+    """
+    Creates a watcher for a project, polling even where inotify is available.
+
+    Args:
+        tmp_path: The base directory of the project
+        monkeypatch: Disables inotify
+
+    Returns:
+        The watcher
+    """
+    monkeypatch.setattr(ProjectWatcher, "start_inotify", lambda self: False)
+    watcher = ProjectWatcher(str(tmp_path), debounce=0.01, poll_interval=0.01)
+    assert watcher.backend == "polling"
+    return watcher
+
+
+def test_watched_files(tmp_path, monkeypatch):
+    watcher = polling_watcher(tmp_path, monkeypatch)
+    assert watcher.is_watched("project.godot")
+    assert watcher.is_watched("player/player.gd")
+    assert watcher.is_watched("player/player.gd.uid")
+    assert watcher.is_watched("player/player.tscn")
+    assert not watcher.is_watched("icon.svg")
+    assert not watcher.is_watched(".godot/cache.gd")
+
+
+def test_polling_reports_created_and_deleted_files(tmp_path, monkeypatch):
+    make_files(tmp_path, "project.godot", "player/player.gd")
+    watcher = polling_watcher(tmp_path, monkeypatch)
+    make_files(tmp_path, "player/enemy.gd", "player/notes.txt")
+    bump_mtime(tmp_path / "player")
+    assert watcher.poll_changes() == {"player/enemy.gd"}
+    (tmp_path / "player/player.gd").unlink()
+    bump_mtime(tmp_path / "player")
+    assert watcher.poll_changes() == {"player/player.gd"}
+    assert watcher.poll_changes() == set()
+
+
+def test_polling_reports_files_changed_in_place(tmp_path, monkeypatch):
+    make_files(tmp_path, "player.gd")
+    watcher = polling_watcher(tmp_path, monkeypatch)
+    (tmp_path / "player.gd").write_text("extends Node\n", encoding="utf-8")
+    dir_stat = stat(tmp_path)
+    utime(tmp_path, ns=(dir_stat.st_atime_ns, watcher._dir_mtimes[""]))
+    assert watcher.poll_changes() == {"player.gd"}
+
+
+def test_polling_reports_files_of_new_and_deleted_directories(tmp_path, monkeypatch):
+    make_files(tmp_path, "enemies/slime.gd", "enemies/bat/bat.gd")
+    watcher = polling_watcher(tmp_path, monkeypatch)
+    rmtree(tmp_path / "enemies")
+    make_files(tmp_path, "items/sword.gd")
+    bump_mtime(tmp_path)
+    assert watcher.poll_changes() == {"enemies/slime.gd", "enemies/bat/bat.gd", "items/sword.gd"}
+
+
+def test_links_to_directories_are_not_followed(tmp_path, monkeypatch):
+    make_files(tmp_path, "player/player.gd")
+    symlink(tmp_path, tmp_path / "player/loop")
+    symlink(tmp_path / "player", tmp_path / "alias")
+    watcher = polling_watcher(tmp_path, monkeypatch)
+    assert watcher.list_dirs("") == ["player/"]
+    assert watcher.known_files() == ["player/player.gd"]
+    assert set(watcher._dir_mtimes) == {"", "player/"}
+
+
+def test_inotify_reports_created_files(tmp_path):
+    make_files(tmp_path, "player/player.gd")
+    symlink(tmp_path, tmp_path / "player/loop")
+    watcher = ProjectWatcher(str(tmp_path), debounce=0.05)
+    try:
+        if watcher.backend != "inotify":
+            pytest.skip("inotify is not available")
+        assert sorted(watcher._watched_dirs.values()) == ["", "player/"]
+        make_files(tmp_path, "player/enemy.gd", "player/notes.txt")
+        assert watcher.wait_for_changes() == {"player/enemy.gd"}
+        # created before or after the new directory is watched, the file is reported either way
+        make_files(tmp_path, "items/sword.gd")
+        assert watcher.wait_for_changes() == {"items/sword.gd"}
+    finally:
+        watcher.close()
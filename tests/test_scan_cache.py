@@ -0,0 +1,99 @@
+"""
+Regression tests for the ScanCache: invalidation of changed scripts and the source left out of the cache.
+"""
+
+from os import stat, utime
+
+from src.control.scan_cache import ScanCache
+from src.control.script_scanner import ScriptScanner
+
+SCRIPT: str = "extends Node\n\n## Jumps.\nfunc jump():\n\tpass\n"
+
+
+def cache_script(tmp_path, code: str = SCRIPT) -> tuple[ScanCache, str]:
+    """
+    Writes and scans a script, stores it in a new scan cache and saves the cache.
+
+    Args:
+        tmp_path: Directory to write the script and the cache to
+        code: Content of the script
+
+    Returns:
+        The scan cache and the path of the script
+    """
+    script_path = str(tmp_path / "script.gd")
+    (tmp_path / "script.gd").write_text(code, encoding="utf-8")
+    scan_cache = ScanCache(str(tmp_path / "md_gd4_docs.cache"), ("test",))
+    file_state = scan_cache.file_state(script_path)
+    scan_cache.store(script_path, ScriptScanner().scan(script_path, False), file_state)
+    scan_cache.save()
+    return scan_cache, script_path
+
+
+def reload(scan_cache: ScanCache) -> ScanCache:
+    """
+    Loads a saved scan cache again, like the next build does.
+
+    Args:
+        scan_cache: The saved scan cache
+
+    Returns:
+        The loaded scan cache
+    """
+    loaded = ScanCache(scan_cache.cache_file, scan_cache.fingerprint[1:])
+    assert loaded.load()
+    return loaded
+
+
+def test_unchanged_script_is_fresh(tmp_path):
+    scan_cache, script_path = cache_script(tmp_path)
+    loaded = reload(scan_cache)
+    assert loaded.is_fresh(script_path)
+    class_doc = loaded.load_doc(script_path)
+    assert [func_doc.name for func_doc in class_doc.func_docs] == ["jump"]
+    assert (loaded.hits, loaded.misses) == (1, 0)
+
+
+def test_changed_script_is_scanned_again(tmp_path):
+    scan_cache, script_path = cache_script(tmp_path)
+    (tmp_path / "script.gd").write_text(SCRIPT + "## Runs.\nfunc run():\n\tpass\n", encoding="utf-8")
+    loaded = reload(scan_cache)
+    assert not loaded.is_fresh(script_path)
+    assert (loaded.hits, loaded.misses) == (0, 1)
+
+
+def test_same_size_change_is_detected_by_hash(tmp_path):
+    scan_cache, script_path = cache_script(tmp_path)
+    script_stat = stat(script_path)
+    (tmp_path / "script.gd").write_text(SCRIPT.replace("jump", "duck"), encoding="utf-8")
+    utime(script_path, ns=(script_stat.st_atime_ns, script_stat.st_mtime_ns + 1_000_000_000))
+    assert not reload(scan_cache).is_fresh(script_path)
+
+
+def test_touched_script_stays_fresh(tmp_path):
+    scan_cache, script_path = cache_script(tmp_path)
+    script_stat = stat(script_path)
+    utime(script_path, ns=(script_stat.st_atime_ns, script_stat.st_mtime_ns + 1_000_000_000))
+    assert reload(scan_cache).is_fresh(script_path)
+
+
+def test_other_fingerprint_discards_the_cache(tmp_path):
+    scan_cache, _ = cache_script(tmp_path)
+    assert not ScanCache(scan_cache.cache_file, ("other",)).load()
+
+
+def test_source_is_not_cached(tmp_path):
+    marker = "# " + "unique marker " * 20
+    scan_cache, script_path = cache_script(tmp_path, SCRIPT + marker + "\n")
+    assert marker.encode() not in scan_cache.entries[script_path]["class_doc"]
+    class_doc = reload(scan_cache).load_doc(script_path)
+    assert class_doc.func_docs[0].code == "func jump():\n\tpass\n"
+    assert class_doc.code.endswith(marker + "\n")
+
+
+def test_code_of_a_changed_script_is_empty(tmp_path):
+    scan_cache, script_path = cache_script(tmp_path)
+    loaded = reload(scan_cache)
+    class_doc = loaded.load_doc(script_path)
+    (tmp_path / "script.gd").write_text("extends Node\n", encoding="utf-8")
+    assert class_doc.func_docs[0].code == ""
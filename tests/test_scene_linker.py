@@ -0,0 +1,37 @@
+"""
+Regression tests for the SceneLinker: scripts referenced by path or uid, read from the scene header only.
+"""
+
+from src.control.scene_linker import SceneLinker
+
+SCENE_HEADER: str = """[gd_scene load_steps=4 format=3 uid="uid://c5a8q0p1player"]
+
+[ext_resource type="Script" path="res://player/player.gd" id="1_abc"]
+[ext_resource type="Texture2D" path="res://icon.svg" id="2_def"]
+[ext_resource type="Script" uid="uid://b2k4x7mfw3c1p" id="3_ghi"]
+[ext_resource type="Script" path="res://player/player.gd" id="4_jkl"]
+
+"""
+
+
+def test_scripts_by_path_and_uid(tmp_path):
+    (tmp_path / "player.tscn").write_text(SCENE_HEADER + '[node name="Player" type="Node2D"]\n', encoding="utf-8")
+    (tmp_path / "moved").mkdir()
+    (tmp_path / "moved/weapon.gd.uid").write_text("uid://b2k4x7mfw3c1p\n", encoding="utf-8")
+    linker = SceneLinker(str(tmp_path), ["moved/weapon.gd.uid"])
+    assert linker.scene_scripts("player.tscn") == ["player/player.gd", "moved/weapon.gd"]
+
+
+def test_unknown_uid_is_skipped(tmp_path):
+    (tmp_path / "player.tscn").write_text(SCENE_HEADER, encoding="utf-8")
+    assert SceneLinker(str(tmp_path)).scene_scripts("player.tscn") == ["player/player.gd"]
+
+
+def test_node_data_is_not_read(tmp_path, monkeypatch):
+    monkeypatch.setattr(SceneLinker, "CHUNK_SIZE", 64)
+    nodes = '[node name="Player" type="Node2D"]\n' + 'position = Vector2(1, 2)\n' * 10000
+    nodes += '[ext_resource type="Script" path="res://late.gd" id="9_xyz"]\n'
+    (tmp_path / "player.tscn").write_text(SCENE_HEADER + nodes, encoding="utf-8")
+    linker = SceneLinker(str(tmp_path))
+    assert linker.scene_scripts("player.tscn") == ["player/player.gd"]
+    assert linker.bytes_read < len(SCENE_HEADER) + 2 * 64
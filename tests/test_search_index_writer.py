@@ -0,0 +1,91 @@
+"""
+Regression tests for the SearchIndexWriter: the shared entry table and the anchors of repeated headings.
+"""
+
+from json import loads
+
+from src.model.class_doc import ClassDoc
+from src.model.func_doc import FuncDoc
+from src.view.markdown_writer import MarkdownWriter
+from src.view.search_index_writer import SearchIndexWriter
+
+
+def player_doc() -> ClassDoc:
+    """
+    Creates the documentation of a script with an inner class repeating the sections of its outer class.
+
+    Returns:
+        The documentation of the script
+    """
+    doc = ClassDoc("player.gd")
+    doc.set_class_name("Player")
+    doc.add_signal("died", "Emitted on death.")
+    doc.add_attribute("health", "int", "Hit points.", "3", "var")
+    doc.func_docs.append(FuncDoc("jump", "Jumps.", []))
+    stats = ClassDoc("player.gd", "Stats", True)
+    stats.add_signal("changed", "Emitted on changes.")
+    stats.add_attribute("speed", "float", "Run speed.", "1.0", "var")
+    stats.func_docs.append(FuncDoc("jump", "Jumps higher.", []))
+    doc.inner_class_docs.append(stats)
+    return doc
+
+
+def read_search_file(tmp_path, file_name: str):
+    """
+    Reads a search index file.
+
+    Args:
+        tmp_path: The doc_destination
+        file_name: Name of the file in the search directory
+
+    Returns:
+        The JSON content of the file
+    """
+    return loads((tmp_path / "search" / file_name).read_text(encoding="utf-8"))
+
+
+def test_page_anchors_match_the_rendered_headings(tmp_path):
+    doc = player_doc()
+    writer = MarkdownWriter(str(tmp_path))
+    headings = [line.lstrip("#").strip() for line in writer.render_class(doc, "player.md", 1, []) if line[:1] == "#"]
+    used_anchors: set[str] = set()
+    rendered_anchors = [MarkdownWriter.unique_anchor(heading, used_anchors) for heading in headings]
+    anchors = MarkdownWriter.page_anchors(doc)
+    inner_anchors = anchors["inner_class_docs"][0]
+    assert rendered_anchors == [
+        anchors["class"], anchors["signals"], anchors["properties"], anchors["methods"], *anchors["func_docs"],
+        anchors["inner_classes"], inner_anchors["class"], inner_anchors["signals"], inner_anchors["properties"],
+        inner_anchors["methods"], *inner_anchors["func_docs"]
+    ]
+    assert (inner_anchors["signals"], inner_anchors["properties"], inner_anchors["func_docs"]) == (
+        "signals_1", "properties_1", ["jump_1"]
+    )
+
+
+def test_entries_are_stored_once_and_use_page_anchors(tmp_path):
+    markdown_writer = MarkdownWriter(str(tmp_path))
+    writer = SearchIndexWriter(str(tmp_path), markdown_writer.page_path)
+    writer.write(player_doc())
+    writer.finish()
+    table = read_search_file(tmp_path, "entries.json")
+    anchors = {title: (table["pages"][page], anchor) for title, page, anchor, _ in table["entries"]}
+    assert anchors["Player"] == ("player.md", "")
+    assert anchors["Stats.changed"] == ("player.md", "signals_1")
+    assert anchors["Stats.speed"] == ("player.md", "properties_1")
+    assert anchors["Stats.jump"] == ("player.md", "jump_1")
+    index = read_search_file(tmp_path, "index.json")
+    shard = read_search_file(tmp_path, index["shards"]["ju"]["file"])
+    postings = shard["trie"]["jump"][""]
+    assert sorted(table["entries"][number][0] for number, _ in postings) == ["Player.jump", "Stats.jump"]
+    assert (tmp_path / "search" / "search.js").is_file()
+
+
+def test_unchanged_files_are_not_written_again(tmp_path, capsys):
+    markdown_writer = MarkdownWriter(str(tmp_path))
+    writer = SearchIndexWriter(str(tmp_path), markdown_writer.page_path)
+    writer.write(player_doc())
+    writer.finish()
+    writer = SearchIndexWriter(str(tmp_path), markdown_writer.page_path)
+    writer.write(player_doc())
+    writer.finish()
+    assert ", 0 files written" in capsys.readouterr().out.splitlines()[-1]
@@ -0,0 +1,44 @@
+"""
+Regression tests for the SourceBuffer: releasing memory-mapped scripts after parsing and reading them again lazily.
+"""
+
+from pickle import dumps, loads
+
+from src.control.script_scanner import ScriptScanner
+from src.model.source_buffer import SourceBuffer
+
+SCRIPT: str = "extends Node\n\n## Jumps.\nfunc jump():\n\tpass\n"
+
+
+def test_small_file_is_kept(tmp_path):
+    (tmp_path / "script.gd").write_text(SCRIPT, encoding="utf-8")
+    source = SourceBuffer(str(tmp_path / "script.gd"))
+    source.release()
+    assert source.data == SCRIPT.encode()
+
+
+def test_large_file_is_released_after_scan(tmp_path, monkeypatch):
+    monkeypatch.setattr(SourceBuffer, "MMAP_THRESHOLD", 16)
+    (tmp_path / "script.gd").write_text(SCRIPT, encoding="utf-8")
+    class_doc = ScriptScanner().scan(str(tmp_path / "script.gd"), False)
+    assert class_doc.source._data is None
+    assert class_doc.func_docs[0].code == "func jump():\n\tpass\n"
+    assert isinstance(class_doc.source.data, bytes)
+
+
+def test_released_file_changed_on_disk_reads_empty(tmp_path, monkeypatch):
+    monkeypatch.setattr(SourceBuffer, "MMAP_THRESHOLD", 16)
+    (tmp_path / "script.gd").write_text(SCRIPT, encoding="utf-8")
+    class_doc = ScriptScanner().scan(str(tmp_path / "script.gd"), False)
+    (tmp_path / "script.gd").write_text("", encoding="utf-8")
+    assert class_doc.func_docs[0].code == ""
+
+
+def test_released_buffer_is_pickled_without_content(tmp_path, monkeypatch):
+    monkeypatch.setattr(SourceBuffer, "MMAP_THRESHOLD", 16)
+    (tmp_path / "script.gd").write_text(SCRIPT, encoding="utf-8")
+    source = SourceBuffer(str(tmp_path / "script.gd"))
+    source.release()
+    pickled = dumps(source)
+    assert b"jump" not in pickled
+    assert loads(pickled).text() == SCRIPT
@@ -0,0 +1,100 @@
+"""
+Regression tests for the SymbolIndex and the links the MarkdownWriter resolves through it.
+"""
+
+from src.control.symbol_index import SymbolIndex
+from src.model.class_doc import ClassDoc
+from src.view.markdown_writer import MarkdownWriter
+
+
+def class_doc(file_name: str, class_name: str = "not exposed", extends: str = "") -> ClassDoc:
+    """
+    Creates the documentation of a script.
+
+    Args:
+        file_name: Path of the script, relative to the project root
+        class_name: Class name of the script
+        extends: Base class of the script
+
+    Returns:
+        The documentation of the script
+    """
+    doc = ClassDoc(file_name)
+    doc.set_class_name(class_name)
+    doc.extends = extends
+    return doc
+
+
+def project_index() -> SymbolIndex:
+    """
+    Creates the symbol index of a small project: Player with the inner class Stats, Enemy extending Player and a
+    script without class_name extending Enemy by path.
+
+    Returns:
+        The symbol index
+    """
+    player = class_doc("player/player.gd", "Player", "CharacterBody2D")
+    player.add_attribute("health", "int", "Hit points.", "3", "var")
+    stats = ClassDoc("player/player.gd", "Stats", True)
+    stats.add_attribute("speed", "float", "Run speed.", "1.0", "var")
+    player.inner_class_docs.append(stats)
+    symbol_index = SymbolIndex()
+    symbol_index.add(player)
+    symbol_index.add(class_doc("enemy.gd", "Enemy", "Player"))
+    symbol_index.add(class_doc("boss.gd", extends='"res://enemy.gd"'))
+    return symbol_index
+
+
+def test_classes_members_and_inheritance():
+    symbol_index = project_index()
+    assert symbol_index.class_script("Player.Stats") == "player/player.gd"
+    assert symbol_index.is_inner_class("Player.Stats")
+    assert not symbol_index.is_inner_class("Player")
+    assert symbol_index.member("Player.Stats.speed") == ("var", "player/player.gd", "Player.Stats")
+    assert symbol_index.inherited_by("Player") == ["Enemy"]
+    assert symbol_index.base_classes("Enemy") == ["Player", "CharacterBody2D"]
+    assert symbol_index.class_script("CharacterBody2D") is None
+
+
+def test_script_path_resolves_to_its_class_name():
+    symbol_index = project_index()
+    assert symbol_index.class_script("enemy.gd") == "enemy.gd"
+    assert symbol_index.inherited_by("Enemy") == ["boss.gd"]
+    assert symbol_index.base_classes("boss.gd") == ["Enemy", "Player", "CharacterBody2D"]
+
+
+def test_removed_script_is_dropped():
+    symbol_index = project_index()
+    symbol_index.remove("player/player.gd")
+    assert symbol_index.class_script("Player") is None
+    assert symbol_index.member("Player.health") is None
+    assert symbol_index.inherited_by("CharacterBody2D") == []
+    assert symbol_index.inherited_by("Player") == ["Enemy"]
+
+
+def test_shadowed_class_keeps_the_first_script():
+    symbol_index = project_index()
+    symbol_index.add(class_doc("other/player.gd", "Player"))
+    assert symbol_index.class_script("Player") == "player/player.gd"
+    assert symbol_index.shadowed == {"Player": ["other/player.gd"]}
+
+
+def test_saved_index_is_loaded(tmp_path):
+    symbol_index = project_index()
+    symbol_index.index_file = str(tmp_path / "md_gd4_docs.symbols")
+    assert symbol_index.save()
+    loaded = SymbolIndex(symbol_index.index_file)
+    assert loaded.load()
+    assert loaded.classes == symbol_index.classes
+    assert not SymbolIndex(symbol_index.index_file, ("other",)).load()
+
+
+def test_links_resolve_inner_global_and_path_classes(tmp_path):
+    writer = MarkdownWriter(str(tmp_path), symbol_index=project_index())
+    assert writer.type_link("Stats", "enemy.md", ["Player"]) == "[`Stats`](player/player.md#stats)"
+    assert writer.type_link("Stats", "enemy.md", ["Enemy"]) == "`Stats`"
+    assert writer.type_link("Player.Stats", "player/player.md", []) == "[`Player.Stats`](#stats)"
+    assert writer.type_link("Enemy", "player/player.md", []) == "[`Enemy`](../enemy.md)"
+    assert writer.type_link('"res://enemy.gd"', "boss.md", []) == "[`\"res://enemy.gd\"`](enemy.md)"
+    assert writer.type_link("Node", "enemy.md", []) == "`Node`"
+    assert writer.subclass_links("enemy.gd", "player/player.md") == ["[`boss.gd`](../boss.md)"]